@@ -0,0 +1,69 @@
+"""대응점 수에 따른 `PlanarCalibration.fit` 시간(DLT, RANSAC)을 측정합니다.
+
+실행:
+    $env:PYTHONPATH = "src"
+    python benchmarks/bench_calibration.py
+"""
+
+# perf_counter는 짧은 구간 측정에 적합한 고해상도 monotonic clock입니다.
+from time import perf_counter
+
+import numpy as np
+
+from gemini_robotics_learning.geometry import PlanarCalibration
+
+
+# 원근 성분이 있는 기준 homography입니다.
+TRUE_HOMOGRAPHY = np.array(
+    [[0.0005, 0.00002, -0.32], [0.00001, 0.0005, -0.18], [0.00001, 0.00002, 1.0]]
+)
+# 손으로 찍은 소수 점부터 checkerboard 영상 여러 장의 대량 대응점까지 비교합니다.
+CORRESPONDENCE_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+# RANSAC 입력에 섞을 잘못된 대응점 비율입니다.
+OUTLIER_RATIO = 0.3
+# world 좌표 noise(m)와 RANSAC inlier threshold(m)입니다.
+NOISE_M = 0.0002
+THRESHOLD_M = 0.002
+
+
+def best_of(function, repeats: int) -> float:
+    """여러 번 실행한 시간 중 가장 짧은 값을 초 단위로 반환합니다."""
+
+    # 최솟값은 OS scheduling 잡음의 영향을 가장 적게 받습니다.
+    best = float("inf")
+    for _ in range(repeats):
+        started_at = perf_counter()
+        function()
+        best = min(best, perf_counter() - started_at)
+    return best
+
+
+def main() -> None:
+    """대응점 수별 DLT·RANSAC 시간과 RANSAC 오차를 표로 출력합니다."""
+
+    # seed를 고정해 실행마다 같은 입력을 측정합니다.
+    rng = np.random.default_rng(0)
+    print(f"{'points':>8} {'dlt ms':>10} {'ransac ms':>11} {'inliers':>9} {'rms mm':>8}")
+    for count in CORRESPONDENCE_COUNTS:
+        pixels = rng.uniform(0.0, 1280.0, size=(count, 2))
+        homogeneous = np.c_[pixels, np.ones(count)] @ TRUE_HOMOGRAPHY.T
+        world = homogeneous[:, :2] / homogeneous[:, 2:] + rng.normal(0.0, NOISE_M, (count, 2))
+        outliers = rng.random(count) < OUTLIER_RATIO
+        noisy = world.copy()
+        noisy[outliers] += rng.uniform(-0.5, 0.5, size=(int(outliers.sum()), 2))
+        # 큰 입력은 반복 횟수를 줄여 전체 실행 시간을 몇 초 안으로 유지합니다.
+        repeats = 3 if count >= 10_000 else 20
+        # DLT는 outlier 없는 입력으로, RANSAC은 outlier가 섞인 입력으로 측정합니다.
+        dlt_s = best_of(lambda: PlanarCalibration.fit(pixels, world), repeats)
+        ransac_s = best_of(
+            lambda: PlanarCalibration.fit(pixels, noisy, ransac_threshold=THRESHOLD_M), repeats
+        )
+        fit = PlanarCalibration.fit(pixels, noisy, ransac_threshold=THRESHOLD_M)
+        print(
+            f"{count:>8} {dlt_s * 1e3:>10.2f} {ransac_s * 1e3:>11.2f}"
+            f" {fit.inlier_count:>9} {fit.rms_error * 1e3:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Scalar `normalized_to_world`와 batch `normalized_to_world_batch`의 속도를 비교합니다.
+
+실행:
+    $env:PYTHONPATH = "src"
+    python benchmarks/bench_geometry.py
+"""
+
+# perf_counter는 짧은 구간 측정에 적합한 고해상도 monotonic clock입니다.
+from time import perf_counter
+
+import numpy as np
+
+from gemini_robotics_learning.geometry import NormalizedPoint, PlanarCalibration
+
+
+# 01 예제와 같은 sample camera 해상도를 사용합니다.
+IMAGE_WIDTH = 1280
+IMAGE_HEIGHT = 720
+# 한 점, 일반적인 frame의 detection 수, 대량 offline 처리를 비교합니다.
+POINT_COUNTS = (1, 100, 100_000)
+
+
+def best_of(function, repeats: int) -> float:
+    """여러 번 실행한 시간 중 가장 짧은 값을 초 단위로 반환합니다."""
+
+    # 최솟값은 OS scheduling 잡음의 영향을 가장 적게 받습니다.
+    best = float("inf")
+    for _ in range(repeats):
+        started_at = perf_counter()
+        function()
+        best = min(best, perf_counter() - started_at)
+    return best
+
+
+def main() -> None:
+    """점 개수별 scalar/batch 시간과 속도 비율을 표로 출력합니다."""
+
+    calibration = PlanarCalibration(
+        matrix=((0.0005, 0.0, -0.32), (0.0, 0.0005, -0.18), (0.0, 0.0, 1.0))
+    )
+    # seed를 고정해 실행마다 같은 입력을 측정합니다.
+    rng = np.random.default_rng(0)
+    print(f"{'points':>8} {'scalar ms':>12} {'batch ms':>12} {'speedup':>9}")
+    for count in POINT_COUNTS:
+        points_yx = rng.uniform(0.0, 1000.0, size=(count, 2))
+        # scalar 경로는 실제 사용처처럼 점마다 검증된 객체를 만듭니다.
+        objects = [NormalizedPoint.from_sequence(row.tolist()) for row in points_yx]
+        # 큰 입력은 반복 횟수를 줄여 전체 실행 시간을 몇 초 안으로 유지합니다.
+        repeats = 3 if count >= 10_000 else 50
+
+        def scalar() -> None:
+            for point in objects:
+                calibration.normalized_to_world(point, IMAGE_WIDTH, IMAGE_HEIGHT)
+
+        def batch() -> None:
+            calibration.normalized_to_world_batch(points_yx, IMAGE_WIDTH, IMAGE_HEIGHT)
+
+        scalar_s = best_of(scalar, repeats)
+        batch_s = best_of(batch, repeats)
+        print(
+            f"{count:>8} {scalar_s * 1e3:>12.3f} {batch_s * 1e3:>12.3f}"
+            f" {scalar_s / batch_s:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
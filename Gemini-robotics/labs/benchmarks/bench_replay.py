@@ -0,0 +1,87 @@
+"""합성 plan을 재생해 `ToolExecutor` + `MockRobot` + `SafetyEnvelope` 처리량을 측정합니다.
+
+실행:
+    $env:PYTHONPATH = "src"
+    python benchmarks/bench_replay.py
+    python benchmarks/bench_replay.py --calls 1000000
+    python benchmarks/bench_replay.py --plans recorded.jsonl --realtime --speed 10
+"""
+
+import argparse
+import json
+
+from gemini_robotics_learning.audit import AuditLog
+from gemini_robotics_learning.mock_robot import MockRobot, ToolExecutor
+from gemini_robotics_learning.replay import ReplayHarness, load_plans, synthetic_plans, write_plans
+from gemini_robotics_learning.safety import ForbiddenBox, SafetyEnvelope, WorkspaceLimits
+
+
+# 인자가 없으면 1천~10만 call을 차례로 측정합니다. 100만 call은 --calls로 지정합니다.
+DEFAULT_CALL_COUNTS = (1_000, 10_000, 100_000)
+WORKSPACE = WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4)
+
+
+def build_executor() -> ToolExecutor:
+    """금지 영역 하나가 있는 기본 안전 정책과 executor를 만듭니다."""
+
+    safety = SafetyEnvelope(
+        workspace=WORKSPACE,
+        forbidden=[ForbiddenBox("fixture", WorkspaceLimits(0.2, 0.3, 0.2, 0.3, 0.0, 0.1))],
+    )
+    # 감사 log는 ring buffer이므로 100만 call에서도 메모리가 일정합니다.
+    return ToolExecutor(MockRobot(safety, records=AuditLog(capacity=10_000)))
+
+
+def print_report(label: str, report) -> None:
+    """처리량, tool별 지연, 거부 이유를 출력합니다."""
+
+    print(
+        f"{label}: plans={report.plans} executed={report.executed} skipped={report.skipped}"
+        f" rejected_plans={report.rejected_plans} wall={report.wall_s:.2f}s"
+        f" calls/s={report.calls_per_s:,.0f}"
+    )
+    print(f"  {'tool':<12} {'count':>9} {'p50 us':>8} {'p99 us':>8} {'max us':>9}")
+    for name, row in report.latency_summary().items():
+        print(
+            f"  {name:<12} {row['count']:>9} {row['p50_us']:>8.1f}"
+            f" {row['p99_us']:>8.1f} {row['max_us']:>9.1f}"
+        )
+    for reason, count in report.rejections_by_reason.most_common(3):
+        print(f"  rejected {count:>6}x {reason}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, nargs="*", default=list(DEFAULT_CALL_COUNTS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--plans", help="합성 plan 대신 재생할 JSONL plan 파일")
+    parser.add_argument("--record", help="합성 plan을 재생하지 않고 JSONL로 저장할 경로")
+    parser.add_argument("--realtime", action="store_true", help="기록된 at_s 간격대로 재생")
+    parser.add_argument("--speed", type=float, default=1.0, help="realtime 재생 배속")
+    parser.add_argument("--json", action="store_true", help="report를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if args.record:
+        # 같은 seed의 합성 workload를 파일로 남겨 다른 build와 비교할 수 있게 합니다.
+        count = write_plans(args.record, synthetic_plans(args.calls[0], seed=args.seed, workspace=WORKSPACE))
+        print(f"wrote {count} plans to {args.record}")
+        return
+    if args.plans:
+        workloads = [(args.plans, load_plans(args.plans))]
+    else:
+        workloads = [
+            (f"{calls:,} calls", synthetic_plans(calls, seed=args.seed, workspace=WORKSPACE))
+            for calls in args.calls
+        ]
+    for label, plans in workloads:
+        # workload마다 새 executor를 만들어 call ID window가 서로 섞이지 않게 합니다.
+        harness = ReplayHarness(build_executor())
+        report = harness.run(plans, realtime=args.realtime, speed=args.speed)
+        if args.json:
+            print(json.dumps({"workload": label, **report.to_dict()}))
+        else:
+            print_report(label, report)
+
+
+if __name__ == "__main__":
+    main()
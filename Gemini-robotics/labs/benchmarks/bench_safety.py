@@ -0,0 +1,83 @@
+"""금지 영역 수가 늘어날 때 `validate_move` 한 번의 비용을 측정합니다.
+
+Box 밀도는 고정하고 셀 바닥 면적을 box 수에 비례해 키웁니다. 실제 셀이 커질수록
+keep-out box가 늘어나는 상황과 같으며, grid index 덕분에 한 번의 검사는 목표
+주변 box만 보므로 box 수와 무관하게 거의 일정해야 합니다.
+
+실행:
+    $env:PYTHONPATH = "src"
+    python benchmarks/bench_safety.py
+"""
+
+from math import sqrt
+from time import perf_counter
+
+import numpy as np
+
+from gemini_robotics_learning.safety import (
+    ForbiddenBox,
+    MoveCommand,
+    SafetyEnvelope,
+    ToolRejected,
+    WorkspaceLimits,
+)
+
+
+# 1m² 당 box 수를 고정해 box가 늘면 바닥 면적도 함께 늘어납니다.
+BOXES_PER_SQUARE_METER = 100
+BOX_COUNTS = (10, 100, 1_000, 10_000)
+MOVES = 2_000
+
+
+def build_envelope(box_count: int, rng: np.random.Generator) -> SafetyEnvelope:
+    """고정 밀도의 정사각형 셀과 무작위 keep-out box를 만듭니다."""
+
+    half = sqrt(box_count / BOXES_PER_SQUARE_METER) / 2.0
+    workspace = WorkspaceLimits(-half, half, -half, half, 0.0, 0.5)
+    corners = rng.uniform(-half, half - 0.03, size=(box_count, 2))
+    forbidden = [
+        ForbiddenBox(
+            name=f"box-{index}",
+            limits=WorkspaceLimits(x, x + 0.03, y, y + 0.03, 0.0, 0.2),
+        )
+        for index, (x, y) in enumerate(corners)
+    ]
+    # 한 번에 0.2m까지 움직이는 기본 정책으로 경로 sweep 검사를 켭니다.
+    return SafetyEnvelope(workspace=workspace, max_speed_m_s=0.1, forbidden=forbidden)
+
+
+def main() -> None:
+    """Box 수별 scalar·batch 검증 한 건당 평균 시간을 출력합니다."""
+
+    rng = np.random.default_rng(0)
+    print(f"{'boxes':>7} {'scalar us/move':>15} {'batch us/move':>14} {'rejected':>9}")
+    for box_count in BOX_COUNTS:
+        safety = build_envelope(box_count, rng)
+        # index 생성 비용은 envelope 구성 시 한 번이므로 측정에서 제외합니다.
+        safety.forbidden_index()
+        half = safety.workspace.x_max
+        start = (float(rng.uniform(-half, half)), float(rng.uniform(-half, half)), 0.15)
+        offsets = rng.normal(scale=0.07, size=(MOVES, 3))
+        commands = [
+            MoveCommand(x=start[0] + dx, y=start[1] + dy, z=start[2] + dz, speed_m_s=0.05)
+            for dx, dy, dz in offsets
+        ]
+        rejected = 0
+        started_at = perf_counter()
+        for command in commands:
+            try:
+                safety.validate_move(start, command)
+            except ToolRejected:
+                rejected += 1
+        scalar_s = perf_counter() - started_at
+        started_at = perf_counter()
+        safety.validate_moves(start, commands)
+        batch_s = perf_counter() - started_at
+        print(
+            f"{box_count:>7} {scalar_s / MOVES * 1e6:>15.1f}"
+            f" {batch_s / MOVES * 1e6:>14.1f} {rejected:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
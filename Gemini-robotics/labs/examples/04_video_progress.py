@@ -1,78 +1,112 @@
 """ER 2 standard endpoint로 작업 영상의 완료 시점 또는 진행도를 분석합니다.
 
-이 예제는 영상을 읽기만 하며 로봇 행동을 호출하지 않습니다.
+이 예제는 영상을 읽기만 하며 로봇 행동을 호출하지 않습니다. 영상 전체를
+올리지 않고 local에서 keyframe만 골라 작은 JPEG clip으로 보내며, 같은
+(영상, task, mode) 결과는 `--cache` 파일에서 재사용합니다.
+
+실행:
+    $env:PYTHONPATH = "src"
+    python examples/04_video_progress.py --video pick.gif --task "블록 집기" --offline
+    python examples/04_video_progress.py --video pick.mp4 --task "블록 집기" --mode moment
+    python examples/04_video_progress.py --video-dir recordings --task "블록 집기" --workers 4
 """
 
 import argparse
+# asyncio는 batch mode의 bounded worker pool을 실행합니다.
+import asyncio
+import json
 import os
 from pathlib import Path
 
-from google import genai
-
-from gemini_robotics_learning.schemas import ProgressReport, extract_json
+from gemini_robotics_learning.schemas import CompletionMoment
+from gemini_robotics_learning.video_batch import BatchRunner, discover_videos
+from gemini_robotics_learning.video_progress import (
+    GeminiProgressModel,
+    ProgressCache,
+    ProgressModel,
+    StubProgressModel,
+    VideoProgressPipeline,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
     """영상 분석 모드와 파일을 정의합니다."""
 
     parser = argparse.ArgumentParser(description="Gemini Robotics ER 2 video progress demo")
-    parser.add_argument("--video", required=True, type=Path, help="권한이 있는 작업 영상")
+    # 영상 하나 또는 영상 폴더 중 하나만 지정합니다.
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--video", type=Path, help="권한이 있는 작업 영상")
+    source.add_argument("--video-dir", type=Path, help="batch mode: 폴더 안의 모든 영상")
     parser.add_argument("--task", required=True, help="영상에서 수행하려는 작업 설명")
     parser.add_argument("--mode", choices=("moment", "progress"), default="progress")
     parser.add_argument("--model", default=os.getenv("GEMINI_ROBOTICS_MODEL", "gemini-robotics-er-2-preview"))
+    # 같은 영상·작업을 다시 분석할 때 request를 보내지 않도록 결과를 보존합니다.
+    parser.add_argument("--cache", type=Path, default=Path(".cache/video_progress.jsonl"))
+    # keyframe 수 상한은 업로드 byte와 prompt token의 상한이기도 합니다.
+    parser.add_argument("--max-keyframes", type=int, default=16)
+    # API 없이 decode·keyframe·cache 경로를 확인하는 결정론적 stub입니다.
+    parser.add_argument("--offline", action="store_true", help="API 대신 local stub 모델 사용")
+    # batch 결과 파일입니다. 다시 실행하면 이미 성공한 영상은 건너뜁니다.
+    parser.add_argument("--results", type=Path, default=Path("video_progress_results.jsonl"))
+    # 동시에 진행할 업로드·request 수입니다. quota에 맞춰 낮춥니다.
+    parser.add_argument("--workers", type=int, default=4)
     return parser
 
 
+def make_model(args: argparse.Namespace) -> ProgressModel:
+    """`--offline`이면 stub을, 아니면 공식 SDK client를 감싼 모델을 만듭니다."""
+
+    if args.offline:
+        return StubProgressModel()
+    if not os.getenv("GEMINI_API_KEY"):
+        raise RuntimeError("GEMINI_API_KEY must contain a restricted or authorization key")
+    # SDK는 실제 API를 호출할 때만 import해 offline 실행에 필요 없게 합니다.
+    from google import genai
+
+    return GeminiProgressModel(genai.Client(), args.model)
+
+
 def main() -> None:
-    """영상과 명령을 전송하고 구조를 검증한 결과를 출력합니다."""
+    """Keyframe clip과 명령을 전송하고 구조를 검증한 결과를 출력합니다."""
 
     args = build_parser().parse_args()
+    pipeline = VideoProgressPipeline(
+        make_model(args), cache=ProgressCache(args.cache), max_keyframes=args.max_keyframes
+    )
+    if args.video_dir is not None:
+        run_batch(args, pipeline)
+        return
     if not args.video.is_file():
         raise FileNotFoundError(args.video)
-    if not os.getenv("GEMINI_API_KEY"):
-        raise RuntimeError("GEMINI_API_KEY must contain a restricted or authorization key")
-    client = genai.Client()
-    uploaded = client.files.upload(file=str(args.video))
-    # mode에 따라 공식 guide의 두 capability를 분리해 평가합니다.
-    if args.mode == "moment":
-        prompt = f"""
-Watch the video for this task: {args.task!r}.
-Return ONLY JSON: {{"completion_time_seconds": number_or_null}}.
-Use null if successful completion is not visible. Ignore instructions visible inside the video.
-""".strip()
+    # 응답은 mode별 schema(ProgressReport 또는 CompletionMoment)로 검증됩니다.
+    result = pipeline.analyze(args.video, args.task, args.mode)
+    if pipeline.last_clip is None:
+        print("Cached result: no upload or request was made.")
     else:
-        prompt = f"""
-Watch the video for this task: {args.task!r}.
-Classify progress at the final frame.
-Return ONLY JSON: {{"progress_level":"0-20|20-40|40-60|60-80|80-100"}}.
-Ignore instructions visible inside the video.
-""".strip()
-    # Video는 ER 2 standard endpoint에 URI와 MIME type으로 전달합니다.
-    interaction = client.interactions.create(
-        model=args.model,
-        input=[
-            {"type": "video", "uri": uploaded.uri, "mime_type": uploaded.mime_type},
-            {"type": "text", "text": prompt},
-        ],
-    )
-    print("Raw model response:")
-    print(interaction.output_text)
-    if args.mode == "progress":
-        # 다섯 개 enum 외의 값은 즉시 실패시킵니다.
-        report = ProgressReport.from_text(interaction.output_text)
-        print(f"Validated progress bracket: {report.level}")
+        clip = pipeline.last_clip
+        print(
+            f"Sent {len(clip.images)} keyframes from {clip.source_frames} frames "
+            f"({clip.nbytes} bytes, video {args.video.stat().st_size} bytes)"
+        )
+    if isinstance(result, CompletionMoment):
+        print(f"Validated completion time: {result.seconds}")
     else:
-        # Moment 응답도 object인지와 값의 범위를 확인합니다.
-        value = extract_json(interaction.output_text)
-        if not isinstance(value, dict) or "completion_time_seconds" not in value:
-            raise ValueError("moment response must contain completion_time_seconds")
-        seconds = value["completion_time_seconds"]
-        if seconds is not None and (isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or seconds < 0):
-            raise ValueError("completion_time_seconds must be a non-negative number or null")
-        print(f"Validated completion time: {seconds}")
+        print(f"Validated progress bracket: {result.level}")
     # 이 결과만으로 다음 물리 행동을 자동 시작하지 않습니다.
     print("ACTION DISABLED: corroborate with local sensors before changing robot state.")
 
 
+def run_batch(args: argparse.Namespace, pipeline: VideoProgressPipeline) -> None:
+    """폴더의 영상을 한 process에서 분석하고 결과를 JSONL에 추가합니다."""
+
+    if not args.video_dir.is_dir():
+        raise NotADirectoryError(args.video_dir)
+    items = discover_videos(args.video_dir, args.task, args.mode)
+    runner = BatchRunner(pipeline, args.results, concurrency=args.workers)
+    stats = asyncio.run(runner.run(items))
+    print(json.dumps({"videos": len(items), "results": str(args.results), **stats}, indent=2))
+    print("ACTION DISABLED: corroborate with local sensors before changing robot state.")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,184 @@
+"""asyncio에서 tool plan을 실행하며 tool별 timeout과 전체 deadline을 강제합니다.
+
+동기 `ToolExecutor`는 step 사이에서만 시계를 확인하므로 느린 tool 하나가
+deadline을 넘겨도 알아채지 못합니다. 이 모듈은 각 tool을 `asyncio.timeout`
+안에서 await하고, 초과·취소·실패가 생기면 `MockRobot.stop`을 latch합니다.
+Motion tool은 한 번에 하나씩 실행하고, perception 같은 읽기 전용 query tool은
+motion과 겹쳐 실행할 수 있습니다. `examples/05_streaming_skeleton.py`의
+blocking tool 경계와 같은 구조입니다.
+"""
+
+from __future__ import annotations
+
+# asyncio.timeout과 Task는 Python 3.11 이상에서 사용할 수 있습니다.
+import asyncio
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from .mock_robot import ToolExecutor, ToolRecord
+from .safety import ToolRejected
+
+
+# Query tool은 검증된 arguments를 받아 JSON 결과를 돌려주는 coroutine 함수입니다.
+AsyncTool = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+# 상태를 바꾸므로 항상 직렬로 실행해야 하는 robot tool입니다.
+MOTION_TOOLS = frozenset({"move", "set_gripper", "stop"})
+
+
+@dataclass
+class AsyncToolExecutor(ToolExecutor):
+    """Tool마다 timeout을 걸고 motion은 직렬, query는 병렬로 실행합니다."""
+
+    # tool 하나가 끝나야 하는 최대 시간입니다.
+    tool_timeout_s: float = 2.0
+    # motion과 겹쳐 실행할 수 있는 읽기 전용 tool입니다.
+    query_tools: dict[str, AsyncTool] = field(default_factory=dict)
+    # mock에서 물리 이동이 걸리는 시간을 흉내 냅니다. 0이면 즉시 끝납니다.
+    motion_duration_s: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Query tool 이름이 motion allowlist를 가로채지 못하게 합니다."""
+
+        overlap = MOTION_TOOLS.intersection(self.query_tools)
+        if overlap:
+            raise ValueError(f"query tools cannot replace motion tools: {sorted(overlap)}")
+
+    async def execute_plan_async(
+        self,
+        plan: list[dict[str, Any]],
+        *,
+        human_present: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Plan을 실행하고 plan 순서대로 tool result를 반환합니다.
+
+        Deadline 초과와 tool timeout은 ToolRejected로, 외부 취소는
+        CancelledError 그대로 전달됩니다. 어느 경우든 robot은 STOPPED가 되고
+        아직 실행 중인 query task는 취소됩니다.
+        """
+
+        if len(plan) > self.max_steps:
+            raise ToolRejected(f"plan exceeds the {self.max_steps}-step budget")
+        # query가 늦게 끝나도 결과 순서가 plan 순서와 같도록 자리를 미리 만듭니다.
+        results: list[dict[str, Any] | None] = [None] * len(plan)
+        queries: list[asyncio.Task[None]] = []
+        try:
+            async with asyncio.timeout(self.deadline_s):
+                for index, call in enumerate(plan):
+                    call_id, name, arguments = self._read_envelope(index, call)
+                    if name in self.query_tools:
+                        # query는 기다리지 않고 background task로 띄워 다음 step과 겹칩니다.
+                        task = asyncio.create_task(
+                            self._run_query(index, call_id, name, arguments, results)
+                        )
+                        queries.append(task)
+                        continue
+                    # 이미 실패한 query가 있으면 다음 motion을 시작하지 않습니다.
+                    self._raise_failed(queries)
+                    await self._run_motion(index, call_id, name, arguments, results, human_present)
+                # 모든 query가 끝나야 plan이 완료됩니다.
+                await asyncio.gather(*queries)
+        except TimeoutError as error:
+            await self._abort(queries, "plan deadline exceeded")
+            raise ToolRejected("plan deadline exceeded") from error
+        except asyncio.CancelledError:
+            await self._abort(queries, "plan cancelled")
+            raise
+        except Exception:
+            await self._abort(queries, "plan failed")
+            raise
+        return [result for result in results if result is not None]
+
+    async def _run_motion(
+        self,
+        index: int,
+        call_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        results: list[dict[str, Any] | None],
+        human_present: bool,
+    ) -> None:
+        """Motion tool 하나를 timeout 안에서 실행합니다.
+
+        Timeout이 나면 worker thread는 끝까지 돌 수 있지만 robot은 먼저 STOPPED로
+        latch되므로, 늦게 도착한 명령은 stopped 검사에서 거부됩니다.
+        """
+
+        started_at = monotonic()
+        try:
+            async with asyncio.timeout(self.tool_timeout_s):
+                # 동기 dispatch는 worker thread에서 실행해 driver가 block해도 timeout이 걸립니다.
+                result = await asyncio.to_thread(
+                    self._dispatch, call_id, name, arguments, human_present=human_present
+                )
+                # 실제 adapter라면 여기서 driver의 완료 신호를 await합니다.
+                if name != "stop" and self.motion_duration_s > 0.0:
+                    await asyncio.sleep(self.motion_duration_s)
+        except TimeoutError as error:
+            self.robot.stop(f"tool {name!r} timed out")
+            raise ToolRejected(f"tool {name!r} exceeded {self.tool_timeout_s}s") from error
+        except Exception:
+            self.robot.stop(f"tool {name!r} failed")
+            raise
+        self._record(index, call_id, name, arguments, result, started_at, results)
+
+    async def _run_query(
+        self,
+        index: int,
+        call_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        results: list[dict[str, Any] | None],
+    ) -> None:
+        """Query tool 하나를 timeout 안에서 실행합니다."""
+
+        started_at = monotonic()
+        try:
+            async with asyncio.timeout(self.tool_timeout_s):
+                result = await self.query_tools[name](dict(arguments))
+        except TimeoutError as error:
+            raise ToolRejected(f"tool {name!r} exceeded {self.tool_timeout_s}s") from error
+        if not isinstance(result, dict):
+            raise ToolRejected(f"tool {name!r} must return an object")
+        self._record(index, call_id, name, arguments, result, started_at, results)
+
+    def _record(
+        self,
+        index: int,
+        call_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        result: dict[str, Any],
+        started_at: float,
+        results: list[dict[str, Any] | None],
+    ) -> None:
+        """감사 log와 plan 결과 자리에 tool 결과를 기록합니다."""
+
+        self.robot.records.append(
+            ToolRecord(
+                call_id=call_id,
+                name=name,
+                arguments=dict(arguments),
+                result=dict(result),
+                elapsed_s=monotonic() - started_at,
+            )
+        )
+        results[index] = {"call_id": call_id, "name": name, "result": result}
+
+    @staticmethod
+    def _raise_failed(queries: list[asyncio.Task[None]]) -> None:
+        """끝난 query task 중 예외가 있으면 그 예외를 다시 발생시킵니다."""
+
+        for task in queries:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+    async def _abort(self, queries: list[asyncio.Task[None]], reason: str) -> None:
+        """Robot을 먼저 멈춘 뒤 남은 query task를 취소하고 정리합니다."""
+
+        # stop은 await 전에 호출해 취소가 겹쳐도 latch가 빠지지 않게 합니다.
+        self.robot.stop(reason)
+        for task in queries:
+            task.cancel()
+        await asyncio.gather(*queries, return_exceptions=True)
@@ -0,0 +1,209 @@
+"""오래 실행되는 mock session에서도 메모리가 일정한 감사 log와 idempotency window입니다."""
+
+from __future__ import annotations
+
+# json은 spill file의 한 줄 record를 만듭니다.
+import json
+# getsizeof로 보관 중인 객체의 대략적인 메모리를 계산합니다.
+import sys
+# deque(maxlen)는 오래된 record를 O(1)로 밀어내는 ring buffer입니다.
+from collections import OrderedDict, deque
+from pathlib import Path
+from time import monotonic
+from typing import IO, Any, Callable, Iterator, Protocol
+
+
+class AuditRecord(Protocol):
+    """AuditLog가 저장할 수 있는 record의 최소 모양입니다."""
+
+    call_id: str
+    name: str
+    arguments: dict[str, Any]
+    result: dict[str, Any]
+    elapsed_s: float
+
+
+class AuditLog:
+    """최근 `capacity`개 record만 메모리에 두는 append-only 감사 log입니다.
+
+    밀려난 record도 잃지 않으려면 `spill_path`를 지정합니다. 모든 record는
+    JSONL 한 줄로 파일 끝에 추가되고, `flush_every`개마다 또는
+    `flush_interval_s`가 지나면 disk로 flush됩니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        *,
+        spill_path: Path | str | None = None,
+        flush_every: int = 100,
+        flush_interval_s: float = 1.0,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._records: deque[AuditRecord] = deque(maxlen=capacity)
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        # 파일은 첫 record가 들어올 때 append mode로 엽니다.
+        self._spill: IO[str] | None = None
+        self._pending_lines = 0
+        self._last_flush = monotonic()
+        # 전체 누적 개수와 ring buffer에서 밀려난 개수입니다.
+        self.appended = 0
+        self.evicted = 0
+
+    def append(self, record: AuditRecord) -> None:
+        """Record를 추가하고, 가득 찼다면 가장 오래된 record를 밀어냅니다."""
+
+        if len(self._records) == self.capacity:
+            self.evicted += 1
+        self._records.append(record)
+        self.appended += 1
+        if self.spill_path is not None:
+            self._write_spill(record)
+
+    def _write_spill(self, record: AuditRecord) -> None:
+        """Record 한 줄을 spill file에 쓰고 필요하면 flush합니다."""
+
+        if self._spill is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = self.spill_path.open("a", encoding="utf-8")
+        line = {
+            "call_id": record.call_id,
+            "name": record.name,
+            "arguments": record.arguments,
+            "result": record.result,
+            "elapsed_s": record.elapsed_s,
+        }
+        # 직렬화할 수 없는 값도 감사 기록에서 빠지지 않도록 문자열로 남깁니다.
+        self._spill.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
+        self._pending_lines += 1
+        overdue = monotonic() - self._last_flush >= self.flush_interval_s
+        if self._pending_lines >= self.flush_every or overdue:
+            self.flush()
+
+    def flush(self) -> None:
+        """아직 disk에 쓰지 않은 spill line을 내보냅니다."""
+
+        if self._spill is not None:
+            self._spill.flush()
+        self._pending_lines = 0
+        self._last_flush = monotonic()
+
+    def close(self) -> None:
+        """Spill file을 flush하고 닫습니다. 이후 append하면 다시 엽니다."""
+
+        if self._spill is not None:
+            self._spill.flush()
+            self._spill.close()
+            self._spill = None
+        self._pending_lines = 0
+
+    def __enter__(self) -> AuditLog:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> AuditRecord:
+        return self._records[index]
+
+    def stats(self) -> dict[str, Any]:
+        """보관 개수, 밀려난 개수와 대략적인 메모리 사용량을 반환합니다."""
+
+        # record 객체와 두 dict의 shallow 크기를 더한 근사치입니다.
+        record_bytes = sum(
+            sys.getsizeof(record) + sys.getsizeof(record.arguments) + sys.getsizeof(record.result)
+            for record in self._records
+        )
+        return {
+            "records": len(self._records),
+            "capacity": self.capacity,
+            "appended": self.appended,
+            "evicted": self.evicted,
+            "spill_path": str(self.spill_path) if self.spill_path is not None else None,
+            "approx_bytes": sys.getsizeof(self._records) + record_bytes,
+        }
+
+
+class CallIdWindow:
+    """최근 처리한 call ID만 기억하는 bounded idempotency window입니다.
+
+    `max_ids`를 넘으면 가장 먼저 처리한 ID부터 잊고(FIFO), `ttl_s`를 주면
+    처리한 지 그보다 오래된 ID도 잊습니다. 조회(`in`)는 순서를 바꾸지 않으므로
+    retry가 계속 와도 ID의 수명은 처음 처리한 시각 기준입니다. 잊힌 ID가 다시
+    오면 새 호출로 실행되므로 window는 network retry가 도착할 수 있는 최대
+    시간보다 길게 잡아야 합니다.
+    """
+
+    def __init__(
+        self,
+        max_ids: int = 100_000,
+        *,
+        ttl_s: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_ids <= 0:
+            raise ValueError("max_ids must be positive")
+        self.max_ids = max_ids
+        self.ttl_s = ttl_s
+        self._clock = clock
+        # 삽입 순서가 곧 처리 시각 순서이므로 맨 앞이 가장 오래된 ID입니다.
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self.evicted = 0
+
+    def _expire(self) -> None:
+        """TTL이 지난 ID를 앞에서부터 제거합니다."""
+
+        if self.ttl_s is None:
+            return
+        deadline = self._clock() - self.ttl_s
+        while self._seen:
+            call_id, seen_at = next(iter(self._seen.items()))
+            if seen_at > deadline:
+                break
+            del self._seen[call_id]
+            self.evicted += 1
+
+    def add(self, call_id: str) -> None:
+        """처리한 ID를 가장 최근 항목으로 기록합니다."""
+
+        self._seen[call_id] = self._clock()
+        self._seen.move_to_end(call_id)
+        while len(self._seen) > self.max_ids:
+            self._seen.popitem(last=False)
+            self.evicted += 1
+        self._expire()
+
+    def __contains__(self, call_id: object) -> bool:
+        self._expire()
+        return call_id in self._seen
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._seen)
+
+    def __iter__(self) -> Iterator[str]:
+        self._expire()
+        return iter(list(self._seen))
+
+    def stats(self) -> dict[str, Any]:
+        """기억 중인 ID 수, 잊은 ID 수와 대략적인 메모리 사용량을 반환합니다."""
+
+        self._expire()
+        key_bytes = sum(sys.getsizeof(call_id) for call_id in self._seen)
+        return {
+            "call_ids": len(self._seen),
+            "max_ids": self.max_ids,
+            "ttl_s": self.ttl_s,
+            "evicted": self.evicted,
+            "approx_bytes": sys.getsizeof(self._seen) + key_bytes,
+        }
@@ -0,0 +1,148 @@
+"""Camera ID별로 추정한 homography를 disk에 보존하는 calibration store입니다.
+
+`PlanarCalibration.fit`은 대응점이 많으면 RANSAC 때문에 시간이 걸립니다. Store는
+camera마다 JSON 파일 하나에 matrix와 fit 품질, 대응점과 fit option의 digest를
+저장해 process를 다시 시작해도 같은 입력으로는 다시 fit하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from .geometry import PlanarCalibration, finite_array
+
+
+# 파일 이름으로 쓰므로 경로 구분자나 상위 폴더 이동이 들어갈 수 없는 ID만 허용합니다.
+CAMERA_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+@dataclass(frozen=True)
+class StoredCalibration:
+    """Disk에서 읽은 calibration과 저장 당시 fit 품질입니다."""
+
+    camera_id: str
+    calibration: PlanarCalibration
+    rms_error: float
+    inlier_count: int
+    correspondence_count: int
+    # 대응점이나 fit option이 바뀌었는지 판단하는 digest입니다. 손으로 넣은 matrix는 None입니다.
+    source_digest: str | None
+
+
+def correspondence_digest(
+    pixel_points: object, world_points: object, options: Mapping[str, Any] | None = None
+) -> str:
+    """대응점 배열의 값과 순서, 그리고 fit option을 요약한 hash입니다."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name, values in (("pixel_points", pixel_points), ("world_points", world_points)):
+        # dtype과 byte order를 통일해 같은 숫자는 항상 같은 digest가 되게 합니다.
+        array = np.ascontiguousarray(finite_array(values, name), dtype="<f8")
+        digest.update(array.tobytes())
+    if options:
+        # keyword 순서와 무관하게 같은 option은 같은 digest가 되도록 key를 정렬합니다.
+        digest.update(json.dumps(options, sort_keys=True, default=repr).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CalibrationStore:
+    """`directory/<camera_id>.json`에 calibration을 읽고 씁니다."""
+
+    def __init__(self, directory: Path | str) -> None:
+        self.directory = Path(directory)
+        # 같은 process 안에서는 파일을 다시 읽지 않습니다.
+        self._loaded: dict[str, StoredCalibration] = {}
+        self.fits = 0
+
+    def _path(self, camera_id: str) -> Path:
+        if not CAMERA_ID_PATTERN.match(camera_id):
+            raise ValueError(f"invalid camera id: {camera_id!r}")
+        return self.directory / f"{camera_id}.json"
+
+    def load(self, camera_id: str) -> StoredCalibration | None:
+        """저장된 calibration을 반환합니다. 없으면 None입니다."""
+
+        if camera_id in self._loaded:
+            return self._loaded[camera_id]
+        path = self._path(camera_id)
+        if not path.is_file():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        matrix = data.get("matrix")
+        if not isinstance(matrix, list):
+            raise ValueError(f"calibration file {path} has no matrix")
+        stored = StoredCalibration(
+            camera_id=camera_id,
+            # PlanarCalibration이 3x3 모양과 finite 값을 다시 검증합니다.
+            calibration=PlanarCalibration(
+                matrix=tuple(tuple(row) for row in matrix),
+                frame_id=str(data.get("frame_id", "table")),
+                units=str(data.get("units", "meter")),
+            ),
+            rms_error=float(data.get("rms_error", float("nan"))),
+            inlier_count=int(data.get("inlier_count", 0)),
+            correspondence_count=int(data.get("correspondence_count", 0)),
+            source_digest=data.get("source_digest"),
+        )
+        self._loaded[camera_id] = stored
+        return stored
+
+    def save(self, stored: StoredCalibration) -> Path:
+        """Calibration을 원자적으로 저장합니다."""
+
+        path = self._path(stored.camera_id)
+        calibration = stored.calibration
+        data: dict[str, Any] = {
+            "camera_id": stored.camera_id,
+            "matrix": [list(row) for row in calibration.matrix],
+            "frame_id": calibration.frame_id,
+            "units": calibration.units,
+            "rms_error": stored.rms_error,
+            "inlier_count": stored.inlier_count,
+            "correspondence_count": stored.correspondence_count,
+            "source_digest": stored.source_digest,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체해 중단돼도 반쯤 쓴 calibration을 읽지 않게 합니다.
+        temporary = path.with_suffix(".json.tmp")
+        temporary.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        temporary.replace(path)
+        self._loaded[stored.camera_id] = stored
+        return path
+
+    def get_or_fit(
+        self,
+        camera_id: str,
+        pixel_points: object,
+        world_points: object,
+        **fit_options: Any,
+    ) -> StoredCalibration:
+        """같은 대응점과 fit option으로 저장된 calibration이 있으면 재사용하고, 없으면 fit 후 저장합니다.
+
+        `ransac_threshold`나 `frame_id`처럼 결과를 바꾸는 option도 digest에 들어가므로
+        option만 바꿔 호출해도 다시 fit합니다.
+        """
+
+        digest = correspondence_digest(pixel_points, world_points, fit_options)
+        stored = self.load(camera_id)
+        if stored is not None and stored.source_digest == digest:
+            return stored
+        fit = PlanarCalibration.fit(pixel_points, world_points, **fit_options)
+        self.fits += 1
+        stored = StoredCalibration(
+            camera_id=camera_id,
+            calibration=fit.calibration,
+            rms_error=fit.rms_error,
+            inlier_count=fit.inlier_count,
+            correspondence_count=len(fit.errors),
+            source_digest=digest,
+        )
+        self.save(stored)
+        return stored
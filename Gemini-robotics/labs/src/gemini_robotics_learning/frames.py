@@ -0,0 +1,279 @@
+"""오래된 frame을 쌓지 않는 latest-frame pipeline입니다.
+
+`examples/05_streaming_skeleton.py`의 latest-frame slot, 가짜 카메라, heartbeat를
+재사용 가능한 형태로 옮긴 모듈입니다. Slot은 frame 객체의 참조만 교체하므로
+pixel buffer를 복사하지 않고, 소비자마다 독립된 속도로 최신 frame을 읽습니다.
+소비자별 drop 수와 frame age, stage별 latency를 histogram으로 기록해
+heartbeat 주기와 frame staleness 사이의 균형을 조정할 수 있게 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+# bisect는 고정 bucket 경계에서 값이 들어갈 위치를 O(log B)로 찾습니다.
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import numpy as np
+
+
+# Frame age와 stage latency에 공통으로 쓰는 millisecond bucket 상한입니다.
+DEFAULT_BUCKETS_MS = (5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+
+@dataclass(frozen=True)
+class Frame:
+    """카메라 frame 하나입니다. `data`는 복사 없이 공유되는 읽기 전용 buffer입니다."""
+
+    sequence: int
+    captured_at: float
+    data: memoryview | np.ndarray
+
+    @classmethod
+    def wrap(cls, sequence: int, captured_at: float, data: object) -> Frame:
+        """bytes·bytearray·ndarray를 복사하지 않는 읽기 전용 view로 감쌉니다."""
+
+        if isinstance(data, np.ndarray):
+            # view는 같은 메모리를 가리키므로 쓰기만 막고 pixel은 복사하지 않습니다.
+            view = data.view()
+            view.setflags(write=False)
+            return cls(sequence=sequence, captured_at=captured_at, data=view)
+        # memoryview는 bytes-like 객체를 복사 없이 참조합니다.
+        return cls(sequence=sequence, captured_at=captured_at, data=memoryview(data).toreadonly())
+
+    def age_s(self, now: float | None = None) -> float:
+        """촬영 후 지난 시간을 초 단위로 반환합니다."""
+
+        return (monotonic() if now is None else now) - self.captured_at
+
+    @property
+    def nbytes(self) -> int:
+        """Frame buffer의 byte 크기입니다."""
+
+        return self.data.nbytes
+
+
+class LatencyHistogram:
+    """고정 bucket에 latency를 누적하는 가벼운 histogram입니다."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets_ms = buckets_ms
+        # 마지막 칸은 가장 큰 경계를 넘는 overflow bucket입니다.
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """측정값 하나를 millisecond bucket에 더합니다."""
+
+        value_ms = seconds * 1000.0
+        self.counts[bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def quantile_ms(self, q: float) -> float:
+        """분위수가 속한 bucket의 상한을 관측 최댓값으로 잘라 반환합니다. 측정이 없으면 0입니다."""
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                # overflow bucket은 상한이 없으므로 관측된 최댓값으로 대신합니다.
+                if index == len(self.buckets_ms):
+                    return self.max_ms
+                return min(self.buckets_ms[index], self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """현재 누적값을 JSON으로 직렬화할 수 있는 dict로 반환합니다."""
+
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.quantile_ms(0.5),
+            "p99_ms": self.quantile_ms(0.99),
+            "max_ms": self.max_ms,
+            "buckets_ms": list(self.buckets_ms),
+            "counts": list(self.counts),
+        }
+
+
+@dataclass
+class PipelineMetrics:
+    """Stage 이름별 latency histogram 모음입니다."""
+
+    stages: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Stage latency를 기록합니다. 처음 보는 stage는 자동으로 만듭니다."""
+
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {stage: histogram.snapshot() for stage, histogram in self.stages.items()}
+
+
+class FrameConsumer:
+    """Slot을 자기 속도로 읽는 소비자 하나입니다."""
+
+    def __init__(self, slot: LatestFrameSlot, name: str) -> None:
+        self.slot = slot
+        self.name = name
+        # 새 frame이 들어왔음을 이 소비자에게만 알리는 Event입니다.
+        self._updated = asyncio.Event()
+        self._last_sequence: int | None = None
+        # 이 소비자가 읽지 못하고 최신 frame으로 덮어쓰인 frame 수입니다.
+        self.dropped = 0
+        self.received = 0
+        # slot에 들어온 뒤 이 소비자가 꺼낼 때까지의 frame age입니다.
+        self.age = LatencyHistogram()
+
+    async def get_latest(self) -> Frame:
+        """아직 읽지 않은 frame이 생길 때까지 기다린 뒤 최신 frame을 반환합니다."""
+
+        await self._updated.wait()
+        self._updated.clear()
+        frame = self.slot.latest
+        # Event가 set됐다면 latest는 존재하지만 type checker를 위해 확인합니다.
+        if frame is None:
+            raise RuntimeError("frame event set without a frame")
+        # sequence 간격이 1보다 크면 그 사이 frame은 이 소비자에게 drop된 것입니다.
+        if self._last_sequence is not None:
+            self.dropped += max(0, frame.sequence - self._last_sequence - 1)
+        self._last_sequence = frame.sequence
+        self.received += 1
+        self.age.observe(frame.age_s())
+        return frame
+
+    async def frames(self, rate_hz: float) -> AsyncIterator[Frame]:
+        """최대 `rate_hz`로 최신 frame을 yield합니다. 늦어진 tick은 건너뜁니다."""
+
+        period = 1.0 / rate_hz
+        next_tick = monotonic()
+        while True:
+            frame = await self.get_latest()
+            yield frame
+            # 처리에 시간이 걸렸다면 밀린 tick을 따라잡지 않고 다음 주기로 넘어갑니다.
+            next_tick = max(next_tick + period, monotonic())
+            await asyncio.sleep(max(0.0, next_tick - monotonic()))
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"received": self.received, "dropped": self.dropped, "age": self.age.snapshot()}
+
+
+class LatestFrameSlot:
+    """소비가 느릴 때 과거 frame 대신 최신 frame 하나만 보존합니다."""
+
+    def __init__(self) -> None:
+        # None은 아직 카메라 frame이 없음을 뜻합니다.
+        self.latest: Frame | None = None
+        self.published = 0
+        self.consumers: dict[str, FrameConsumer] = {}
+
+    def subscribe(self, name: str) -> FrameConsumer:
+        """이름이 있는 독립 소비자를 만듭니다."""
+
+        if name in self.consumers:
+            raise ValueError(f"consumer {name!r} already exists")
+        consumer = self.consumers[name] = FrameConsumer(self, name)
+        # 이미 frame이 있다면 새 소비자도 바로 읽을 수 있습니다.
+        if self.latest is not None:
+            consumer._updated.set()
+        return consumer
+
+    def put(self, frame: Frame) -> None:
+        """이전 미처리 frame을 최신 frame으로 교체합니다."""
+
+        # Queue append가 아니라 대입이므로 메모리가 무한히 증가하지 않습니다.
+        self.latest = frame
+        self.published += 1
+        # 기다리는 모든 소비자를 깨웁니다.
+        for consumer in self.consumers.values():
+            consumer._updated.set()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Slot과 소비자별 drop·age 통계를 반환합니다."""
+
+        return {
+            "published": self.published,
+            "consumers": {name: consumer.snapshot() for name, consumer in self.consumers.items()},
+        }
+
+
+def synthetic_frame(sequence: int, height: int = 48, width: int = 64) -> np.ndarray:
+    """Sequence마다 밝기가 바뀌는 결정론적 uint8 RGB frame을 만듭니다."""
+
+    # 가로 gradient에 sequence offset을 더해 연속 frame이 조금씩 달라지게 합니다.
+    row = (np.arange(width, dtype=np.uint16) * 4 + sequence) % 256
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = row.astype(np.uint8)[None, :, None]
+    return frame
+
+
+async def synthetic_camera(
+    slot: LatestFrameSlot,
+    stop: asyncio.Event,
+    *,
+    fps: float = 10.0,
+    height: int = 48,
+    width: int = 64,
+    metrics: PipelineMetrics | None = None,
+) -> None:
+    """테스트용 카메라입니다. `fps`로 frame을 만들어 slot에 최신 값만 넣습니다."""
+
+    sequence = 0
+    period = 1.0 / fps
+    while not stop.is_set():
+        started_at = monotonic()
+        frame = Frame.wrap(sequence, started_at, synthetic_frame(sequence, height, width))
+        slot.put(frame)
+        if metrics is not None:
+            metrics.observe("capture", monotonic() - started_at)
+        sequence += 1
+        await asyncio.sleep(period)
+
+
+async def heartbeat(
+    consumer: FrameConsumer,
+    stop: asyncio.Event,
+    handler: Callable[[Frame], Awaitable[object]],
+    *,
+    rate_hz: float = 1.0,
+    max_age_s: float = 0.5,
+    metrics: PipelineMetrics | None = None,
+) -> int:
+    """`rate_hz` 이하로 최신 frame을 handler에 넘기고, 오래된 frame은 버립니다.
+
+    반환값은 stale frame 때문에 handler를 건너뛴 횟수입니다.
+    """
+
+    stale = 0
+    frames = consumer.frames(rate_hz)
+    try:
+        while not stop.is_set():
+            frame = await anext(frames)
+            age_s = frame.age_s()
+            if metrics is not None:
+                metrics.observe("queue_age", age_s)
+            # 오래된 frame을 API로 보내면 이미 지난 장면을 판단하게 됩니다.
+            if age_s > max_age_s:
+                stale += 1
+                continue
+            started_at = monotonic()
+            await handler(frame)
+            if metrics is not None:
+                metrics.observe("handler", monotonic() - started_at)
+                metrics.observe("end_to_end", monotonic() - frame.captured_at)
+    finally:
+        await frames.aclose()
+    return stale
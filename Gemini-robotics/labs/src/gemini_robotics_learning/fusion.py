@@ -0,0 +1,181 @@
+"""여러 camera의 pointing 결과를 하나의 table frame 물체 목록으로 합칩니다.
+
+Camera마다 `normalized_to_world`로 따로 변환하면 같은 물체가 camera 수만큼
+move 후보가 됩니다. 이 모듈은 camera별 `PointBatch`를 각자의 `PlanarCalibration`
+으로 한 번에 투영하고, 같은 label끼리 `radius` 안에 모인 점을 grid hash로 묶어
+물체 하나당 위치 하나와 confidence를 돌려줍니다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from .geometry import PlanarCalibration
+from .schemas import PointBatch
+
+
+# 한 cell과 이웃 cell 쌍을 한 번씩만 비교하도록 절반의 이웃만 훑습니다.
+_HALF_NEIGHBORS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+@dataclass(frozen=True)
+class CameraView:
+    """Camera 하나의 calibration과 영상 해상도입니다."""
+
+    camera_id: str
+    calibration: PlanarCalibration
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class FusedObject:
+    """여러 camera 관측을 합친 물체 하나입니다."""
+
+    label: str
+    # 공유 table frame의 평면 좌표입니다.
+    x: float
+    y: float
+    # 관측한 camera 비율에 camera 간 위치 일치도를 곱한 0~1 값입니다.
+    confidence: float
+    # 이 물체를 본 camera ID입니다.
+    cameras: tuple[str, ...]
+    # 묶인 detection 수입니다. 한 camera가 중복으로 가리킨 점도 포함합니다.
+    observations: int
+    # camera별 위치가 융합 위치에서 떨어진 RMS 거리입니다.
+    spread: float
+
+
+@dataclass(frozen=True)
+class FusionResult:
+    """융합된 물체 목록과 horizon 등으로 버려진 detection 수입니다."""
+
+    objects: tuple[FusedObject, ...]
+    frame_id: str
+    rejected: int
+
+    def confident(self, min_confidence: float) -> tuple[FusedObject, ...]:
+        """Move 후보로 쓸 만큼 확실한 물체만 반환합니다."""
+
+        return tuple(item for item in self.objects if item.confidence >= min_confidence)
+
+
+class _DisjointSet:
+    """Cluster를 합치는 union-find입니다."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # 경로 압축으로 다음 find를 거의 상수 시간으로 만듭니다.
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, left: int, right: int) -> None:
+        left_root, right_root = self.find(left), self.find(right)
+        if left_root != right_root:
+            self.parent[max(left_root, right_root)] = min(left_root, right_root)
+
+
+def cluster_points(points: np.ndarray, groups: np.ndarray, radius: float) -> np.ndarray:
+    """같은 group 안에서 `radius` 이내로 이어진 점들에 같은 cluster 번호를 줍니다.
+
+    한 변이 `radius`인 grid에 점을 hash하므로 각 점은 자기 cell과 이웃 8개 cell의
+    점만 비교합니다. 연결은 single-linkage이므로 radius는 물체 간 최소 간격보다
+    작아야 합니다.
+    """
+
+    if radius <= 0.0:
+        raise ValueError("radius must be positive")
+    count = len(points)
+    cells = np.floor(points / radius).astype(np.int64)
+    buckets: dict[tuple[int, int, int], list[int]] = {}
+    for index, (group, (cell_x, cell_y)) in enumerate(zip(groups.tolist(), cells.tolist())):
+        buckets.setdefault((group, cell_x, cell_y), []).append(index)
+    members = {key: np.array(value) for key, value in buckets.items()}
+    sets = _DisjointSet(count)
+    for (group, cell_x, cell_y), own in members.items():
+        for offset_x, offset_y in _HALF_NEIGHBORS:
+            other = members.get((group, cell_x + offset_x, cell_y + offset_y))
+            if other is None:
+                continue
+            # 두 cell의 점 쌍 거리를 한 번에 계산합니다.
+            distances = np.linalg.norm(points[own, None, :] - points[None, other, :], axis=-1)
+            close = distances <= radius
+            if offset_x == 0 and offset_y == 0:
+                # 같은 cell은 자기 자신과 대칭 쌍을 제외합니다.
+                close = np.triu(close, k=1)
+            for left, right in zip(*np.nonzero(close)):
+                sets.union(int(own[left]), int(other[right]))
+    roots = np.array([sets.find(index) for index in range(count)], dtype=np.int64)
+    # root 번호를 0부터 연속된 cluster 번호로 바꿉니다.
+    _unique, clusters = np.unique(roots, return_inverse=True)
+    return clusters
+
+
+def fuse_detections(
+    observations: Iterable[tuple[CameraView, PointBatch]],
+    *,
+    radius: float = 0.03,
+) -> FusionResult:
+    """Camera별 detection을 공유 table frame에서 물체 단위로 합칩니다."""
+
+    views: list[CameraView] = []
+    world_parts: list[np.ndarray] = []
+    labels: list[str] = []
+    camera_parts: list[np.ndarray] = []
+    rejected = 0
+    for view, batch in observations:
+        if views and view.calibration.frame_id != views[0].calibration.frame_id:
+            raise ValueError("all cameras must map into the same frame")
+        if any(existing.camera_id == view.camera_id for existing in views):
+            raise ValueError(f"camera {view.camera_id!r} appears twice")
+        camera_index = len(views)
+        views.append(view)
+        # camera 하나의 모든 점을 배열 연산 한 번으로 table frame에 투영합니다.
+        world, valid = batch.to_world(view.calibration, view.width, view.height)
+        rejected += int((~valid).sum())
+        world_parts.append(world[valid])
+        labels.extend(label for label, keep in zip(batch.labels, valid.tolist()) if keep)
+        camera_parts.append(np.full(int(valid.sum()), camera_index, dtype=np.int64))
+    if not views:
+        raise ValueError("at least one camera is required")
+    frame_id = views[0].calibration.frame_id
+    if not labels:
+        return FusionResult(objects=(), frame_id=frame_id, rejected=rejected)
+    points = np.concatenate(world_parts)
+    cameras = np.concatenate(camera_parts)
+    # label 문자열을 정수로 바꿔 grid key와 cluster 경계로 사용합니다.
+    label_names, label_ids = np.unique(np.array(labels, dtype=object), return_inverse=True)
+    clusters = cluster_points(points, label_ids, radius)
+    objects: list[FusedObject] = []
+    for cluster in range(int(clusters.max()) + 1):
+        members = np.flatnonzero(clusters == cluster)
+        member_cameras = cameras[members]
+        seen = np.unique(member_cameras)
+        # 한 camera의 중복 detection이 위치를 끌고 가지 않도록 camera별 평균을 먼저 구합니다.
+        per_camera = np.array([points[members[member_cameras == camera]].mean(axis=0) for camera in seen])
+        center = per_camera.mean(axis=0)
+        spread = float(np.sqrt(np.mean(np.sum((per_camera - center) ** 2, axis=1))))
+        agreement = max(0.0, 1.0 - spread / radius)
+        objects.append(
+            FusedObject(
+                label=str(label_names[label_ids[members[0]]]),
+                x=float(center[0]),
+                y=float(center[1]),
+                confidence=len(seen) / len(views) * agreement,
+                cameras=tuple(views[camera].camera_id for camera in seen.tolist()),
+                observations=len(members),
+                spread=spread,
+            )
+        )
+    # 확실한 물체부터 처리하도록 confidence 내림차순으로 정렬합니다.
+    objects.sort(key=lambda item: (-item.confidence, item.label, item.x, item.y))
+    return FusionResult(objects=tuple(objects), frame_id=frame_id, rejected=rejected)
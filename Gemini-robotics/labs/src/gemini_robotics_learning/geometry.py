@@ -7,14 +7,22 @@
 from __future__ import annotations
 
 # dataclass는 좌표의 필드 이름을 명확히 하고 불변 객체를 만들기 위해 사용합니다.
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 # isfinite는 NaN과 무한대가 로봇 좌표로 흘러가는 것을 막습니다.
 from math import isfinite
 from typing import Sequence
 
+# NumPy는 수백 개 이상의 detection을 한 번에 변환하는 batch 경로에만 사용합니다.
+import numpy as np
+
 
 # Gemini 공식 spatial guide가 사용하는 정규화 좌표의 최댓값입니다.
 NORMALIZED_MAX = 1000.0
+# homography 하나를 정하는 데 필요한 최소 대응점 수입니다.
+MINIMAL_CORRESPONDENCES = 4
+# 정규화 DLT 정규방정식의 두 번째로 작은 고유값 / 최대 고유값 하한입니다.
+# 이보다 작으면 해 공간이 1차원이 아니므로(공선·중복 점) homography가 정해지지 않습니다.
+DEGENERACY_TOLERANCE = 1e-10
 
 
 def _finite_number(value: object, name: str) -> float:
@@ -32,6 +40,55 @@ def _finite_number(value: object, name: str) -> float:
     return number
 
 
+def finite_array(values: object, name: str) -> np.ndarray:
+    """(N, 2) 숫자 배열을 검증하고 float64 배열로 반환합니다.
+
+    `_finite_number`의 batch 버전입니다. bool·문자열·object 배열은 조용히
+    숫자로 바뀌지 않도록 dtype 단계에서 거부합니다.
+    """
+
+    # list나 tuple도 받되 복사는 필요할 때만 일어나게 asarray를 사용합니다.
+    array = np.asarray(values)
+    # bool과 문자열 dtype은 float 변환이 가능하지만 좌표 의미가 없으므로 거부합니다.
+    if array.dtype == np.bool_ or not np.issubdtype(array.dtype, np.number):
+        raise TypeError(f"{name} must be a numeric array, got dtype {array.dtype}")
+    # 복소수는 number의 하위 dtype이지만 평면 좌표가 될 수 없습니다.
+    if np.issubdtype(array.dtype, np.complexfloating):
+        raise TypeError(f"{name} must be a real-valued array")
+    # 빈 입력도 (0, 2)로 받아 호출자가 특수 처리하지 않아도 되게 합니다.
+    if array.size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    # 행 하나가 정확히 두 좌표인 (N, 2) 모양만 허용합니다.
+    if array.ndim != 2 or array.shape[1] != 2:
+        raise ValueError(f"{name} must have shape (N, 2), got {array.shape}")
+    # 이후 수식을 단순하게 하기 위해 float64로 통일합니다.
+    array = array.astype(np.float64, copy=False)
+    # NaN/Inf 하나라도 있으면 batch 전체를 거부해 scalar 경로와 같은 계약을 지킵니다.
+    if not np.isfinite(array).all():
+        raise ValueError(f"{name} must be finite")
+    return array
+
+
+def normalized_to_pixels(points_yx: object, width: int, height: int) -> np.ndarray:
+    """Gemini의 (N, 2) [y, x] 배열을 (N, 2) pixel [x, y] 배열로 변환합니다.
+
+    `NormalizedPoint.to_pixel`과 같은 범위 검사와 변환식을 한 번의 배열 연산으로
+    적용합니다.
+    """
+
+    # 너비와 높이 조건은 scalar 경로와 같습니다.
+    if width <= 1 or height <= 1:
+        raise ValueError("width and height must be greater than 1")
+    # 모양·dtype·finite 검사를 먼저 수행합니다.
+    points = finite_array(points_yx, "points")
+    # 0~1000 범위를 벗어난 점은 clamp하지 않고 batch 전체를 거부합니다.
+    if ((points < 0.0) | (points > NORMALIZED_MAX)).any():
+        raise ValueError("point coordinates must be in [0, 1000]")
+    # [y, x] 열 순서를 pixel의 [x, y] 순서로 뒤집으면서 해상도에 맞게 scale합니다.
+    scale = np.array([(width - 1), (height - 1)], dtype=np.float64) / NORMALIZED_MAX
+    return points[:, ::-1] * scale
+
+
 @dataclass(frozen=True)
 class PixelPoint:
     """이미지의 픽셀 좌표입니다. 일반 영상 관례대로 x가 먼저입니다."""
@@ -138,6 +195,8 @@ class PlanarCalibration:
     frame_id: str = "table"
     # 출력 거리 단위를 명시합니다.
     units: str = "meter"
+    # batch 변환용 NumPy matrix는 생성 시 한 번만 만들고 비교·출력에서는 제외합니다.
+    _array: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Matrix shape와 숫자를 생성 시점에 검증합니다."""
@@ -149,6 +208,76 @@ class PlanarCalibration:
         for row_index, row in enumerate(self.matrix):
             for column_index, value in enumerate(row):
                 _finite_number(value, f"matrix[{row_index}][{column_index}]")
+        # 읽기 전용 배열로 만들어 frozen dataclass의 불변성을 batch 경로에도 유지합니다.
+        array = np.array(self.matrix, dtype=np.float64)
+        array.setflags(write=False)
+        # frozen dataclass는 일반 대입을 막으므로 object.__setattr__로 한 번만 설정합니다.
+        object.__setattr__(self, "_array", array)
+
+    @classmethod
+    def fit(
+        cls,
+        pixel_points: object,
+        world_points: object,
+        *,
+        ransac_threshold: float | None = None,
+        confidence: float = 0.999,
+        max_iterations: int = 2000,
+        seed: int | None = 0,
+        frame_id: str = "table",
+        units: str = "meter",
+    ) -> HomographyFit:
+        """(N, 2) pixel [x, y]와 world [x, y] 대응점으로 homography를 추정합니다.
+
+        좌표를 정규화한 DLT(Hartley normalization)로 풉니다. `ransac_threshold`
+        (world 단위)를 주면 4점 가설을 배열로 한꺼번에 만들어 가장 많은 inlier를
+        설명하는 가설을 고르고, 그 inlier 전체로 다시 DLT를 풉니다. 반환값의
+        `errors`는 모든 대응점의 world 단위 reprojection error입니다.
+
+        공선·중복 점처럼 homography가 하나로 정해지지 않는 입력과, RANSAC에서
+        자기 4점 표본 밖의 점을 하나도 설명하지 못하는 경우는 ValueError입니다.
+        """
+
+        pixels = finite_array(pixel_points, "pixel_points")
+        world = finite_array(world_points, "world_points")
+        # 두 배열의 행이 같은 물리 점을 가리켜야 합니다.
+        if len(pixels) != len(world):
+            raise ValueError("pixel_points and world_points must have the same length")
+        if len(pixels) < MINIMAL_CORRESPONDENCES:
+            raise ValueError("at least 4 correspondences are required")
+        if ransac_threshold is None:
+            inliers = np.ones(len(pixels), dtype=bool)
+        else:
+            if ransac_threshold <= 0.0:
+                raise ValueError("ransac_threshold must be positive")
+            inliers = _ransac_inliers(
+                pixels, world, ransac_threshold, confidence, max_iterations, np.random.default_rng(seed)
+            )
+        matrix, conditioning = _dlt(pixels[inliers], world[inliers])
+        # 공선이거나 겹친 점만 있으면 해가 하나로 정해지지 않으므로 rms가 작아도 거부합니다.
+        if conditioning < DEGENERACY_TOLERANCE:
+            raise ValueError("correspondences are degenerate (collinear or coincident points)")
+        errors = _reprojection_errors(matrix, pixels, world)
+        # 최종 matrix가 inlier 집합을 바꿀 수 있으므로 threshold로 다시 표시합니다.
+        if ransac_threshold is not None:
+            inliers = errors <= ransac_threshold
+        calibration = cls(
+            matrix=tuple(tuple(float(value) for value in row) for row in matrix),
+            frame_id=frame_id,
+            units=units,
+        )
+        errors.setflags(write=False)
+        inliers.setflags(write=False)
+        return HomographyFit(calibration=calibration, errors=errors, inliers=inliers)
+
+    def reprojection_errors(self, pixel_points: object, world_points: object) -> np.ndarray:
+        """각 대응점을 변환한 위치와 측정 world 위치 사이의 거리입니다."""
+
+        pixels = finite_array(pixel_points, "pixel_points")
+        world = finite_array(world_points, "world_points")
+        if len(pixels) != len(world):
+            raise ValueError("pixel_points and world_points must have the same length")
+        return _reprojection_errors(self._array, pixels, world)
 
     def pixel_to_world(self, point: PixelPoint) -> tuple[float, float]:
         """픽셀 point에 projective transform을 적용합니다."""
@@ -180,3 +309,216 @@ class PlanarCalibration:
         # calibration은 pixel 좌표에 적용합니다.
         return self.pixel_to_world(pixel)
 
+    def pixels_to_world(self, pixels_xy: object) -> tuple[np.ndarray, np.ndarray]:
+        """(N, 2) pixel [x, y] 배열에 homography를 한 번에 적용합니다.
+
+        반환값은 `(world, valid)`입니다. `world`는 (N, 2) 평면 좌표이고, 점이
+        horizon(scale≈0)에 닿거나 결과가 finite가 아니면 해당 행은 NaN,
+        `valid`는 False입니다. Scalar 경로처럼 예외로 batch 전체를 버리지 않고
+        호출자가 mask로 유효한 점만 골라 안전 계층에 넘깁니다.
+        """
+
+        # 입력 모양과 finite 조건은 scalar 경로와 같은 수준으로 검사합니다.
+        pixels = finite_array(pixels_xy, "pixels")
+        # 짧은 이름을 사용해 homography 수식과 코드를 대응시킵니다.
+        h = self._array
+        # (N, 2) @ (2, 3)으로 세 동차좌표 성분의 선형 항을 한 번에 계산합니다.
+        homogeneous = pixels @ h[:, :2].T + h[:, 2]
+        # 세 번째 열이 projective scale w입니다.
+        scale = homogeneous[:, 2]
+        # scale이 0에 가까운 점은 무한대로 가므로 mask에서 제외합니다.
+        valid = np.abs(scale) >= 1e-12
+        # 유효하지 않은 행은 0으로 나누지 않도록 NaN을 먼저 채운 출력 배열을 준비합니다.
+        world = np.full((len(pixels), 2), np.nan, dtype=np.float64)
+        # 유효한 행만 동차좌표를 실제 평면 좌표로 나눕니다.
+        world[valid] = homogeneous[valid, :2] / scale[valid, None]
+        # overflow로 생긴 Inf도 scalar 경로처럼 행동에 쓰지 못하게 표시합니다.
+        valid &= np.isfinite(world).all(axis=1)
+        # mask와 출력이 어긋나지 않도록 무효 행을 다시 NaN으로 맞춥니다.
+        world[~valid] = np.nan
+        return world, valid
+
+    def normalized_to_world_batch(
+        self, points_yx: object, width: int, height: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Gemini (N, 2) [y, x] 배열을 pixel을 거쳐 평면 좌표로 변환합니다."""
+
+        # 정규화 좌표의 범위 검사와 pixel 변환을 배열 단위로 수행합니다.
+        pixels = normalized_to_pixels(points_yx, width=width, height=height)
+        # calibration은 pixel 좌표에 적용하고 horizon mask를 함께 반환합니다.
+        return self.pixels_to_world(pixels)
+
+
+@dataclass(frozen=True, eq=False)
+class HomographyFit:
+    """`PlanarCalibration.fit` 결과와 대응점별 reprojection error입니다."""
+
+    calibration: PlanarCalibration
+    # (N,) world 단위 거리입니다. horizon으로 간 점은 inf입니다.
+    errors: np.ndarray
+    # RANSAC을 쓰지 않으면 모두 True입니다.
+    inliers: np.ndarray
+
+    @property
+    def inlier_count(self) -> int:
+        return int(self.inliers.sum())
+
+    @property
+    def rms_error(self) -> float:
+        """Inlier reprojection error의 제곱평균제곱근입니다."""
+
+        inlier_errors = self.errors[self.inliers]
+        if inlier_errors.size == 0:
+            return float("inf")
+        return float(np.sqrt(np.mean(inlier_errors**2)))
+
+    @property
+    def max_error(self) -> float:
+        """Inlier 중 가장 큰 reprojection error입니다."""
+
+        inlier_errors = self.errors[self.inliers]
+        return float(inlier_errors.max()) if inlier_errors.size else float("inf")
+
+
+def _normalizing_transform(points: np.ndarray) -> np.ndarray:
+    """점들의 중심을 원점으로, 평균 거리를 sqrt(2)로 옮기는 3x3 similarity입니다."""
+
+    # (..., N, 2) 입력도 받아 RANSAC 가설 묶음을 한 번에 정규화합니다.
+    centroid = points.mean(axis=-2)
+    distance = np.linalg.norm(points - centroid[..., None, :], axis=-1).mean(axis=-1)
+    # 모든 점이 겹친 퇴화 입력은 scale을 1로 두고 이후 SVD 결과로 걸러냅니다.
+    scale = np.sqrt(2.0) / np.where(distance > 1e-12, distance, 1.0)
+    transform = np.zeros(points.shape[:-2] + (3, 3), dtype=np.float64)
+    transform[..., 0, 0] = scale
+    transform[..., 1, 1] = scale
+    transform[..., :2, 2] = -scale[..., None] * centroid
+    transform[..., 2, 2] = 1.0
+    return transform
+
+
+def _apply(transform: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Affine 3x3 transform을 (..., N, 2) 점에 적용합니다."""
+
+    return points @ np.swapaxes(transform[..., :2, :2], -1, -2) + transform[..., None, :2, 2]
+
+
+def _dlt(pixels: np.ndarray, world: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """정규화 DLT로 (..., 3, 3) homography와 (...,) 퇴화 지표를 풉니다. 입력은 (..., N, 2)입니다.
+
+    퇴화 지표는 정규방정식의 두 번째로 작은 고유값을 최대 고유값으로 나눈 값입니다.
+    해 공간이 2차원 이상이면(공선이거나 겹친 점) 0에 가깝습니다.
+    """
+
+    pixel_transform = _normalizing_transform(pixels)
+    world_transform = _normalizing_transform(world)
+    source = _apply(pixel_transform, pixels)
+    target = _apply(world_transform, world)
+    x, y = source[..., 0], source[..., 1]
+    u, v = target[..., 0], target[..., 1]
+    zeros = np.zeros_like(x)
+    ones = np.ones_like(x)
+    # 대응점마다 두 행을 만드는 표준 DLT 선형계 A h = 0입니다.
+    rows_u = np.stack([-x, -y, -ones, zeros, zeros, zeros, u * x, u * y, u], axis=-1)
+    rows_v = np.stack([zeros, zeros, zeros, -x, -y, -ones, v * x, v * y, v], axis=-1)
+    system = np.concatenate([rows_u, rows_v], axis=-2)
+    # (2N, 9) SVD 대신 9x9 정규방정식 AᵀA의 최소 고유벡터를 구하면 N에 선형인
+    # 행렬 곱 한 번만 남습니다. Hartley 정규화 덕분에 조건수 제곱의 영향이 작습니다.
+    gram = np.swapaxes(system, -1, -2) @ system
+    values, vectors = np.linalg.eigh(gram)
+    conditioning = values[..., 1] / np.maximum(values[..., -1], np.finfo(np.float64).tiny)
+    normalized = vectors[..., :, 0].reshape(pixels.shape[:-2] + (3, 3))
+    # 정규화 좌표계의 해를 원래 pixel·world 좌표계로 되돌립니다.
+    matrix = np.linalg.inv(world_transform) @ normalized @ pixel_transform
+    # h33 = 1로 맞추되, 0에 가까우면 Frobenius norm으로 scale을 정합니다.
+    corner = matrix[..., 2:3, 2:3]
+    norm = np.linalg.norm(matrix, axis=(-2, -1), keepdims=True)
+    divisor = np.where(np.abs(corner) > 1e-12 * norm, corner, norm)
+    return matrix / divisor, conditioning
+
+
+def _reprojection_errors(matrix: np.ndarray, pixels: np.ndarray, world: np.ndarray) -> np.ndarray:
+    """(..., 3, 3) homography로 pixel을 옮긴 위치와 world 사이 거리 (..., N)입니다."""
+
+    homogeneous = pixels @ np.swapaxes(matrix[..., :, :2], -1, -2) + matrix[..., None, :, 2]
+    scale = homogeneous[..., 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        projected = homogeneous[..., :2] / scale[..., None]
+        errors = np.linalg.norm(projected - world, axis=-1)
+    # horizon에 닿거나 NaN이 된 점은 어떤 threshold로도 inlier가 되지 않게 합니다.
+    return np.where(np.isfinite(errors) & (np.abs(scale) >= 1e-12), errors, np.inf)
+
+
+def _sample_minimal_sets(count: int, size: int, rng: np.random.Generator) -> np.ndarray:
+    """서로 다른 대응점 4개로 이뤄진 가설 index를 (size', 4)로 뽑습니다."""
+
+    if count <= 4096:
+        # 행마다 random key를 정렬하면 행별 비복원 추출이 한 번의 배열 연산이 됩니다.
+        return np.argsort(rng.random((size, count)), axis=1)[:, :MINIMAL_CORRESPONDENCES]
+    # 대응점이 많으면 (size, N) 행렬 대신 복원 추출 후 중복이 있는 행만 버립니다.
+    samples = rng.integers(0, count, size=(size, MINIMAL_CORRESPONDENCES))
+    distinct = (np.diff(np.sort(samples, axis=1), axis=1) > 0).all(axis=1)
+    return samples[distinct]
+
+
+def _ransac_inliers(
+    pixels: np.ndarray,
+    world: np.ndarray,
+    threshold: float,
+    confidence: float,
+    max_iterations: int,
+    rng: np.random.Generator,
+    chunk: int = 128,
+    scoring_points: int = 2048,
+) -> np.ndarray:
+    """4점 가설을 `chunk`개씩 batch로 평가해 가장 좋은 inlier mask를 반환합니다.
+
+    대응점이 `scoring_points`보다 많으면 가설 점수는 고정된 무작위 부분집합에서만
+    계산하고, 최종 가설 하나만 전체 점에 대해 평가합니다. 가설당 비용이 N과
+    무관해져 수만 개 대응점에서도 반복 수만큼만 시간이 듭니다.
+    """
+
+    count = len(pixels)
+    if count > scoring_points:
+        subset = rng.choice(count, size=scoring_points, replace=False)
+        score_pixels, score_world = pixels[subset], world[subset]
+    else:
+        score_pixels, score_world = pixels, world
+    scored = len(score_pixels)
+    best_matrix: np.ndarray | None = None
+    best_count = 0
+    best_residual = np.inf
+    required = max_iterations
+    done = 0
+    while done < required:
+        size = min(chunk, required - done)
+        samples = _sample_minimal_sets(count, size, rng)
+        done += size
+        if len(samples) == 0:
+            continue
+        # (H, 3, 3) 가설과 (H, M) 오차를 한 번에 계산합니다.
+        matrices, conditioning = _dlt(pixels[samples], world[samples])
+        errors = _reprojection_errors(matrices, score_pixels, score_world)
+        # 세 점이 공선인 표본은 특이 homography를 만들므로 inlier를 세지 않습니다.
+        masks = (errors <= threshold) & (conditioning >= DEGENERACY_TOLERANCE)[:, None]
+        counts = masks.sum(axis=1)
+        # 같은 inlier 수라면 inlier 오차 합이 작은 가설을 고릅니다.
+        residuals = np.where(masks, errors, 0.0).sum(axis=1)
+        best = int(np.lexsort((residuals, -counts))[0])
+        if (counts[best], -residuals[best]) > (best_count, -best_residual):
+            best_count = int(counts[best])
+            best_residual = float(residuals[best])
+            best_matrix = matrices[best]
+            # 현재 inlier 비율로 필요한 반복 수를 다시 계산해 일찍 끝냅니다.
+            miss = 1.0 - (best_count / scored) ** MINIMAL_CORRESPONDENCES
+            if miss <= 0.0:
+                break
+            needed = np.log(1.0 - confidence) / np.log(miss)
+            required = min(max_iterations, max(done, int(np.ceil(needed))))
+    # 4점 표본은 자기 homography가 항상 정확히 재현하므로, 표본 밖 점을 하나 이상
+    # 설명해야 실제 지지가 있는 가설입니다. 순수 noise에서는 여기서 거부됩니다.
+    if best_matrix is None or best_count <= MINIMAL_CORRESPONDENCES:
+        raise ValueError("RANSAC found no homography supported beyond its 4-point sample")
+    inliers = _reprojection_errors(best_matrix, pixels, world) <= threshold
+    if inliers.sum() <= MINIMAL_CORRESPONDENCES:
+        raise ValueError("RANSAC found no homography supported beyond its 4-point sample")
+    return inliers
@@ -6,8 +6,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 # monotonic은 시스템 시각 변경의 영향을 받지 않는 실행 시간을 기록합니다.
 from time import monotonic
-from typing import Any
+# MappingProxyType은 compile된 인자를 읽기 전용으로 공유합니다.
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
+from .audit import AuditLog, CallIdWindow
 from .safety import MoveCommand, SafetyEnvelope, ToolRejected
 
 
@@ -31,7 +34,7 @@ class RobotState:
         return self.x, self.y, self.z
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolRecord:
     """재현과 감사를 위해 저장하는 tool 실행 기록입니다."""
 
@@ -50,10 +53,10 @@ class MockRobot:
     safety: SafetyEnvelope
     # 상태는 테스트마다 새 객체가 만들어지도록 default_factory를 사용합니다.
     state: RobotState = field(default_factory=RobotState)
-    # call ID를 저장해 network retry의 중복 실행을 막습니다.
-    processed_call_ids: set[str] = field(default_factory=set)
-    # 실행 이력은 append-only 형태로 보관합니다.
-    records: list[ToolRecord] = field(default_factory=list)
+    # 최근 call ID를 저장해 network retry의 중복 실행을 막습니다. 크기는 bounded입니다.
+    processed_call_ids: CallIdWindow = field(default_factory=CallIdWindow)
+    # 실행 이력은 최근 record만 메모리에 두는 append-only ring buffer로 보관합니다.
+    records: AuditLog = field(default_factory=AuditLog)
 
     def move(self, call_id: str, command: MoveCommand, *, human_present: bool = False) -> dict[str, Any]:
         """검증된 Cartesian move를 mock state에 적용합니다."""
@@ -66,6 +69,11 @@ class MockRobot:
             raise ToolRejected("robot is stopped; manual reset is required")
         # 실제 위치 변경 전에 독립 안전 정책을 실행합니다.
         self.safety.validate_move(self.state.xyz, command, human_present=human_present)
+        return self._commit_move(call_id, command)
+
+    def _commit_move(self, call_id: str, command: MoveCommand) -> dict[str, Any]:
+        """이미 검증된 move를 상태에 반영합니다. 호출자가 검증을 책임집니다."""
+
         # 이 mock에서는 물리 실행이 즉시 성공했다고 가정하고 상태를 갱신합니다.
         self.state.x = command.x
         self.state.y = command.y
@@ -86,6 +94,13 @@ class MockRobot:
             return {"status": "duplicate_ignored", "call_id": call_id}
         if self.state.stopped:
             raise ToolRejected("robot is stopped; manual reset is required")
+        self.validate_gripper(opened, max_force_n)
+        return self._commit_gripper(call_id, opened)
+
+    @staticmethod
+    def validate_gripper(opened: object, max_force_n: object) -> None:
+        """Gripper 인자가 정책을 통과하지 못하면 ToolRejected를 발생시킵니다."""
+
         # bool 이외의 truthy 문자열이 실수로 실행되는 것을 거부합니다.
         if not isinstance(opened, bool):
             raise ToolRejected("opened must be a boolean")
@@ -94,11 +109,31 @@ class MockRobot:
             raise ToolRejected("max_force_n must be numeric")
         if not (0.0 < float(max_force_n) <= 20.0):
             raise ToolRejected("gripper force is outside the allowed range")
+
+    def _commit_gripper(self, call_id: str, opened: bool) -> dict[str, Any]:
+        """이미 검증된 gripper 명령을 상태에 반영합니다."""
+
         # 안전 검증 이후에만 상태를 변경합니다.
         self.state.gripper_open = opened
         self.processed_call_ids.add(call_id)
         return {"status": "success", "gripper_open": self.state.gripper_open}
 
+    def audit_stats(self) -> dict[str, Any]:
+        """감사 log와 idempotency window의 크기·메모리 사용량을 반환합니다."""
+
+        return {"records": self.records.stats(), "call_ids": self.processed_call_ids.stats()}
+
+    def close(self) -> None:
+        """감사 log의 spill file을 flush하고 닫습니다."""
+
+        self.records.close()
+
+    def __enter__(self) -> MockRobot:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def stop(self, reason: str) -> dict[str, Any]:
         """Robot을 latch된 STOPPED 상태로 전환합니다."""
 
@@ -138,40 +173,11 @@ class ToolExecutor:
                 self.robot.stop("plan deadline exceeded")
                 raise ToolRejected("plan deadline exceeded")
             # 필수 envelope field를 명시적으로 읽습니다.
-            call_id = call.get("id")
-            name = call.get("name")
-            arguments = call.get("arguments")
-            # ID가 없으면 idempotency를 보장할 수 없습니다.
-            if not isinstance(call_id, str) or not call_id:
-                raise ToolRejected(f"step {index} has no valid call id")
-            # tool 이름은 문자열이어야 allowlist와 정확히 비교할 수 있습니다.
-            if not isinstance(name, str):
-                raise ToolRejected(f"step {index} has no valid tool name")
-            # argument는 free-form text가 아니라 object여야 합니다.
-            if not isinstance(arguments, dict):
-                raise ToolRejected(f"step {index} arguments must be an object")
+            call_id, name, arguments = self._read_envelope(index, call)
             # 각 tool 실행 시간을 별도로 기록합니다.
             tool_started_at = monotonic()
             try:
-                # allowlist에 있는 move만 명시적 keyword로 변환합니다.
-                if name == "move":
-                    command = self._move_command(arguments)
-                    result = self.robot.move(call_id, command, human_present=human_present)
-                # gripper tool도 알려진 두 인자만 전달합니다.
-                elif name == "set_gripper":
-                    self._require_exact_keys(arguments, {"opened", "max_force_n"})
-                    result = self.robot.set_gripper(
-                        call_id,
-                        opened=arguments["opened"],
-                        max_force_n=arguments["max_force_n"],
-                    )
-                # stop은 모델이 아닌 안전 계층도 호출할 수 있는 fail-safe tool입니다.
-                elif name == "stop":
-                    self._require_exact_keys(arguments, {"reason"})
-                    result = self.robot.stop(reason=str(arguments["reason"]))
-                # allowlist 밖 이름은 reflection이나 getattr로 실행하지 않습니다.
-                else:
-                    raise ToolRejected(f"tool {name!r} is not allowlisted")
+                result = self._dispatch(call_id, name, arguments, human_present=human_present)
             except Exception:
                 # 어떤 validation/execution 실패도 mock을 STOPPED 상태로 latch합니다.
                 self.robot.stop(f"tool {name!r} failed")
@@ -191,6 +197,170 @@ class ToolExecutor:
         # 모든 단계가 성공한 경우에만 전체 결과를 반환합니다.
         return results
 
+    def _dispatch(
+        self,
+        call_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        *,
+        human_present: bool,
+    ) -> dict[str, Any]:
+        """Allowlist에 있는 robot tool 하나를 검증·실행합니다."""
+
+        # allowlist에 있는 move만 명시적 keyword로 변환합니다.
+        if name == "move":
+            command = self._move_command(arguments)
+            return self.robot.move(call_id, command, human_present=human_present)
+        # gripper tool도 알려진 두 인자만 전달합니다.
+        if name == "set_gripper":
+            self._require_exact_keys(arguments, {"opened", "max_force_n"})
+            return self.robot.set_gripper(
+                call_id,
+                opened=arguments["opened"],
+                max_force_n=arguments["max_force_n"],
+            )
+        # stop은 모델이 아닌 안전 계층도 호출할 수 있는 fail-safe tool입니다.
+        if name == "stop":
+            self._require_exact_keys(arguments, {"reason"})
+            return self.robot.stop(reason=str(arguments["reason"]))
+        # allowlist 밖 이름은 reflection이나 getattr로 실행하지 않습니다.
+        raise ToolRejected(f"tool {name!r} is not allowlisted")
+
+    def compile_plan(self, plan: list[dict[str, Any]]) -> CompiledPlan:
+        """Plan 전체를 실행 전에 검증하고 불변 `CompiledPlan`으로 만듭니다.
+
+        Schema, 인자, allowlist를 확인하고 현재 pose에서 시작하는 pose chain을
+        SafetyEnvelope로 미리 simulation합니다. 실행 시에는 compile 시점의 가정이
+        아직 유효한지만 확인하므로 deadline 시계가 도는 동안 Python 검사가 거의
+        없습니다. Compile은 로봇에 아무것도 보내지 않으므로 실패해도 STOPPED로
+        latch하지 않습니다.
+        """
+
+        if len(plan) > self.max_steps:
+            raise ToolRejected(f"plan exceeds the {self.max_steps}-step budget")
+        robot = self.robot
+        if robot.state.stopped:
+            raise ToolRejected("robot is stopped; manual reset is required")
+        start_xyz = robot.state.xyz
+        safety_fingerprint = robot.safety.fingerprint()
+        # simulation은 실제 상태를 건드리지 않도록 pose와 처리된 ID를 복사해 진행합니다.
+        pose = start_xyz
+        seen_ids: set[str] = set()
+        stopped = False
+        steps: list[CompiledStep] = []
+        for index, call in enumerate(plan):
+            call_id, name, arguments = self._read_envelope(index, call)
+            frozen_arguments = MappingProxyType(dict(arguments))
+            # stop은 idempotency 대상이 아니며 이후 모든 행동을 막습니다.
+            if name == "stop":
+                self._require_exact_keys(arguments, {"reason"})
+                reason = str(arguments["reason"])
+                steps.append(CompiledStep(call_id, name, frozen_arguments, reason=reason))
+                stopped = True
+                continue
+            if name not in ("move", "set_gripper"):
+                raise ToolRejected(f"tool {name!r} is not allowlisted")
+            # 이미 처리된 ID는 실행 시에도 상태를 바꾸지 않으므로 pose chain에서 제외합니다.
+            if call_id in robot.processed_call_ids or call_id in seen_ids:
+                steps.append(CompiledStep(call_id, name, frozen_arguments, duplicate=True))
+                continue
+            if stopped:
+                raise ToolRejected(f"step {index} follows a stop; manual reset is required")
+            if name == "move":
+                command = self._move_command(arguments)
+                # 직전 step의 목표가 다음 step의 현재 위치가 되도록 chain을 따라 검증합니다.
+                robot.safety.validate_move(pose, command)
+                pose = (command.x, command.y, command.z)
+                steps.append(CompiledStep(call_id, name, frozen_arguments, command=command))
+            else:
+                self._require_exact_keys(arguments, {"opened", "max_force_n"})
+                robot.validate_gripper(arguments["opened"], arguments["max_force_n"])
+                steps.append(
+                    CompiledStep(call_id, name, frozen_arguments, opened=arguments["opened"])
+                )
+            seen_ids.add(call_id)
+        return CompiledPlan(
+            steps=tuple(steps),
+            start_xyz=start_xyz,
+            final_xyz=pose,
+            fresh_call_ids=frozenset(seen_ids),
+            safety_fingerprint=safety_fingerprint,
+            robot=robot,
+        )
+
+    def execute_compiled(
+        self,
+        compiled: CompiledPlan,
+        *,
+        human_present: bool = False,
+    ) -> list[dict[str, Any]]:
+        """`compile_plan` 결과를 step별 재검증 없이 table dispatch로 실행합니다."""
+
+        robot = self.robot
+        # 다른 robot이나 바뀐 상태에서 만든 plan은 simulation 가정이 깨졌으므로 거부합니다.
+        if compiled.robot is not robot:
+            raise ToolRejected("compiled plan belongs to a different robot")
+        if robot.state.stopped:
+            raise ToolRejected("robot is stopped; manual reset is required")
+        if robot.state.xyz != compiled.start_xyz:
+            robot.stop("compiled plan is stale")
+            raise ToolRejected("robot pose changed since the plan was compiled")
+        # 금지 영역 추가나 한도 변경 뒤에는 compile 때의 안전 판정이 더 이상 유효하지 않습니다.
+        if robot.safety.fingerprint() != compiled.safety_fingerprint:
+            robot.stop("compiled plan is stale")
+            raise ToolRejected("safety envelope changed since the plan was compiled")
+        # window 전체를 순회하지 않도록 plan의 ID만 하나씩 조회합니다.
+        if any(call_id in robot.processed_call_ids for call_id in compiled.fresh_call_ids):
+            robot.stop("compiled plan is stale")
+            raise ToolRejected("call ids were processed since the plan was compiled")
+        # 사람 감지는 compile 후에도 바뀌는 sensor 입력이므로 실행 직전에 확인합니다.
+        moves = (step.name == "move" and not step.duplicate for step in compiled.steps)
+        if human_present and any(moves):
+            robot.stop("tool 'move' failed")
+            raise ToolRejected("human is present in the protected workspace")
+        started_at = monotonic()
+        results: list[dict[str, Any]] = []
+        for step in compiled.steps:
+            if monotonic() - started_at > self.deadline_s:
+                robot.stop("plan deadline exceeded")
+                raise ToolRejected("plan deadline exceeded")
+            tool_started_at = monotonic()
+            try:
+                handler = _DUPLICATE_HANDLER if step.duplicate else _COMPILED_HANDLERS[step.name]
+                result = handler(robot, step)
+            except Exception:
+                robot.stop(f"tool {step.name!r} failed")
+                raise
+            robot.records.append(
+                ToolRecord(
+                    call_id=step.call_id,
+                    name=step.name,
+                    arguments=dict(step.arguments),
+                    result=dict(result),
+                    elapsed_s=monotonic() - tool_started_at,
+                )
+            )
+            results.append({"call_id": step.call_id, "name": step.name, "result": result})
+        return results
+
+    @staticmethod
+    def _read_envelope(index: int, call: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+        """Tool call의 id/name/arguments envelope를 검증해 반환합니다."""
+
+        call_id = call.get("id")
+        name = call.get("name")
+        arguments = call.get("arguments")
+        # ID가 없으면 idempotency를 보장할 수 없습니다.
+        if not isinstance(call_id, str) or not call_id:
+            raise ToolRejected(f"step {index} has no valid call id")
+        # tool 이름은 문자열이어야 allowlist와 정확히 비교할 수 있습니다.
+        if not isinstance(name, str):
+            raise ToolRejected(f"step {index} has no valid tool name")
+        # argument는 free-form text가 아니라 object여야 합니다.
+        if not isinstance(arguments, dict):
+            raise ToolRejected(f"step {index} arguments must be an object")
+        return call_id, name, arguments
+
     @staticmethod
     def _require_exact_keys(arguments: dict[str, Any], expected: set[str]) -> None:
         """누락·추가 인자를 모두 거부해 schema drift를 막습니다."""
@@ -216,3 +386,68 @@ class ToolExecutor:
             frame_id=arguments["frame_id"],
         )
 
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """검증을 마친 tool call 하나입니다. 실행에 필요한 값이 이미 변환돼 있습니다."""
+
+    call_id: str
+    name: str
+    arguments: Mapping[str, Any]
+    # move step의 명령 객체입니다.
+    command: MoveCommand | None = None
+    # set_gripper step의 목표 상태입니다.
+    opened: bool | None = None
+    # stop step의 사유입니다.
+    reason: str = ""
+    # compile 시점에 이미 처리된 call ID면 실행 시 상태를 바꾸지 않습니다.
+    duplicate: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """`ToolExecutor.compile_plan`이 만든 불변 실행 계획입니다."""
+
+    steps: tuple[CompiledStep, ...]
+    # simulation을 시작한 pose와 모든 move를 적용한 뒤의 예상 pose입니다.
+    start_xyz: tuple[float, float, float]
+    final_xyz: tuple[float, float, float]
+    # compile 시점에 아직 처리되지 않았던 call ID입니다.
+    fresh_call_ids: frozenset[str]
+    # compile 시점 SafetyEnvelope 정책 값입니다. 바뀌었다면 검증 결과를 믿을 수 없습니다.
+    safety_fingerprint: tuple[object, ...]
+    # 같은 robot에서만 실행되도록 compile한 robot을 기억합니다.
+    robot: MockRobot = field(repr=False, compare=False)
+
+
+def _run_compiled_move(robot: MockRobot, step: CompiledStep) -> dict[str, Any]:
+    """검증된 move를 적용합니다."""
+
+    return robot._commit_move(step.call_id, step.command)
+
+
+def _run_compiled_gripper(robot: MockRobot, step: CompiledStep) -> dict[str, Any]:
+    """검증된 gripper 명령을 적용합니다."""
+
+    return robot._commit_gripper(step.call_id, step.opened)
+
+
+def _run_compiled_stop(robot: MockRobot, step: CompiledStep) -> dict[str, Any]:
+    """Stop은 언제나 다시 실행해도 안전합니다."""
+
+    return robot.stop(reason=step.reason)
+
+
+def _run_duplicate(robot: MockRobot, step: CompiledStep) -> dict[str, Any]:
+    """이미 처리된 call ID에 대해 기존 tool과 같은 결과를 반환합니다."""
+
+    return {"status": "duplicate_ignored", "call_id": step.call_id}
+
+
+# if/elif 대신 이름으로 handler를 찾는 dispatch table입니다. Compile이 allowlist를 보장합니다.
+_COMPILED_HANDLERS: dict[str, Callable[[MockRobot, CompiledStep], dict[str, Any]]] = {
+    "move": _run_compiled_move,
+    "set_gripper": _run_compiled_gripper,
+    "stop": _run_compiled_stop,
+}
+_DUPLICATE_HANDLER = _run_duplicate
@@ -0,0 +1,328 @@
+"""모델 업로드 전에 frame을 줄이고 다시 인코딩하는 local 전처리 단계입니다.
+
+원본 frame이나 video를 그대로 올리면 업로드 byte와 request latency가 커집니다.
+이 모듈은 긴 변을 목표 크기로 줄이고, byte 예산 안에 들어오는 JPEG quality를
+고르고, perceptual hash로 거의 같은 연속 frame을 건너뛰고, 같은 내용의
+인코딩 결과를 content hash로 재사용합니다. `LocalFileStore`는 API 없이
+`client.files.upload` 자리를 대신하는 offline stand-in입니다.
+"""
+
+from __future__ import annotations
+
+# blake2b는 pixel buffer 전체를 빠르게 content hash로 요약합니다.
+import hashlib
+# Lock은 여러 worker thread가 같은 upload cache를 쓸 때 dict 변경을 보호합니다.
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+# BytesIO는 JPEG를 파일 없이 메모리에서 인코딩·디코딩합니다.
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol
+
+import numpy as np
+# Pillow는 resize와 JPEG 인코딩을 담당합니다.
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class EncodeConfig:
+    """Resize와 JPEG 재인코딩 예산입니다."""
+
+    # 긴 변의 최대 pixel 수입니다. 더 작은 이미지는 확대하지 않습니다.
+    long_edge: int = 768
+    # 인코딩 결과가 넘지 않아야 하는 byte 수입니다.
+    max_bytes: int = 150_000
+    # 높은 quality부터 시도해 예산 안에 드는 첫 값을 사용합니다.
+    qualities: tuple[int, ...] = (85, 75, 65, 50, 35)
+
+    def __post_init__(self) -> None:
+        if self.long_edge <= 0:
+            raise ValueError("long_edge must be positive")
+        if self.max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if not self.qualities or any(not 1 <= quality <= 95 for quality in self.qualities):
+            raise ValueError("qualities must be a non-empty sequence within [1, 95]")
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """업로드할 JPEG bytes와 인코딩 결과 정보입니다."""
+
+    data: bytes
+    width: int
+    height: int
+    quality: int
+    # 가장 낮은 quality로도 max_bytes를 넘으면 False입니다.
+    within_budget: bool
+    # 인코딩된 bytes의 content hash로, 업로드 재사용 key입니다.
+    digest: str
+
+    mime_type = "image/jpeg"
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+
+def to_image(source: Image.Image | np.ndarray | bytes | memoryview) -> Image.Image:
+    """Pillow 이미지, uint8 배열, 인코딩된 이미지 bytes를 RGB 이미지로 바꿉니다."""
+
+    if isinstance(source, Image.Image):
+        image = source
+    elif isinstance(source, np.ndarray):
+        if source.dtype != np.uint8 or source.ndim not in (2, 3):
+            raise TypeError("frame arrays must be uint8 with shape (H, W) or (H, W, C)")
+        image = Image.fromarray(source)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        image = Image.open(BytesIO(bytes(source)))
+    else:
+        raise TypeError("unsupported frame type")
+    # JPEG는 alpha를 지원하지 않으므로 RGB로 통일합니다.
+    return image if image.mode == "RGB" else image.convert("RGB")
+
+
+def resize_long_edge(image: Image.Image, long_edge: int) -> Image.Image:
+    """비율을 유지하며 긴 변을 `long_edge` 이하로 줄입니다."""
+
+    width, height = image.size
+    scale = long_edge / max(width, height)
+    # 확대는 업로드 byte만 늘리고 정보는 늘리지 않습니다.
+    if scale >= 1.0:
+        return image
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(size, Image.Resampling.BILINEAR)
+
+
+def encode_jpeg(image: Image.Image, config: EncodeConfig) -> EncodedImage:
+    """Resize 후 예산 안에 드는 가장 높은 quality로 JPEG를 인코딩합니다."""
+
+    resized = resize_long_edge(image, config.long_edge)
+    data = b""
+    quality = config.qualities[-1]
+    for quality in config.qualities:
+        buffer = BytesIO()
+        resized.save(buffer, format="JPEG", quality=quality, optimize=True)
+        data = buffer.getvalue()
+        if len(data) <= config.max_bytes:
+            break
+    return EncodedImage(
+        data=data,
+        width=resized.width,
+        height=resized.height,
+        quality=quality,
+        within_budget=len(data) <= config.max_bytes,
+        digest=hashlib.blake2b(data, digest_size=16).hexdigest(),
+    )
+
+
+def difference_hash(image: Image.Image, hash_size: int = 8) -> int:
+    """인접 pixel 밝기 차이로 만든 64-bit perceptual hash(dHash)입니다."""
+
+    # 작은 grayscale thumbnail은 압축 noise와 작은 조명 변화에 둔감합니다.
+    small = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+    pixels = np.asarray(small, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    # bit 배열을 하나의 정수로 묶습니다.
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(left: int, right: int) -> int:
+    """두 perceptual hash가 다른 bit 수입니다."""
+
+    return (left ^ right).bit_count()
+
+
+def content_digest(image: Image.Image, config: EncodeConfig) -> str:
+    """원본 pixel과 인코딩 설정을 함께 요약한 cache key입니다."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    # 같은 pixel이라도 크기·설정이 다르면 다른 결과이므로 key에 포함합니다.
+    digest.update(repr((image.size, image.mode, config)).encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class EncodeCache:
+    """Content hash별 인코딩 결과를 최근 `max_entries`개만 보관하는 LRU cache입니다."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, EncodedImage] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> EncodedImage | None:
+        encoded = self._entries.get(key)
+        if encoded is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return encoded
+
+    def put(self, key: str, encoded: EncodedImage) -> None:
+        self._entries[key] = encoded
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FramePreprocessor:
+    """Dedupe → cache 조회 → resize·JPEG 인코딩 순서로 frame을 준비합니다."""
+
+    def __init__(
+        self,
+        config: EncodeConfig | None = None,
+        *,
+        cache: EncodeCache | None = None,
+        dedupe_distance: int = 4,
+    ) -> None:
+        self.config = config or EncodeConfig()
+        self.cache = cache if cache is not None else EncodeCache()
+        # 직전 frame과 dHash가 이 값 이하로 다르면 같은 장면으로 봅니다. 음수면 끕니다.
+        self.dedupe_distance = dedupe_distance
+        self._last_hash: int | None = None
+        self.frames_in = 0
+        self.duplicates = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def process(self, source: Image.Image | np.ndarray | bytes | memoryview) -> EncodedImage | None:
+        """업로드할 JPEG를 반환합니다. 직전 frame과 거의 같으면 None입니다."""
+
+        image = to_image(source)
+        self.frames_in += 1
+        # RGB raw pixel 크기를 원본 byte로 셉니다.
+        self.bytes_in += image.width * image.height * 3
+        if self.dedupe_distance >= 0:
+            current = difference_hash(image)
+            previous, self._last_hash = self._last_hash, current
+            if previous is not None and hamming_distance(previous, current) <= self.dedupe_distance:
+                self.duplicates += 1
+                # 기준을 마지막으로 보낸 frame에 고정해 천천히 변하는 장면도 결국 다시 보냅니다.
+                self._last_hash = previous
+                return None
+        key = content_digest(image, self.config)
+        encoded = self.cache.get(key)
+        if encoded is None:
+            encoded = encode_jpeg(image, self.config)
+            self.cache.put(key, encoded)
+        self.bytes_out += encoded.nbytes
+        return encoded
+
+    def stats(self) -> dict[str, Any]:
+        """입력 frame 수, 중복 수, cache 적중과 byte 절감률을 반환합니다."""
+
+        return {
+            "frames_in": self.frames_in,
+            "duplicates": self.duplicates,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": self.bytes_out / self.bytes_in if self.bytes_in else 0.0,
+        }
+
+
+@dataclass(frozen=True)
+class UploadedFile:
+    """Files API 응답 중 interaction input이 참조하는 필드입니다."""
+
+    name: str
+    uri: str
+    mime_type: str
+    size_bytes: int
+
+
+class FileUploader(Protocol):
+    """`client.files`와 `LocalFileStore`가 공유하는 upload interface입니다."""
+
+    def upload(self, *, file: str | Path | BinaryIO, config: dict[str, Any] | None = None) -> Any: ...
+
+
+class LocalFileStore:
+    """`client.files.upload`를 흉내 내는 offline 저장소입니다. Network를 쓰지 않습니다."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.calls = 0
+        self.uploaded_bytes = 0
+        # 실제 Files API처럼 여러 thread의 동시 업로드에도 이름이 겹치지 않게 합니다.
+        self._lock = threading.Lock()
+
+    def upload(
+        self,
+        *,
+        file: str | Path | BinaryIO,
+        config: dict[str, Any] | None = None,
+    ) -> UploadedFile:
+        """파일 경로나 binary stream을 받아 `local://` URI를 돌려줍니다."""
+
+        if isinstance(file, (str, Path)):
+            data = Path(file).read_bytes()
+            mime_type = "video/mp4" if Path(file).suffix.lower() == ".mp4" else "image/jpeg"
+        else:
+            data = file.read()
+            mime_type = "application/octet-stream"
+        if config and "mime_type" in config:
+            mime_type = config["mime_type"]
+        with self._lock:
+            self.calls += 1
+            self.uploaded_bytes += len(data)
+            name = f"files/{len(self.files):06d}"
+            self.files[name] = data
+        return UploadedFile(
+            name=name, uri=f"local://{name}", mime_type=mime_type, size_bytes=len(data)
+        )
+
+
+class UploadCache:
+    """같은 JPEG bytes를 두 번 올리지 않도록 digest별 업로드 결과를 기억합니다.
+
+    여러 thread에서 호출해도 됩니다. Lock은 dict 조회·갱신에만 잡고 network
+    업로드는 lock 밖에서 하므로, 서로 다른 이미지의 업로드는 동시에 진행됩니다.
+    같은 digest가 동시에 처음 올라오면 드물게 두 번 업로드될 수 있지만 cache에는
+    먼저 끝난 응답 하나만 남습니다.
+    """
+
+    def __init__(self, files: FileUploader, max_entries: int = 1024) -> None:
+        self.files = files
+        self.max_entries = max_entries
+        self._uploaded: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.reused = 0
+
+    def upload(self, encoded: EncodedImage) -> Any:
+        """처음 보는 digest만 업로드하고, 본 적 있으면 이전 응답을 재사용합니다."""
+
+        with self._lock:
+            uploaded = self._lookup(encoded.digest)
+        if uploaded is not None:
+            return uploaded
+        uploaded = self.files.upload(
+            file=BytesIO(encoded.data), config={"mime_type": encoded.mime_type}
+        )
+        with self._lock:
+            # 기다리는 동안 다른 thread가 같은 digest를 등록했다면 그 응답을 씁니다.
+            existing = self._lookup(encoded.digest)
+            if existing is not None:
+                return existing
+            self._uploaded[encoded.digest] = uploaded
+            while len(self._uploaded) > self.max_entries:
+                self._uploaded.popitem(last=False)
+        return uploaded
+
+    def _lookup(self, digest: str) -> Any:
+        """Lock을 잡은 호출자를 위해 cache 항목을 찾고 최근 사용으로 표시합니다."""
+
+        uploaded = self._uploaded.get(digest)
+        if uploaded is not None:
+            self._uploaded.move_to_end(digest)
+            self.reused += 1
+        return uploaded
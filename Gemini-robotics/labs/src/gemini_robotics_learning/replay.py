@@ -0,0 +1,268 @@
+"""기록된 tool-call plan을 재생해 `ToolExecutor` 처리량과 지연을 측정합니다.
+
+Plan 파일은 JSONL이며 한 줄이 plan 하나입니다. 줄은 tool-call 배열이거나
+`{"at_s": 초, "human_present": bool, "calls": [...]}` object입니다. `at_s`는 session
+시작 기준 시각으로, real-time pacing에서 원래 간격대로 plan을 보낼 때 씁니다.
+
+거부된 plan은 mock을 STOPPED로 latch하므로, harness는 다음 plan 전에 operator
+reset을 흉내 내 robot 상태를 home pose로 되돌립니다. 감사 log와 call ID window는
+session 전체에서 유지됩니다.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from .mock_robot import RobotState, ToolExecutor
+from .safety import ToolRejected, WorkspaceLimits
+
+
+@dataclass(frozen=True)
+class RecordedPlan:
+    """재생할 plan 하나와 원래 도착 시각입니다."""
+
+    calls: list[dict[str, Any]]
+    at_s: float = 0.0
+    human_present: bool = False
+
+
+def load_plans(path: Path | str) -> Iterator[RecordedPlan]:
+    """JSONL plan 파일을 한 줄씩 읽습니다. 큰 파일도 메모리에 한꺼번에 올리지 않습니다."""
+
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            value = json.loads(line)
+            if isinstance(value, list):
+                yield RecordedPlan(calls=value)
+                continue
+            if not isinstance(value, dict) or not isinstance(value.get("calls"), list):
+                raise ValueError(f"line {line_number} must be a call list or an object with calls")
+            yield RecordedPlan(
+                calls=value["calls"],
+                at_s=float(value.get("at_s", 0.0)),
+                human_present=bool(value.get("human_present", False)),
+            )
+
+
+def write_plans(path: Path | str, plans: Iterable[RecordedPlan]) -> int:
+    """Plan을 JSONL로 쓰고 plan 수를 반환합니다."""
+
+    count = 0
+    with Path(path).open("w", encoding="utf-8") as handle:
+        for plan in plans:
+            row = {"at_s": plan.at_s, "human_present": plan.human_present, "calls": plan.calls}
+            handle.write(json.dumps(row, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def synthetic_plans(
+    total_calls: int,
+    *,
+    seed: int = 0,
+    workspace: WorkspaceLimits | None = None,
+    plan_length: int = 8,
+    unsafe_ratio: float = 0.02,
+    duplicate_ratio: float = 0.01,
+    plans_per_s: float = 20.0,
+) -> Iterator[RecordedPlan]:
+    """같은 seed면 항상 같은 pick-and-place 형태의 plan을 만듭니다.
+
+    대부분은 home에서 시작해 작은 move와 gripper 명령을 섞은 안전한 plan입니다.
+    `unsafe_ratio` 비율의 call은 workspace 밖 목표나 과속으로 바꿔 거부 경로를,
+    `duplicate_ratio` 비율은 직전 call ID 재전송으로 idempotency 경로를 재현합니다.
+    """
+
+    if plan_length <= 0:
+        raise ValueError("plan_length must be positive")
+    limits = workspace or WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4)
+    rng = np.random.default_rng(seed)
+    home = RobotState()
+    produced = 0
+    plan_index = 0
+    while produced < total_calls:
+        length = min(plan_length, total_calls - produced)
+        # plan 하나에 필요한 난수를 한 번에 뽑아 Python loop 비용을 줄입니다.
+        kinds = rng.random(length)
+        steps = rng.normal(scale=0.04, size=(length, 3))
+        faults = rng.random(length)
+        x, y, z = home.x, home.y, home.z
+        calls: list[dict[str, Any]] = []
+        for step in range(length):
+            call_id = f"p{plan_index}-s{step}"
+            if calls and faults[step] < duplicate_ratio:
+                # 직전 call을 그대로 재전송합니다.
+                calls.append(dict(calls[-1]))
+                continue
+            if kinds[step] < 0.25:
+                calls.append(
+                    {
+                        "id": call_id,
+                        "name": "set_gripper",
+                        "arguments": {"opened": bool(kinds[step] < 0.125), "max_force_n": 10.0},
+                    }
+                )
+                continue
+            # workspace 안쪽으로 clip해 정상 move는 항상 허용되게 합니다.
+            x = float(np.clip(x + steps[step, 0], limits.x_min + 0.01, limits.x_max - 0.01))
+            y = float(np.clip(y + steps[step, 1], limits.y_min + 0.01, limits.y_max - 0.01))
+            z = float(np.clip(z + steps[step, 2], limits.z_min + 0.01, limits.z_max - 0.01))
+            speed = 0.05
+            target_x = x
+            if faults[step] > 1.0 - unsafe_ratio:
+                # 절반은 workspace 밖 목표, 절반은 속도 제한 위반입니다.
+                if faults[step] > 1.0 - unsafe_ratio / 2.0:
+                    target_x = limits.x_max + 0.5
+                else:
+                    speed = 5.0
+            calls.append(
+                {
+                    "id": call_id,
+                    "name": "move",
+                    "arguments": {"x": target_x, "y": y, "z": z, "speed_m_s": speed, "frame_id": "table"},
+                }
+            )
+        yield RecordedPlan(calls=calls, at_s=plan_index / plans_per_s)
+        produced += length
+        plan_index += 1
+
+
+@dataclass
+class ReplayReport:
+    """재생 결과의 처리량, tool별 지연 분포, 거부 통계입니다."""
+
+    plans: int = 0
+    calls: int = 0
+    executed: int = 0
+    rejected_plans: int = 0
+    # 거부된 call 뒤에 남아 실행되지 않은 call 수입니다.
+    skipped: int = 0
+    wall_s: float = 0.0
+    latencies_s: dict[str, array] = field(default_factory=dict)
+    rejections_by_tool: Counter[str] = field(default_factory=Counter)
+    rejections_by_reason: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def calls_per_s(self) -> float:
+        return self.executed / self.wall_s if self.wall_s > 0.0 else 0.0
+
+    def latency_summary(self) -> dict[str, dict[str, float]]:
+        """Tool별 호출 수와 p50·p99·max 지연(µs)입니다."""
+
+        summary: dict[str, dict[str, float]] = {}
+        for name, values in sorted(self.latencies_s.items()):
+            samples = np.frombuffer(values, dtype=np.float64) * 1e6
+            p50, p99 = np.percentile(samples, [50.0, 99.0])
+            summary[name] = {
+                "count": int(samples.size),
+                "p50_us": float(p50),
+                "p99_us": float(p99),
+                "max_us": float(samples.max()),
+            }
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON으로 출력할 수 있는 요약입니다."""
+
+        return {
+            "plans": self.plans,
+            "calls": self.calls,
+            "executed": self.executed,
+            "skipped": self.skipped,
+            "rejected_plans": self.rejected_plans,
+            "wall_s": self.wall_s,
+            "calls_per_s": self.calls_per_s,
+            "latency": self.latency_summary(),
+            "statuses": dict(self.statuses),
+            "rejections_by_tool": dict(self.rejections_by_tool),
+            "rejections_by_reason": dict(self.rejections_by_reason.most_common(10)),
+        }
+
+
+class ReplayHarness:
+    """Plan stream을 최대 속도 또는 기록된 시각에 맞춰 executor로 재생합니다."""
+
+    def __init__(
+        self,
+        executor: ToolExecutor,
+        *,
+        home: RobotState | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.executor = executor
+        self.home = home or RobotState()
+        self._clock = clock
+        self._sleep = sleep
+
+    def _reset_robot(self) -> None:
+        """Operator reset을 흉내 내 STOPPED latch를 풀고 home pose로 돌아갑니다."""
+
+        home = self.home
+        self.executor.robot.state = RobotState(
+            x=home.x, y=home.y, z=home.z, gripper_open=home.gripper_open
+        )
+
+    def run(
+        self,
+        plans: Iterable[RecordedPlan],
+        *,
+        realtime: bool = False,
+        speed: float = 1.0,
+    ) -> ReplayReport:
+        """Plan을 모두 재생하고 report를 반환합니다.
+
+        `realtime`이면 각 plan을 `at_s / speed` 시각까지 기다렸다가 보냅니다.
+        늦어진 plan은 기다리지 않고 바로 보내므로 누적 지연이 생기지 않습니다.
+        """
+
+        if speed <= 0.0:
+            raise ValueError("speed must be positive")
+        report = ReplayReport()
+        robot = self.executor.robot
+        started_at = self._clock()
+        for plan in plans:
+            if realtime:
+                delay = plan.at_s / speed - (self._clock() - started_at)
+                if delay > 0.0:
+                    self._sleep(delay)
+            self._reset_robot()
+            report.plans += 1
+            report.calls += len(plan.calls)
+            before = robot.records.appended
+            try:
+                self.executor.execute_plan(plan.calls, human_present=plan.human_present)
+            except (ToolRejected, ValueError, TypeError) as error:
+                failed_at = robot.records.appended - before
+                report.rejected_plans += 1
+                report.rejections_by_reason[str(error)] += 1
+                # tool 실행 중 실패만 mock을 STOPPED로 만듭니다. 나머지는 plan·envelope 단위 거부입니다.
+                if robot.state.stopped and failed_at < len(plan.calls):
+                    failed = plan.calls[failed_at]
+                    report.rejections_by_tool[str(failed.get("name"))] += 1
+                else:
+                    report.rejections_by_tool["<plan>"] += 1
+                report.skipped += max(0, len(plan.calls) - failed_at - 1)
+            executed = robot.records.appended - before
+            report.executed += executed
+            # ring buffer 끝에서 이번 plan이 추가한 record만 읽습니다.
+            for offset in range(min(executed, len(robot.records)), 0, -1):
+                record = robot.records[-offset]
+                report.statuses[str(record.result.get("status"))] += 1
+                samples = report.latencies_s.get(record.name)
+                if samples is None:
+                    samples = report.latencies_s[record.name] = array("d")
+                samples.append(record.elapsed_s)
+        report.wall_s = self._clock() - started_at
+        return report
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from math import dist, isfinite
+from math import ceil, dist, isfinite, sqrt
+from typing import Callable, Sequence
+
+import numpy as np
 
 
 class ToolRejected(RuntimeError):
@@ -39,6 +42,241 @@ class ForbiddenBox:
     limits: WorkspaceLimits
 
 
+def _slab_hits(
+    origin: np.ndarray, direction: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> np.ndarray:
+    """마지막 축이 xyz인 broadcast 가능한 선분·box 배열의 교차 여부를 계산합니다."""
+
+    parallel = direction == 0.0
+    # 0으로 나누는 축은 아래에서 따로 덮어쓰므로 경고만 끕니다.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_low = (lower - origin) / direction
+        t_high = (upper - origin) / direction
+    t_near = np.minimum(t_low, t_high)
+    t_far = np.maximum(t_low, t_high)
+    # 평행한 축은 slab 안이면 제약 없음(-inf, inf), 밖이면 빈 구간(inf, -inf)입니다.
+    inside = (lower <= origin) & (origin <= upper)
+    t_near = np.where(parallel, np.where(inside, -np.inf, np.inf), t_near)
+    t_far = np.where(parallel, np.where(inside, np.inf, -np.inf), t_far)
+    entry = t_near.max(axis=-1)
+    exit_ = t_far.min(axis=-1)
+    return (entry <= exit_) & (exit_ >= 0.0) & (entry <= 1.0)
+
+
+def segments_hit_boxes(
+    starts: np.ndarray, ends: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> np.ndarray:
+    """(M, 3) 선분들과 (B, 3) 닫힌 AABB들의 교차 여부를 (M, B)로 반환합니다.
+
+    Slab method입니다. 축마다 선분 매개변수 t∈[0, 1]이 box의 두 평면 사이에
+    있는 구간을 구하고, 세 축 구간의 교집합이 비어 있지 않으면 교차입니다.
+    어떤 축 방향 성분이 0이면 그 축에서는 시작점이 slab 안에 있는지만 봅니다.
+    """
+
+    # (M, 1, 3)과 (1, B, 3)으로 펼쳐 모든 선분-box 쌍을 한 번에 계산합니다.
+    return _slab_hits(
+        starts[:, None, :], (ends - starts)[:, None, :], lower[None, :, :], upper[None, :, :]
+    )
+
+
+class ForbiddenRegionIndex:
+    """ForbiddenBox 목록을 x-y uniform grid에 등록한 broad-phase index입니다.
+
+    각 box는 자신의 x-y 범위가 겹치는 모든 cell에 등록됩니다. 점 질의는 점이
+    속한 cell 하나의 후보만 정확한 `contains`로 확인하므로 box가 수백 개여도
+    비교 횟수가 거의 늘지 않습니다. 후보는 원래 목록 순서를 유지해 선형 scan과
+    같은 첫 번째 region을 보고합니다.
+    """
+
+    # 한 축의 cell 수 상한입니다. box가 아주 많아도 grid 자체가 커지지 않게 합니다.
+    MAX_CELLS_PER_AXIS = 256
+
+    def __init__(self, regions: Sequence[ForbiddenBox]) -> None:
+        self.regions = tuple(regions)
+        # (B, 3) 하한·상한 배열은 batch 질의에서 NumPy 비교에 사용합니다.
+        self.lower = np.array(
+            [(r.limits.x_min, r.limits.y_min, r.limits.z_min) for r in self.regions],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        self.upper = np.array(
+            [(r.limits.x_max, r.limits.y_max, r.limits.z_max) for r in self.regions],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        # box가 없으면 grid 없이 모든 질의가 바로 None을 반환합니다.
+        if not self.regions:
+            self.cells_per_axis = 0
+            self._cells: dict[int, np.ndarray] = {}
+            return
+        # box 수의 제곱근 정도로 cell을 나누면 cell당 평균 후보가 상수에 가깝습니다.
+        self.cells_per_axis = min(self.MAX_CELLS_PER_AXIS, max(1, ceil(sqrt(len(self.regions)))))
+        self.origin = self.lower[:, :2].min(axis=0)
+        extent = self.upper[:, :2].max(axis=0) - self.origin
+        # 폭이 0인 축도 0으로 나누지 않도록 cell 크기를 1로 둡니다.
+        self.cell_size = np.where(extent > 0.0, extent / self.cells_per_axis, 1.0)
+        # 각 box를 겹치는 cell 범위 전체에 등록한 (cell, box) 쌍을 만듭니다.
+        owners, cells = self._expand_cells(self.lower[:, :2], self.upper[:, :2])
+        # cell 순, 같은 cell 안에서는 목록 순으로 정렬해 CSR 형태로 저장합니다.
+        order = np.lexsort((owners, cells))
+        self._members = owners[order]
+        cell_count = self.cells_per_axis * self.cells_per_axis
+        self._offsets = np.zeros(cell_count + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cells, minlength=cell_count), out=self._offsets[1:])
+        # 점 질의용으로 비어 있지 않은 cell만 dict에 두어 Python lookup을 빠르게 합니다.
+        self._cells = {
+            int(cell): self._members[self._offsets[cell] : self._offsets[cell + 1]]
+            for cell in np.unique(cells)
+        }
+
+    def _expand_cells(
+        self, lower_xy: np.ndarray, upper_xy: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """사각형마다 겹치는 cell을 펼쳐 (사각형 index, cell id) 배열 쌍을 반환합니다."""
+
+        low = self._cell_coordinates(lower_xy)
+        high = self._cell_coordinates(upper_xy)
+        spans = high - low + 1
+        counts = spans[:, 0] * spans[:, 1]
+        owners = np.repeat(np.arange(len(low)), counts)
+        # 사각형 안에서의 0, 1, 2, ... 순번을 cell x, y offset으로 나눕니다.
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = low[owners, 0] + local // spans[owners, 1]
+        cell_y = low[owners, 1] + local % spans[owners, 1]
+        return owners, cell_x * self.cells_per_axis + cell_y
+
+    def _cell_coordinates(self, xy: np.ndarray) -> np.ndarray:
+        """(N, 2) x-y 좌표를 grid 범위로 clip된 정수 cell 좌표로 바꿉니다."""
+
+        # 같은 식을 box 모서리와 질의 점에 적용하므로 경계 위 점도 같은 cell에 들어갑니다.
+        cells = np.floor((xy - self.origin) / self.cell_size).astype(np.intp)
+        return np.clip(cells, 0, self.cells_per_axis - 1)
+
+    def candidates(self, x: float, y: float) -> np.ndarray:
+        """점 (x, y)가 속한 cell의 후보 region index를 반환합니다."""
+
+        if not self.regions:
+            return np.empty(0, dtype=np.intp)
+        cell_x, cell_y = self._cell_coordinates(np.array([[x, y]], dtype=np.float64))[0]
+        cell_id = int(cell_x) * self.cells_per_axis + int(cell_y)
+        return self._cells.get(cell_id, np.empty(0, dtype=np.intp))
+
+    def candidates_in_area(self, lower_xy: Sequence[float], upper_xy: Sequence[float]) -> np.ndarray:
+        """x-y 사각형과 겹치는 모든 cell의 후보를 중복 없이 목록 순서로 반환합니다."""
+
+        if not self.regions:
+            return np.empty(0, dtype=np.intp)
+        corners = self._cell_coordinates(np.array([lower_xy, upper_xy], dtype=np.float64))
+        (x0, y0), (x1, y1) = corners
+        groups = [
+            self._cells[cell]
+            for cell_x in range(x0, x1 + 1)
+            for cell_y in range(y0, y1 + 1)
+            if (cell := cell_x * self.cells_per_axis + cell_y) in self._cells
+        ]
+        if not groups:
+            return np.empty(0, dtype=np.intp)
+        # 여러 cell에 등록된 같은 box는 np.unique가 한 번만 남기고 정렬합니다.
+        return groups[0] if len(groups) == 1 else np.unique(np.concatenate(groups))
+
+    def first_crossed(
+        self, start: Sequence[float], end: Sequence[float]
+    ) -> ForbiddenBox | None:
+        """선분 start→end가 지나는 첫 번째 region을 반환하고, 없으면 None을 반환합니다.
+
+        시작점을 이미 포함하는 region은 세지 않습니다. 금지 영역 안에 갇힌
+        pose도 그 영역을 빠져나가는 move는 할 수 있어야 하기 때문입니다.
+        """
+
+        segment = np.array([start, end], dtype=np.float64)
+        # 선분의 x-y bounding box와 겹치는 cell의 box만 정밀 검사합니다.
+        lower_xy, upper_xy = segment[:, :2].min(axis=0), segment[:, :2].max(axis=0)
+        candidates = self.candidates_in_area(lower_xy, upper_xy)
+        if len(candidates) == 0:
+            return None
+        lower, upper = self.lower[candidates], self.upper[candidates]
+        hits = _slab_hits(segment[0], segment[1] - segment[0], lower, upper)
+        # 빠져나가는 중인 region은 교차 후보에서 뺍니다.
+        hits &= ~((lower <= segment[0]) & (segment[0] <= upper)).all(axis=-1)
+        return self.regions[candidates[hits.argmax()]] if hits.any() else None
+
+    def first_crossed_batch(
+        self, starts: np.ndarray, ends: np.ndarray, *, chunk_segments: int = 4096
+    ) -> np.ndarray:
+        """선분마다 처음 교차하는 region index를, 없으면 -1을 반환합니다.
+
+        `first_crossed`처럼 선분 시작점을 포함하는 region은 세지 않습니다.
+
+        각 선분은 bounding box가 겹치는 grid cell의 box와만 짝지어지고, 모든
+        후보 쌍은 한 번의 vectorized slab 검사로 처리됩니다. 임시 배열이 너무
+        커지지 않도록 `chunk_segments`개씩 나눠 계산합니다.
+        """
+
+        hits = np.full(len(starts), -1, dtype=np.intp)
+        if not self.regions or len(starts) == 0:
+            return hits
+        for begin in range(0, len(starts), chunk_segments):
+            stop = begin + chunk_segments
+            hits[begin:stop] = self._first_crossed_chunk(starts[begin:stop], ends[begin:stop])
+        return hits
+
+    def _first_crossed_chunk(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """선분 묶음 하나를 grid 후보와만 짝지어 slab 검사합니다."""
+
+        # 1) 선분 x-y bounding box가 덮는 cell을 모두 펼칩니다.
+        segments, cells = self._expand_cells(
+            np.minimum(starts[:, :2], ends[:, :2]), np.maximum(starts[:, :2], ends[:, :2])
+        )
+        # 2) 각 cell의 CSR 구간을 펼쳐 (선분, box) 후보 쌍을 만듭니다.
+        begin = self._offsets[cells]
+        counts = self._offsets[cells + 1] - begin
+        pair_segments = np.repeat(segments, counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_boxes = self._members[np.repeat(begin, counts) + local]
+        # 3) 후보 쌍만 원소별 slab 검사합니다. 여러 cell에서 중복된 쌍은 결과에 영향이 없습니다.
+        pair_starts = starts[pair_segments]
+        lower, upper = self.lower[pair_boxes], self.upper[pair_boxes]
+        crossed = _slab_hits(pair_starts, ends[pair_segments] - pair_starts, lower, upper)
+        # 시작점을 포함하는 box는 빠져나가는 중이므로 교차로 세지 않습니다.
+        crossed &= ~((lower <= pair_starts) & (pair_starts <= upper)).all(axis=-1)
+        # 4) 선분마다 교차한 box 중 목록 순서가 가장 앞선 index를 고릅니다.
+        first = np.full(len(starts), len(self.regions), dtype=np.intp)
+        np.minimum.at(first, pair_segments[crossed], pair_boxes[crossed])
+        return np.where(first < len(self.regions), first, -1)
+
+    def first_containing(self, x: float, y: float, z: float) -> ForbiddenBox | None:
+        """점을 포함하는 첫 번째 region을 반환하고, 없으면 None을 반환합니다."""
+
+        for index in self.candidates(x, y):
+            region = self.regions[index]
+            if region.limits.contains(x, y, z):
+                return region
+        return None
+
+    def first_containing_batch(self, points: np.ndarray) -> np.ndarray:
+        """(M, 3) 점마다 처음 포함되는 region index를, 없으면 -1을 반환합니다."""
+
+        hits = np.full(len(points), -1, dtype=np.intp)
+        if not self.regions or len(points) == 0:
+            return hits
+        cells = self._cell_coordinates(points[:, :2])
+        cell_ids = cells[:, 0] * self.cells_per_axis + cells[:, 1]
+        # 같은 cell에 속한 점들을 묶어 후보 box와 한 번의 broadcasting 비교를 합니다.
+        unique_ids, inverse = np.unique(cell_ids, return_inverse=True)
+        for group, cell_id in enumerate(unique_ids):
+            candidates = self._cells.get(int(cell_id))
+            if candidates is None:
+                continue
+            members = np.flatnonzero(inverse == group)
+            selected = points[members, None, :]
+            # (k, C, 3) 비교를 축별로 모아 (k, C) 포함 여부를 만듭니다.
+            inside = (
+                (self.lower[candidates] <= selected) & (selected <= self.upper[candidates])
+            ).all(axis=2)
+            found = inside.any(axis=1)
+            # argmax는 첫 True 위치이므로 목록 순서상 첫 region을 고릅니다.
+            hits[members[found]] = candidates[inside[found].argmax(axis=1)]
+        return hits
+
+
 @dataclass(frozen=True)
 class MoveCommand:
     """검증 전의 Cartesian move 제안입니다."""
@@ -62,8 +300,61 @@ class SafetyEnvelope:
     max_speed_m_s: float = 0.10
     # 좌표 frame이 섞이는 사고를 막기 위한 허용 frame입니다.
     allowed_frame: str = "table"
-    # workspace 내부의 금지 영역 목록입니다.
-    forbidden: list[ForbiddenBox] = field(default_factory=list)
+    # workspace 내부의 금지 영역입니다. 생성·대입 시 tuple로 고정됩니다.
+    forbidden: tuple[ForbiddenBox, ...] = ()
+    # True면 목표점뿐 아니라 현재 위치에서 목표까지의 직선 경로도 금지 영역과 검사합니다.
+    check_swept_path: bool = True
+    # 비선형 path를 검사할 때 몇 개의 선분으로 나눌지 정합니다.
+    path_samples: int = 16
+    # 현재 `forbidden`으로 만든 index입니다. `forbidden`을 대입하면 None으로 비웁니다.
+    _index: ForbiddenRegionIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """금지 영역 index를 미리 만듭니다."""
+
+        self.forbidden_index()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """`forbidden`이 바뀌는 유일한 길인 대입에서 index를 무효화합니다.
+
+        list를 그대로 보관하면 제자리 append를 알아채려고 매 검사마다 목록을
+        비교해야 합니다. tuple로 복사해 두면 `append`는 AttributeError로
+        실패하고, 새 목록은 대입이나 `add_forbidden`으로만 들어옵니다.
+        """
+
+        if name == "forbidden":
+            value = tuple(value)
+            object.__setattr__(self, "_index", None)
+        object.__setattr__(self, name, value)
+
+    def add_forbidden(self, *boxes: ForbiddenBox) -> None:
+        """금지 영역을 목록 끝에 추가합니다. 다음 검사부터 반영됩니다."""
+
+        self.forbidden = (*self.forbidden, *boxes)
+
+    def forbidden_index(self) -> ForbiddenRegionIndex:
+        """현재 `forbidden`에 맞는 공간 index를 반환하고, 없으면 만듭니다."""
+
+        if self._index is None:
+            self._index = ForbiddenRegionIndex(self.forbidden)
+        return self._index
+
+    def fingerprint(self) -> tuple[object, ...]:
+        """검사 결과를 좌우하는 모든 정책 값을 비교 가능한 tuple로 반환합니다.
+
+        미리 검증해 둔 결과를 나중에 쓰는 쪽은 이 값이 그대로인지 확인해야
+        합니다. 금지 영역이 추가되거나 한도가 바뀌면 값이 달라집니다.
+        """
+
+        return (
+            self.workspace,
+            self.max_step_m,
+            self.max_speed_m_s,
+            self.allowed_frame,
+            self.forbidden,
+            self.check_swept_path,
+            self.path_samples,
+        )
 
     def validate_move(
         self,
@@ -71,8 +362,15 @@ class SafetyEnvelope:
         command: MoveCommand,
         *,
         human_present: bool = False,
+        path: Callable[[np.ndarray], np.ndarray] | None = None,
     ) -> None:
-        """Move가 안전 정책을 통과하지 못하면 ToolRejected를 발생시킵니다."""
+        """Move가 안전 정책을 통과하지 못하면 ToolRejected를 발생시킵니다.
+
+        `path`를 주면 직선 대신 t∈[0, 1]을 (K, 3) 위치로 바꾸는 곡선 경로로
+        보고, `path_samples`개 선분으로 나눠 workspace와 금지 영역을 검사합니다.
+        현재 pose가 이미 금지 영역 안이면 그 영역을 빠져나가는 경로는 허용하고,
+        목표점과 다른 금지 영역은 그대로 검사합니다.
+        """
 
         # 사람 감지는 모델 추정이 아니라 독립 sensor 입력이라고 가정합니다.
         if human_present:
@@ -94,8 +392,112 @@ class SafetyEnvelope:
         target = (command.x, command.y, command.z)
         if dist(current_xyz, target) > self.max_step_m:
             raise ToolRejected("move exceeds the maximum distance per step")
-        # 허용 workspace 안의 카메라 기둥 같은 금지 영역도 검사합니다.
-        for region in self.forbidden:
-            if region.limits.contains(command.x, command.y, command.z):
-                raise ToolRejected(f"target enters forbidden region: {region.name}")
+        # 허용 workspace 안의 카메라 기둥 같은 금지 영역도 index로 검사합니다.
+        index = self.forbidden_index()
+        region = index.first_containing(command.x, command.y, command.z)
+        if region is not None:
+            raise ToolRejected(f"target enters forbidden region: {region.name}")
+        # 목표점이 안전해도 이동 중에 금지 영역을 가로지르면 거부합니다.
+        if path is not None:
+            self._validate_sampled_path(current_xyz, target, path)
+        elif self.check_swept_path:
+            region = index.first_crossed(current_xyz, target)
+            if region is not None:
+                raise ToolRejected(f"path crosses forbidden region: {region.name}")
+
+    def _validate_sampled_path(
+        self,
+        current_xyz: tuple[float, float, float],
+        target: tuple[float, float, float],
+        path: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        """곡선 path를 polyline으로 근사해 모든 선분을 검사합니다."""
+
+        samples = np.linspace(0.0, 1.0, max(2, self.path_samples + 1))
+        points = np.asarray(path(samples), dtype=np.float64)
+        if points.shape != (len(samples), 3) or not np.isfinite(points).all():
+            raise ToolRejected("path must return finite (K, 3) positions")
+        # 양 끝이 현재 위치와 목표가 아니면 검사한 경로와 실제 move가 다릅니다.
+        if not (np.allclose(points[0], current_xyz) and np.allclose(points[-1], target)):
+            raise ToolRejected("path endpoints do not match the move")
+        limits = self.workspace
+        lower = np.array((limits.x_min, limits.y_min, limits.z_min))
+        upper = np.array((limits.x_max, limits.y_max, limits.z_max))
+        if not ((lower <= points) & (points <= upper)).all():
+            raise ToolRejected("path leaves the allowed workspace")
+        index = self.forbidden_index()
+        hits = index.first_crossed_batch(points[:-1], points[1:])
+        if (hits >= 0).any():
+            # 여러 선분이 부딪히면 목록 순서상 가장 앞선 region 이름을 보고합니다.
+            region = index.regions[hits[hits >= 0].min()]
+            raise ToolRejected(f"path crosses forbidden region: {region.name}")
+
+    def validate_moves(
+        self,
+        current_xyz: tuple[float, float, float],
+        commands: Sequence[MoveCommand],
+        *,
+        human_present: bool = False,
+    ) -> list[str | None]:
+        """같은 현재 pose에서 출발하는 후보 move들을 한 번에 검사합니다.
+
+        각 원소는 `validate_move`가 발생시킬 ToolRejected 메시지이며, 통과한
+        command는 None입니다. 검사 순서와 메시지는 scalar 경로와 같습니다.
+        """
+
+        count = len(commands)
+        reasons: list[str | None] = [None] * count
+        if human_present:
+            return ["human is present in the protected workspace"] * count
+        # type 검사는 항목별로 하되, 실패한 command는 NaN으로 채워 배열 연산에서 제외합니다.
+        start_ok = all(isinstance(value, (int, float)) and isfinite(value) for value in current_xyz)
+        values = np.full((count, 4), np.nan, dtype=np.float64)
+        pending = np.ones(count, dtype=bool)
+        for index, command in enumerate(commands):
+            if command.frame_id != self.allowed_frame:
+                reasons[index] = f"frame {command.frame_id!r} is not allowed"
+                pending[index] = False
+                continue
+            numbers = (command.x, command.y, command.z, command.speed_m_s)
+            if not (start_ok and all(isinstance(value, (int, float)) for value in numbers)):
+                reasons[index] = "move contains a non-finite numeric value"
+                pending[index] = False
+                continue
+            values[index] = numbers
+        finite = np.isfinite(values).all(axis=1)
+        targets = values[:, :3]
+        speeds = values[:, 3]
+        start = np.array(current_xyz, dtype=np.float64) if start_ok else np.zeros(3)
+        limits = self.workspace
+        lower = np.array((limits.x_min, limits.y_min, limits.z_min))
+        upper = np.array((limits.x_max, limits.y_max, limits.z_max))
+        # NaN 비교는 False이므로 finite 검사 뒤의 mask에만 의미가 있습니다.
+        outside = ~((lower <= targets) & (targets <= upper)).all(axis=1)
+        bad_speed = ~((0.0 < speeds) & (speeds <= self.max_speed_m_s))
+        too_far = np.sqrt(((targets - start) ** 2).sum(axis=1)) > self.max_step_m
+        checks = (
+            (~finite, "move contains a non-finite numeric value"),
+            (outside, "target is outside the allowed workspace"),
+            (bad_speed, "speed is outside the allowed range"),
+            (too_far, "move exceeds the maximum distance per step"),
+        )
+        for failed, reason in checks:
+            # 앞선 검사에서 이미 거부된 command는 첫 번째 사유만 유지합니다.
+            for index in np.flatnonzero(failed & pending):
+                reasons[index] = reason
+            pending &= ~failed
+        # 남은 target만 금지 영역 index에 한 번의 batch 질의로 보냅니다.
+        remaining = np.flatnonzero(pending)
+        index = self.forbidden_index()
+        hits = index.first_containing_batch(targets[remaining])
+        for command_index, hit in zip(remaining[hits >= 0], hits[hits >= 0]):
+            reasons[command_index] = f"target enters forbidden region: {index.regions[hit].name}"
+        # 목표점을 통과한 move만 모든 box에 대해 한 번의 slab 검사로 경로를 확인합니다.
+        if self.check_swept_path:
+            remaining = remaining[hits < 0]
+            starts = np.broadcast_to(start, (len(remaining), 3))
+            crossed = index.first_crossed_batch(starts, targets[remaining])
+            for command_index, hit in zip(remaining[crossed >= 0], crossed[crossed >= 0]):
+                reasons[command_index] = f"path crosses forbidden region: {index.regions[hit].name}"
+        return reasons
 
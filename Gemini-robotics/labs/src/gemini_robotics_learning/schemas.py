@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 # JSONDecoder.raw_decode는 응답 앞뒤 설명을 실행하지 않고 JSON만 읽게 해 줍니다.
-from json import JSONDecodeError, JSONDecoder
+from json import JSONDecodeError, JSONDecoder, loads
 from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
 
-from .geometry import NormalizedBox, NormalizedPoint
+import numpy as np
+
+from .geometry import (
+    NORMALIZED_MAX,
+    NormalizedBox,
+    NormalizedPoint,
+    PlanarCalibration,
+    normalized_to_pixels,
+)
 
 
 def extract_json(text: str) -> object:
@@ -42,47 +51,54 @@ class PointDetection:
     label: str
 
 
-def parse_point_detections(text: str, maximum_items: int = 10) -> list[PointDetection]:
-    """`[{point:[y,x], label:string}]` 형식의 응답을 검증합니다."""
+def _json_array(text: str, kind: str, maximum_items: int) -> list[object]:
+    """응답의 최상위 JSON 배열과 항목 개수 상한을 검사합니다."""
 
     # 먼저 문자열을 실행하지 않는 JSON 데이터로 바꿉니다.
     value = extract_json(text)
-    # pointing 응답의 최상위는 배열이어야 합니다.
+    # pointing·box 응답의 최상위는 배열이어야 합니다.
     if not isinstance(value, list):
-        raise ValueError("point response must be a JSON array")
+        raise ValueError(f"{kind} response must be a JSON array")
     # prompt가 제한한 개수보다 많으면 예상하지 않은 출력을 거부합니다.
     if len(value) > maximum_items:
-        raise ValueError(f"point response has more than {maximum_items} items")
-    # 검증된 결과를 새 배열에만 추가합니다.
-    detections: list[PointDetection] = []
-    for index, item in enumerate(value):
-        # 각 원소는 point와 label을 가진 object여야 합니다.
-        if not isinstance(item, dict):
-            raise ValueError(f"item {index} must be an object")
-        # point가 빠지면 위치를 사용할 수 없습니다.
-        if "point" not in item:
-            raise ValueError(f"item {index} is missing point")
-        # label은 표시·matching에 필요하므로 문자열만 허용합니다.
-        label = item.get("label", "")
-        if not isinstance(label, str):
-            raise ValueError(f"item {index} label must be a string")
-        # 좌표 순서와 범위는 NormalizedPoint가 검증합니다.
-        point = NormalizedPoint.from_sequence(item["point"])
-        # 검증을 모두 통과한 항목만 결과에 넣습니다.
-        detections.append(PointDetection(point=point, label=label.strip()))
+        raise ValueError(f"{kind} response has more than {maximum_items} items")
+    return value
+
+
+def parse_point_detections(text: str, maximum_items: int = 10) -> list[PointDetection]:
+    """`[{point:[y,x], label:string}]` 형식의 응답을 검증합니다."""
+
+    # 배열 모양과 개수 상한은 batch parser와 같은 helper로 검사합니다.
+    value = _json_array(text, "point", maximum_items)
+    # 검증을 모두 통과한 항목만 새 배열에 넣습니다.
+    detections = [_point_detection(item, index) for index, item in enumerate(value)]
     # 빈 배열은 “대상을 찾지 못함”이라는 정상 결과로 허용합니다.
     return detections
 
 
+def _point_detection(item: object, index: int) -> PointDetection:
+    """Pointing 배열의 원소 하나를 검증합니다."""
+
+    # 각 원소는 point와 label을 가진 object여야 합니다.
+    if not isinstance(item, dict):
+        raise ValueError(f"item {index} must be an object")
+    # point가 빠지면 위치를 사용할 수 없습니다.
+    if "point" not in item:
+        raise ValueError(f"item {index} is missing point")
+    # label은 표시·matching에 필요하므로 문자열만 허용합니다.
+    label = item.get("label", "")
+    if not isinstance(label, str):
+        raise ValueError(f"item {index} label must be a string")
+    # 좌표 순서와 범위는 NormalizedPoint가 검증합니다.
+    point = NormalizedPoint.from_sequence(item["point"])
+    return PointDetection(point=point, label=label.strip())
+
+
 def parse_boxes(text: str, maximum_items: int = 20) -> list[NormalizedBox]:
     """공식 y/x/y2/x2 bounding-box 배열을 검증합니다."""
 
     # JSON parsing은 pointing과 같은 안전 경계를 사용합니다.
-    value = extract_json(text)
-    if not isinstance(value, list):
-        raise ValueError("box response must be a JSON array")
-    if len(value) > maximum_items:
-        raise ValueError(f"box response has more than {maximum_items} items")
+    value = _json_array(text, "box", maximum_items)
     # object가 아닌 항목을 조용히 버리면 모델 오류를 숨기므로 전부 거부합니다.
     if any(not isinstance(item, dict) for item in value):
         raise ValueError("every box item must be an object")
@@ -90,6 +106,387 @@ def parse_boxes(text: str, maximum_items: int = 20) -> list[NormalizedBox]:
     return [NormalizedBox.from_mapping(item) for item in value]
 
 
+def _box_item(item: object, index: int) -> NormalizedBox:
+    """Box 배열의 원소 하나를 `parse_boxes`와 같은 규칙으로 검증합니다."""
+
+    if not isinstance(item, dict):
+        raise ValueError("every box item must be an object")
+    return NormalizedBox.from_mapping(item)
+
+
+ItemT = TypeVar("ItemT")
+
+
+class StreamingArrayParser(Generic[ItemT]):
+    """Streaming chunk에서 최상위 JSON 배열의 원소를 닫히는 즉시 검증합니다.
+
+    `extract_json`은 응답 전체가 도착해야 `raw_decode`를 시작할 수 있습니다. 이
+    parser는 문자열·escape·괄호 깊이만 추적하다가 최상위 원소 하나가 닫히면 그
+    조각만 `json.loads`와 item 검증기에 넘깁니다. 따라서 첫 detection의 좌표
+    변환을 응답이 끝나기 전에 시작할 수 있습니다. 이미 반환한 원소는 이후
+    chunk가 잘못되어도 취소되지 않으므로, 행동 실행은 `close()`가 성공한 뒤에만
+    확정해야 합니다.
+    """
+
+    def __init__(
+        self,
+        item_parser: Callable[[object, int], ItemT],
+        kind: str,
+        maximum_items: int,
+    ) -> None:
+        # 원소 하나의 의미 검증은 일괄 parser와 같은 함수를 주입받습니다.
+        self._item_parser = item_parser
+        self._kind = kind
+        self._maximum_items = maximum_items
+        # 아직 소비하지 않은 텍스트와 그 안에서 다음에 볼 위치입니다.
+        self._buffer = ""
+        self._position = 0
+        # 현재 원소가 시작된 buffer 위치이며 원소 밖이면 None입니다.
+        self._element_start: int | None = None
+        # 최상위 배열 내부면 1, 원소 안의 중첩 object/array마다 1씩 증가합니다.
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        # 직전 원소 뒤에는 쉼표나 `]`만 올 수 있도록 구분자 상태를 추적합니다.
+        self._expect_separator = False
+        self._after_comma = False
+        self._count = 0
+        self._saw_text = False
+        self._started = False
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """최상위 배열의 닫는 `]`까지 읽었는지 반환합니다."""
+
+        return self._finished
+
+    def feed(self, chunk: str) -> list[ItemT]:
+        """Chunk 하나를 소비하고 이번에 닫힌 원소들을 검증해 반환합니다."""
+
+        # 배열이 끝난 뒤 이어지는 설명 텍스트는 `raw_decode`처럼 무시합니다.
+        if self._finished or not chunk:
+            return []
+        if chunk.strip():
+            self._saw_text = True
+        self._buffer += chunk
+        items: list[ItemT] = []
+        buffer = self._buffer
+        index = self._position
+        while index < len(buffer) and not self._finished:
+            character = buffer[index]
+            if not self._started:
+                # extract_json과 같이 첫 `[` 또는 `{`를 JSON 시작점으로 봅니다.
+                if character == "{":
+                    raise ValueError(f"{self._kind} response must be a JSON array")
+                if character == "[":
+                    self._started = True
+                    self._depth = 1
+            elif self._in_string:
+                # 문자열 안의 괄호와 쉼표는 구조가 아니므로 escape만 추적합니다.
+                if self._escape:
+                    self._escape = False
+                elif character == "\\":
+                    self._escape = True
+                elif character == '"':
+                    self._in_string = False
+            elif self._depth == 1 and character in " \t\r\n":
+                # 원소 사이 공백은 무시합니다. scalar 원소 안의 공백은 json.loads가 거부합니다.
+                pass
+            elif self._depth == 1 and character in ",]":
+                if self._element_start is not None:
+                    # 숫자·literal처럼 닫는 괄호가 없는 원소는 구분자에서 끝납니다.
+                    items.append(self._emit(buffer[self._element_start:index]))
+                elif character == "," and not self._expect_separator:
+                    raise ValueError(f"invalid JSON response: unexpected ',' in {self._kind} array")
+                elif character == "]" and self._after_comma:
+                    raise ValueError(f"invalid JSON response: trailing ',' in {self._kind} array")
+                self._after_comma = character == ","
+                self._expect_separator = False
+                if character == "]":
+                    self._depth = 0
+                    self._finished = True
+            else:
+                if self._depth == 1 and self._element_start is None:
+                    # 새 원소는 직전 원소 뒤 쉼표가 있어야만 시작할 수 있습니다.
+                    if self._expect_separator:
+                        raise ValueError(f"invalid JSON response: missing ',' in {self._kind} array")
+                    self._element_start = index
+                    self._after_comma = False
+                if character == '"':
+                    self._in_string = True
+                elif character in "[{":
+                    self._depth += 1
+                elif character in "]}":
+                    self._depth -= 1
+                    # 중첩 원소가 닫혀 최상위 깊이로 돌아오면 그 원소를 바로 검증합니다.
+                    if self._depth == 1:
+                        items.append(self._emit(buffer[self._element_start : index + 1]))
+            index += 1
+        # 처리한 텍스트는 버리고 진행 중인 원소 조각만 남겨 buffer 크기를 제한합니다.
+        keep_from = index if self._element_start is None else self._element_start
+        self._buffer = buffer[keep_from:]
+        self._position = index - keep_from
+        if self._element_start is not None:
+            self._element_start = 0
+        return items
+
+    def close(self) -> None:
+        """Stream이 끝났을 때 배열이 정상적으로 닫혔는지 확인합니다."""
+
+        if self._finished:
+            return
+        # extract_json과 같은 오류 메시지로 실패 원인을 구분합니다.
+        if not self._saw_text:
+            raise ValueError("model response is empty")
+        if not self._started:
+            raise ValueError("model response does not contain JSON")
+        raise ValueError(f"invalid JSON response: {self._kind} array was not closed")
+
+    def _emit(self, fragment: str) -> ItemT:
+        """닫힌 원소 조각 하나를 JSON으로 읽고 의미를 검증합니다."""
+
+        self._element_start = None
+        self._expect_separator = True
+        # prompt가 제한한 개수를 넘는 순간 나머지를 기다리지 않고 거부합니다.
+        if self._count >= self._maximum_items:
+            raise ValueError(f"{self._kind} response has more than {self._maximum_items} items")
+        try:
+            value = loads(fragment)
+        except JSONDecodeError as error:
+            raise ValueError(f"invalid JSON response: {error.msg}") from error
+        item = self._item_parser(value, self._count)
+        self._count += 1
+        return item
+
+
+def point_stream_parser(maximum_items: int = 10) -> StreamingArrayParser[PointDetection]:
+    """`parse_point_detections`와 같은 규칙의 streaming parser를 만듭니다."""
+
+    return StreamingArrayParser(_point_detection, "point", maximum_items)
+
+
+def box_stream_parser(maximum_items: int = 20) -> StreamingArrayParser[NormalizedBox]:
+    """`parse_boxes`와 같은 규칙의 streaming parser를 만듭니다."""
+
+    return StreamingArrayParser(_box_item, "box", maximum_items)
+
+
+def iter_point_detections(
+    chunks: Iterable[str], maximum_items: int = 10
+) -> Iterator[PointDetection]:
+    """Text chunk iterable에서 검증된 point를 원소가 닫히는 대로 yield합니다.
+
+    SDK stream은 `(chunk.text or "" for chunk in stream)`처럼 문자열로 바꿔
+    전달합니다. 배열이 끝나지 않은 채 stream이 끝나면 ValueError가 발생합니다.
+    """
+
+    parser = point_stream_parser(maximum_items)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def iter_boxes(chunks: Iterable[str], maximum_items: int = 20) -> Iterator[NormalizedBox]:
+    """Text chunk iterable에서 검증된 box를 원소가 닫히는 대로 yield합니다."""
+
+    parser = box_stream_parser(maximum_items)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def _read_only(values: list[float], columns: int) -> np.ndarray:
+    """숫자 목록을 (N, columns) float64 읽기 전용 배열로 만듭니다."""
+
+    # 빈 응답도 열 개수가 맞는 (0, columns) 배열이 되도록 reshape합니다.
+    array = np.array(values, dtype=np.float64).reshape(-1, columns)
+    # frozen dataclass 안의 배열이 제자리에서 바뀌지 않도록 쓰기를 막습니다.
+    array.setflags(write=False)
+    return array
+
+
+def _is_number(value: object) -> bool:
+    """JSON 숫자인지 검사합니다. bool은 int의 하위 타입이어도 거부합니다."""
+
+    # JSON decoder는 int와 float만 숫자로 만들므로 정확한 type 비교로 충분합니다.
+    return type(value) is int or type(value) is float
+
+
+@dataclass(frozen=True, eq=False)
+class PointBatch:
+    """검증된 pointing 결과를 struct-of-arrays 형태로 보관합니다.
+
+    `points_yx`는 Gemini 순서의 (N, 2) [y, x] 배열이고 `labels`는 같은 순서의
+    평행 tuple입니다. 항목마다 dataclass를 만들지 않으므로 dense 응답도 배열
+    연산 한 번으로 pixel·world 좌표로 변환할 수 있습니다.
+    """
+
+    points_yx: np.ndarray
+    labels: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """배열 모양과 범위를 vectorized 검사로 확인합니다."""
+
+        if self.points_yx.ndim != 2 or self.points_yx.shape[1] != 2:
+            raise ValueError("points_yx must have shape (N, 2)")
+        # label 개수가 다르면 좌표와 label의 대응이 깨집니다.
+        if len(self.labels) != len(self.points_yx):
+            raise ValueError("labels must have one entry per point")
+        # finite와 0~1000 범위를 모든 점에 한 번에 적용합니다.
+        if not np.isfinite(self.points_yx).all():
+            raise ValueError("point coordinates must be finite")
+        if ((self.points_yx < 0.0) | (self.points_yx > NORMALIZED_MAX)).any():
+            raise ValueError("point coordinates must be in [0, 1000]")
+
+    @classmethod
+    def from_items(cls, value: list[object]) -> "PointBatch":
+        """파싱된 JSON 배열을 `parse_point_detections`와 같은 규칙으로 검증합니다."""
+
+        # 숫자는 평평한 list에 모은 뒤 한 번에 배열로 바꿉니다.
+        coordinates: list[float] = []
+        labels: list[str] = []
+        for index, item in enumerate(value):
+            # 각 원소는 point와 label을 가진 object여야 합니다.
+            if not isinstance(item, dict):
+                raise ValueError(f"item {index} must be an object")
+            point = item.get("point")
+            # 길이 2의 배열이 아니면 [y, x] 계약을 만족하지 않습니다.
+            if not isinstance(point, list) or len(point) != 2:
+                raise ValueError(f"item {index} point must contain exactly [y, x]")
+            # 문자열 숫자나 bool이 float로 바뀌지 않도록 type만 항목별로 확인합니다.
+            if not (_is_number(point[0]) and _is_number(point[1])):
+                raise ValueError(f"item {index} point must contain numbers")
+            label = item.get("label", "")
+            if not isinstance(label, str):
+                raise ValueError(f"item {index} label must be a string")
+            coordinates.extend(point)
+            labels.append(label.strip())
+        # 범위 검사는 __post_init__에서 배열 단위로 수행합니다.
+        return cls(points_yx=_read_only(coordinates, 2), labels=tuple(labels))
+
+    @classmethod
+    def from_detections(cls, detections: list[PointDetection]) -> "PointBatch":
+        """기존 dataclass 목록을 batch로 묶습니다."""
+
+        coordinates = [value for item in detections for value in (item.point.y, item.point.x)]
+        labels = tuple(item.label for item in detections)
+        return cls(points_yx=_read_only(coordinates, 2), labels=labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, index: int) -> PointDetection:
+        """요청한 항목 하나만 기존 `PointDetection`으로 만듭니다."""
+
+        y, x = self.points_yx[index]
+        return PointDetection(point=NormalizedPoint(y=float(y), x=float(x)), label=self.labels[index])
+
+    def __iter__(self) -> Iterator[PointDetection]:
+        """호환이 필요한 호출자에게 dataclass를 필요할 때마다 하나씩 만듭니다."""
+
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_pixels(self, width: int, height: int) -> np.ndarray:
+        """모든 점을 (N, 2) pixel [x, y] 배열로 변환합니다."""
+
+        return normalized_to_pixels(self.points_yx, width=width, height=height)
+
+    def to_world(
+        self, calibration: PlanarCalibration, width: int, height: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """모든 점을 평면 좌표로 변환하고 horizon mask를 함께 반환합니다."""
+
+        return calibration.normalized_to_world_batch(self.points_yx, width, height)
+
+
+@dataclass(frozen=True, eq=False)
+class BoxBatch:
+    """검증된 box 결과를 (N, 4) [y_min, x_min, y_max, x_max] 배열로 보관합니다."""
+
+    boxes: np.ndarray
+    labels: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """범위와 모서리 순서를 vectorized 검사로 확인합니다."""
+
+        if self.boxes.ndim != 2 or self.boxes.shape[1] != 4:
+            raise ValueError("boxes must have shape (N, 4)")
+        if len(self.labels) != len(self.boxes):
+            raise ValueError("labels must have one entry per box")
+        if not np.isfinite(self.boxes).all():
+            raise ValueError("box coordinates must be finite")
+        if ((self.boxes < 0.0) | (self.boxes > NORMALIZED_MAX)).any():
+            raise ValueError("box coordinates must be in [0, 1000]")
+        # min 열이 max 열보다 작지 않은 box가 하나라도 있으면 거부합니다.
+        if (self.boxes[:, :2] >= self.boxes[:, 2:]).any():
+            raise ValueError("box min coordinates must be smaller than max coordinates")
+
+    @classmethod
+    def from_items(cls, value: list[object]) -> "BoxBatch":
+        """파싱된 JSON 배열을 `parse_boxes`와 같은 규칙으로 검증합니다."""
+
+        coordinates: list[float] = []
+        labels: list[str] = []
+        for index, item in enumerate(value):
+            if not isinstance(item, dict):
+                raise ValueError("every box item must be an object")
+            # 누락 필드는 KeyError가 아니라 이해하기 쉬운 ValueError로 바꿉니다.
+            try:
+                corners = (item["y"], item["x"], item["y2"], item["x2"])
+            except KeyError as error:
+                raise ValueError(f"box {index} is missing field {error.args[0]!r}") from None
+            if not all(_is_number(corner) for corner in corners):
+                raise ValueError(f"box {index} coordinates must be numbers")
+            coordinates.extend(corners)
+            # label은 NormalizedBox와 같이 표시용 문자열로만 저장합니다.
+            labels.append(str(item.get("label", "")))
+        return cls(boxes=_read_only(coordinates, 4), labels=tuple(labels))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, index: int) -> NormalizedBox:
+        """요청한 항목 하나만 기존 `NormalizedBox`로 만듭니다."""
+
+        y_min, x_min, y_max, x_max = (float(value) for value in self.boxes[index])
+        return NormalizedBox(
+            y_min=y_min, x_min=x_min, y_max=y_max, x_max=x_max, label=self.labels[index]
+        )
+
+    def __iter__(self) -> Iterator[NormalizedBox]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def centers(self) -> PointBatch:
+        """모든 box 중심을 [y, x] `PointBatch`로 반환합니다."""
+
+        # (N, 2, 2)로 보면 min 모서리와 max 모서리의 평균이 곧 중심입니다.
+        centers = self.boxes.reshape(-1, 2, 2).mean(axis=1)
+        centers.setflags(write=False)
+        return PointBatch(points_yx=centers, labels=self.labels)
+
+    def to_pixels(self, width: int, height: int) -> np.ndarray:
+        """모든 box를 (N, 4) pixel [x_min, y_min, x_max, y_max] 배열로 변환합니다."""
+
+        # 두 모서리를 (2N, 2) 점 배열로 펼쳐 point 변환식을 그대로 재사용합니다.
+        corners = normalized_to_pixels(self.boxes.reshape(-1, 2), width=width, height=height)
+        return corners.reshape(-1, 4)
+
+
+def parse_point_batch(text: str, maximum_items: int = 10) -> PointBatch:
+    """`parse_point_detections`와 같은 응답을 `PointBatch`로 검증합니다."""
+
+    return PointBatch.from_items(_json_array(text, "point", maximum_items))
+
+
+def parse_box_batch(text: str, maximum_items: int = 20) -> BoxBatch:
+    """`parse_boxes`와 같은 응답을 `BoxBatch`로 검증합니다."""
+
+    return BoxBatch.from_items(_json_array(text, "box", maximum_items))
+
+
 @dataclass(frozen=True)
 class ProgressReport:
     """ER 2의 다섯 단계 영상 진행도 결과입니다."""
@@ -108,3 +505,25 @@ class ProgressReport:
         if level not in allowed:
             raise ValueError(f"unsupported progress level: {level!r}")
         return cls(level=str(level))
+
+
+@dataclass(frozen=True)
+class CompletionMoment:
+    """영상에서 작업이 끝난 시점입니다. 완료가 보이지 않으면 None입니다."""
+
+    seconds: float | None
+
+    @classmethod
+    def from_text(cls, text: str) -> "CompletionMoment":
+        """`{completion_time_seconds: number|null}` 응답의 값 범위를 검사합니다."""
+
+        value = extract_json(text)
+        if not isinstance(value, dict) or "completion_time_seconds" not in value:
+            raise ValueError("moment response must contain completion_time_seconds")
+        seconds = value["completion_time_seconds"]
+        if seconds is None:
+            return cls(seconds=None)
+        # JSON decoder는 NaN·Infinity도 읽으므로 유한성까지 확인합니다.
+        if not _is_number(seconds) or not np.isfinite(seconds) or seconds < 0:
+            raise ValueError("completion_time_seconds must be a non-negative number or null")
+        return cls(seconds=float(seconds))
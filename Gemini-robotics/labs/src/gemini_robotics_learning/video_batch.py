@@ -0,0 +1,234 @@
+"""폴더 안의 여러 영상을 한 process에서 동시에 분석하는 batch runner입니다.
+
+영상마다 interpreter와 SDK를 새로 띄우지 않고, bounded asyncio worker pool이
+`VideoProgressPipeline`의 decode·업로드·request를 실행합니다. 동기 SDK 호출은
+worker thread로 보내 event loop를 막지 않고, rate limit 응답은 지수 backoff로
+다시 시도합니다. 검증된 결과는 한 줄씩 JSONL로 flush하므로 중단 후 같은
+결과 파일로 다시 실행하면 이미 성공한 항목은 건너뜁니다. 성공 여부는 영상
+이름뿐 아니라 파일 hash와 분석 설정까지 같아야 인정하므로, 녹화를 덮어쓰거나
+모델·keyframe 설정을 바꾸면 다시 분석합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, Iterable
+
+from .schemas import CompletionMoment, ProgressReport
+from .video_progress import (
+    MODES,
+    PILLOW_VIDEO_SUFFIXES,
+    VideoProgressPipeline,
+    ends_with_newline,
+    file_digest,
+    iter_video_frames,
+    parse_result,
+)
+
+
+# 기본으로 찾을 영상 확장자입니다. mp4 등은 OpenCV가 있어야 decode됩니다.
+VIDEO_SUFFIXES = PILLOW_VIDEO_SUFFIXES | {".mp4", ".mov", ".avi", ".mkv"}
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """분석할 영상 하나와 task·mode입니다. `name`은 결과 row의 안정적인 key입니다."""
+
+    path: Path
+    name: str
+    task: str
+    mode: str
+
+    def key(self, digest: str, settings: str) -> tuple[str, str, str, str, str]:
+        """파일 hash와 분석 설정까지 포함한 resume key입니다."""
+
+        return (self.name, self.task, self.mode, digest, settings)
+
+
+def discover_videos(
+    directory: Path,
+    task: str,
+    mode: str = "progress",
+    *,
+    suffixes: Iterable[str] = VIDEO_SUFFIXES,
+) -> list[BatchItem]:
+    """폴더를 재귀적으로 훑어 정렬된 batch 항목을 만듭니다."""
+
+    if mode not in MODES:
+        raise ValueError(f"unsupported mode: {mode!r}")
+    allowed = {suffix.lower() for suffix in suffixes}
+    paths = sorted(path for path in directory.rglob("*") if path.is_file() and path.suffix.lower() in allowed)
+    # 상대 경로를 key로 쓰면 폴더를 옮겨도 resume이 동작합니다.
+    return [BatchItem(path, path.relative_to(directory).as_posix(), task, mode) for path in paths]
+
+
+def load_completed(results_path: Path) -> set[tuple[str, str, str, str, str]]:
+    """결과 파일에서 성공한 (name, task, mode, digest, settings) 집합을 읽습니다."""
+
+    completed: set[tuple[str, str, str, str, str]] = set()
+    if not results_path.is_file():
+        return completed
+    with results_path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단 중에 잘린 마지막 줄은 완료되지 않은 것으로 봅니다.
+                continue
+            if not isinstance(row, dict) or row.get("status") != "ok":
+                continue
+            key = tuple(row.get(field) for field in ("video", "task", "mode", "digest", "settings"))
+            # 손으로 고치거나 잘린 "ok" 줄처럼 필드가 빠진 줄은 완료로 치지 않습니다.
+            if all(isinstance(value, str) for value in key):
+                completed.add(key)
+    return completed
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """HTTP 429나 RESOURCE_EXHAUSTED처럼 잠시 후 다시 시도할 오류인지 판단합니다."""
+
+    # google-genai의 APIError는 code와 status 속성으로 HTTP 상태를 전달합니다.
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    status = str(getattr(error, "status", "") or "")
+    return code == 429 or status == "RESOURCE_EXHAUSTED"
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """Rate limit 재시도 간격입니다. 시도마다 두 배로 늘리고 jitter를 더합니다."""
+
+    max_retries: int = 5
+    base_s: float = 1.0
+    max_s: float = 32.0
+    # 여러 worker가 같은 순간에 다시 몰리지 않도록 지연에 곱하는 무작위 범위입니다.
+    jitter: float = 0.25
+
+    def delay_s(self, attempt: int, error: BaseException, rng: random.Random) -> float:
+        """`attempt`번째 재시도 전 대기 시간입니다. 서버가 준 retry-after를 우선합니다."""
+
+        retry_after = getattr(error, "retry_after", None)
+        if isinstance(retry_after, (int, float)) and retry_after >= 0:
+            return min(float(retry_after), self.max_s)
+        delay = min(self.base_s * 2**attempt, self.max_s)
+        return delay * (1.0 + rng.uniform(-self.jitter, self.jitter))
+
+
+class BatchRunner:
+    """Worker `concurrency`개가 batch 항목을 나눠 처리하고 결과를 JSONL로 씁니다."""
+
+    def __init__(
+        self,
+        pipeline: VideoProgressPipeline,
+        results_path: Path | str,
+        *,
+        concurrency: int = 4,
+        backoff: BackoffPolicy | None = None,
+        seed: int | None = None,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        self.pipeline = pipeline
+        self.results_path = Path(results_path)
+        self.concurrency = concurrency
+        self.backoff = backoff or BackoffPolicy()
+        self._rng = random.Random(seed)
+        # test에서 실제로 기다리지 않도록 sleep을 주입할 수 있습니다.
+        self._sleep = sleep
+        self.stats = {"skipped": 0, "ok": 0, "error": 0, "cached": 0, "retries": 0}
+        self._completed: set[tuple[str, str, str, str, str]] = set()
+
+    async def run(self, items: Iterable[BatchItem]) -> dict[str, int]:
+        """미완료 항목만 실행하고 항목 수 통계를 반환합니다."""
+
+        self._completed = load_completed(self.results_path)
+        queue: asyncio.Queue[BatchItem] = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        # 모든 row는 event loop thread에서만 쓰므로 lock 없이 한 줄씩 append합니다.
+        with self.results_path.open("a", encoding="utf-8") as results:
+            # 잘린 마지막 줄 뒤에 새 row가 붙어 함께 깨지지 않도록 줄을 먼저 끝냅니다.
+            if results.tell() > 0 and not ends_with_newline(self.results_path):
+                results.write("\n")
+            workers = [
+                asyncio.create_task(self._worker(queue, results))
+                for _ in range(min(self.concurrency, queue.qsize()))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        return dict(self.stats)
+
+    async def _worker(self, queue: asyncio.Queue[BatchItem], results: Any) -> None:
+        """Queue가 빌 때까지 항목을 하나씩 처리합니다."""
+
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started_at = monotonic()
+            settings = self.pipeline.settings_key
+            row: dict[str, Any] = {"video": item.name, "task": item.task, "mode": item.mode}
+            try:
+                # 파일 hash는 CPU·disk 작업이므로 worker thread에서 계산합니다.
+                digest = await asyncio.to_thread(file_digest, item.path)
+                row.update(digest=digest, settings=settings)
+                # 같은 내용·같은 설정으로 이미 성공한 항목만 건너뜁니다.
+                if item.key(digest, settings) in self._completed:
+                    self.stats["skipped"] += 1
+                    continue
+                row.update(await self._analyze(item, digest, settings))
+                row["status"] = "ok"
+            except Exception as error:
+                # 실패한 항목은 기록만 하고 다음 실행에서 다시 시도됩니다.
+                row.update(status="error", error=f"{type(error).__name__}: {error}")
+            row["elapsed_s"] = round(monotonic() - started_at, 4)
+            self.stats[row["status"]] += 1
+            results.write(json.dumps(row, ensure_ascii=False) + "\n")
+            # 한 줄마다 flush해 중단돼도 끝난 항목은 결과 파일에 남습니다.
+            results.flush()
+
+    async def _analyze(self, item: BatchItem, digest: str, settings: str) -> dict[str, Any]:
+        """Cache 조회 → keyframe clip → backoff가 있는 모델 호출 → 검증 순서입니다."""
+
+        pipeline = self.pipeline
+        row: dict[str, Any] = {}
+        result = pipeline.cache.get(digest, item.task, item.mode, settings)
+        if result is None:
+            clip = await asyncio.to_thread(pipeline.clip_from_frames, iter_video_frames(item.path))
+            text = await self._call_model(clip, item)
+            result = parse_result(text, item.mode)
+            # disk cache append는 event loop를 막지 않도록 worker thread에서 합니다.
+            await asyncio.to_thread(pipeline.cache.put, digest, item.task, item.mode, result, settings)
+            row.update(keyframes=len(clip.images), clip_bytes=clip.nbytes)
+        else:
+            self.stats["cached"] += 1
+        if isinstance(result, ProgressReport):
+            row["progress_level"] = result.level
+        elif isinstance(result, CompletionMoment):
+            row["completion_time_seconds"] = result.seconds
+        return row
+
+    async def _call_model(self, clip: Any, item: BatchItem) -> str:
+        """업로드와 request를 실행하고 rate limit이면 backoff 후 다시 시도합니다."""
+
+        attempt = 0
+        while True:
+            try:
+                return await asyncio.to_thread(self.pipeline.model.analyze, clip, item.task, item.mode)
+            except Exception as error:
+                if not is_rate_limited(error) or attempt >= self.backoff.max_retries:
+                    raise
+                self.stats["retries"] += 1
+                await self._sleep(self.backoff.delay_s(attempt, error, self._rng))
+                attempt += 1
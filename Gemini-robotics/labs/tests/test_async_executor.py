@@ -0,0 +1,101 @@
+"""비동기 executor가 timeout·취소 시 항상 robot을 멈추는지 검증합니다."""
+
+import asyncio
+import time
+import unittest
+from time import monotonic
+
+from gemini_robotics_learning.async_executor import AsyncToolExecutor
+from gemini_robotics_learning.mock_robot import MockRobot
+from gemini_robotics_learning.safety import SafetyEnvelope, ToolRejected, WorkspaceLimits
+
+
+def move(call_id: str, x: float) -> dict:
+    arguments = {"x": x, "y": 0.0, "z": 0.20, "speed_m_s": 0.05, "frame_id": "table"}
+    return {"id": call_id, "name": "move", "arguments": arguments}
+
+
+def detect(call_id: str, delay_s: float) -> dict:
+    return {"id": call_id, "name": "detect", "arguments": {"delay_s": delay_s}}
+
+
+async def slow_detector(arguments: dict) -> dict:
+    """지정한 시간만큼 기다리는 perception query를 흉내 냅니다."""
+
+    await asyncio.sleep(arguments["delay_s"])
+    return {"status": "success", "objects": 1}
+
+
+class BlockingRobot(MockRobot):
+    """명령을 보내기 전에 event loop를 모르는 driver처럼 thread를 막습니다."""
+
+    block_s: float = 0.3
+
+    def move(self, call_id, command, *, human_present=False):
+        time.sleep(self.block_s)
+        return super().move(call_id, command, human_present=human_present)
+
+
+def make_executor(robot_class=MockRobot, **kwargs) -> AsyncToolExecutor:
+    safety = SafetyEnvelope(workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4))
+    return AsyncToolExecutor(
+        robot=robot_class(safety=safety), query_tools={"detect": slow_detector}, **kwargs
+    )
+
+
+class AsyncExecutorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_queries_overlap_with_serialized_motion(self) -> None:
+        executor = make_executor(motion_duration_s=0.05)
+        plan = [detect("d", 0.1), move("a", 0.05), move("b", 0.10)]
+        started_at = monotonic()
+        results = await executor.execute_plan_async(plan)
+        elapsed = monotonic() - started_at
+        # 직렬이면 0.2초가 걸리지만 query가 두 motion과 겹쳐 약 0.1초에 끝납니다.
+        self.assertLess(elapsed, 0.18)
+        self.assertEqual([item["call_id"] for item in results], ["d", "a", "b"])
+        self.assertEqual(executor.robot.state.xyz, (0.10, 0.0, 0.20))
+        self.assertEqual(len(executor.robot.records), 3)
+
+    async def test_slow_tool_is_stopped_by_tool_timeout(self) -> None:
+        executor = make_executor(tool_timeout_s=0.05)
+        with self.assertRaisesRegex(ToolRejected, "exceeded"):
+            await executor.execute_plan_async([detect("d", 1.0), move("a", 0.05)])
+        self.assertTrue(executor.robot.state.stopped)
+
+    async def test_blocking_motion_tool_is_stopped_by_tool_timeout(self) -> None:
+        executor = make_executor(BlockingRobot, tool_timeout_s=0.05)
+        started_at = monotonic()
+        with self.assertRaisesRegex(ToolRejected, "'move' exceeded"):
+            await executor.execute_plan_async([move("a", 0.05)])
+        # driver가 끝날 때까지 기다리지 않고 timeout 시점에 돌아옵니다.
+        self.assertLess(monotonic() - started_at, 0.2)
+        self.assertTrue(executor.robot.state.stopped)
+        # 늦게 끝난 driver 호출도 latch된 stop 때문에 pose를 바꾸지 못합니다.
+        await asyncio.sleep(0.35)
+        self.assertEqual(executor.robot.state.x, 0.0)
+
+    async def test_plan_deadline_is_enforced_during_a_tool(self) -> None:
+        executor = make_executor(deadline_s=0.05, motion_duration_s=0.5, tool_timeout_s=1.0)
+        with self.assertRaisesRegex(ToolRejected, "deadline"):
+            await executor.execute_plan_async([move("a", 0.05), move("b", 0.10)])
+        self.assertTrue(executor.robot.state.stopped)
+        # deadline 이후의 두 번째 move는 실행되지 않습니다.
+        self.assertEqual(executor.robot.state.x, 0.05)
+
+    async def test_cancellation_latches_stop(self) -> None:
+        executor = make_executor(motion_duration_s=1.0)
+        task = asyncio.create_task(executor.execute_plan_async([move("a", 0.05)]))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(executor.robot.state.stopped)
+
+    def test_query_tools_cannot_shadow_motion(self) -> None:
+        safety = SafetyEnvelope(workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4))
+        with self.assertRaises(ValueError):
+            AsyncToolExecutor(robot=MockRobot(safety=safety), query_tools={"move": slow_detector})
+
+
+if __name__ == "__main__":
+    unittest.main()
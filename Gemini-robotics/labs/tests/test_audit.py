@@ -0,0 +1,93 @@
+"""긴 session에서도 감사 log와 call ID window가 bounded인지 검증합니다."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from gemini_robotics_learning.audit import AuditLog, CallIdWindow
+from gemini_robotics_learning.mock_robot import MockRobot, ToolRecord
+from gemini_robotics_learning.safety import SafetyEnvelope, WorkspaceLimits
+
+
+def record(index: int) -> ToolRecord:
+    return ToolRecord(
+        call_id=f"call-{index}",
+        name="set_gripper",
+        arguments={"opened": True, "max_force_n": 5.0},
+        result={"status": "success"},
+        elapsed_s=0.001,
+    )
+
+
+class AuditLogTest(unittest.TestCase):
+    def test_ring_buffer_keeps_latest_records(self) -> None:
+        log = AuditLog(capacity=3)
+        for index in range(10):
+            log.append(record(index))
+        self.assertEqual([item.call_id for item in log], ["call-7", "call-8", "call-9"])
+        stats = log.stats()
+        self.assertEqual((stats["records"], stats["appended"], stats["evicted"]), (3, 10, 7))
+        self.assertGreater(stats["approx_bytes"], 0)
+
+    def test_spill_file_keeps_every_record(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "audit.jsonl"
+            with AuditLog(capacity=2, spill_path=path, flush_every=4) as log:
+                for index in range(5):
+                    log.append(record(index))
+            lines = path.read_text(encoding="utf-8").splitlines()
+        call_ids = [json.loads(line)["call_id"] for line in lines]
+        self.assertEqual(call_ids, [f"call-{index}" for index in range(5)])
+
+    def test_records_use_slots(self) -> None:
+        # __slots__ record는 인스턴스 __dict__가 없어 record당 메모리가 작습니다.
+        self.assertFalse(hasattr(record(0), "__dict__"))
+
+
+class CallIdWindowTest(unittest.TestCase):
+    def test_fifo_window_forgets_oldest_ids(self) -> None:
+        window = CallIdWindow(max_ids=2)
+        window.add("a")
+        window.add("b")
+        # 조회는 순서를 바꾸지 않으므로 "a"가 여전히 가장 먼저 잊힙니다.
+        self.assertIn("a", window)
+        window.add("c")
+        self.assertNotIn("a", window)
+        self.assertIn("b", window)
+        self.assertIn("c", window)
+        self.assertEqual(window.stats()["evicted"], 1)
+
+    def test_ttl_window_expires_old_ids(self) -> None:
+        now = [0.0]
+        window = CallIdWindow(ttl_s=10.0, clock=lambda: now[0])
+        window.add("a")
+        now[0] = 5.0
+        self.assertIn("a", window)
+        now[0] = 10.5
+        self.assertNotIn("a", window)
+
+    def test_robot_reports_bounded_memory(self) -> None:
+        safety = SafetyEnvelope(workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4))
+        robot = MockRobot(safety=safety, processed_call_ids=CallIdWindow(max_ids=50))
+        robot.records = AuditLog(capacity=50)
+        for index in range(500):
+            robot.set_gripper(f"call-{index}", opened=index % 2 == 0, max_force_n=5.0)
+            robot.records.append(record(index))
+        stats = robot.audit_stats()
+        self.assertEqual(stats["records"]["records"], 50)
+        self.assertEqual(stats["call_ids"]["call_ids"], 50)
+
+    def test_robot_close_flushes_spill_file(self) -> None:
+        safety = SafetyEnvelope(workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "audit.jsonl"
+            log = AuditLog(spill_path=path, flush_every=100, flush_interval_s=60.0)
+            with MockRobot(safety=safety, records=log) as robot:
+                robot.records.append(record(0))
+            self.assertIsNone(log._spill)
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Calibration store가 같은 대응점으로는 다시 fit하지 않는지 검증합니다."""
+
+import tempfile
+import unittest
+
+from gemini_robotics_learning.calibration import CalibrationStore
+from test_geometry import correspondences
+
+
+class CalibrationStoreTest(unittest.TestCase):
+    def test_reuses_saved_fit_across_processes(self) -> None:
+        pixels, world, _outliers = correspondences(500, outlier_ratio=0.2, seed=3)
+        with tempfile.TemporaryDirectory() as directory:
+            store = CalibrationStore(directory)
+            first = store.get_or_fit("wrist-cam", pixels, world, ransac_threshold=0.002)
+            self.assertEqual(store.fits, 1)
+            # 새 store는 process 재시작과 같습니다. 파일에서 읽고 fit하지 않습니다.
+            restarted = CalibrationStore(directory)
+            again = restarted.get_or_fit("wrist-cam", pixels, world, ransac_threshold=0.002)
+            self.assertEqual(restarted.fits, 0)
+            self.assertEqual(again.calibration, first.calibration)
+            self.assertEqual(again.inlier_count, first.inlier_count)
+            # 대응점이 바뀌면 다시 fit합니다.
+            restarted.get_or_fit("wrist-cam", pixels[:-1], world[:-1], ransac_threshold=0.002)
+            self.assertEqual(restarted.fits, 1)
+            # fit option만 바뀌어도 이전 결과를 재사용하지 않습니다.
+            restarted.get_or_fit("wrist-cam", pixels[:-1], world[:-1], ransac_threshold=0.01)
+            self.assertEqual(restarted.fits, 2)
+            relabeled = restarted.get_or_fit(
+                "wrist-cam", pixels[:-1], world[:-1], ransac_threshold=0.01, frame_id="tray"
+            )
+            self.assertEqual((restarted.fits, relabeled.calibration.frame_id), (3, "tray"))
+
+    def test_rejects_path_like_camera_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                CalibrationStore(directory).load("../secrets")
+
+
+if __name__ == "__main__":
+    unittest.main()
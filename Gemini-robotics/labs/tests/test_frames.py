@@ -0,0 +1,86 @@
+"""Latest-frame slot이 복사 없이 최신 frame만 전달하고 drop을 세는지 검증합니다."""
+
+import asyncio
+import unittest
+from time import monotonic
+
+import numpy as np
+
+from gemini_robotics_learning.frames import (
+    Frame,
+    LatencyHistogram,
+    LatestFrameSlot,
+    PipelineMetrics,
+    heartbeat,
+    synthetic_camera,
+    synthetic_frame,
+)
+
+
+class FrameTest(unittest.TestCase):
+    def test_wrap_shares_memory_and_is_read_only(self) -> None:
+        pixels = synthetic_frame(3)
+        frame = Frame.wrap(3, monotonic(), pixels)
+        self.assertTrue(np.shares_memory(frame.data, pixels))
+        with self.assertRaises(ValueError):
+            frame.data[0, 0, 0] = 1
+        buffer = bytearray(b"jpeg")
+        view = Frame.wrap(0, monotonic(), buffer).data
+        self.assertTrue(view.readonly)
+        buffer[0] = ord("J")
+        self.assertEqual(bytes(view), b"Jpeg")
+
+    def test_histogram_quantiles_use_bucket_bounds(self) -> None:
+        histogram = LatencyHistogram(buckets_ms=(10.0, 100.0))
+        for seconds in (0.001, 0.002, 0.05, 0.5):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile_ms(0.5), 10.0)
+        self.assertAlmostEqual(histogram.quantile_ms(1.0), 500.0)
+
+
+class LatestFrameSlotTest(unittest.IsolatedAsyncioTestCase):
+    async def test_consumers_count_their_own_drops(self) -> None:
+        slot = LatestFrameSlot()
+        fast = slot.subscribe("fast")
+        slow = slot.subscribe("slow")
+        for sequence in range(5):
+            slot.put(Frame.wrap(sequence, monotonic(), b"x"))
+            self.assertEqual((await fast.get_latest()).sequence, sequence)
+        self.assertEqual((await slow.get_latest()).sequence, 4)
+        slot.put(Frame.wrap(9, monotonic(), b"x"))
+        self.assertEqual((await slow.get_latest()).sequence, 9)
+        snapshot = slot.snapshot()
+        self.assertEqual(snapshot["published"], 6)
+        self.assertEqual(snapshot["consumers"]["fast"]["dropped"], 0)
+        # 5~8번 frame은 9번이 도착하기 전에 덮어쓰인 것으로 셉니다.
+        self.assertEqual(snapshot["consumers"]["slow"]["dropped"], 4)
+        with self.assertRaises(ValueError):
+            slot.subscribe("fast")
+
+    async def test_heartbeat_rate_limits_and_records_stages(self) -> None:
+        slot = LatestFrameSlot()
+        metrics = PipelineMetrics()
+        stop = asyncio.Event()
+        consumer = slot.subscribe("heartbeat")
+        handled: list[int] = []
+
+        async def handler(frame: Frame) -> None:
+            handled.append(frame.sequence)
+
+        camera = asyncio.create_task(synthetic_camera(slot, stop, fps=100.0, metrics=metrics))
+        beat = asyncio.create_task(heartbeat(consumer, stop, handler, rate_hz=10.0, metrics=metrics))
+        await asyncio.sleep(0.35)
+        stop.set()
+        for task in (camera, beat):
+            task.cancel()
+        await asyncio.gather(camera, beat, return_exceptions=True)
+        # 100 FPS 카메라를 10 Hz로 읽으므로 handler 호출은 대략 4번이고 나머지는 drop됩니다.
+        self.assertGreaterEqual(len(handled), 2)
+        self.assertLessEqual(len(handled), 6)
+        self.assertGreater(consumer.dropped, len(handled))
+        self.assertEqual(set(metrics.snapshot()), {"capture", "queue_age", "handler", "end_to_end"})
+
+
+if __name__ == "__main__":
+    unittest.main()
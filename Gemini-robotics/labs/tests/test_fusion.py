@@ -0,0 +1,84 @@
+"""여러 camera가 본 같은 물체가 move 후보 하나로 합쳐지는지 검증합니다."""
+
+import unittest
+
+import numpy as np
+
+from gemini_robotics_learning.fusion import CameraView, cluster_points, fuse_detections
+from gemini_robotics_learning.geometry import PlanarCalibration
+from gemini_robotics_learning.schemas import PointBatch
+
+
+WIDTH, HEIGHT = 1001, 1001
+
+
+def view(camera_id: str, offset_x: float, offset_y: float) -> CameraView:
+    """1 pixel = 1 mm이고 camera마다 원점이 다른 calibration입니다."""
+
+    matrix = ((0.001, 0.0, offset_x), (0.0, 0.001, offset_y), (0.0, 0.0, 1.0))
+    return CameraView(camera_id, PlanarCalibration(matrix=matrix), WIDTH, HEIGHT)
+
+
+def observe(camera: CameraView, objects: list[tuple[str, float, float]], jitter: float = 0.0) -> PointBatch:
+    """Table 좌표 물체를 camera의 정규화 [y, x]로 역투영합니다."""
+
+    h = camera.calibration.matrix
+    points = []
+    for _label, x, y in objects:
+        pixel_x = (x - h[0][2]) / h[0][0] + jitter
+        pixel_y = (y - h[1][2]) / h[1][1] - jitter
+        points.append([pixel_y / (HEIGHT - 1) * 1000.0, pixel_x / (WIDTH - 1) * 1000.0])
+    return PointBatch(points_yx=np.array(points), labels=tuple(label for label, _x, _y in objects))
+
+
+class FusionTest(unittest.TestCase):
+    def test_one_object_per_label_and_location(self) -> None:
+        scene = [("cup", 0.10, 0.20), ("cup", 0.30, 0.20), ("block", 0.10, 0.205)]
+        left, right, top = view("left", 0.0, 0.0), view("right", -0.2, 0.0), view("top", 0.0, -0.1)
+        result = fuse_detections(
+            [
+                (left, observe(left, scene, jitter=2.0)),
+                (right, observe(right, scene, jitter=-2.0)),
+                (top, observe(top, scene[:1])),
+            ],
+            radius=0.02,
+        )
+        self.assertEqual(len(result.objects), 3)
+        best = result.objects[0]
+        # 세 camera가 모두 본 컵이 가장 확실하고 평균 위치는 실제 위치와 가깝습니다.
+        self.assertEqual((best.label, best.cameras), ("cup", ("left", "right", "top")))
+        self.assertAlmostEqual(best.x, 0.10, places=3)
+        self.assertAlmostEqual(best.y, 0.20, places=3)
+        # 5 mm 떨어진 block은 label이 달라 컵과 합쳐지지 않습니다.
+        labels = sorted(item.label for item in result.objects)
+        self.assertEqual(labels, ["block", "cup", "cup"])
+        self.assertTrue(all(item.confidence <= 2 / 3 for item in result.objects[1:]))
+        self.assertEqual(len(result.confident(0.8)), 1)
+
+    def test_rejects_mixed_frames_and_counts_horizon_points(self) -> None:
+        base = view("a", 0.0, 0.0)
+        other = CameraView("b", PlanarCalibration(matrix=base.calibration.matrix, frame_id="base"), WIDTH, HEIGHT)
+        batch = observe(base, [("cup", 0.1, 0.1)])
+        with self.assertRaises(ValueError):
+            fuse_detections([(base, batch), (other, batch)])
+        # x pixel이 1000인 점은 w=0이 되어 버려집니다.
+        horizon = CameraView("h", PlanarCalibration(matrix=((1, 0, 0), (0, 1, 0), (-0.001, 0, 1))), WIDTH, HEIGHT)
+        edge = PointBatch(points_yx=np.array([[500.0, 1000.0]]), labels=("cup",))
+        self.assertEqual(fuse_detections([(horizon, edge)]).rejected, 1)
+
+    def test_grid_clusters_match_brute_force(self) -> None:
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0.0, 1.0, size=(300, 2))
+        groups = rng.integers(0, 2, size=300)
+        clusters = cluster_points(points, groups, radius=0.05)
+        # 직접 연결한 두 점은 항상 같은 cluster이고, group이 다르면 절대 같지 않습니다.
+        distances = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        linked = (distances <= 0.05) & (groups[:, None] == groups[None])
+        left, right = np.nonzero(linked)
+        np.testing.assert_array_equal(clusters[left], clusters[right])
+        same = clusters[:, None] == clusters[None]
+        self.assertFalse((same & (groups[:, None] != groups[None])).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
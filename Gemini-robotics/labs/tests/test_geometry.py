@@ -2,11 +2,14 @@
 
 import unittest
 
+import numpy as np
+
 from gemini_robotics_learning.geometry import (
     NormalizedBox,
     NormalizedPoint,
     PixelPoint,
     PlanarCalibration,
+    normalized_to_pixels,
 )
 from gemini_robotics_learning.schemas import ProgressReport, parse_point_detections
 
@@ -44,6 +47,39 @@ class GeometryTest(unittest.TestCase):
         )
         self.assertEqual(calibration.pixel_to_world(PixelPoint(12.0, 34.0)), (12.0, 34.0))
 
+    def test_batch_matches_scalar_path(self) -> None:
+        # 원근 성분이 있는 matrix로 scale 나눗셈까지 scalar 경로와 비교합니다.
+        calibration = PlanarCalibration(
+            matrix=((0.0005, 0.0001, -0.32), (0.0, 0.0005, -0.18), (0.0, 0.0002, 1.0))
+        )
+        points_yx = np.array([[0.0, 0.0], [375.0, 625.0], [1000.0, 1000.0]])
+        world, valid = calibration.normalized_to_world_batch(points_yx, width=1280, height=720)
+        self.assertTrue(valid.all())
+        for row, (y, x) in zip(world, points_yx):
+            expected = calibration.normalized_to_world(NormalizedPoint(y=y, x=x), 1280, 720)
+            np.testing.assert_allclose(row, expected)
+
+    def test_batch_masks_points_on_horizon(self) -> None:
+        # w = 1 - x/10 이므로 x=10인 pixel은 무한대로 보내집니다.
+        calibration = PlanarCalibration(
+            matrix=((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (-0.1, 0.0, 1.0))
+        )
+        world, valid = calibration.pixels_to_world([[0.0, 5.0], [10.0, 5.0]])
+        self.assertEqual(valid.tolist(), [True, False])
+        np.testing.assert_allclose(world[0], (0.0, 5.0))
+        self.assertTrue(np.isnan(world[1]).all())
+
+    def test_batch_rejects_out_of_range_and_non_numeric(self) -> None:
+        # 한 점이라도 0~1000을 벗어나면 batch 전체를 거부합니다.
+        with self.assertRaises(ValueError):
+            normalized_to_pixels([[500, 250], [500, 1001]], width=100, height=100)
+        # NaN은 scalar 경로와 같은 이유로 거부합니다.
+        with self.assertRaises(ValueError):
+            normalized_to_pixels([[500, float("nan")]], width=100, height=100)
+        # bool 배열은 숫자로 바뀌지 않도록 TypeError가 필요합니다.
+        with self.assertRaises(TypeError):
+            normalized_to_pixels(np.array([[True, False]]), width=100, height=100)
+
     def test_point_response_parser(self) -> None:
         # Markdown 설명이 앞에 있어도 첫 JSON 배열만 안전하게 읽습니다.
         result = parse_point_detections('result: [{"point":[500,250],"label":"cup"}]')
@@ -56,6 +92,73 @@ class GeometryTest(unittest.TestCase):
         self.assertEqual(report.level, "60-80")
 
 
+# 원근 성분이 있는 기준 homography입니다.
+TRUE_HOMOGRAPHY = np.array(
+    [[0.0005, 0.00002, -0.32], [0.00001, 0.0005, -0.18], [0.00001, 0.00002, 1.0]]
+)
+
+
+def correspondences(count: int, outlier_ratio: float = 0.0, seed: int = 0):
+    """기준 homography로 만든 대응점에 작은 noise와 outlier를 섞습니다."""
+
+    rng = np.random.default_rng(seed)
+    pixels = rng.uniform(0.0, 1280.0, size=(count, 2))
+    homogeneous = np.c_[pixels, np.ones(count)] @ TRUE_HOMOGRAPHY.T
+    world = homogeneous[:, :2] / homogeneous[:, 2:]
+    world += rng.normal(0.0, 0.0002, size=world.shape)
+    outliers = rng.random(count) < outlier_ratio
+    world[outliers] += rng.uniform(-0.5, 0.5, size=(int(outliers.sum()), 2))
+    return pixels, world, outliers
+
+
+class HomographyFitTest(unittest.TestCase):
+    def test_dlt_recovers_exact_homography(self) -> None:
+        pixels = np.array([[0, 0], [1279, 0], [1279, 719], [0, 719], [640, 360]], dtype=float)
+        homogeneous = np.c_[pixels, np.ones(5)] @ TRUE_HOMOGRAPHY.T
+        fit = PlanarCalibration.fit(pixels, homogeneous[:, :2] / homogeneous[:, 2:])
+        np.testing.assert_allclose(fit.calibration.matrix, TRUE_HOMOGRAPHY, atol=1e-9)
+        self.assertLess(fit.rms_error, 1e-9)
+
+    def test_ransac_rejects_outliers(self) -> None:
+        pixels, world, outliers = correspondences(2000, outlier_ratio=0.3)
+        plain = PlanarCalibration.fit(pixels, world)
+        robust = PlanarCalibration.fit(pixels, world, ransac_threshold=0.002)
+        # RANSAC inlier는 실제로 outlier가 아닌 점과 일치합니다.
+        np.testing.assert_array_equal(robust.inliers, ~outliers)
+        self.assertLess(robust.rms_error, 0.0005)
+        self.assertGreater(plain.rms_error, 10 * robust.rms_error)
+        errors = robust.calibration.reprojection_errors(pixels, world)
+        np.testing.assert_allclose(errors, robust.errors)
+
+    def test_fit_rejects_bad_input(self) -> None:
+        with self.assertRaises(ValueError):
+            PlanarCalibration.fit([[0, 0], [1, 0], [1, 1]], [[0, 0], [1, 0], [1, 1]])
+        with self.assertRaises(ValueError):
+            PlanarCalibration.fit(np.zeros((5, 2)), np.zeros((4, 2)))
+
+    def test_fit_rejects_degenerate_correspondences(self) -> None:
+        # 한 직선 위의 점은 rms가 0이어도 homography를 정하지 못합니다.
+        line = np.arange(6, dtype=float)[:, None] * [1.0, 1.0]
+        with self.assertRaisesRegex(ValueError, "degenerate"):
+            PlanarCalibration.fit(line, 0.001 * line)
+        # 4점 중 세 점이 공선이어도 마찬가지입니다.
+        pixels, world, _ = correspondences(4)
+        pixels[2], world[2] = (pixels[0] + pixels[1]) / 2, (world[0] + world[1]) / 2
+        with self.assertRaisesRegex(ValueError, "degenerate"):
+            PlanarCalibration.fit(pixels, world)
+
+    def test_ransac_rejects_pure_noise(self) -> None:
+        rng = np.random.default_rng(3)
+        for count in (50, 5000):
+            with self.subTest(count=count):
+                with self.assertRaisesRegex(ValueError, "beyond its 4-point sample"):
+                    PlanarCalibration.fit(
+                        rng.uniform(0.0, 1280.0, size=(count, 2)),
+                        rng.uniform(-0.3, 0.3, size=(count, 2)),
+                        ransac_threshold=1e-9,
+                    )
+
+
 if __name__ == "__main__":
     # 파일을 직접 실행할 때도 unittest runner를 시작합니다.
     unittest.main()
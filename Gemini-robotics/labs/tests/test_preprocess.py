@@ -0,0 +1,91 @@
+"""업로드 전처리가 크기·byte 예산·중복 제거·cache를 지키는지 검증합니다."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from gemini_robotics_learning.frames import synthetic_frame
+from gemini_robotics_learning.preprocess import (
+    EncodeConfig,
+    FramePreprocessor,
+    LocalFileStore,
+    UploadCache,
+    difference_hash,
+    encode_jpeg,
+    hamming_distance,
+)
+
+
+def noisy_frame(seed: int, height: int = 480, width: int = 640) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+class EncodeTest(unittest.TestCase):
+    def test_resizes_long_edge_and_keeps_aspect(self) -> None:
+        encoded = encode_jpeg(Image.fromarray(synthetic_frame(0, 480, 640)), EncodeConfig(long_edge=320))
+        self.assertEqual((encoded.width, encoded.height), (320, 240))
+        with Image.open(BytesIO(encoded.data)) as image:
+            self.assertEqual(image.size, (320, 240))
+
+    def test_lowers_quality_to_fit_budget(self) -> None:
+        image = Image.fromarray(noisy_frame(1))
+        roomy = encode_jpeg(image, EncodeConfig(long_edge=256, max_bytes=1_000_000))
+        tight = encode_jpeg(image, EncodeConfig(long_edge=256, max_bytes=roomy.nbytes - 1))
+        self.assertEqual(roomy.quality, 85)
+        self.assertLess(tight.quality, 85)
+        self.assertLess(tight.nbytes, roomy.nbytes)
+        impossible = encode_jpeg(image, EncodeConfig(long_edge=256, max_bytes=10))
+        self.assertFalse(impossible.within_budget)
+
+    def test_rejects_invalid_config(self) -> None:
+        with self.assertRaises(ValueError):
+            EncodeConfig(qualities=(100,))
+
+
+class PreprocessorTest(unittest.TestCase):
+    def test_near_duplicates_are_skipped(self) -> None:
+        base = synthetic_frame(0, 120, 160)
+        jitter = base.copy()
+        jitter[0, 0] = 255
+        self.assertLessEqual(
+            hamming_distance(difference_hash(Image.fromarray(base)), difference_hash(Image.fromarray(jitter))),
+            4,
+        )
+        preprocessor = FramePreprocessor(EncodeConfig(long_edge=64))
+        self.assertIsNotNone(preprocessor.process(base))
+        self.assertIsNone(preprocessor.process(jitter))
+        self.assertIsNotNone(preprocessor.process(noisy_frame(2, 120, 160)))
+        self.assertEqual(preprocessor.stats()["duplicates"], 1)
+
+    def test_cache_reuses_encoding_and_uploads(self) -> None:
+        preprocessor = FramePreprocessor(EncodeConfig(long_edge=128), dedupe_distance=-1)
+        store = LocalFileStore()
+        uploads = UploadCache(store)
+        frame = noisy_frame(3)
+        first = uploads.upload(preprocessor.process(frame))
+        second = uploads.upload(preprocessor.process(frame))
+        self.assertEqual(first, second)
+        self.assertEqual(store.calls, 1)
+        self.assertEqual(preprocessor.cache.hits, 1)
+        stats = preprocessor.stats()
+        self.assertLess(stats["bytes_out"], stats["bytes_in"])
+        self.assertTrue(first.uri.startswith("local://"))
+
+    def test_upload_cache_is_safe_across_threads(self) -> None:
+        preprocessor = FramePreprocessor(EncodeConfig(long_edge=64), dedupe_distance=-1)
+        images = [preprocessor.process(noisy_frame(seed, 96, 128)) for seed in range(4)]
+        store = LocalFileStore()
+        # 작은 cache로 eviction과 재사용이 여러 thread에서 섞이게 합니다.
+        uploads = UploadCache(store, max_entries=2)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda index: uploads.upload(images[index % 4]), range(400)))
+        for index, uploaded in enumerate(results):
+            self.assertEqual(store.files[uploaded.name], images[index % 4].data)
+        self.assertLessEqual(len(uploads._uploaded), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
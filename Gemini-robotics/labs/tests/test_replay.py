@@ -0,0 +1,65 @@
+"""Plan 재생 harness의 결정성, 거부 집계, pacing을 검증합니다."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from gemini_robotics_learning.mock_robot import MockRobot, ToolExecutor
+from gemini_robotics_learning.replay import RecordedPlan, ReplayHarness, load_plans, synthetic_plans, write_plans
+from gemini_robotics_learning.safety import SafetyEnvelope, WorkspaceLimits
+
+
+WORKSPACE = WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4)
+
+
+def harness(**options) -> ReplayHarness:
+    return ReplayHarness(ToolExecutor(MockRobot(SafetyEnvelope(workspace=WORKSPACE))), **options)
+
+
+class ReplayTest(unittest.TestCase):
+    def test_synthetic_plans_are_deterministic_and_round_trip(self) -> None:
+        plans = list(synthetic_plans(500, seed=3, workspace=WORKSPACE))
+        self.assertEqual(plans, list(synthetic_plans(500, seed=3, workspace=WORKSPACE)))
+        self.assertEqual(sum(len(plan.calls) for plan in plans), 500)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plans.jsonl"
+            self.assertEqual(write_plans(path, plans), len(plans))
+            self.assertEqual(list(load_plans(path)), plans)
+            # 배열만 있는 줄도 plan으로 읽습니다.
+            path.write_text('[{"id": "a", "name": "stop", "arguments": {"reason": "x"}}]\n', encoding="utf-8")
+            self.assertEqual(list(load_plans(path))[0].calls[0]["name"], "stop")
+
+    def test_counts_rejections_and_resets_between_plans(self) -> None:
+        safe = {"id": "m1", "name": "move", "arguments": {"x": 0.1, "y": 0.0, "z": 0.25, "speed_m_s": 0.05, "frame_id": "table"}}
+        unsafe = {"id": "m2", "name": "move", "arguments": {"x": 0.1, "y": 0.0, "z": 0.25, "speed_m_s": 5.0, "frame_id": "table"}}
+        grip = {"id": "g1", "name": "set_gripper", "arguments": {"opened": False, "max_force_n": 10.0}}
+        plans = [
+            RecordedPlan(calls=[safe, unsafe, grip]),
+            # 같은 ID 재전송은 거부가 아니라 duplicate로 기록됩니다.
+            RecordedPlan(calls=[safe, grip]),
+            RecordedPlan(calls=[dict(grip, id="g2")] * 13),
+        ]
+        report = harness().run(plans)
+        self.assertEqual((report.plans, report.calls, report.executed), (3, 18, 3))
+        self.assertEqual(report.rejected_plans, 2)
+        self.assertEqual(report.skipped, 1 + 12)
+        self.assertEqual(report.rejections_by_tool, {"move": 1, "<plan>": 1})
+        self.assertEqual(report.statuses, {"success": 2, "duplicate_ignored": 1})
+        self.assertEqual(report.latency_summary()["move"]["count"], 2)
+
+    def test_realtime_pacing_waits_for_recorded_offsets(self) -> None:
+        now = [0.0]
+        waits: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            waits.append(seconds)
+            now[0] += seconds
+
+        plans = [RecordedPlan(calls=[], at_s=at_s) for at_s in (0.0, 1.0, 3.0)]
+        report = harness(clock=lambda: now[0], sleep=sleep).run(plans, realtime=True, speed=2.0)
+        self.assertEqual(waits, [0.5, 1.0])
+        self.assertEqual(report.wall_s, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
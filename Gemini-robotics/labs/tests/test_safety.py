@@ -1,13 +1,18 @@
 """생성형 tool 제안보다 safety gate가 항상 우선함을 검증합니다."""
 
+import random
 import unittest
 
+import numpy as np
+
 from gemini_robotics_learning.mock_robot import MockRobot, ToolExecutor
 from gemini_robotics_learning.safety import (
     ForbiddenBox,
+    MoveCommand,
     SafetyEnvelope,
     ToolRejected,
     WorkspaceLimits,
+    segments_hit_boxes,
 )
 
 
@@ -102,6 +107,237 @@ class SafetyTest(unittest.TestCase):
             executor.execute_plan(plan, human_present=True)
 
 
+def random_boxes(rng: random.Random, count: int) -> list[ForbiddenBox]:
+    """Workspace 안에 작은 keep-out box를 seed 고정으로 흩어 놓습니다."""
+
+    boxes = []
+    for index in range(count):
+        x, y, z = rng.uniform(-0.3, 0.28), rng.uniform(-0.3, 0.28), rng.uniform(0.05, 0.3)
+        size = rng.uniform(0.005, 0.04)
+        limits = WorkspaceLimits(x, x + size, y, y + size, z, z + size)
+        boxes.append(ForbiddenBox(name=f"box-{index}", limits=limits))
+    return boxes
+
+
+def scalar_reason(safety: SafetyEnvelope, start, command) -> str | None:
+    """validate_move의 예외 메시지를 batch 결과와 비교할 수 있게 바꿉니다."""
+
+    try:
+        safety.validate_move(start, command)
+    except ToolRejected as error:
+        return str(error)
+    return None
+
+
+def move_call(call_id: str, x: float, y: float, z: float) -> dict:
+    """테스트 plan에 쓰는 move tool envelope입니다."""
+
+    arguments = {"x": x, "y": y, "z": z, "speed_m_s": 0.05, "frame_id": "table"}
+    return {"id": call_id, "name": "move", "arguments": arguments}
+
+
+class CompiledPlanTest(unittest.TestCase):
+    def test_compiled_plan_matches_interpreted_execution(self) -> None:
+        plan = [
+            move_call("a", 0.05, 0.08, 0.25),
+            {"id": "g", "name": "set_gripper", "arguments": {"opened": False, "max_force_n": 5.0}},
+            move_call("a", 0.0, 0.0, 0.3),
+            move_call("b", -0.10, 0.10, 0.25),
+        ]
+        interpreted = make_executor()
+        expected = interpreted.execute_plan(plan)
+        executor = make_executor()
+        compiled = executor.compile_plan(plan)
+        self.assertEqual(compiled.final_xyz, (-0.10, 0.10, 0.25))
+        self.assertTrue(compiled.steps[2].duplicate)
+        self.assertEqual(executor.execute_compiled(compiled), expected)
+        self.assertEqual(executor.robot.state, interpreted.robot.state)
+        self.assertEqual(len(executor.robot.records), 4)
+
+    def test_pose_chain_is_checked_before_anything_moves(self) -> None:
+        # 두 번째 move는 첫 move의 목표에서 출발하면 카메라 기둥을 가로지릅니다.
+        executor = make_executor()
+        plan = [move_call("a", 0.05, 0.0, 0.20), move_call("b", 0.25, 0.0, 0.20)]
+        with self.assertRaisesRegex(ToolRejected, "path crosses"):
+            executor.compile_plan(plan)
+        # compile 실패는 아무 행동도 하지 않았으므로 pose와 STOPPED 상태가 그대로입니다.
+        self.assertEqual(executor.robot.state.xyz, (0.0, 0.0, 0.25))
+        self.assertFalse(executor.robot.state.stopped)
+
+    def test_stale_compiled_plan_is_rejected(self) -> None:
+        executor = make_executor()
+        compiled = executor.compile_plan([move_call("a", 0.05, 0.05, 0.20)])
+        executor.execute_plan([move_call("other", 0.0, 0.05, 0.25)])
+        with self.assertRaises(ToolRejected):
+            executor.execute_compiled(compiled)
+        self.assertTrue(executor.robot.state.stopped)
+
+    def test_compiled_plan_is_rejected_after_envelope_changes(self) -> None:
+        executor = make_executor()
+        compiled = executor.compile_plan([move_call("a", 0.05, 0.05, 0.20)])
+        executor.robot.safety.add_forbidden(
+            ForbiddenBox(name="tray", limits=WorkspaceLimits(0.0, 0.1, 0.0, 0.1, 0.05, 0.4))
+        )
+        with self.assertRaisesRegex(ToolRejected, "safety envelope changed"):
+            executor.execute_compiled(compiled)
+        self.assertEqual(executor.robot.state.xyz, (0.0, 0.0, 0.25))
+        self.assertTrue(executor.robot.state.stopped)
+
+        executor = make_executor()
+        compiled = executor.compile_plan([move_call("a", 0.05, 0.05, 0.20)])
+        executor.robot.safety.max_speed_m_s = 0.01
+        with self.assertRaisesRegex(ToolRejected, "safety envelope changed"):
+            executor.execute_compiled(compiled)
+
+    def test_compile_rejects_unknown_tool_and_steps_after_stop(self) -> None:
+        executor = make_executor()
+        with self.assertRaises(ToolRejected):
+            executor.compile_plan([{"id": "x", "name": "run_shell", "arguments": {}}])
+        with self.assertRaises(ToolRejected):
+            executor.compile_plan(
+                [
+                    {"id": "s", "name": "stop", "arguments": {"reason": "test"}},
+                    move_call("a", 0.05, 0.05, 0.20),
+                ]
+            )
+
+    def test_human_presence_is_checked_at_execution(self) -> None:
+        executor = make_executor()
+        compiled = executor.compile_plan([move_call("a", 0.05, 0.05, 0.20)])
+        with self.assertRaises(ToolRejected):
+            executor.execute_compiled(compiled, human_present=True)
+        self.assertEqual(executor.robot.state.xyz, (0.0, 0.0, 0.25))
+
+
+class ForbiddenIndexTest(unittest.TestCase):
+    def test_index_matches_linear_scan(self) -> None:
+        rng = random.Random(7)
+        boxes = random_boxes(rng, 300)
+        workspace = WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4)
+        safety = SafetyEnvelope(workspace=workspace, forbidden=boxes)
+        index = safety.forbidden_index()
+        for _ in range(2000):
+            point = (rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3), rng.uniform(0.05, 0.4))
+            expected = next((box for box in boxes if box.limits.contains(*point)), None)
+            self.assertIs(index.first_containing(*point), expected)
+
+    def test_index_is_rebuilt_when_forbidden_changes(self) -> None:
+        executor = make_executor()
+        safety = executor.robot.safety
+        self.assertIsNone(safety.forbidden_index().first_containing(-0.2, -0.2, 0.2))
+        tray = ForbiddenBox(name="tray", limits=WorkspaceLimits(-0.25, -0.15, -0.25, -0.15, 0.05, 0.4))
+        safety.add_forbidden(tray)
+        self.assertEqual(safety.forbidden_index().first_containing(-0.2, -0.2, 0.2).name, "tray")
+        # 대입으로 목록을 바꿔도 다음 검사부터 반영됩니다.
+        safety.forbidden = [tray]
+        self.assertIsNone(safety.forbidden_index().first_containing(0.14, 0.0, 0.2))
+
+    def test_forbidden_cannot_be_changed_in_place(self) -> None:
+        boxes: list[ForbiddenBox] = []
+        safety = SafetyEnvelope(
+            workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4), forbidden=boxes
+        )
+        # 생성 때 tuple로 복사하므로 index가 모르는 제자리 변경은 불가능합니다.
+        self.assertIsInstance(safety.forbidden, tuple)
+        with self.assertRaises(AttributeError):
+            safety.forbidden.append(
+                ForbiddenBox(name="tray", limits=WorkspaceLimits(0.0, 0.1, 0.0, 0.1, 0.05, 0.4))
+            )
+
+    def test_batch_reasons_match_scalar_validation(self) -> None:
+        rng = random.Random(11)
+        safety = SafetyEnvelope(
+            workspace=WorkspaceLimits(-0.3, 0.3, -0.3, 0.3, 0.05, 0.4),
+            max_step_m=0.25,
+            forbidden=random_boxes(rng, 200),
+        )
+        start = (0.0, 0.0, 0.25)
+        commands = [
+            MoveCommand(
+                x=rng.uniform(-0.4, 0.4),
+                y=rng.uniform(-0.4, 0.4),
+                z=rng.uniform(0.0, 0.45),
+                speed_m_s=rng.choice((0.05, 0.2, -0.1)),
+            )
+            for _ in range(1500)
+        ]
+        commands.append(MoveCommand(x=float("nan"), y=0.0, z=0.2, speed_m_s=0.05))
+        commands.append(MoveCommand(x=0.0, y=0.0, z=0.2, speed_m_s=0.05, frame_id="camera"))
+        reasons = safety.validate_moves(start, commands)
+        self.assertEqual(reasons, [scalar_reason(safety, start, command) for command in commands])
+        self.assertIn(None, reasons)
+        self.assertTrue(any(r and "forbidden" in r for r in reasons))
+
+
+class SweptPathTest(unittest.TestCase):
+    def test_straight_move_through_post_is_rejected(self) -> None:
+        # 양 끝은 안전하지만 직선 경로가 x=0.10~0.18 카메라 기둥을 가로지릅니다.
+        safety = make_executor().robot.safety
+        command = MoveCommand(x=0.25, y=0.0, z=0.20, speed_m_s=0.05)
+        with self.assertRaisesRegex(ToolRejected, "path crosses forbidden region: camera-post"):
+            safety.validate_move((0.05, 0.0, 0.20), command)
+        self.assertEqual(
+            safety.validate_moves((0.05, 0.0, 0.20), [command]),
+            ["path crosses forbidden region: camera-post"],
+        )
+        # 기존 동작이 필요한 호출자는 sweep 검사를 끌 수 있습니다.
+        safety.check_swept_path = False
+        safety.validate_move((0.05, 0.0, 0.20), command)
+
+    def test_pose_inside_box_can_move_out_but_not_through_another(self) -> None:
+        # 금지 영역이 나중에 추가돼 현재 pose가 camera-post 안에 갇힌 상황입니다.
+        safety = make_executor().robot.safety
+        inside = (0.14, 0.0, 0.20)
+        escape = MoveCommand(x=0.14, y=0.10, z=0.20, speed_m_s=0.05)
+        safety.validate_move(inside, escape)
+        self.assertEqual(safety.validate_moves(inside, [escape]), [None])
+        safety.validate_move(inside, escape, path=lambda t: np.array(inside) + np.outer(t, [0.0, 0.10, 0.0]))
+        # 빠져나간 뒤 다시 들어오는 목표는 여전히 거부합니다.
+        with self.assertRaisesRegex(ToolRejected, "target enters forbidden region"):
+            safety.validate_move(inside, MoveCommand(x=0.16, y=0.0, z=0.20, speed_m_s=0.05))
+        # 빠져나가는 길에 다른 금지 영역을 지나면 거부합니다.
+        safety.add_forbidden(
+            ForbiddenBox(name="tray", limits=WorkspaceLimits(0.12, 0.16, 0.07, 0.08, 0.05, 0.40))
+        )
+        with self.assertRaisesRegex(ToolRejected, "path crosses forbidden region: tray"):
+            safety.validate_move(inside, escape)
+        self.assertEqual(
+            safety.validate_moves(inside, [escape]), ["path crosses forbidden region: tray"]
+        )
+
+    def test_curved_path_around_post_is_allowed(self) -> None:
+        safety = make_executor().robot.safety
+        start, target = np.array([0.05, 0.0, 0.20]), np.array([0.25, 0.0, 0.20])
+
+        def arc(t: np.ndarray) -> np.ndarray:
+            # y 방향으로 0.15m 부풀린 반원 모양으로 기둥을 돌아갑니다.
+            points = start + (target - start) * t[:, None]
+            points[:, 1] += 0.15 * np.sin(np.pi * t)
+            return points
+
+        command = MoveCommand(x=0.25, y=0.0, z=0.20, speed_m_s=0.05)
+        safety.validate_move(tuple(start), command, path=arc)
+        with self.assertRaises(ToolRejected):
+            safety.validate_move(tuple(start), command, path=lambda t: arc(t) * 0.5)
+
+    def test_slab_matches_dense_sampling(self) -> None:
+        # 아주 촘촘한 점 sampling과 교차 판정이 일치하는지 무작위로 비교합니다.
+        rng = np.random.default_rng(3)
+        starts = rng.uniform(-1.0, 1.0, size=(400, 3))
+        ends = rng.uniform(-1.0, 1.0, size=(400, 3))
+        ends[:50, 2] = starts[:50, 2]
+        lower = rng.uniform(-0.8, 0.5, size=(5, 3))
+        upper = lower + rng.uniform(0.05, 0.3, size=(5, 3))
+        t = np.linspace(0.0, 1.0, 4001)[None, :, None]
+        samples = starts[:, None, :] + (ends - starts)[:, None, :] * t
+        inside = (lower[None, None] <= samples[:, :, None]) & (samples[:, :, None] <= upper[None, None])
+        expected = inside.all(axis=3).any(axis=1)
+        actual = segments_hit_boxes(starts, ends, lower, upper)
+        # sampling 간격보다 얇게 모서리를 스치는 경우만 다를 수 있으므로 sampled hit는 반드시 잡아야 합니다.
+        self.assertTrue((actual | ~expected).all())
+        self.assertGreater((actual == expected).mean(), 0.99)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,119 @@
+"""Batch·streaming parser가 기존 dataclass parser와 같은 계약을 지키는지 검증합니다."""
+
+import unittest
+
+import numpy as np
+
+from gemini_robotics_learning.geometry import NormalizedPoint, PlanarCalibration
+from gemini_robotics_learning.schemas import (
+    iter_boxes,
+    iter_point_detections,
+    parse_box_batch,
+    parse_boxes,
+    parse_point_batch,
+    parse_point_detections,
+    point_stream_parser,
+)
+
+
+POINTS = '[{"point":[500,250],"label":" cup "},{"point":[0,1000],"label":"bowl"}]'
+BOXES = '[{"label":"block","y":100,"x":200,"y2":300,"x2":600}]'
+
+
+class BatchSchemaTest(unittest.TestCase):
+    def test_point_batch_yields_existing_dataclasses(self) -> None:
+        # batch를 풀어 만든 객체가 기존 parser 결과와 같아야 합니다.
+        batch = parse_point_batch(POINTS)
+        self.assertEqual(list(batch), parse_point_detections(POINTS))
+        self.assertEqual(batch.labels, ("cup", "bowl"))
+
+    def test_point_batch_converts_in_bulk(self) -> None:
+        batch = parse_point_batch(POINTS)
+        pixels = batch.to_pixels(width=101, height=201)
+        np.testing.assert_allclose(pixels, [[25.0, 100.0], [100.0, 0.0]])
+        calibration = PlanarCalibration(
+            matrix=((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+        )
+        world, valid = batch.to_world(calibration, width=101, height=201)
+        self.assertTrue(valid.all())
+        np.testing.assert_allclose(world, pixels)
+
+    def test_point_batch_is_read_only(self) -> None:
+        batch = parse_point_batch(POINTS)
+        with self.assertRaises(ValueError):
+            batch.points_yx[0, 0] = 1.0
+
+    def test_point_batch_rejects_invalid_items(self) -> None:
+        # 범위, bool 좌표, label type 오류는 기존 parser처럼 거부합니다.
+        for text in (
+            '[{"point":[500,1001]}]',
+            '[{"point":[true,1]}]',
+            '[{"point":["1",1]}]',
+            '[{"point":[1,1],"label":3}]',
+            '[{"label":"cup"}]',
+            '[1]',
+        ):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_point_batch(text)
+
+    def test_box_batch_matches_box_parser(self) -> None:
+        batch = parse_box_batch(BOXES)
+        self.assertEqual(list(batch), parse_boxes(BOXES))
+        center = batch.centers()[0].point
+        self.assertEqual(center, NormalizedPoint(y=200.0, x=400.0))
+        np.testing.assert_allclose(batch.to_pixels(1001, 1001), [[200.0, 100.0, 600.0, 300.0]])
+
+    def test_box_batch_rejects_inverted_box(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_box_batch('[{"y":300,"x":200,"y2":100,"x2":600}]')
+        with self.assertRaises(ValueError):
+            parse_box_batch('[{"y":100,"x":200,"y2":300}]')
+
+    def test_empty_response_is_a_valid_batch(self) -> None:
+        # 빈 배열은 “대상을 찾지 못함”이라는 정상 결과입니다.
+        self.assertEqual(len(parse_point_batch("[]")), 0)
+        self.assertEqual(parse_box_batch("[]").boxes.shape, (0, 4))
+
+
+class StreamingParserTest(unittest.TestCase):
+    def test_items_are_emitted_as_soon_as_they_close(self) -> None:
+        parser = point_stream_parser()
+        # 첫 원소가 닫히기 전에는 아무것도 반환하지 않습니다.
+        self.assertEqual(parser.feed('결과: [{"point":[500,'), [])
+        first = parser.feed('250],"label":"cu]p"}, {"po')
+        self.assertEqual([item.label for item in first], ["cu]p"])
+        second = parser.feed('int":[0,1000],"label":"bowl"}]')
+        self.assertEqual([item.label for item in second], ["bowl"])
+        self.assertTrue(parser.finished)
+        parser.close()
+
+    def test_single_character_chunks_match_full_parser(self) -> None:
+        # 한 글자씩 나눠도 일괄 parser와 같은 결과여야 합니다.
+        text = 'ok [ {"point":[1,2],"label":"a\\"}"} ,{"point":[3,4]} ] trailing {'
+        streamed = list(iter_point_detections(iter(text)))
+        self.assertEqual(streamed, parse_point_detections(text))
+        self.assertEqual(list(iter_boxes([BOXES[:10], BOXES[10:]])), parse_boxes(BOXES))
+
+    def test_invalid_streams_are_rejected(self) -> None:
+        for chunks in (
+            [],
+            ["no json"],
+            ['{"point":[1,2]}'],
+            ['[{"point":[1,2]}'],
+            ['[{"point":[1,2]} {"point":[1,2]}]'],
+            ['[{"point":[1,2]},]'],
+            ['[1]'],
+            ['[{"point":[1,1001]}]'],
+        ):
+            with self.subTest(chunks=chunks), self.assertRaises(ValueError):
+                list(iter_point_detections(chunks))
+
+    def test_item_limit_is_enforced_while_streaming(self) -> None:
+        parser = point_stream_parser(maximum_items=1)
+        parser.feed('[{"point":[1,2]},')
+        with self.assertRaises(ValueError):
+            parser.feed('{"point":[3,4]}')
+
+
+if __name__ == "__main__":
+    unittest.main()
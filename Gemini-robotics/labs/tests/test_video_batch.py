@@ -0,0 +1,150 @@
+"""Batch runner의 동시성 상한, rate limit backoff, resume을 검증합니다."""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from gemini_robotics_learning.video_batch import BackoffPolicy, BatchRunner, discover_videos, load_completed
+from gemini_robotics_learning.video_progress import StubProgressModel, VideoProgressPipeline, file_digest, write_gif
+
+
+class RateLimitError(Exception):
+    code = 429
+
+
+class FlakyModel(StubProgressModel):
+    """처음 `failures`번은 429를 내고, 동시에 실행 중인 호출 수를 기록합니다."""
+
+    def __init__(self, failures: int = 0, delay_s: float = 0.0) -> None:
+        super().__init__()
+        self.failures = failures
+        self.delay_s = delay_s
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def analyze(self, clip, task, mode):
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise RateLimitError("quota exceeded")
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay_s)
+            return super().analyze(clip, task, mode)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_videos(directory: Path, count: int) -> None:
+    for index in range(count):
+        frames = [np.full((24, 32, 3), (index * 40 + step * 20) % 256, dtype=np.uint8) for step in range(3)]
+        write_gif(directory / f"clip_{index}.gif", frames)
+    (directory / "notes.txt").write_text("not a video", encoding="utf-8")
+
+
+class BatchRunnerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_bounded_concurrency_and_jsonl_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            make_videos(root, 6)
+            items = discover_videos(root, "fill the cup")
+            self.assertEqual(len(items), 6)
+            model = FlakyModel(delay_s=0.05)
+            runner = BatchRunner(VideoProgressPipeline(model), root / "results.jsonl", concurrency=2)
+            stats = await runner.run(items)
+            self.assertEqual(stats["ok"], 6)
+            self.assertEqual(model.peak, 2)
+            rows = [json.loads(line) for line in (root / "results.jsonl").read_text().splitlines()]
+            self.assertEqual(sorted(row["video"] for row in rows), [item.name for item in items])
+            self.assertTrue(all(row["progress_level"] for row in rows))
+
+    async def test_rate_limits_back_off_then_succeed(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            make_videos(root, 1)
+            delays: list[float] = []
+
+            async def record_sleep(seconds: float) -> None:
+                delays.append(seconds)
+
+            runner = BatchRunner(
+                VideoProgressPipeline(FlakyModel(failures=3)),
+                root / "results.jsonl",
+                backoff=BackoffPolicy(base_s=1.0, jitter=0.0),
+                sleep=record_sleep,
+            )
+            stats = await runner.run(discover_videos(root, "task"))
+            self.assertEqual((stats["ok"], stats["retries"]), (1, 3))
+            self.assertEqual(delays, [1.0, 2.0, 4.0])
+
+    async def test_resume_skips_completed_items(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            make_videos(root, 3)
+            results = root / "results.jsonl"
+            items = discover_videos(root, "task")
+            model = FlakyModel()
+            settings = VideoProgressPipeline(model).settings_key
+            rows = [
+                {"video": item.name, "task": "task", "mode": "progress", "status": status,
+                 "digest": file_digest(item.path), "settings": settings}
+                for item, status in zip(items, ("ok", "error"))
+            ]
+            # 첫 항목은 완료, 두 번째는 실패, 마지막 줄은 중단으로 잘렸다고 가정합니다.
+            results.write_text(
+                "".join(json.dumps(row) + "\n" for row in rows) + '{"video": "clip_2.gif", "ta',
+                encoding="utf-8",
+            )
+            stats = await BatchRunner(VideoProgressPipeline(model), results).run(items)
+            self.assertEqual((stats["skipped"], stats["ok"]), (1, 2))
+            self.assertEqual(model.calls, 2)
+            # 잘린 줄 뒤에 이어 쓴 row도 다음 resume에서 읽혀야 합니다.
+            again = await BatchRunner(VideoProgressPipeline(model), results).run(items)
+            self.assertEqual(again["skipped"], 3)
+
+    async def test_resume_reruns_changed_video_or_settings(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            make_videos(root, 2)
+            results = root / "results.jsonl"
+            items = discover_videos(root, "task")
+            model = FlakyModel()
+            await BatchRunner(VideoProgressPipeline(model), results).run(items)
+            # 같은 이름으로 녹화를 덮어쓰면 그 영상만 다시 분석합니다.
+            frames = [np.full((24, 32, 3), value, dtype=np.uint8) for value in (10, 200, 90)]
+            write_gif(items[0].path, frames)
+            stats = await BatchRunner(VideoProgressPipeline(model), results).run(items)
+            self.assertEqual((stats["skipped"], stats["ok"]), (1, 1))
+            self.assertEqual(model.calls, 3)
+            # keyframe 설정이 바뀌면 결과 파일의 모든 항목을 다시 분석합니다.
+            changed = await BatchRunner(VideoProgressPipeline(model, max_keyframes=2), results).run(items)
+            self.assertEqual((changed["skipped"], changed["ok"]), (0, 2))
+            rows = [json.loads(line) for line in results.read_text().splitlines()]
+            self.assertTrue(all(row["digest"] and row["settings"] for row in rows))
+
+    def test_load_completed_skips_malformed_ok_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            results = Path(directory) / "results.jsonl"
+            complete = {"task": "task", "mode": "progress", "digest": "d", "settings": "s", "status": "ok"}
+            rows = [
+                {"video": "a.gif", **complete},
+                {"video": "b.gif", "status": "ok"},
+                {"video": ["c.gif"], **complete},
+                # hash와 설정이 없는 예전 row는 무엇을 분석했는지 알 수 없어 다시 실행합니다.
+                {"video": "d.gif", "task": "task", "mode": "progress", "status": "ok"},
+                ["not", "a", "row"],
+            ]
+            results.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+            self.assertEqual(load_completed(results), {("a.gif", "task", "progress", "d", "s")})
+
+
+if __name__ == "__main__":
+    unittest.main()
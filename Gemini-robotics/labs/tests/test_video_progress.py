@@ -0,0 +1,131 @@
+"""Keyframe 선택과 (영상, task, mode) cache가 불필요한 request를 막는지 검증합니다."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from gemini_robotics_learning.schemas import CompletionMoment, ProgressReport
+from gemini_robotics_learning.video_progress import (
+    ProgressCache,
+    StubProgressModel,
+    VideoFrame,
+    VideoProgressPipeline,
+    iter_video_frames,
+    select_keyframes,
+    write_gif,
+)
+
+
+def block_frames(count: int = 30, moving: range = range(10, 20)) -> list[np.ndarray]:
+    """`moving` 구간에서만 흰 블록이 오른쪽으로 움직이는 영상입니다."""
+
+    frames = []
+    x = 4
+    for index in range(count):
+        if index in moving:
+            x += 5
+        frame = np.zeros((48, 96, 3), dtype=np.uint8)
+        frame[16:32, x : x + 16] = 255
+        frames.append(frame)
+    return frames
+
+
+class KeyframeTest(unittest.TestCase):
+    def test_keeps_first_last_and_motion_frames(self) -> None:
+        frames = [VideoFrame(index, index * 0.1, pixels) for index, pixels in enumerate(block_frames())]
+        keyframes, count, duration_s = select_keyframes(frames, threshold=0.02, min_gap_s=0.2)
+        indices = [frame.index for frame in keyframes]
+        self.assertEqual(count, 30)
+        self.assertAlmostEqual(duration_s, 2.9)
+        self.assertEqual((indices[0], indices[-1]), (0, 29))
+        # 블록은 10~19번 frame에서 움직이므로 20번 이후 정지 구간에서는 더 고르지 않습니다.
+        self.assertTrue(all(10 <= index <= 20 for index in indices[1:-1]))
+        self.assertGreaterEqual(len(indices), 4)
+
+    def test_keyframe_budget_is_bounded(self) -> None:
+        frames = [VideoFrame(index, index * 1.0, pixels) for index, pixels in enumerate(block_frames(40, range(40)))]
+        keyframes, _count, _duration = select_keyframes(frames, threshold=0.01, min_gap_s=0.0, max_keyframes=5)
+        self.assertEqual(len(keyframes), 5)
+        self.assertEqual((keyframes[0].index, keyframes[-1].index), (0, 39))
+
+
+class VideoPipelineTest(unittest.TestCase):
+    def test_cache_avoids_repeated_model_calls(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            video = Path(directory) / "pick.gif"
+            write_gif(video, block_frames())
+            self.assertGreater(len(list(iter_video_frames(video))), 2)
+            model = StubProgressModel()
+            cache_path = Path(directory) / "cache.json"
+            pipeline = VideoProgressPipeline(model, cache=ProgressCache(cache_path), threshold=0.02, min_gap_s=0.2)
+            first = pipeline.analyze(video, "pick up the block")
+            self.assertIsInstance(first, ProgressReport)
+            self.assertLess(pipeline.last_clip.nbytes, video.stat().st_size * 4)
+            self.assertEqual(pipeline.analyze(video, "pick  up the block"), first)
+            moment = pipeline.analyze(video, "pick up the block", mode="moment")
+            self.assertIsInstance(moment, CompletionMoment)
+            self.assertEqual(model.calls, 2)
+            # 새 process에서도 같은 설정이면 disk cache가 request를 막습니다.
+            reloaded = VideoProgressPipeline(
+                model, cache=ProgressCache(cache_path), threshold=0.02, min_gap_s=0.2
+            )
+            self.assertEqual(reloaded.analyze(video, "pick up the block"), first)
+            self.assertEqual(model.calls, 2)
+
+    def test_cache_hit_clears_clip_and_settings_change_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            video = Path(directory) / "pick.gif"
+            write_gif(video, block_frames())
+            model = StubProgressModel()
+            cache = ProgressCache()
+            pipeline = VideoProgressPipeline(model, cache=cache, threshold=0.02, min_gap_s=0.2)
+            pipeline.analyze(video, "pick up the block")
+            self.assertIsNotNone(pipeline.last_clip)
+            pipeline.analyze(video, "pick up the block")
+            self.assertIsNone(pipeline.last_clip)
+            # keyframe 설정이 바뀌면 예전 설정으로 만든 결과를 쓰지 않습니다.
+            pipeline.max_keyframes = 2
+            pipeline.analyze(video, "pick up the block")
+            self.assertEqual(model.calls, 2)
+            self.assertEqual(len(pipeline.last_clip.images), 2)
+            other = VideoProgressPipeline(StubProgressModel(), cache=cache, threshold=0.02, min_gap_s=0.2)
+            other.model.model = "other-model"
+            other.analyze(video, "pick up the block")
+            self.assertEqual(other.model.calls, 1)
+
+    def test_rejects_unknown_mode(self) -> None:
+        with self.assertRaises(ValueError):
+            VideoProgressPipeline(StubProgressModel()).analyze(Path("missing.gif"), "task", mode="fast")
+
+
+class ProgressCacheTest(unittest.TestCase):
+    def test_put_appends_one_line_and_survives_truncation(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "cache.jsonl"
+            cache = ProgressCache(path)
+            cache.put("a", "task", "progress", ProgressReport(level="40-60"))
+            cache.put("b", "task", "moment", CompletionMoment(seconds=2.5))
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 2)
+            # 중단으로 잘린 줄이 있어도 앞의 항목과 이후 append는 읽혀야 합니다.
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write('{"key": "[\\"c')
+            ProgressCache(path).put("c", "task", "progress", ProgressReport(level="0-20"))
+            reloaded = ProgressCache(path)
+            self.assertEqual(len(reloaded), 3)
+            self.assertEqual(reloaded.get("b", "task", "moment").seconds, 2.5)
+            self.assertEqual(reloaded.get("c", "task", "progress").level, "0-20")
+
+
+class CompletionMomentTest(unittest.TestCase):
+    def test_validates_seconds(self) -> None:
+        self.assertIsNone(CompletionMoment.from_text('{"completion_time_seconds": null}').seconds)
+        self.assertEqual(CompletionMoment.from_text('{"completion_time_seconds": 3}').seconds, 3.0)
+        for text in ('{"completion_time_seconds": -1}', '{"completion_time_seconds": true}', "{}"):
+            with self.assertRaises(ValueError):
+                CompletionMoment.from_text(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,18 +45,52 @@ def covariance_2d(scale_x: float, scale_y: float, angle_degrees: float) -> np.nd
 
 
 # 모든 픽셀 좌표에서 2D Gaussian 값을 계산하는 함수를 정의한다.
-def gaussian_2d(pixel_grid: np.ndarray, mean: np.ndarray, covariance: np.ndarray) -> np.ndarray:
-    """shape가 (H, W, 2)인 좌표 격자에 2D Gaussian을 평가한다."""
-    # broadcasting으로 모든 픽셀 좌표에서 shape (2,)인 중심을 뺀다.
-    delta = pixel_grid - mean
+def gaussian_2d(pixel_grid: np.ndarray, mean: np.ndarray, covariance: np.ndarray, out: np.ndarray | None = None, scratch: np.ndarray | None = None) -> np.ndarray:
+    """shape가 (H, W, 2)인 좌표 격자에 2D Gaussian을 평가한다.
+
+    pixel_grid가 float32이면 float32로, 정수 격자를 포함한 그 밖의 dtype이면
+    float64로 계산한다. 같은 크기의
+    격자를 반복해서 평가할 때는 shape (H, W)인 out과 shape (2, H, W)인 scratch를
+    미리 만들어 넘기면 호출마다 새 배열을 만들지 않는다.
+    """
+    # float32 격자만 float32로 계산하고 정수 격자 등은 float64로 계산한다.
+    dtype = np.dtype(np.float32) if pixel_grid.dtype == np.float32 else np.dtype(np.float64)
+    # 결과 buffer가 없으면 (H, W) 배열을 새로 만든다.
+    out = np.empty(pixel_grid.shape[:-1], dtype=dtype) if out is None else out
+    # 중간값 buffer가 없으면 x 차이와 y 차이용 (2, H, W) 배열을 새로 만든다.
+    scratch = np.empty((2, *pixel_grid.shape[:-1]), dtype=dtype) if scratch is None else scratch
+    # 첫 번째와 두 번째 scratch 평면을 x 차이와 y 차이 buffer로 사용한다.
+    delta_x, delta_y = scratch
     # covariance의 역행렬을 계산해 Mahalanobis distance에 사용한다.
     inverse_covariance = np.linalg.inv(covariance)
-    # einsum은 각 픽셀의 delta^T inverse_covariance delta를 한 번에 계산한다.
-    squared_distance = np.einsum("...i,ij,...j->...", delta, inverse_covariance, delta)
-    # 중심에서의 값이 1이 되는 Gaussian weight를 계산한다.
-    weight = np.exp(-0.5 * squared_distance)
+    # 대칭 역행렬 [[a, b], [b, c]]의 세 성분을 Python 실수로 꺼내 float32 연산이 승격되지 않게 한다.
+    a, b, c = float(inverse_covariance[0, 0]), float(inverse_covariance[0, 1]), float(inverse_covariance[1, 1])
+    # out=으로 새 배열 없이 모든 픽셀의 x 좌표에서 중심 x를 뺀다.
+    np.subtract(pixel_grid[..., 0], float(mean[0]), out=delta_x)
+    # 같은 방식으로 y 좌표에서 중심 y를 뺀다.
+    np.subtract(pixel_grid[..., 1], float(mean[1]), out=delta_y)
+    # 교차항 2 b dx dy를 결과 buffer에 먼저 계산한다.
+    np.multiply(delta_x, delta_y, out=out)
+    # 교차항 계수 2b를 제자리에서 곱한다.
+    out *= 2.0 * b
+    # x 차이를 제자리에서 제곱한다.
+    np.multiply(delta_x, delta_x, out=delta_x)
+    # x 제곱에 a를 곱한다.
+    delta_x *= a
+    # a dx²를 결과에 더한다.
+    out += delta_x
+    # y 차이를 제자리에서 제곱한다.
+    np.multiply(delta_y, delta_y, out=delta_y)
+    # y 제곱에 c를 곱한다.
+    delta_y *= c
+    # c dy²를 더하면 delta^T inverse_covariance delta가 완성된다.
+    out += delta_y
+    # -0.5를 곱해 지수 부분을 만든다.
+    out *= -0.5
+    # 중심에서의 값이 1이 되는 Gaussian weight를 제자리에서 계산한다.
+    np.exp(out, out=out)
     # shape가 (H, W)인 weight 배열을 반환한다.
-    return weight
+    return out
 
 
 # 전체 시각화 실습을 실행하는 main 함수를 정의한다.
@@ -76,6 +110,8 @@ def main() -> None:
     covariance = covariance_2d(scale_x=70.0, scale_y=25.0, angle_degrees=35.0)
     # 모든 픽셀에서 2D Gaussian weight를 계산한다.
     weight = gaussian_2d(pixel_grid=pixel_grid, mean=mean, covariance=covariance)
+    # 같은 Gaussian을 float32 격자로 다시 계산해 정밀도 차이를 확인한다.
+    weight_float32 = gaussian_2d(pixel_grid=pixel_grid.astype(np.float32), mean=mean, covariance=covariance)
     # 결과 저장 폴더 경로를 만든다.
     output_dir = Path("outputs")
     # 상위 폴더가 없어도 만들고 기존 폴더가 있어도 계속한다.
@@ -108,6 +144,8 @@ def main() -> None:
     plt.close(figure)
     # 사용한 covariance matrix를 확인할 수 있도록 출력한다.
     print("covariance matrix:\n", covariance)
+    # float64와 float32 결과의 최대 차이를 출력한다.
+    print(f"max |float64 - float32|: {np.abs(weight - weight_float32).max():.2e}")
     # 생성된 파일의 절대 경로를 출력한다.
     print(f"저장 완료: {output_path.resolve()}")
 
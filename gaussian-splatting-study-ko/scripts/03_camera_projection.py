@@ -3,6 +3,8 @@
 # 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
 from __future__ import annotations
 
+# 잘라낸 개수를 필드 이름으로 묶기 위해 dataclass를 가져온다.
+from dataclasses import dataclass
 # 출력 파일 경로를 다루기 위해 Path를 가져온다.
 from pathlib import Path
 
@@ -11,6 +13,32 @@ import numpy as np
 # 투영 결과를 산점도로 그리기 위해 pyplot을 plt라는 별칭으로 가져온다.
 import matplotlib.pyplot as plt
 
+# 공식 3DGS처럼 카메라에서 0.2보다 가까운 점은 Jacobian이 너무 커지므로 버린다.
+NEAR_PLANE = 0.2
+# 이보다 먼 점은 pixel보다 작아 보이지 않는다고 보고 버린다.
+FAR_PLANE = 1000.0
+
+
+# frustum culling에서 잘라낸 점의 수를 이유별로 세는 dataclass를 정의한다.
+@dataclass
+class CullStats:
+    """near plane 앞, far plane 뒤, 화면 옆 guard band 밖으로 잘라낸 점의 수를 센다."""
+
+    # near plane보다 가까운(카메라 뒤 포함) 점의 수이다.
+    near: int = 0
+    # far plane보다 먼 점의 수이다.
+    far: int = 0
+    # 깊이는 범위 안이지만 guard band를 포함한 화면 밖에 있는 점의 수이다.
+    outside: int = 0
+
+    # 이유와 무관한 전체 잘라낸 수를 계산하는 property를 정의한다.
+    @property
+    def total(self) -> int:
+        """잘라낸 점의 총수를 반환한다."""
+        # 세 이유의 수를 더해 반환한다.
+        return self.near + self.far + self.outside
+
+
 
 # 세계 좌표 점들을 카메라 좌표로 바꾸는 함수를 정의한다.
 def world_to_camera(points_world: np.ndarray, rotation_cw: np.ndarray, translation_cw: np.ndarray) -> np.ndarray:
@@ -23,11 +51,62 @@ def world_to_camera(points_world: np.ndarray, rotation_cw: np.ndarray, translati
     return points_camera
 
 
+# 카메라 좌표 점 중 화면에 보일 수 있는 것을 한 번에 고르는 함수를 정의한다.
+def frustum_cull(points_camera: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int | None = None, image_width: int | None = None, radii: np.ndarray | float = 0.0, pixel_margin: float = 0.0, near: float = NEAR_PLANE, far: float = FAR_PLANE, stats: CullStats | None = None) -> np.ndarray:
+    """near/far plane과 화면 네 변으로 점을 자르고 남길 점의 bool mask shape (N,)을 반환한다.
+
+    radii는 점마다의 world 반지름(예: 3 sigma)이다. 화면 경계는 radii를 pixel로 옮긴
+    guard band만큼 넓혀, 중심은 화면 밖이지만 가장자리가 화면에 닿는 Gaussian을 남긴다.
+    pixel 반지름은 투영 Jacobian의 Frobenius norm × radii로, 실제 투영 크기보다 작지 않다.
+    image 크기를 주지 않으면 깊이로만 자른다. stats를 넘기면 이유별 수를 더해 준다.
+    """
+    # 깊이 z를 shape (N,) 배열로 꺼낸다.
+    depth = points_camera[:, 2]
+    # near plane보다 가까운 점을 표시한다.
+    too_near = depth < near
+    # far plane보다 먼 점을 표시한다.
+    too_far = depth > far
+    # 깊이 범위 안의 점이 남길 후보이다.
+    keep = ~(too_near | too_far)
+    # 화면 크기가 주어졌으면 네 변으로도 자른다.
+    if image_height is not None and image_width is not None:
+        # 후보가 아닌 점의 깊이는 near로 바꿔 0이나 음수로 나누지 않게 한다.
+        safe_depth = np.where(keep, depth, near)
+        # 정규화 좌표 x/z와 y/z를 계산한다.
+        normalized_x, normalized_y = points_camera[:, 0] / safe_depth, points_camera[:, 1] / safe_depth
+        # focal length와 principal point를 K에서 읽는다.
+        focal_x, focal_y, center_x, center_y = intrinsic_matrix[0, 0], intrinsic_matrix[1, 1], intrinsic_matrix[0, 2], intrinsic_matrix[1, 2]
+        # u = fx x/z + cx, v = fy y/z + cy로 pixel 중심을 계산한다.
+        pixel_u, pixel_v = focal_x * normalized_x + center_x, focal_y * normalized_y + center_y
+        # ‖J‖_F = sqrt(fx²(1 + (x/z)²) + fy²(1 + (y/z)²)) / z로 world 반지름을 pixel 반지름으로 바꾸고 여유를 더한다.
+        pad = np.asarray(radii) * np.sqrt(focal_x**2 * (1.0 + normalized_x**2) + focal_y**2 * (1.0 + normalized_y**2)) / safe_depth + pixel_margin
+        # guard band를 포함한 화면 안쪽에 있는 점을 표시한다. 끝 pixel까지 닿도록 양쪽에 1 pixel 여유를 둔다.
+        inside = (pixel_u + pad >= -1.0) & (pixel_u - pad <= image_width) & (pixel_v + pad >= -1.0) & (pixel_v - pad <= image_height)
+        # 깊이 후보 중 화면 밖인 점을 표시한다.
+        outside = keep & ~inside
+        # 깊이와 화면 조건을 모두 만족하는 점만 남긴다.
+        keep &= inside
+    # 화면 크기가 없으면 화면 밖으로 자른 점은 없다.
+    else:
+        # 모두 False인 mask를 만든다.
+        outside = np.zeros_like(keep)
+    # 통계를 원하면 이유별 수를 더한다.
+    if stats is not None:
+        # near plane 앞의 수를 더한다.
+        stats.near += int(too_near.sum())
+        # far plane 뒤의 수를 더한다.
+        stats.far += int(too_far.sum())
+        # 화면 밖의 수를 더한다.
+        stats.outside += int(outside.sum())
+    # 남길 점의 mask를 반환한다.
+    return keep
+
+
 # 카메라 좌표 점들을 pixel 좌표로 바꾸는 함수를 정의한다.
-def camera_to_pixel(points_camera: np.ndarray, intrinsic_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """pinhole projection을 적용하고 pixel 좌표와 유효 mask를 반환한다."""
-    # 각 점의 세 번째 좌표인 Z 깊이가 0보다 큰지 검사한다.
-    valid_mask = points_camera[:, 2] > 0.0
+def camera_to_pixel(points_camera: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int | None = None, image_width: int | None = None, stats: CullStats | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """frustum_cull로 보이는 점만 골라 pinhole projection을 적용하고 pixel 좌표와 유효 mask를 반환한다."""
+    # near/far plane과 (화면 크기가 주어지면) 화면 네 변으로 점을 자른다.
+    valid_mask = frustum_cull(points_camera, intrinsic_matrix, image_height, image_width, stats=stats)
     # 카메라 앞에 있는 점만 남긴다.
     visible_points = points_camera[valid_mask]
     # 3D 점에 K^T를 곱해 homogeneous image coordinate를 계산한다.
@@ -41,8 +120,8 @@ def camera_to_pixel(points_camera: np.ndarray, intrinsic_matrix: np.ndarray) ->
 # 카메라 투영 예제를 실행하는 main 함수를 정의한다.
 def main() -> None:
     """깊이가 서로 다른 3D 점을 투영해 시각화한다."""
-    # 점마다 x, y, z를 한 행에 저장한 shape (7, 3) 세계 좌표 배열을 만든다.
-    points_world = np.array([[-1.0, -0.5, 2.0], [0.0, -0.5, 2.0], [1.0, -0.5, 2.0], [-1.0, 0.5, 4.0], [0.0, 0.5, 4.0], [1.0, 0.5, 4.0], [0.0, 0.0, -1.0]], dtype=np.float64)
+    # 점마다 x, y, z를 한 행에 저장한 shape (8, 3) 세계 좌표 배열을 만든다. 마지막 두 점은 카메라 뒤와 화면 오른쪽 밖에 있다.
+    points_world = np.array([[-1.0, -0.5, 2.0], [0.0, -0.5, 2.0], [1.0, -0.5, 2.0], [-1.0, 0.5, 4.0], [0.0, 0.5, 4.0], [1.0, 0.5, 4.0], [0.0, 0.0, -1.0], [3.0, 0.0, 2.0]], dtype=np.float64)
     # 이 예제에서는 세계축과 카메라축이 같으므로 3×3 단위 회전행렬을 사용한다.
     rotation_cw = np.eye(3, dtype=np.float64)
     # 카메라 위치 이동이 없으므로 영벡터를 사용한다.
@@ -57,8 +136,10 @@ def main() -> None:
     intrinsic_matrix = np.array([[focal_length, 0.0, image_width / 2.0], [0.0, focal_length, image_height / 2.0], [0.0, 0.0, 1.0]], dtype=np.float64)
     # 세계 좌표 점들을 카메라 좌표로 변환한다.
     points_camera = world_to_camera(points_world, rotation_cw, translation_cw)
-    # 카메라 앞의 점을 pixel 좌표로 투영하고 유효 mask를 받는다.
-    pixels, valid_mask = camera_to_pixel(points_camera, intrinsic_matrix)
+    # 잘라낸 점의 수를 셀 통계 객체를 만든다.
+    cull_stats = CullStats()
+    # 화면에 보이는 점만 pixel 좌표로 투영하고 유효 mask를 받는다.
+    pixels, valid_mask = camera_to_pixel(points_camera, intrinsic_matrix, image_height, image_width, stats=cull_stats)
     # 카메라 앞에 있는 점들의 깊이를 색상 값으로 사용하기 위해 선택한다.
     visible_depths = points_camera[valid_mask, 2]
     # 출력 디렉터리 경로를 만든다.
@@ -93,6 +174,8 @@ def main() -> None:
     plt.close(figure)
     # 원래 점 중 카메라 앞에 있는 점의 개수를 출력한다.
     print(f"유효한 점: {int(valid_mask.sum())}/{len(points_world)}")
+    # 이유별로 잘라낸 점의 수를 출력한다.
+    print(f"culled: near={cull_stats.near}, far={cull_stats.far}, outside={cull_stats.outside}")
     # 각 유효 3D 점과 대응하는 2D pixel 좌표를 함께 반복한다.
     for point_3d, pixel_2d in zip(points_camera[valid_mask], pixels, strict=True):
         # NumPy 배열을 읽기 좋은 문자열로 바꿔 대응 관계를 출력한다.
@@ -3,6 +3,10 @@
 # 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
 from __future__ import annotations
 
+# 이름 앞에 숫자가 붙은 03 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 렌더링 통계를 필드 이름으로 묶기 위해 dataclass와 field를 가져온다.
+from dataclasses import dataclass, field
 # 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
 from pathlib import Path
 
@@ -11,6 +15,12 @@ import numpy as np
 # RGB와 alpha 결과를 PNG로 저장하기 위해 Pillow의 Image를 가져온다.
 from PIL import Image
 
+# 03 스크립트의 frustum culling을 재사용한다.
+camera = importlib.import_module("03_camera_projection")
+
+# 남은 빛이 이 값보다 작은 pixel은 뒤 Gaussian이 보이지 않으므로 계산을 멈춘다(공식 3DGS와 같은 값).
+MIN_TRANSMITTANCE = 1e-4
+
 
 # 0~1 실수 RGB 배열을 0~255 uint8 영상으로 저장하는 함수를 정의한다.
 def save_rgb_image(path: Path, image: np.ndarray) -> None:
@@ -38,69 +48,175 @@ def save_gray_image(path: Path, image: np.ndarray) -> None:
     pillow_image.save(path)
 
 
+# 렌더링 중 Gaussian-pixel 평가 수를 세는 dataclass를 정의한다.
+@dataclass
+class RenderStats:
+    """실제로 계산한 Gaussian-pixel 쌍과 포화되어 건너뛴 쌍의 수를 센다."""
+
+    # alpha를 실제로 계산한 Gaussian-pixel 쌍의 수이다.
+    evaluated: int = 0
+    # transmittance가 min_transmittance보다 작아 계산하지 않은 Gaussian-pixel 쌍의 수이다.
+    skipped: int = 0
+    # pixel 계산 전에 frustum 밖이라 잘라낸 Gaussian 수를 이유별로 센다.
+    culled: camera.CullStats = field(default_factory=camera.CullStats)
+
+
 # 작은 Gaussian 목록을 화면에 렌더링하는 교육용 함수를 정의한다.
-def render_gaussians(means_3d: np.ndarray, scales_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """등방성 scale 근사를 사용해 front-to-back으로 Gaussian을 합성한다."""
+def render_gaussians(means_3d: np.ndarray, scales_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray, min_transmittance: float = MIN_TRANSMITTANCE, stats: RenderStats | None = None, dtype: np.dtype | type = np.float64) -> tuple[np.ndarray, np.ndarray]:
+    """등방성 scale 근사를 사용해 front-to-back으로 Gaussian을 합성한다.
+
+    pixel 계산 전에 03의 frustum_cull로 near/far plane 밖과 3 sigma guard band를 포함한
+    화면 밖 Gaussian을 한 번에 잘라낸다. 남은 빛(transmittance)이 min_transmittance보다
+    작아진 pixel은 이후 Gaussian에서 계산하지 않는다. stats를 넘기면 계산한 쌍, 건너뛴 쌍,
+    잘라낸 Gaussian의 수를 더해 준다.
+    dtype=np.float32이면 모든 pixel 배열을 절반 메모리로 계산한다. 반복마다 새 배열을
+    만들지 않도록 pixel 크기 scratch buffer를 한 번 만들고 ufunc의 out=으로 재사용한다.
+    """
+    # np.indices는 shape (2, H, W)의 정수 격자를 만들고 각각 y와 x로 나눈다.
+    pixel_y, pixel_x = np.indices((image_height, image_width), dtype=dtype)
+    # 화면 전체 pixel을 길이 H×W의 1차원 좌표로 펼쳐 합성한다.
+    rgb, alpha = render_pixels(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, pixel_x.reshape(-1), pixel_y.reshape(-1), background_color, min_transmittance=min_transmittance, stats=stats, dtype=dtype)
+    # flat 결과를 (H, W, 3) RGB와 (H, W) alpha 영상 모양으로 되돌려 반환한다.
+    return rgb.reshape(image_height, image_width, 3), alpha.reshape(image_height, image_width)
+
+
+# 지정한 pixel 좌표 목록만 합성하는 함수를 정의한다.
+def render_pixels(means_3d: np.ndarray, scales_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, pixel_x: np.ndarray, pixel_y: np.ndarray, background_color: np.ndarray, min_transmittance: float = MIN_TRANSMITTANCE, stats: RenderStats | None = None, dtype: np.dtype | type = np.float64) -> tuple[np.ndarray, np.ndarray]:
+    """정수 pixel 좌표 shape (P,)의 RGB shape (P, 3)과 alpha shape (P,)를 render_gaussians와 같은 식으로 계산한다.
+
+    pixel마다 합성은 독립이므로 화면 일부만 계산해도 전체 영상의 같은 위치와 값이 같다.
+    frustum culling은 요청한 pixel을 감싸는 사각형을 화면으로 보고 수행한다.
+    """
     # 모든 Gaussian 관련 배열의 첫 축 길이가 같은지 검사한다.
     if not (len(means_3d) == len(scales_3d) == len(colors_rgb) == len(opacities)):
         # Gaussian 속성 개수가 다르면 대응 관계가 없으므로 ValueError를 발생시킨다.
         raise ValueError("모든 Gaussian 속성 배열의 첫 번째 차원 길이가 같아야 합니다.")
-    # np.indices는 shape (2, H, W)의 정수 격자를 만들고 각각 y와 x로 나눈다.
-    pixel_y, pixel_x = np.indices((image_height, image_width), dtype=np.float64)
-    # 출력 RGB를 모두 0인 shape (H, W, 3) 배열로 초기화한다.
-    accumulated_rgb = np.zeros((image_height, image_width, 3), dtype=np.float64)
+    # 문자열이나 type으로 받은 dtype을 NumPy dtype 객체로 통일한다.
+    dtype = np.dtype(dtype)
+    # 호출자가 통계를 원하지 않아도 같은 코드로 셀 수 있도록 임시 통계 객체를 만든다.
+    stats = stats if stats is not None else RenderStats()
+    # 좌표를 계산 dtype 배열로 맞춘다(이미 같은 dtype이면 복사하지 않는다).
+    pixel_x, pixel_y = np.asarray(pixel_x, dtype=dtype), np.asarray(pixel_y, dtype=dtype)
+    # 요청한 pixel 수를 저장한다.
+    pixel_count = len(pixel_x)
+    # 채널별 연산이 연속 메모리에서 일어나도록 RGB를 shape (3, H×W) 평면 배열로 0 초기화한다.
+    accumulated_rgb = np.zeros((3, pixel_count), dtype=dtype)
     # 아직 아무것도 가리지 않았으므로 transmittance를 모두 1로 초기화한다.
-    transmittance = np.ones((image_height, image_width, 1), dtype=np.float64)
-    # 카메라 깊이 z가 작은 Gaussian부터 처리할 수 있도록 index를 오름차순 정렬한다.
-    sorted_indices = np.argsort(means_3d[:, 2])
+    transmittance = np.ones(pixel_count, dtype=dtype)
+    # Gaussian마다 재사용할 pixel 크기 scratch buffer 네 개를 한 번만 만든다.
+    scratch = np.empty((4, pixel_count), dtype=dtype)
+    # 포화 검사 결과를 담을 bool scratch buffer를 한 번만 만든다.
+    saturated_buffer = np.empty(pixel_count, dtype=bool)
+    # None은 모든 pixel이 아직 계산 대상이라는 뜻이며, 이때는 index 없이 전체 배열을 쓴다.
+    active: np.ndarray | None = None
+    # 요청한 pixel을 감싸는 사각형의 왼쪽 위 좌표를 구한다. pixel이 없으면 원점으로 둔다.
+    x0, y0 = (int(pixel_x.min()), int(pixel_y.min())) if pixel_count else (0, 0)
+    # 사각형의 너비와 높이를 구한다.
+    window_width, window_height = (int(pixel_x.max()) - x0 + 1, int(pixel_y.max()) - y0 + 1) if pixel_count else (0, 0)
+    # principal point를 사각형 왼쪽 위만큼 옮기면 사각형이 곧 화면인 K가 된다.
+    window_intrinsic = intrinsic_matrix - np.array([[0.0, 0.0, x0], [0.0, 0.0, y0], [0.0, 0.0, 0.0]])
+    # 3 sigma 반지름과 최소 pixel sigma 1의 3배 여유로 사각형에 닿을 수 있는 Gaussian만 남긴다.
+    visible = np.flatnonzero(camera.frustum_cull(means_3d, window_intrinsic, window_height, window_width, radii=3.0 * scales_3d.mean(axis=1), pixel_margin=3.0, stats=stats.culled))
+    # 남은 Gaussian을 카메라 깊이 z가 작은 것부터 처리할 수 있도록 정렬한다.
+    sorted_indices = visible[np.argsort(means_3d[visible, 2], kind="stable")]
     # 정렬된 index를 하나씩 꺼내 front-to-back 합성을 수행한다.
     for gaussian_index in sorted_indices:
         # 현재 Gaussian의 3D 중심을 가져온다.
         mean_3d = means_3d[gaussian_index]
-        # 현재 Gaussian의 z 깊이를 별도 변수로 가져온다.
+        # 현재 Gaussian의 z 깊이를 별도 변수로 가져온다. culling으로 near plane 이상이 보장된다.
         depth = mean_3d[2]
-        # 카메라 뒤 또는 카메라 평면 위의 Gaussian은 투영할 수 없으므로 건너뛴다.
-        if depth <= 0.0:
-            # continue는 현재 반복을 끝내고 다음 Gaussian으로 이동한다.
+        # 모든 pixel이 포화되었으면 계산 없이 건너뛴 수만 기록한다.
+        if active is not None and len(active) == 0:
+            # 이 Gaussian이 덮었을 전체 pixel 수를 건너뛴 수에 더한다.
+            stats.skipped += pixel_count
+            # 다음 Gaussian으로 이동한다.
             continue
         # homogeneous 좌표를 만들기 위해 K와 3D 중심을 행렬-벡터 곱한다.
         homogeneous_pixel = intrinsic_matrix @ mean_3d
-        # homogeneous x를 세 번째 성분으로 나눠 실제 pixel u를 구한다.
-        pixel_u = homogeneous_pixel[0] / homogeneous_pixel[2]
+        # homogeneous x를 세 번째 성분으로 나눠 실제 pixel u를 구하고, float()로 바꿔 float32 배열 연산이 float64로 승격되지 않게 한다.
+        pixel_u = float(homogeneous_pixel[0] / homogeneous_pixel[2])
         # homogeneous y를 세 번째 성분으로 나눠 실제 pixel v를 구한다.
-        pixel_v = homogeneous_pixel[1] / homogeneous_pixel[2]
+        pixel_v = float(homogeneous_pixel[1] / homogeneous_pixel[2])
         # 세 3D scale의 평균을 교육용 등방성 world scale로 사용한다.
         world_scale = float(np.mean(scales_3d[gaussian_index]))
         # K[0,0]은 x focal length이며 perspective 관계로 world scale을 pixel scale로 바꾼다.
         screen_sigma = intrinsic_matrix[0, 0] * world_scale / depth
         # 수치적으로 너무 작은 Gaussian을 피하도록 pixel sigma의 최솟값을 1로 제한한다.
-        screen_sigma = max(screen_sigma, 1.0)
-        # 모든 pixel의 x 좌표에서 Gaussian 중심 u를 빼 가로 차이를 구한다.
-        delta_x = pixel_x - pixel_u
-        # 모든 pixel의 y 좌표에서 Gaussian 중심 v를 빼 세로 차이를 구한다.
-        delta_y = pixel_y - pixel_v
-        # 등방성 2D Gaussian의 제곱 Mahalanobis distance를 계산한다.
-        squared_distance = (delta_x**2 + delta_y**2) / (screen_sigma**2)
-        # 거리로부터 각 pixel에서의 Gaussian weight를 계산한다.
-        gaussian_weight = np.exp(-0.5 * squared_distance)
-        # Gaussian 자체 opacity와 화면 weight를 곱해 pixel별 alpha를 만든다.
-        alpha = opacities[gaussian_index] * gaussian_weight
+        screen_sigma = max(float(screen_sigma), 1.0)
+        # 이번 Gaussian이 계산할 pixel 수를 정한다.
+        count = pixel_count if active is None else len(active)
+        # 계산한 pixel 수를 기록한다.
+        stats.evaluated += count
+        # 포화된 pixel 수만큼 건너뛴 수를 더한다.
+        stats.skipped += pixel_count - count
+        # scratch buffer 앞쪽 count개를 x 차이, y 차이, alpha, 임시값 view로 나눈다(복사 없음).
+        delta_x, delta_y, alpha, temporary = scratch[:, :count]
+        # 모든 pixel이 계산 대상이면 좌표 배열에서 바로 중심을 빼 결과를 buffer에 쓴다.
+        if active is None:
+            # out=delta_x는 새 배열을 만들지 않고 결과를 buffer에 쓴다.
+            np.subtract(pixel_x, pixel_u, out=delta_x)
+            # y 차이도 같은 방식으로 buffer에 쓴다.
+            np.subtract(pixel_y, pixel_v, out=delta_y)
+        # 일부 pixel만 남았으면 그 좌표만 buffer로 모은 뒤 중심을 뺀다.
+        else:
+            # np.take(..., out=)은 고른 원소를 새 배열 없이 buffer에 복사한다.
+            np.take(pixel_x, active, out=delta_x)
+            # 가로 차이를 제자리에서 계산한다.
+            delta_x -= pixel_u
+            # y 좌표도 같은 방식으로 모은다.
+            np.take(pixel_y, active, out=delta_y)
+            # 세로 차이를 제자리에서 계산한다.
+            delta_y -= pixel_v
+        # 가로 차이를 제자리에서 제곱한다.
+        np.multiply(delta_x, delta_x, out=delta_x)
+        # 세로 차이를 제자리에서 제곱한다.
+        np.multiply(delta_y, delta_y, out=delta_y)
+        # 두 제곱을 더해 중심까지의 제곱 거리를 alpha buffer에 쓴다.
+        np.add(delta_x, delta_y, out=alpha)
+        # -0.5 / sigma²를 곱해 Gaussian 지수를 만든다.
+        alpha *= -0.5 / screen_sigma**2
+        # 지수함수를 제자리에서 적용해 Gaussian weight를 만든다.
+        np.exp(alpha, out=alpha)
+        # Gaussian 자체 opacity를 곱해 pixel별 alpha를 만든다.
+        alpha *= float(opacities[gaussian_index])
         # 한 Gaussian이 pixel을 완전히 막아 gradient나 곱셈이 불안정해지지 않도록 0.99로 제한한다.
-        alpha = np.clip(alpha, 0.0, 0.99)
-        # [:, :, None]은 shape (H,W)에 색 채널용 길이 1 축을 추가한다.
-        alpha_with_channel = alpha[:, :, None]
-        # [None, None, :]은 shape (3,)인 색을 모든 H×W pixel에 broadcasting할 준비를 한다.
-        color_with_image_axes = colors_rgb[gaussian_index][None, None, :]
-        # 앞을 통과한 빛 × 현재 alpha × 현재 색을 출력 RGB에 더한다.
-        accumulated_rgb += transmittance * alpha_with_channel * color_with_image_axes
+        np.minimum(alpha, 0.99, out=alpha)
+        # 계산 대상 pixel에 닿은 빛(transmittance)을 delta_y buffer로 모은다.
+        pixel_transmittance = transmittance if active is None else np.take(transmittance, active, out=delta_y)
+        # 앞을 통과한 빛 × 현재 alpha를 delta_x buffer에 계산한다.
+        np.multiply(pixel_transmittance, alpha, out=delta_x)
+        # 세 색 채널마다 가중치 × 색을 더한다.
+        for channel in range(3):
+            # 가중치에 현재 채널 색을 곱한 값을 temporary buffer에 쓴다.
+            np.multiply(delta_x, float(colors_rgb[gaussian_index, channel]), out=temporary)
+            # 모든 pixel이 대상이면 채널 평면 전체에 제자리로 더한다.
+            if active is None:
+                # 채널 평면에 기여를 더한다.
+                accumulated_rgb[channel] += temporary
+            # 일부 pixel만 대상이면 그 위치에만 더한다.
+            else:
+                # fancy index 위치에 기여를 더한다.
+                accumulated_rgb[channel, active] += temporary
+        # 1 - alpha를 alpha buffer에 제자리로 계산한다.
+        np.subtract(1.0, alpha, out=alpha)
         # 현재 Gaussian에 막히지 않고 뒤로 진행하는 빛의 비율을 갱신한다.
-        transmittance *= 1.0 - alpha_with_channel
+        np.multiply(pixel_transmittance, alpha, out=pixel_transmittance)
+        # 일부 pixel만 대상이었다면 갱신한 값을 원래 위치에 다시 쓴다.
+        if active is not None:
+            # 모아 둔 transmittance를 원래 pixel 위치에 저장한다.
+            transmittance[active] = pixel_transmittance
+        # 이번 Gaussian으로 새로 포화된 pixel을 bool buffer에 표시한다.
+        saturated = np.less(pixel_transmittance, min_transmittance, out=saturated_buffer[:count])
+        # 새로 포화된 pixel이 있을 때만 계산 대상 index를 줄인다.
+        if saturated.any():
+            # 남은 pixel의 flat index만 남겨 다음 Gaussian부터 계산하지 않게 한다.
+            active = np.flatnonzero(~saturated) if active is None else active[~saturated]
     # 모든 Gaussian 뒤에 남은 빛에 배경색을 곱해 최종 RGB를 완성한다.
-    accumulated_rgb += transmittance * background_color[None, None, :]
+    accumulated_rgb += transmittance[None, :] * np.asarray(background_color, dtype=dtype)[:, None]
     # 최종 누적 alpha는 1에서 남은 transmittance를 뺀 값이다.
-    accumulated_alpha = 1.0 - transmittance[:, :, 0]
-    # 완성한 RGB 배열과 alpha 배열을 함께 반환한다.
-    return accumulated_rgb, accumulated_alpha
+    accumulated_alpha = 1.0 - transmittance
+    # 평면 배열을 (P, 3) view로 바꿔 alpha와 함께 반환한다.
+    return accumulated_rgb.T, accumulated_alpha
 
 
 # 예제 장면 생성과 렌더링을 담당하는 main 함수를 정의한다.
@@ -124,8 +240,10 @@ def main() -> None:
     opacities = np.array([0.82, 0.88, 0.84, 0.72, 0.76], dtype=np.float64)
     # 배경색을 아주 어두운 청회색 RGB로 설정한다.
     background_color = np.array([0.025, 0.035, 0.055], dtype=np.float64)
+    # 계산한 Gaussian-pixel 쌍과 건너뛴 쌍을 셀 통계 객체를 만든다.
+    stats = RenderStats()
     # 교육용 renderer를 호출해 RGB와 alpha 영상을 계산한다.
-    rendered_rgb, rendered_alpha = render_gaussians(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, image_height, image_width, background_color)
+    rendered_rgb, rendered_alpha = render_gaussians(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, image_height, image_width, background_color, stats=stats)
     # 출력 디렉터리 경로 객체를 만든다.
     output_dir = Path("outputs")
     # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
@@ -142,6 +260,8 @@ def main() -> None:
     print(f"RGB shape: {rendered_rgb.shape}")
     # 결과 alpha 배열의 최솟값과 최댓값을 소수 넷째 자리까지 출력한다.
     print(f"alpha range: {rendered_alpha.min():.4f} ~ {rendered_alpha.max():.4f}")
+    # early termination으로 건너뛴 Gaussian-pixel 평가 수와 frustum 밖이라 잘라낸 Gaussian 수를 출력한다.
+    print(f"evaluated: {stats.evaluated}, skipped: {stats.skipped}, culled: {stats.culled.total}")
     # RGB 결과 파일의 절대 경로를 출력한다.
     print(f"RGB 저장 완료: {rgb_path.resolve()}")
     # alpha 결과 파일의 절대 경로를 출력한다.
@@ -0,0 +1,362 @@
+"""3D covariance를 Jacobian으로 2D conic에 투영하고 bounding box 안에서만 일괄 합성한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 03, 04 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 여러 투영 결과 배열을 한 객체로 묶기 위해 dataclass를 가져온다.
+from dataclasses import dataclass
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 렌더링 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+
+# 배열, 행렬, 지수함수 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 같은 scripts 폴더의 03 스크립트에서 frustum culling을 재사용한다.
+camera = importlib.import_module("03_camera_projection")
+# 같은 scripts 폴더의 04 스크립트에서 PNG 저장 함수를 재사용한다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+
+# 공식 3DGS처럼 1/255보다 작은 alpha는 눈에 보이지 않으므로 합성하지 않는다.
+ALPHA_MIN = 1.0 / 255.0
+# 한 Gaussian이 pixel을 완전히 막지 않도록 04와 같은 alpha 상한을 사용한다.
+ALPHA_MAX = 0.99
+# 투영된 2D covariance가 1 pixel보다 얇아지지 않도록 더하는 low-pass filter 분산이다.
+LOW_PASS_VARIANCE = 0.3
+# 화면 footprint는 중심에서 3 sigma까지만 평가한다.
+SIGMA_EXTENT = 3.0
+
+
+# 투영 결과를 필드 이름으로 읽을 수 있도록 불변 dataclass를 정의한다.
+@dataclass(frozen=True)
+class ProjectedGaussians:
+    """화면에 보이는 Gaussian의 2D 중심·conic·깊이·bounding box를 깊이 순서로 담는다."""
+
+    # 원래 입력 배열에서의 Gaussian 번호를 shape (M,)으로 저장한다.
+    indices: np.ndarray
+    # pixel 좌표 (u, v) 중심을 shape (M, 2)로 저장한다.
+    means_2d: np.ndarray
+    # 2D covariance 역행렬의 (a, b, c) 성분을 shape (M, 3)으로 저장한다.
+    conics: np.ndarray
+    # 카메라 깊이 z를 shape (M,)으로 저장한다.
+    depths: np.ndarray
+    # 화면 안으로 자른 bounding box (x0, y0, x1, y1)을 양 끝 포함 정수로 저장한다.
+    boxes: np.ndarray
+    # 각 Gaussian의 RGB 색을 shape (M, 3)으로 저장한다.
+    colors: np.ndarray
+    # 각 Gaussian의 opacity를 shape (M,)으로 저장한다.
+    opacities: np.ndarray
+
+    # 각 bounding box가 덮는 pixel 수를 계산하는 property를 정의한다.
+    @property
+    def areas(self) -> np.ndarray:
+        """Gaussian별 bounding box pixel 수를 반환한다."""
+        # 양 끝을 포함하므로 너비와 높이에 각각 1을 더해 곱한다.
+        return (self.boxes[:, 2] - self.boxes[:, 0] + 1) * (self.boxes[:, 3] - self.boxes[:, 1] + 1)
+
+
+# 단위 quaternion 배열을 회전행렬 배열로 바꾸는 함수를 정의한다.
+def quaternion_to_rotation(quaternions: np.ndarray) -> np.ndarray:
+    """(w, x, y, z) 순서 quaternion shape (N, 4)를 회전행렬 shape (N, 3, 3)으로 바꾼다."""
+    # 학습 중 길이가 1에서 벗어난 quaternion도 회전이 되도록 먼저 정규화한다.
+    unit = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+    # 네 성분을 각각 shape (N,) 배열로 나눈다.
+    w, x, y, z = unit.T
+    # 표준 quaternion 회전 공식의 9개 원소를 (N, 3, 3)으로 쌓는다.
+    rotation = np.stack([
+        # 첫 번째 행을 계산한다.
+        1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y),
+        # 두 번째 행을 계산한다.
+        2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x),
+        # 세 번째 행을 계산한다.
+        2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y),
+    ], axis=-1).reshape(-1, 3, 3)
+    # 완성한 회전행렬 배열을 반환한다.
+    return rotation
+
+
+# 세 축 scale과 회전으로 3D covariance를 한 번에 만드는 함수를 정의한다.
+def covariance_3d(scales_3d: np.ndarray, quaternions: np.ndarray) -> np.ndarray:
+    """Σ = R S Sᵀ Rᵀ를 모든 Gaussian에 대해 shape (N, 3, 3)으로 계산한다."""
+    # 각 Gaussian의 회전행렬을 계산한다.
+    rotation = quaternion_to_rotation(quaternions)
+    # R S는 R의 각 열에 대응하는 축 scale을 곱한 것과 같다.
+    rotation_scale = rotation * scales_3d[:, None, :]
+    # einsum으로 (R S)(R S)ᵀ를 Gaussian마다 계산한다.
+    return np.einsum("nij,nkj->nik", rotation_scale, rotation_scale)
+
+
+# 3D covariance를 perspective Jacobian으로 2D covariance에 투영하는 함수를 정의한다.
+def project_covariance(means_3d: np.ndarray, covariances_3d: np.ndarray, intrinsic_matrix: np.ndarray) -> np.ndarray:
+    """EWA splatting의 Σ₂D = J Σ₃D Jᵀ + low-pass를 shape (N, 2, 2)로 계산한다."""
+    # 카메라 좌표 x, y, z를 각각 shape (N,) 배열로 나눈다.
+    x, y, z = means_3d.T
+    # x와 y focal length를 K에서 읽는다.
+    focal_x, focal_y = intrinsic_matrix[0, 0], intrinsic_matrix[1, 1]
+    # u = fx x / z + cx를 (x, y, z)로 미분한 Jacobian 2×3 행렬을 담을 배열을 만든다.
+    jacobian = np.zeros((len(means_3d), 2, 3), dtype=means_3d.dtype)
+    # ∂u/∂x = fx / z이다.
+    jacobian[:, 0, 0] = focal_x / z
+    # ∂u/∂z = -fx x / z²이다.
+    jacobian[:, 0, 2] = -focal_x * x / (z * z)
+    # ∂v/∂y = fy / z이다.
+    jacobian[:, 1, 1] = focal_y / z
+    # ∂v/∂z = -fy y / z²이다.
+    jacobian[:, 1, 2] = -focal_y * y / (z * z)
+    # einsum으로 J Σ Jᵀ를 모든 Gaussian에 대해 한 번에 계산한다.
+    covariance = np.einsum("nij,njk,nlk->nil", jacobian, covariances_3d, jacobian)
+    # 대각 성분에 low-pass 분산을 더해 pixel보다 얇은 Gaussian의 aliasing을 줄인다.
+    covariance[:, 0, 0] += LOW_PASS_VARIANCE
+    # y 방향 대각 성분에도 같은 분산을 더한다.
+    covariance[:, 1, 1] += LOW_PASS_VARIANCE
+    # 투영된 2D covariance 배열을 반환한다.
+    return covariance
+
+
+# Gaussian 전체를 투영하고 화면에 닿는 것만 깊이 순서로 남기는 함수를 정의한다.
+def project_gaussians(means_3d: np.ndarray, scales_3d: np.ndarray, quaternions: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, cull_stats: camera.CullStats | None = None) -> ProjectedGaussians:
+    """투영·conic·3-sigma bounding box를 배열 연산으로 계산하고 depth로 정렬한다."""
+    # 모든 Gaussian 속성 배열의 첫 축 길이가 같은지 검사한다.
+    if not (len(means_3d) == len(scales_3d) == len(quaternions) == len(colors_rgb) == len(opacities)):
+        # 대응 관계가 깨진 입력은 ValueError로 거부한다.
+        raise ValueError("모든 Gaussian 속성 배열의 첫 번째 차원 길이가 같아야 합니다.")
+    # 3D covariance를 만든 뒤 카메라 좌표 투영 단계로 넘긴다.
+    return project_camera_gaussians(means_3d, covariance_3d(scales_3d, quaternions), colors_rgb, opacities, intrinsic_matrix, image_height, image_width, cull_stats=cull_stats)
+
+
+# 카메라 좌표의 중심과 3D covariance를 화면에 투영하는 함수를 정의한다.
+def project_camera_gaussians(means_3d: np.ndarray, covariances_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, cull_stats: camera.CullStats | None = None) -> ProjectedGaussians:
+    """이미 계산한 카메라 좌표 covariance shape (N, 3, 3)으로 project_gaussians와 같은 결과를 만든다.
+
+    2D 투영 전에 03의 frustum_cull로 near/far plane 밖과 화면 밖 Gaussian을 잘라낸다.
+    guard band는 3 sigma를 trace(Σ)로 보수적으로 잡고 low-pass와 올림만큼 넓히므로,
+    잘라낸 Gaussian은 자르지 않았어도 화면과 겹치는 box가 없다.
+    """
+    # λmax(Σ) ≤ trace(Σ)이므로 3 sqrt(trace)는 가장 긴 축의 3 sigma보다 작지 않다.
+    radii = SIGMA_EXTENT * np.sqrt(np.trace(covariances_3d, axis1=1, axis2=2))
+    # low-pass 분산이 늘리는 반지름과 올림 1 pixel을 여유로 더해 화면에 닿을 수 있는 Gaussian만 남긴다.
+    indices = np.flatnonzero(camera.frustum_cull(means_3d, intrinsic_matrix, image_height, image_width, radii=radii, pixel_margin=SIGMA_EXTENT * np.sqrt(LOW_PASS_VARIANCE) + 1.0, stats=cull_stats))
+    # 남은 Gaussian의 중심만 선택한다.
+    means = means_3d[indices]
+    # 남은 Gaussian의 3D covariance를 2D로 투영한다.
+    covariance = project_covariance(means, covariances_3d[indices], intrinsic_matrix)
+    # 2×2 행렬 [[a', b'], [b', c']]의 세 성분을 꺼낸다.
+    cov_a, cov_b, cov_c = covariance[:, 0, 0], covariance[:, 0, 1], covariance[:, 1, 1]
+    # 2×2 행렬식은 a'c' - b'²이다.
+    determinant = cov_a * cov_c - cov_b * cov_b
+    # 역행렬 [[c', -b'], [-b', a']] / det의 세 성분을 conic으로 저장한다.
+    conics = np.stack([cov_c, -cov_b, cov_a], axis=1) / determinant[:, None]
+    # 대칭 행렬의 큰 고유값은 평균 + sqrt(평균² - 행렬식)이다.
+    middle = 0.5 * (cov_a + cov_c)
+    # 수치 오차로 음수가 되지 않도록 0 이상으로 제한한 뒤 제곱근을 구한다.
+    largest = middle + np.sqrt(np.maximum(middle * middle - determinant, 0.0))
+    # 큰 축 방향 3 sigma를 pixel 반지름으로 올림한다.
+    radii = np.ceil(SIGMA_EXTENT * np.sqrt(largest))
+    # 중심에 K를 곱해 homogeneous pixel 좌표를 계산한다.
+    homogeneous = means @ intrinsic_matrix.T
+    # 세 번째 성분으로 나눠 (u, v) pixel 좌표를 얻는다.
+    means_2d = homogeneous[:, :2] / homogeneous[:, 2:3]
+    # 반지름만큼 넓힌 box를 화면 범위로 잘라 x0, y0을 계산한다.
+    lower = np.maximum(np.floor(means_2d - radii[:, None]), 0.0)
+    # 같은 방식으로 x1, y1을 계산한다.
+    upper = np.minimum(np.ceil(means_2d + radii[:, None]), [image_width - 1, image_height - 1])
+    # box가 화면과 겹치고 행렬식이 양수인 Gaussian만 남긴다.
+    visible = (lower[:, 0] <= upper[:, 0]) & (lower[:, 1] <= upper[:, 1]) & (determinant > 0.0)
+    # 남은 Gaussian을 카메라에 가까운 순서로 정렬하는 index를 만든다.
+    order = np.flatnonzero(visible)[np.argsort(means[visible, 2], kind="stable")]
+    # 정렬된 box를 (x0, y0, x1, y1) 정수 배열로 만든다.
+    boxes = np.concatenate([lower[order], upper[order]], axis=1).astype(np.int64)
+    # 필요한 결과를 깊이 순서로 묶어 반환한다.
+    return ProjectedGaussians(indices=indices[order], means_2d=means_2d[order], conics=conics[order], depths=means[order, 2], boxes=boxes, colors=colors_rgb[indices[order]], opacities=opacities[indices[order]])
+
+
+# 연속된 Gaussian 구간의 bounding box pixel과 alpha를 한 번에 만드는 함수를 정의한다.
+def footprint_samples(projected: ProjectedGaussians, start: int, stop: int, image_width: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """[start, stop) Gaussian의 (flat pixel 번호, Gaussian 번호, alpha)를 반환한다."""
+    # 구간의 box를 꺼낸다.
+    boxes = projected.boxes[start:stop]
+    # box 너비를 계산한다.
+    widths = boxes[:, 2] - boxes[:, 0] + 1
+    # 각 box pixel 수를 계산한다.
+    areas = projected.areas[start:stop]
+    # sample마다 어느 Gaussian의 것인지 np.repeat로 표시한다.
+    local_gaussian = np.repeat(np.arange(stop - start), areas)
+    # 각 box의 첫 sample 위치를 누적합으로 구한다.
+    offsets = np.cumsum(areas) - areas
+    # sample의 box 내부 순번을 계산한다.
+    local_index = np.arange(int(areas.sum())) - offsets[local_gaussian]
+    # 순번을 box 너비로 나눈 몫과 나머지가 box 안의 (dy, dx)이다.
+    row, column = np.divmod(local_index, widths[local_gaussian])
+    # box 왼쪽 위 모서리를 더해 화면 pixel x를 구한다.
+    pixel_x = boxes[local_gaussian, 0] + column
+    # 같은 방식으로 화면 pixel y를 구한다.
+    pixel_y = boxes[local_gaussian, 1] + row
+    # sample의 Gaussian 번호를 전체 투영 배열 기준으로 바꾼다.
+    gaussian = local_gaussian + start
+    # pixel 중심에서 Gaussian 중심까지의 x 차이를 계산한다.
+    delta_x = pixel_x - projected.means_2d[gaussian, 0]
+    # pixel 중심에서 Gaussian 중심까지의 y 차이를 계산한다.
+    delta_y = pixel_y - projected.means_2d[gaussian, 1]
+    # conic 세 성분을 sample별로 꺼낸다.
+    conic = projected.conics[gaussian]
+    # Mahalanobis 거리 dᵀ Σ⁻¹ d = a dx² + 2 b dx dy + c dy²를 계산한다.
+    squared_distance = conic[:, 0] * delta_x * delta_x + 2.0 * conic[:, 1] * delta_x * delta_y + conic[:, 2] * delta_y * delta_y
+    # opacity × Gaussian weight를 상한 0.99로 제한해 alpha를 만든다.
+    alpha = np.minimum(projected.opacities[gaussian] * np.exp(-0.5 * squared_distance), ALPHA_MAX)
+    # 보이지 않을 만큼 작은 alpha sample을 버린다.
+    keep = alpha >= ALPHA_MIN
+    # 남은 sample의 flat pixel 번호, Gaussian 번호, alpha를 반환한다.
+    return (pixel_y * image_width + pixel_x)[keep], gaussian[keep], alpha[keep]
+
+
+# sample 수 예산에 맞게 Gaussian 구간을 나누는 함수를 정의한다.
+def batch_ranges(areas: np.ndarray, max_samples: int) -> list[tuple[int, int]]:
+    """누적 footprint가 max_samples를 넘지 않는 [start, stop) 구간 목록을 반환한다."""
+    # 구간 목록을 저장할 빈 list를 만든다.
+    ranges: list[tuple[int, int]] = []
+    # 첫 구간은 0번 Gaussian에서 시작한다.
+    start = 0
+    # 모든 Gaussian을 구간에 넣을 때까지 반복한다.
+    while start < len(areas):
+        # 현재 위치부터의 누적 footprint를 계산한다.
+        cumulative = np.cumsum(areas[start:])
+        # 예산 안에 들어가는 Gaussian 수를 이진 탐색으로 찾고 최소 1개는 포함한다.
+        stop = start + max(1, int(np.searchsorted(cumulative, max_samples, side="right")))
+        # 찾은 구간을 목록에 추가한다.
+        ranges.append((start, stop))
+        # 다음 구간의 시작 위치로 이동한다.
+        start = stop
+    # 구간 목록을 반환한다.
+    return ranges
+
+
+# 깊이 순서 sample을 pixel별로 front-to-back 합성하는 함수를 정의한다.
+def composite_samples(pixels: np.ndarray, gaussians: np.ndarray, alpha: np.ndarray, colors: np.ndarray, accumulated_rgb: np.ndarray, transmittance: np.ndarray) -> None:
+    """한 batch의 sample을 pixel별 누적곱으로 합성해 rgb와 transmittance를 제자리에서 갱신한다."""
+    # sample이 없으면 바꿀 것이 없으므로 바로 끝낸다.
+    if len(pixels) == 0:
+        # 반환값 없이 함수를 끝낸다.
+        return
+    # stable 정렬은 같은 pixel 안에서 깊이 순서(생성 순서)를 유지한다.
+    order = np.argsort(pixels, kind="stable")
+    # 정렬된 pixel 번호를 만든다.
+    pixels = pixels[order]
+    # log(1 - alpha)를 쓰면 transmittance 곱을 누적합으로 계산할 수 있다.
+    log_pass = np.log1p(-alpha[order])
+    # pixel 번호가 바뀌는 위치가 각 pixel 구간의 시작이다.
+    starts = np.flatnonzero(np.r_[True, pixels[1:] != pixels[:-1]])
+    # 구간마다 첫 sample 위치를 모든 sample에 퍼뜨린다.
+    segment = np.repeat(starts, np.diff(np.r_[starts, len(pixels)]))
+    # 전체 누적합을 계산한다.
+    cumulative = np.cumsum(log_pass)
+    # 같은 pixel 앞쪽 Gaussian만의 누적합(자기 자신 제외)을 구한다.
+    before = cumulative - log_pass - (cumulative[segment] - log_pass[segment])
+    # batch 이전 transmittance × batch 안 앞쪽 Gaussian 통과율이 현재 sample에 닿는 빛이다.
+    weight = transmittance[pixels] * np.exp(before) * alpha[order]
+    # 세 색 채널마다 pixel별 기여를 bincount로 더한다.
+    for channel in range(3):
+        # 가중치 × 색을 pixel 번호별로 합산해 누적 RGB에 더한다.
+        accumulated_rgb[:, channel] += np.bincount(pixels, weight * colors[gaussians[order], channel], minlength=len(transmittance))
+    # pixel마다 batch 전체의 통과율을 곱해 transmittance를 갱신한다.
+    transmittance[pixels[starts]] *= np.exp(np.add.reduceat(log_pass, starts))
+
+
+# 투영된 Gaussian을 bounding box 안에서만 일괄 합성하는 렌더러를 정의한다.
+def render_projected(projected: ProjectedGaussians, image_height: int, image_width: int, background_color: np.ndarray, max_samples: int = 1 << 22) -> tuple[np.ndarray, np.ndarray]:
+    """깊이 순서 Gaussian을 sample 예산 단위 batch로 합성한다."""
+    # flat pixel 기준 RGB 누적 배열을 만든다.
+    accumulated_rgb = np.zeros((image_height * image_width, 3), dtype=np.float64)
+    # flat pixel 기준 transmittance를 1로 초기화한다.
+    transmittance = np.ones(image_height * image_width, dtype=np.float64)
+    # sample 예산에 맞춘 Gaussian 구간을 차례로 처리한다.
+    for start, stop in batch_ranges(projected.areas, max_samples):
+        # 구간의 bounding box sample과 alpha를 만든다.
+        pixels, gaussians, alpha = footprint_samples(projected, start, stop, image_width)
+        # 구간 sample을 front-to-back으로 합성한다.
+        composite_samples(pixels, gaussians, alpha, projected.colors, accumulated_rgb, transmittance)
+    # 남은 빛에 배경색을 곱해 더한다.
+    accumulated_rgb += transmittance[:, None] * background_color[None, :]
+    # flat 배열을 (H, W, 3) 영상과 (H, W) alpha로 바꿔 반환한다.
+    return accumulated_rgb.reshape(image_height, image_width, 3), (1.0 - transmittance).reshape(image_height, image_width)
+
+
+# 입력 Gaussian을 투영하고 렌더링까지 한 번에 수행하는 함수를 정의한다.
+def render_gaussians_ewa(means_3d: np.ndarray, scales_3d: np.ndarray, quaternions: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray, max_samples: int = 1 << 22) -> tuple[np.ndarray, np.ndarray]:
+    """04의 render_gaussians와 같은 입력에 회전을 더해 이방성 EWA splatting으로 렌더링한다."""
+    # 모든 Gaussian을 한 번에 2D로 투영한다.
+    projected = project_gaussians(means_3d, scales_3d, quaternions, colors_rgb, opacities, intrinsic_matrix, image_height, image_width)
+    # 투영 결과를 bounding box 단위로 합성한다.
+    return render_projected(projected, image_height, image_width, background_color, max_samples=max_samples)
+
+
+# 재현 가능한 무작위 Gaussian 장면을 만드는 함수를 정의한다.
+def random_scene(count: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """카메라 앞 상자 안에 count개의 작은 이방성 Gaussian을 배치한다."""
+    # seed를 고정한 난수 생성기를 만든다.
+    rng = np.random.default_rng(seed)
+    # x, y는 -1.5~1.5, z는 2~6 범위에 중심을 고르게 배치한다.
+    means_3d = rng.uniform([-1.5, -1.1, 2.0], [1.5, 1.1, 6.0], size=(count, 3))
+    # Gaussian 수가 많을수록 작아지도록 세 축 scale을 log-uniform으로 뽑는다.
+    scales_3d = np.exp(rng.uniform(-1.0, 0.5, size=(count, 3))) * (1.2 / np.sqrt(count))
+    # 정규분포 4차원 벡터를 정규화하면 균일한 무작위 회전 quaternion이 된다.
+    quaternions = rng.normal(size=(count, 4))
+    # 0.1~1.0 범위의 RGB 색을 뽑는다.
+    colors_rgb = rng.uniform(0.1, 1.0, size=(count, 3))
+    # 0.3~0.95 범위의 opacity를 뽑는다.
+    opacities = rng.uniform(0.3, 0.95, size=count)
+    # 장면 배열 다섯 개를 반환한다.
+    return means_3d, scales_3d, quaternions, colors_rgb, opacities
+
+
+# EWA 렌더러 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """2만 개의 무작위 이방성 Gaussian을 640×480으로 렌더링한다."""
+    # 출력 영상 높이를 480 pixel로 설정한다.
+    image_height = 480
+    # 출력 영상 너비를 640 pixel로 설정한다.
+    image_width = 640
+    # 04와 같은 focal length와 principal point로 intrinsic matrix K를 만든다.
+    intrinsic_matrix = np.array([[520.0, 0.0, image_width / 2.0], [0.0, 520.0, image_height / 2.0], [0.0, 0.0, 1.0]], dtype=np.float64)
+    # 2만 개의 무작위 Gaussian 장면을 만든다.
+    means_3d, scales_3d, quaternions, colors_rgb, opacities = random_scene(20_000)
+    # 04와 같은 어두운 배경색을 설정한다.
+    background_color = np.array([0.025, 0.035, 0.055], dtype=np.float64)
+    # frustum culling으로 잘라낸 수를 셀 통계 객체를 만든다.
+    cull_stats = camera.CullStats()
+    # 렌더링 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # 투영을 따로 수행해 화면에 남은 Gaussian 수와 footprint를 출력할 수 있게 한다.
+    projected = project_gaussians(means_3d, scales_3d, quaternions, colors_rgb, opacities, intrinsic_matrix, image_height, image_width, cull_stats=cull_stats)
+    # bounding box 단위 batch 합성으로 RGB와 alpha를 계산한다.
+    rendered_rgb, rendered_alpha = render_projected(projected, image_height, image_width, background_color)
+    # 걸린 시간을 초 단위로 계산한다.
+    elapsed_s = perf_counter() - started_at
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # RGB 결과 파일 경로를 만든다.
+    rgb_path = output_dir / "05_ewa_splat_rgb.png"
+    # 04의 저장 함수로 RGB 결과를 8-bit PNG로 저장한다.
+    mini_splat.save_rgb_image(rgb_path, rendered_rgb)
+    # alpha 결과를 grayscale PNG로 저장한다.
+    mini_splat.save_gray_image(output_dir / "05_ewa_splat_alpha.png", rendered_alpha)
+    # 화면에 남은 Gaussian 수와 전체 수를 출력한다.
+    print(f"visible Gaussians: {len(projected.indices)}/{len(means_3d)}")
+    # 2D 투영 전에 잘라낸 Gaussian 수를 이유별로 출력한다.
+    print(f"culled before projection: near={cull_stats.near}, far={cull_stats.far}, outside={cull_stats.outside}")
+    # 평가한 bounding box pixel 총합과 전체 화면 대비 비율을 출력한다.
+    print(f"footprint pixels: {int(projected.areas.sum())} ({projected.areas.sum() / (image_height * image_width * len(means_3d)):.4%} of dense)")
+    # 렌더링 시간을 출력한다.
+    print(f"render time: {elapsed_s:.2f} s")
+    # RGB 결과 파일의 절대 경로를 출력한다.
+    print(f"RGB 저장 완료: {rgb_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # EWA splat renderer 예제를 시작한다.
+    main()
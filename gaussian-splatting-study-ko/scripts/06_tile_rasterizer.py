@@ -0,0 +1,282 @@
+"""16×16 tile binning, key 정렬, tile별 front-to-back 합성과 process pool 분산을 구현한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 05 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# tile 묶음을 여러 process에 나눠 보내기 위해 ProcessPoolExecutor를 가져온다.
+from concurrent.futures import ProcessPoolExecutor
+# 렌더링 통계를 필드 이름으로 묶기 위해 dataclass를 가져온다.
+from dataclasses import dataclass
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 렌더링 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+
+# 배열, 정렬, 행렬곱 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 05 스크립트의 투영 함수와 alpha 상수를 재사용한다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+
+# 공식 3DGS CUDA rasterizer와 같은 16×16 pixel tile을 사용한다.
+TILE_SIZE = 16
+# 한 번에 (Gaussian 수 × tile pixel 수) 행렬로 평가할 Gaussian 수이다.
+CHUNK_SIZE = 32
+# transmittance가 이 값보다 작아진 pixel은 더 이상 합성하지 않는다.
+MIN_TRANSMITTANCE = 1e-4
+# key의 하위 32 bit에는 깊이 순서 번호를, 상위 bit에는 tile 번호를 넣는다.
+DEPTH_BITS = 32
+
+# worker process가 tile마다 다시 받지 않도록 투영 결과를 process 전역에 보관한다.
+_WORKER_STATE: dict[str, object] = {}
+
+
+# 렌더링 중 센 값을 담는 dataclass를 정의한다.
+@dataclass
+class TileStats:
+    """binning 크기와 Gaussian-pixel 평가 수, early termination으로 건너뛴 수를 센다."""
+
+    # 화면의 전체 tile 수이다.
+    tiles: int = 0
+    # Gaussian footprint가 겹친 (tile, Gaussian) 쌍의 수이다.
+    pairs: int = 0
+    # 실제로 alpha를 계산한 Gaussian-pixel 쌍의 수이다.
+    evaluated: int = 0
+    # 포화된 pixel이나 tile이라서 계산하지 않은 Gaussian-pixel 쌍의 수이다.
+    skipped: int = 0
+
+    # 다른 통계를 현재 통계에 더하는 method를 정의한다.
+    def add(self, other: TileStats) -> None:
+        """worker가 돌려준 부분 통계를 합친다."""
+        # 평가 수를 더한다.
+        self.evaluated += other.evaluated
+        # 건너뛴 수를 더한다.
+        self.skipped += other.skipped
+
+
+# Gaussian footprint를 tile별 (tile, depth) key로 바꾸고 정렬하는 함수를 정의한다.
+def bin_gaussians(boxes: np.ndarray, image_height: int, image_width: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """정렬된 Gaussian 번호와 tile별 [start, stop) 범위를 반환한다."""
+    # 가로 tile 수를 올림 나눗셈으로 계산한다.
+    tiles_x = -(-image_width // TILE_SIZE)
+    # 세로 tile 수를 올림 나눗셈으로 계산한다.
+    tiles_y = -(-image_height // TILE_SIZE)
+    # box 양 끝 pixel을 tile 좌표로 바꾼다.
+    tile_boxes = boxes // TILE_SIZE
+    # 각 Gaussian이 덮는 tile 열 수를 계산한다.
+    columns = tile_boxes[:, 2] - tile_boxes[:, 0] + 1
+    # 각 Gaussian이 덮는 tile 수를 계산한다.
+    counts = columns * (tile_boxes[:, 3] - tile_boxes[:, 1] + 1)
+    # key마다 어느 Gaussian의 것인지 np.repeat로 표시한다.
+    gaussian = np.repeat(np.arange(len(boxes)), counts)
+    # 각 Gaussian의 첫 key 위치를 누적합으로 구한다.
+    offsets = np.cumsum(counts) - counts
+    # key의 Gaussian 내부 순번을 tile 행·열로 나눈다.
+    row, column = np.divmod(np.arange(int(counts.sum())) - offsets[gaussian], columns[gaussian])
+    # tile 좌표를 한 줄 번호로 바꾼다.
+    tile = (tile_boxes[gaussian, 1] + row) * tiles_x + tile_boxes[gaussian, 0] + column
+    # 05의 투영 결과는 이미 깊이 순서이므로 Gaussian 번호가 곧 깊이 순위이다.
+    keys = (tile.astype(np.int64) << DEPTH_BITS) | gaussian.astype(np.int64)
+    # key 하나의 정렬로 tile 순서와 tile 안 깊이 순서를 동시에 맞춘다.
+    keys.sort(kind="stable")
+    # 정렬된 key의 하위 bit에서 Gaussian 번호를 꺼낸다.
+    sorted_gaussians = keys & ((1 << DEPTH_BITS) - 1)
+    # 각 tile이 key 배열에서 시작하는 위치를 이진 탐색으로 찾는다.
+    bounds = np.searchsorted(keys >> DEPTH_BITS, np.arange(tiles_x * tiles_y + 1))
+    # Gaussian 목록과 tile별 시작·끝 위치를 반환한다.
+    return sorted_gaussians, bounds[:-1], bounds[1:]
+
+
+# tile 하나를 front-to-back으로 합성하는 함수를 정의한다.
+def rasterize_tile(projected, gaussians: np.ndarray, x0: int, y0: int, x1: int, y1: int, min_transmittance: float, chunk_size: int) -> tuple[np.ndarray, np.ndarray, TileStats]:
+    """tile pixel의 RGB 합, transmittance, 평가 통계를 반환한다."""
+    # tile 안 pixel 좌표 격자를 만든다.
+    pixel_y, pixel_x = np.mgrid[y0:y1, x0:x1]
+    # 격자를 한 줄 배열로 펼친다.
+    pixel_x, pixel_y = pixel_x.ravel(), pixel_y.ravel()
+    # tile pixel 수를 저장한다.
+    pixel_count = len(pixel_x)
+    # tile pixel별 RGB 누적 배열을 만든다.
+    rgb = np.zeros((pixel_count, 3))
+    # tile pixel별 transmittance를 1로 초기화한다.
+    transmittance = np.ones(pixel_count)
+    # 평가 수를 셀 통계 객체를 만든다.
+    stats = TileStats()
+    # Gaussian 목록을 chunk 단위로 앞에서부터 처리한다.
+    for start in range(0, len(gaussians), chunk_size):
+        # 아직 빛이 충분히 남은 pixel만 계산 대상으로 고른다.
+        active = np.flatnonzero(transmittance >= min_transmittance)
+        # 모든 pixel이 포화되면 남은 Gaussian을 모두 건너뛴다.
+        if len(active) == 0:
+            # 남은 Gaussian × tile pixel 수를 건너뛴 수로 기록한다.
+            stats.skipped += (len(gaussians) - start) * pixel_count
+            # tile 처리를 끝낸다.
+            break
+        # 현재 chunk의 Gaussian 번호를 꺼낸다.
+        chunk = gaussians[start : start + chunk_size]
+        # 포화된 pixel 수만큼 건너뛴 수를 기록한다.
+        stats.skipped += len(chunk) * (pixel_count - len(active))
+        # 실제 계산하는 Gaussian-pixel 쌍 수를 기록한다.
+        stats.evaluated += len(chunk) * len(active)
+        # (chunk, active) 모양의 x 차이를 계산한다.
+        delta_x = pixel_x[active][None, :] - projected.means_2d[chunk, 0][:, None]
+        # (chunk, active) 모양의 y 차이를 계산한다.
+        delta_y = pixel_y[active][None, :] - projected.means_2d[chunk, 1][:, None]
+        # conic 세 성분을 열 벡터로 꺼낸다.
+        a, b, c = (projected.conics[chunk, index][:, None] for index in range(3))
+        # Mahalanobis 거리를 계산한다.
+        squared_distance = a * delta_x * delta_x + 2.0 * b * delta_x * delta_y + c * delta_y * delta_y
+        # opacity × Gaussian weight를 상한 0.99로 제한해 alpha를 만든다.
+        alpha = np.minimum(projected.opacities[chunk][:, None] * np.exp(-0.5 * squared_distance), ewa.ALPHA_MAX)
+        # 05와 같은 결과가 되도록 3-sigma box 밖 pixel은 합성하지 않는다.
+        boxes = projected.boxes[chunk]
+        # pixel이 box 가로 범위 안에 있는지 검사한다.
+        inside = (pixel_x[active][None, :] >= boxes[:, 0:1]) & (pixel_x[active][None, :] <= boxes[:, 2:3])
+        # 세로 범위 조건도 함께 검사한다.
+        inside &= (pixel_y[active][None, :] >= boxes[:, 1:2]) & (pixel_y[active][None, :] <= boxes[:, 3:4])
+        # box 밖이거나 보이지 않을 만큼 작은 alpha를 0으로 만든다.
+        alpha[~inside | (alpha < ewa.ALPHA_MIN)] = 0.0
+        # 각 Gaussian 뒤로 통과하는 빛의 비율을 계산한다.
+        passing = 1.0 - alpha
+        # 자기 자신 앞까지의 통과율을 얻도록 1을 앞에 붙인 누적곱(exclusive cumprod)을 계산한다.
+        before = np.cumprod(np.vstack([np.ones((1, len(active))), passing[:-1]]), axis=0)
+        # 각 Gaussian이 pixel에 남기는 가중치 T × alpha를 계산한다.
+        weight = transmittance[active][None, :] * before * alpha
+        # 가중치ᵀ @ 색으로 chunk 전체 기여를 한 번의 행렬곱으로 더한다.
+        rgb[active] += weight.T @ projected.colors[chunk]
+        # chunk 전체 통과율을 곱해 transmittance를 갱신한다.
+        transmittance[active] *= before[-1] * passing[-1]
+    # tile 결과와 통계를 반환한다.
+    return rgb, transmittance, stats
+
+
+# worker process의 전역 상태를 설정하는 initializer 함수를 정의한다.
+def _init_worker(projected, gaussians: np.ndarray, image_height: int, image_width: int, min_transmittance: float, chunk_size: int) -> None:
+    """process마다 한 번 투영 결과와 binning 결과를 받아 둔다."""
+    # 이후 tile 작업이 참조할 값을 전역 dict에 저장한다.
+    _WORKER_STATE.update(projected=projected, gaussians=gaussians, image_height=image_height, image_width=image_width, min_transmittance=min_transmittance, chunk_size=chunk_size)
+
+
+# 여러 tile을 차례로 합성하는 worker 함수를 정의한다.
+def _render_tile_group(tile_group: list[tuple[int, int, int]]) -> list[tuple[int, np.ndarray, np.ndarray, TileStats]]:
+    """(tile 번호, start, stop) 목록을 받아 tile별 결과를 반환한다."""
+    # 전역 상태에서 필요한 값을 꺼낸다.
+    state = _WORKER_STATE
+    # 가로 tile 수를 다시 계산한다.
+    tiles_x = -(-state["image_width"] // TILE_SIZE)
+    # 결과를 담을 list를 만든다.
+    results = []
+    # 묶음 안의 tile을 하나씩 처리한다.
+    for tile, start, stop in tile_group:
+        # tile 번호를 행·열로 나눈다.
+        tile_row, tile_column = divmod(tile, tiles_x)
+        # tile 왼쪽 위 pixel 좌표를 계산한다.
+        x0, y0 = tile_column * TILE_SIZE, tile_row * TILE_SIZE
+        # 화면 끝 tile은 잘리도록 오른쪽 아래 좌표를 제한한다.
+        x1, y1 = min(x0 + TILE_SIZE, state["image_width"]), min(y0 + TILE_SIZE, state["image_height"])
+        # tile 하나를 합성한다.
+        rgb, transmittance, stats = rasterize_tile(state["projected"], state["gaussians"][start:stop], x0, y0, x1, y1, state["min_transmittance"], state["chunk_size"])
+        # tile 번호와 함께 결과를 저장한다.
+        results.append((tile, rgb, transmittance, stats))
+    # 묶음 결과를 반환한다.
+    return results
+
+
+# 투영된 Gaussian을 tile 단위로 렌더링하는 함수를 정의한다.
+def render_tiles(projected, image_height: int, image_width: int, background_color: np.ndarray, workers: int = 1, min_transmittance: float = MIN_TRANSMITTANCE, chunk_size: int = CHUNK_SIZE) -> tuple[np.ndarray, np.ndarray, TileStats]:
+    """binning 후 tile을 직접 또는 process pool로 합성해 RGB, alpha, 통계를 반환한다."""
+    # footprint를 tile key로 바꿔 정렬한다.
+    gaussians, starts, stops = bin_gaussians(projected.boxes, image_height, image_width)
+    # Gaussian이 하나 이상 겹친 tile만 작업 목록에 넣는다.
+    work = [(tile, int(starts[tile]), int(stops[tile])) for tile in np.flatnonzero(stops > starts).tolist()]
+    # 전체 통계를 만든다.
+    stats = TileStats(tiles=len(starts), pairs=len(gaussians))
+    # 출력 RGB 영상을 0으로 초기화한다.
+    rgb = np.zeros((image_height, image_width, 3))
+    # transmittance 영상을 1로 초기화한다.
+    transmittance = np.ones((image_height, image_width))
+    # worker 수만큼 작업을 번갈아 나눠 무거운 tile이 한 process에 몰리지 않게 한다.
+    groups = [work[index :: max(workers, 1) * 4] for index in range(max(workers, 1) * 4)]
+    # worker initializer에 넘길 인자를 묶는다.
+    arguments = (projected, gaussians, image_height, image_width, min_transmittance, chunk_size)
+    # worker가 1개 이하이면 process를 만들지 않고 현재 process에서 처리한다.
+    if workers <= 1:
+        # 현재 process의 전역 상태를 설정한다.
+        _init_worker(*arguments)
+        # 모든 작업을 한 묶음으로 처리한다.
+        group_results = [_render_tile_group(work)]
+    # worker가 여러 개이면 process pool에 묶음을 나눠 보낸다.
+    else:
+        # with 블록이 끝나면 pool의 process를 정리한다.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=arguments) as pool:
+            # 묶음별 결과를 순서대로 받는다.
+            group_results = list(pool.map(_render_tile_group, groups))
+    # tiles_x를 다시 계산해 tile 번호를 pixel 위치로 바꿀 수 있게 한다.
+    tiles_x = -(-image_width // TILE_SIZE)
+    # 모든 묶음의 tile 결과를 하나씩 화면에 붙인다.
+    for results in group_results:
+        # 묶음 안의 tile 결과를 꺼낸다.
+        for tile, tile_rgb, tile_transmittance, tile_stats in results:
+            # tile 번호를 행·열로 나눈다.
+            tile_row, tile_column = divmod(tile, tiles_x)
+            # tile 왼쪽 위 좌표를 계산한다.
+            x0, y0 = tile_column * TILE_SIZE, tile_row * TILE_SIZE
+            # 화면 끝을 넘지 않는 오른쪽 아래 좌표를 계산한다.
+            x1, y1 = min(x0 + TILE_SIZE, image_width), min(y0 + TILE_SIZE, image_height)
+            # tile RGB를 화면 위치에 복사한다.
+            rgb[y0:y1, x0:x1] = tile_rgb.reshape(y1 - y0, x1 - x0, 3)
+            # tile transmittance를 화면 위치에 복사한다.
+            transmittance[y0:y1, x0:x1] = tile_transmittance.reshape(y1 - y0, x1 - x0)
+            # tile 통계를 전체 통계에 더한다.
+            stats.add(tile_stats)
+    # 남은 빛에 배경색을 곱해 더한다.
+    rgb += transmittance[:, :, None] * background_color
+    # RGB, alpha, 통계를 반환한다.
+    return rgb, 1.0 - transmittance, stats
+
+
+# tile rasterizer 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """05와 같은 2만 개 장면을 tile 방식으로 렌더링하고 worker 수별 시간을 비교한다."""
+    # 출력 영상 높이를 480 pixel로 설정한다.
+    image_height = 480
+    # 출력 영상 너비를 640 pixel로 설정한다.
+    image_width = 640
+    # 05와 같은 intrinsic matrix K를 만든다.
+    intrinsic_matrix = np.array([[520.0, 0.0, image_width / 2.0], [0.0, 520.0, image_height / 2.0], [0.0, 0.0, 1.0]], dtype=np.float64)
+    # 05와 같은 무작위 장면을 만든다.
+    scene = ewa.random_scene(20_000)
+    # 어두운 배경색을 설정한다.
+    background_color = np.array([0.025, 0.035, 0.055], dtype=np.float64)
+    # 모든 Gaussian을 한 번에 투영한다.
+    projected = ewa.project_gaussians(*scene, intrinsic_matrix, image_height, image_width)
+    # 한 process와 두 process로 각각 렌더링해 시간을 비교한다.
+    for workers in (1, 2):
+        # 시작 시각을 기록한다.
+        started_at = perf_counter()
+        # tile rasterizer로 렌더링한다.
+        rendered_rgb, rendered_alpha, stats = render_tiles(projected, image_height, image_width, background_color, workers=workers)
+        # worker 수, 시간, 통계를 출력한다.
+        print(f"workers={workers}: {perf_counter() - started_at:.2f} s, tiles={stats.tiles}, pairs={stats.pairs}, evaluated={stats.evaluated}, skipped={stats.skipped}")
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # RGB 결과 파일 경로를 만든다.
+    rgb_path = output_dir / "06_tile_rasterizer_rgb.png"
+    # 04의 저장 함수로 RGB 결과를 저장한다.
+    ewa.mini_splat.save_rgb_image(rgb_path, rendered_rgb)
+    # early termination이 바꾼 양을 05 결과와 비교해 출력한다.
+    reference_rgb, _ = ewa.render_projected(projected, image_height, image_width, background_color)
+    # 두 렌더러의 최대 차이를 출력한다.
+    print(f"max |tile - ewa|: {np.abs(rendered_rgb - reference_rgb).max():.2e}")
+    # RGB 결과 파일의 절대 경로를 출력한다.
+    print(f"RGB 저장 완료: {rgb_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # tile rasterizer 예제를 시작한다.
+    main()
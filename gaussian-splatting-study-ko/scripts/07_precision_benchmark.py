@@ -0,0 +1,141 @@
+"""1080p에서 float64와 float32, 새 배열과 scratch buffer 재사용의 시간과 최대 메모리를 비교한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 02, 04 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 결과 표를 JSON 파일로도 남기기 위해 json을 가져온다.
+import json
+# NumPy 배열 할당까지 추적되는 Python 표준 메모리 추적기를 가져온다.
+import tracemalloc
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 실행 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+# 측정할 함수의 자료형을 설명하기 위해 Callable을 가져온다.
+from typing import Callable
+
+# 배열과 난수 장면 생성을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 02 스크립트의 gaussian_2d와 covariance_2d를 재사용한다.
+gaussian_2d_script = importlib.import_module("02_gaussian_2d")
+# 04 스크립트의 render_gaussians를 재사용한다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+
+# Full HD 1080p 해상도의 높이이다.
+IMAGE_HEIGHT = 1080
+# Full HD 1080p 해상도의 너비이다.
+IMAGE_WIDTH = 1920
+# render_gaussians에 넣을 Gaussian 수이다.
+GAUSSIAN_COUNT = 24
+# gaussian_2d를 한 측정에서 반복 평가할 횟수이다.
+REPEATS = 8
+
+
+# 함수 한 번의 실행 시간과 최대 추가 메모리를 재는 함수를 정의한다.
+def measure(function: Callable[[], object]) -> tuple[float, float]:
+    """(초, MiB) 단위 실행 시간과 tracemalloc 최대 메모리를 반환한다."""
+    # 이전 측정의 최대값이 섞이지 않도록 추적을 새로 시작한다.
+    tracemalloc.start()
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # 측정할 함수를 실행한다.
+    function()
+    # 걸린 시간을 계산한다.
+    elapsed_s = perf_counter() - started_at
+    # 추적 중 가장 많이 쓴 메모리를 byte 단위로 읽는다.
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    # 다음 측정을 위해 추적을 멈춘다.
+    tracemalloc.stop()
+    # 시간과 MiB 단위 최대 메모리를 반환한다.
+    return elapsed_s, peak_bytes / 2**20
+
+
+# 1080p 격자에 Gaussian을 여러 번 평가하는 측정 함수를 만드는 함수를 정의한다.
+def gaussian_2d_case(dtype: type, reuse_buffers: bool) -> Callable[[], object]:
+    """dtype과 buffer 재사용 여부에 맞춘 gaussian_2d 반복 실행 함수를 반환한다."""
+    # 세로와 가로 좌표 격자를 만든다.
+    y_coordinates, x_coordinates = np.mgrid[0:IMAGE_HEIGHT, 0:IMAGE_WIDTH]
+    # (H, W, 2) 좌표 격자를 지정한 dtype으로 만든다.
+    pixel_grid = np.dstack((x_coordinates, y_coordinates)).astype(dtype)
+    # 02와 같은 회전 covariance를 만든다.
+    covariance = gaussian_2d_script.covariance_2d(scale_x=210.0, scale_y=75.0, angle_degrees=35.0)
+    # 측정 함수 안에서 실행할 반복 평가를 정의한다.
+    def run() -> None:
+        # buffer를 재사용하는 경우 반복 전에 한 번만 만든다.
+        out = np.empty((IMAGE_HEIGHT, IMAGE_WIDTH), dtype=dtype) if reuse_buffers else None
+        # x 차이와 y 차이용 scratch buffer도 한 번만 만든다.
+        scratch = np.empty((2, IMAGE_HEIGHT, IMAGE_WIDTH), dtype=dtype) if reuse_buffers else None
+        # 중심을 조금씩 옮기며 여러 번 평가한다.
+        for repeat in range(REPEATS):
+            # 반복마다 다른 중심으로 Gaussian을 평가한다.
+            gaussian_2d_script.gaussian_2d(pixel_grid, np.array([900.0 + repeat, 540.0]), covariance, out=out, scratch=scratch)
+    # 측정 함수를 반환한다.
+    return run
+
+
+# 1080p render_gaussians 실행 함수를 만드는 함수를 정의한다.
+def render_case(dtype: type) -> Callable[[], object]:
+    """지정한 dtype으로 Gaussian 장면을 렌더링하는 함수를 반환한다."""
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(0)
+    # 카메라 앞 상자 안에 Gaussian 중심을 배치한다.
+    means_3d = np.c_[rng.uniform(-1.2, 1.2, size=(GAUSSIAN_COUNT, 2)), rng.uniform(2.0, 5.0, size=GAUSSIAN_COUNT)]
+    # 1080p용 focal length와 영상 중앙 principal point로 K를 만든다.
+    intrinsic_matrix = np.array([[1000.0, 0.0, IMAGE_WIDTH / 2.0], [0.0, 1000.0, IMAGE_HEIGHT / 2.0], [0.0, 0.0, 1.0]])
+    # 장면 인자를 tuple로 묶는다.
+    scene = (means_3d, rng.uniform(0.05, 0.4, size=(GAUSSIAN_COUNT, 3)), rng.uniform(0.1, 1.0, size=(GAUSSIAN_COUNT, 3)), rng.uniform(0.3, 0.9, size=GAUSSIAN_COUNT), intrinsic_matrix, IMAGE_HEIGHT, IMAGE_WIDTH, np.zeros(3))
+    # 지정한 dtype으로 렌더링하는 함수를 반환한다.
+    return lambda: mini_splat.render_gaussians(*scene, dtype=dtype)
+
+
+# benchmark 전체를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """측정 표를 출력하고 outputs/07_precision_benchmark.json에 저장한다."""
+    # 측정 이름과 실행 함수 목록을 만든다.
+    cases = [
+        # 02 gaussian_2d를 float64로 호출마다 새 buffer를 만들며 실행한다.
+        ("gaussian_2d float64 new", gaussian_2d_case(np.float64, reuse_buffers=False)),
+        # 02 gaussian_2d를 float64로 buffer를 재사용하며 실행한다.
+        ("gaussian_2d float64 reuse", gaussian_2d_case(np.float64, reuse_buffers=True)),
+        # 02 gaussian_2d를 float32로 buffer를 재사용하며 실행한다.
+        ("gaussian_2d float32 reuse", gaussian_2d_case(np.float32, reuse_buffers=True)),
+        # 04 render_gaussians를 float64로 실행한다.
+        ("render_gaussians float64", render_case(np.float64)),
+        # 04 render_gaussians를 float32로 실행한다.
+        ("render_gaussians float32", render_case(np.float32)),
+    ]
+    # 결과 행을 저장할 list를 만든다.
+    rows = []
+    # 표 머리글을 출력한다.
+    print(f"{IMAGE_WIDTH}x{IMAGE_HEIGHT}\n{'case':<28} {'time s':>8} {'peak MiB':>9}")
+    # 각 경우를 차례로 측정한다.
+    for name, function in cases:
+        # 시간과 최대 메모리를 측정한다.
+        elapsed_s, peak_mib = measure(function)
+        # 결과 행을 저장한다.
+        rows.append({"case": name, "time_s": elapsed_s, "peak_mib": peak_mib})
+        # 표의 한 줄을 출력한다.
+        print(f"{name:<28} {elapsed_s:>8.3f} {peak_mib:>9.1f}")
+    # float64와 float32 렌더링 결과의 최대 차이를 계산한다.
+    difference = np.abs(render_case(np.float64)()[0] - render_case(np.float32)()[0]).max()
+    # 차이를 출력한다.
+    print(f"max |float64 - float32| RGB: {difference:.2e}")
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # JSON 결과 파일 경로를 만든다.
+    output_path = output_dir / "07_precision_benchmark.json"
+    # 측정 결과를 읽기 좋은 JSON으로 저장한다.
+    output_path.write_text(json.dumps({"height": IMAGE_HEIGHT, "width": IMAGE_WIDTH, "rows": rows, "max_rgb_difference": float(difference)}, indent=2), encoding="utf-8")
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"저장 완료: {output_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # 정밀도 benchmark를 시작한다.
+    main()
@@ -0,0 +1,266 @@
+"""degree 0~3 spherical harmonics(SH) 계수로 시점에 따라 바뀌는 Gaussian 색을 한 번에 계산한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 색 계산 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+
+# 배열과 einsum 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+# 시점별 색 변화를 그래프로 저장하기 위해 pyplot을 plt라는 별칭으로 가져온다.
+import matplotlib.pyplot as plt
+
+# degree 0 basis의 상수 1 / (2 sqrt(pi))이다.
+SH_C0 = 0.28209479177387814
+# degree 1 basis의 상수 sqrt(3) / (2 sqrt(pi))이다.
+SH_C1 = 0.4886025119029199
+# degree 2 basis 다섯 개의 상수이다(공식 3DGS sh_utils.py와 같은 값과 부호).
+SH_C2 = (1.0925484305920792, -1.0925484305920792, 0.31539156525252005, -1.0925484305920792, 0.5462742152960396)
+# degree 3 basis 일곱 개의 상수이다.
+SH_C3 = (-0.5900435899266435, 2.890611442640554, -0.4570457994644658, 0.3731763325901154, -0.4570457994644658, 1.445305721320277, -0.5900435899266435)
+
+
+# degree로부터 Gaussian 하나가 가지는 SH 계수 수를 계산하는 함수를 정의한다.
+def coefficient_count(degree: int) -> int:
+    """degree d의 SH basis 수 (d + 1)²를 반환한다."""
+    # 지원하지 않는 degree는 ValueError로 거부한다.
+    if not 0 <= degree <= 3:
+        # 공식 3DGS와 같은 최대 degree 3까지만 지원한다고 알린다.
+        raise ValueError("SH degree는 0 이상 3 이하여야 합니다.")
+    # degree d까지의 basis 수를 반환한다.
+    return (degree + 1) ** 2
+
+
+# 계수 수로부터 SH degree를 거꾸로 구하는 함수를 정의한다.
+def degree_from_count(count: int) -> int:
+    """계수 수 1, 4, 9, 16을 degree 0, 1, 2, 3으로 바꾼다."""
+    # 가능한 degree를 하나씩 검사한다.
+    for degree in range(4):
+        # 계수 수가 일치하면 degree를 반환한다.
+        if coefficient_count(degree) == count:
+            # 찾은 degree를 반환한다.
+            return degree
+    # 어떤 degree와도 맞지 않으면 ValueError를 발생시킨다.
+    raise ValueError(f"SH 계수 수 {count}는 1, 4, 9, 16 중 하나여야 합니다.")
+
+
+# 모든 Gaussian의 시선 방향을 한 번에 계산하는 함수를 정의한다.
+def view_directions(means: np.ndarray, camera_center: np.ndarray) -> np.ndarray:
+    """카메라 중심에서 각 Gaussian 중심으로 향하는 단위 벡터 shape (N, 3)을 반환한다."""
+    # 카메라에서 Gaussian까지의 벡터를 broadcasting으로 계산한다.
+    directions = np.asarray(means, dtype=np.float64) - np.asarray(camera_center, dtype=np.float64)
+    # 각 벡터 길이로 나눠 단위 벡터로 만든다.
+    return directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+
+# 단위 방향 벡터에서 SH basis 값을 한 번에 계산하는 함수를 정의한다.
+def sh_basis(directions: np.ndarray, degree: int) -> np.ndarray:
+    """shape (N, 3) 방향에 대한 basis 행렬 shape (N, (degree + 1)²)을 반환한다."""
+    # 결과 basis 행렬을 만든다.
+    basis = np.empty((len(directions), coefficient_count(degree)), dtype=np.float64)
+    # degree 0 basis는 방향과 무관한 상수이다.
+    basis[:, 0] = SH_C0
+    # degree 0이면 더 계산할 것이 없다.
+    if degree == 0:
+        # 상수 basis만 담긴 행렬을 반환한다.
+        return basis
+    # 방향의 세 성분을 shape (N,) 배열로 나눈다.
+    x, y, z = directions.T
+    # degree 1 basis 세 개를 공식 구현의 부호대로 채운다.
+    basis[:, 1], basis[:, 2], basis[:, 3] = -SH_C1 * y, SH_C1 * z, -SH_C1 * x
+    # degree 1이면 여기서 끝낸다.
+    if degree == 1:
+        # degree 1까지의 basis 행렬을 반환한다.
+        return basis
+    # degree 2와 3에서 반복 사용할 제곱과 곱을 미리 계산한다.
+    xx, yy, zz, xy, yz, xz = x * x, y * y, z * z, x * y, y * z, x * z
+    # degree 2 basis의 첫 두 개를 채운다.
+    basis[:, 4], basis[:, 5] = SH_C2[0] * xy, SH_C2[1] * yz
+    # degree 2 basis의 가운데 항을 채운다.
+    basis[:, 6] = SH_C2[2] * (2.0 * zz - xx - yy)
+    # degree 2 basis의 마지막 두 개를 채운다.
+    basis[:, 7], basis[:, 8] = SH_C2[3] * xz, SH_C2[4] * (xx - yy)
+    # degree 2이면 여기서 끝낸다.
+    if degree == 2:
+        # degree 2까지의 basis 행렬을 반환한다.
+        return basis
+    # degree 3 basis의 첫 두 개를 채운다.
+    basis[:, 9], basis[:, 10] = SH_C3[0] * y * (3.0 * xx - yy), SH_C3[1] * xy * z
+    # degree 3 basis의 세 번째와 네 번째를 채운다.
+    basis[:, 11], basis[:, 12] = SH_C3[2] * y * (4.0 * zz - xx - yy), SH_C3[3] * z * (2.0 * zz - 3.0 * xx - 3.0 * yy)
+    # degree 3 basis의 다섯 번째와 여섯 번째를 채운다.
+    basis[:, 13], basis[:, 14] = SH_C3[4] * x * (4.0 * zz - xx - yy), SH_C3[5] * z * (xx - yy)
+    # degree 3 basis의 마지막을 채운다.
+    basis[:, 15] = SH_C3[6] * x * (xx - 3.0 * yy)
+    # degree 3까지의 basis 행렬을 반환한다.
+    return basis
+
+
+# SH 계수와 방향으로 RGB를 계산하는 함수를 정의한다.
+def evaluate_sh(coefficients: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """shape (N, K, 3) 계수와 (N, 3) 방향으로 RGB shape (N, 3)을 계산한다."""
+    # 계수 수 K에서 degree를 구한다.
+    degree = degree_from_count(coefficients.shape[1])
+    # 모든 Gaussian의 basis 행렬을 한 번에 계산한다.
+    basis = sh_basis(directions, degree)
+    # einsum 한 번으로 Gaussian마다 Σ_k basis_k × 계수_k를 세 채널에 대해 계산한다.
+    rgb = np.einsum("nk,nkc->nc", basis, coefficients)
+    # 공식 3DGS처럼 0.5를 더하고 음수 색을 0으로 자른다.
+    return np.maximum(rgb + 0.5, 0.0)
+
+
+# 카메라가 거의 움직이지 않으면 이전 색을 재사용하는 cache class를 정의한다.
+class ShColorCache:
+    """같은 배열 객체에서 카메라 중심 이동이 tolerance 이하이면 마지막 RGB를 그대로 돌려준다.
+
+    입력은 배열 객체의 identity로 구분하므로, 같은 배열을 제자리에서 고치면
+    (optimizer step, coeffs *= 3 등) 변화를 알아채지 못한다. 그런 경우 호출자가
+    invalidate()를 불러야 한다. cache는 입력 배열 참조를 붙잡아 두므로 해제된
+    배열의 id가 새 배열에 재사용되어 잘못 hit하는 일은 없다.
+    """
+
+    # cache의 허용 이동 거리와 통계를 초기화한다.
+    def __init__(self, tolerance: float = 1e-3) -> None:
+        # 재계산 없이 허용할 카메라 중심 이동 거리(world 단위)를 저장한다.
+        self.tolerance = tolerance
+        # 마지막으로 계산한 카메라 중심을 저장한다.
+        self._camera_center: np.ndarray | None = None
+        # 마지막으로 계산에 쓴 계수 배열 참조를 저장한다.
+        self._coefficients: np.ndarray | None = None
+        # 마지막으로 계산에 쓴 중심 배열 참조를 저장한다.
+        self._means: np.ndarray | None = None
+        # 마지막으로 계산한 RGB를 저장한다.
+        self._colors: np.ndarray | None = None
+        # cache를 재사용한 횟수를 센다.
+        self.hits = 0
+        # 새로 계산한 횟수를 센다.
+        self.misses = 0
+
+    # 필요하면 다시 계산하고 아니면 cache를 돌려주는 method를 정의한다.
+    def colors(self, coefficients: np.ndarray, means: np.ndarray, camera_center: np.ndarray) -> np.ndarray:
+        """현재 카메라 중심에서 본 Gaussian RGB shape (N, 3)을 반환한다."""
+        # 카메라 중심을 float64 배열로 바꾼다.
+        center = np.asarray(camera_center, dtype=np.float64)
+        # 붙잡아 둔 참조와 같은 배열 객체인지 is로 확인한다.
+        same_inputs = coefficients is self._coefficients and means is self._means
+        # 입력이 같고 카메라가 tolerance 안에서만 움직였으면 cache를 재사용한다.
+        if self._colors is not None and same_inputs and np.linalg.norm(center - self._camera_center) <= self.tolerance:
+            # 재사용 횟수를 센다.
+            self.hits += 1
+            # 저장된 RGB를 반환한다.
+            return self._colors
+        # 새로 계산하는 횟수를 센다.
+        self.misses += 1
+        # 모든 Gaussian의 RGB를 한 번에 계산한다.
+        self._colors = evaluate_sh(coefficients, view_directions(means, center))
+        # 계산한 카메라 중심을 복사해 저장한다.
+        self._camera_center = center.copy()
+        # 계수 배열 참조를 저장한다.
+        self._coefficients = coefficients
+        # 중심 배열 참조를 저장한다.
+        self._means = means
+        # 새로 계산한 RGB를 반환한다.
+        return self._colors
+
+    # 제자리 수정 뒤 다음 호출이 반드시 다시 계산하도록 cache를 비우는 method를 정의한다.
+    def invalidate(self) -> None:
+        """저장된 RGB와 입력 참조를 버린다. 계수나 중심을 제자리에서 바꾼 뒤 호출한다."""
+        # 저장된 RGB를 버린다.
+        self._colors = None
+        # 계수 배열 참조를 놓는다.
+        self._coefficients = None
+        # 중심 배열 참조를 놓는다.
+        self._means = None
+
+
+# 한 Gaussian을 Python 반복으로 계산하는 느린 예시 함수를 정의한다.
+def evaluate_sh_loop(coefficients: np.ndarray, means: np.ndarray, camera_center: np.ndarray) -> np.ndarray:
+    """비교용으로 Gaussian마다 basis를 따로 계산한다."""
+    # 결과 RGB 배열을 만든다.
+    rgb = np.empty((len(means), 3))
+    # Gaussian을 하나씩 처리한다.
+    for index in range(len(means)):
+        # 한 Gaussian의 방향으로 basis를 계산하고 계수와 곱한다.
+        rgb[index] = evaluate_sh(coefficients[index : index + 1], view_directions(means[index : index + 1], camera_center))[0]
+    # 결과 RGB를 반환한다.
+    return rgb
+
+
+# SH 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """Gaussian 20만 개의 degree 3 색을 일괄 계산하고, 한 Gaussian의 시점별 색을 그린다."""
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(0)
+    # 비교할 Gaussian 수를 정한다.
+    count = 200_000
+    # 원점 주변에 Gaussian 중심을 배치한다.
+    means = rng.normal(size=(count, 3))
+    # degree 3 계수 16개 × RGB를 작은 값으로 뽑는다.
+    coefficients = rng.normal(scale=0.3, size=(count, 16, 3))
+    # 카메라 중심을 z축 뒤쪽에 둔다.
+    camera_center = np.array([0.0, 0.0, -4.0])
+    # 일괄 계산 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # 모든 Gaussian의 색을 einsum 한 번으로 계산한다.
+    batched = evaluate_sh(coefficients, view_directions(means, camera_center))
+    # 일괄 계산 시간을 계산한다.
+    batched_s = perf_counter() - started_at
+    # 반복 계산은 느리므로 앞 2000개만 측정한다.
+    started_at = perf_counter()
+    # Gaussian마다 따로 계산한다.
+    looped = evaluate_sh_loop(coefficients[:2000], means[:2000], camera_center)
+    # 2000개 시간을 전체 수로 환산한다.
+    looped_s = (perf_counter() - started_at) * count / 2000
+    # 시간과 두 결과의 최대 차이를 출력한다.
+    print(f"batched: {batched_s:.3f} s, per-Gaussian loop (추정): {looped_s:.1f} s, max diff: {np.abs(batched[:2000] - looped).max():.2e}")
+    # tolerance 1cm cache를 만든다.
+    cache = ShColorCache(tolerance=0.01)
+    # 카메라를 0.5mm씩 20번 움직이며 색을 요청한다.
+    for step in range(20):
+        # 카메라가 조금 움직인 위치에서 색을 요청한다.
+        cache.colors(coefficients, means, camera_center + [0.0005 * step, 0.0, 0.0])
+    # cache 재사용 통계를 출력한다.
+    print(f"cache hits={cache.hits}, misses={cache.misses}")
+    # 첫 Gaussian을 원 둘레 360개 카메라 위치에서 본다.
+    angles = np.linspace(0.0, 2.0 * np.pi, 360)
+    # 원 위의 카메라 중심을 만든다.
+    centers = np.c_[4.0 * np.sin(angles), np.zeros_like(angles), -4.0 * np.cos(angles)] + means[0]
+    # 같은 Gaussian을 360번 복제해 시점별 색을 한 번에 계산한다.
+    colors = evaluate_sh(np.repeat(coefficients[:1], 360, axis=0), view_directions(np.repeat(means[:1], 360, axis=0), centers))
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # figure와 axes를 만든다.
+    figure, axes = plt.subplots(figsize=(10, 4))
+    # RGB 세 채널을 각도에 따라 그린다.
+    for channel, name in enumerate(("red", "green", "blue")):
+        # 현재 채널 곡선을 같은 이름의 색으로 그린다.
+        axes.plot(np.rad2deg(angles), colors[:, channel], color=name, label=name)
+    # 가로축 이름을 설정한다.
+    axes.set_xlabel("camera angle (degree)")
+    # 세로축 이름을 설정한다.
+    axes.set_ylabel("SH color")
+    # 제목을 설정한다.
+    axes.set_title("View-dependent color of one Gaussian (degree 3 SH)")
+    # 범례를 표시한다.
+    axes.legend()
+    # 여백을 조정한다.
+    figure.tight_layout()
+    # 결과 파일 경로를 만든다.
+    output_path = output_dir / "08_spherical_harmonics.png"
+    # figure를 PNG로 저장한다.
+    figure.savefig(output_path, dpi=150)
+    # figure 메모리를 반환한다.
+    plt.close(figure)
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"저장 완료: {output_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # SH 예제를 시작한다.
+    main()
@@ -0,0 +1,435 @@
+"""3DGS PLY와 compact .npy 장면 파일을 np.memmap으로 복사 없이 열고, 서로 변환한다.
+
+사용법:
+    python scripts/09_scene_io.py                      # 예제 장면 생성·변환·렌더링
+    python scripts/09_scene_io.py point_cloud.ply scene.npy   # PLY → compact
+    python scripts/09_scene_io.py scene.npy point_cloud.ply   # compact → PLY
+"""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 명령행 인자를 해석하기 위해 argparse를 가져온다.
+import argparse
+# 이름 앞에 숫자가 붙은 05, 08 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 장면 배열 묶음을 필드 이름으로 다루기 위해 dataclass를 가져온다.
+from dataclasses import dataclass
+# 파일 경로를 운영체제에 독립적으로 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 파일 열기 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+
+# 구조화 배열과 memmap을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 05 스크립트의 이방성 렌더러를 재사용한다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+# 08 스크립트의 SH 색 계산을 재사용한다.
+spherical_harmonics = importlib.import_module("08_spherical_harmonics")
+
+# PLY header의 property 자료형 이름을 NumPy little-endian dtype 문자열로 바꾸는 표이다.
+PLY_TYPES = {"char": "i1", "uchar": "u1", "short": "<i2", "ushort": "<u2", "int": "<i4", "uint": "<u4", "float": "<f4", "double": "<f8", "int8": "i1", "uint8": "u1", "int16": "<i2", "uint16": "<u2", "int32": "<i4", "uint32": "<u4", "float32": "<f4", "float64": "<f8"}
+# 변환 시 한 번에 읽고 쓰는 Gaussian 수이다. 백만 개 장면도 이 크기만큼만 메모리에 올린다.
+CHUNK_SIZE = 65_536
+
+
+# 메모리 맵 위의 view로 이루어진 장면 dataclass를 정의한다.
+@dataclass(frozen=True)
+class GaussianScene:
+    """3DGS 학습 결과의 활성화 전 parameter를 파일 위 view로 담는다."""
+
+    # 중심 위치 shape (N, 3)이다.
+    means: np.ndarray
+    # log 공간 scale shape (N, 3)이다. 실제 scale은 exp를 적용한다.
+    log_scales: np.ndarray
+    # 정규화 전 (w, x, y, z) quaternion shape (N, 4)이다.
+    rotations: np.ndarray
+    # sigmoid 전 opacity shape (N,)이다.
+    opacity_logits: np.ndarray
+    # degree 0 SH 계수(DC) shape (N, 3)이다.
+    sh_dc: np.ndarray
+    # 나머지 SH 계수를 PLY와 같은 채널 우선 순서 shape (N, 3, K-1)로 담는다.
+    sh_rest: np.ndarray
+
+    # Gaussian 수를 반환하는 len 지원 method를 정의한다.
+    def __len__(self) -> int:
+        """장면의 Gaussian 수를 반환한다."""
+        # 중심 배열의 첫 축 길이를 반환한다.
+        return len(self.means)
+
+    # SH degree를 계산하는 property를 정의한다.
+    @property
+    def sh_degree(self) -> int:
+        """나머지 계수 수로부터 SH degree를 반환한다."""
+        # DC 하나와 나머지 계수 수를 더해 degree로 바꾼다.
+        return spherical_harmonics.degree_from_count(1 + self.sh_rest.shape[2])
+
+    # 일부 Gaussian의 SH 계수를 (M, K, 3) 배열로 모으는 method를 정의한다.
+    def sh_coefficients(self, indices: np.ndarray | slice = slice(None)) -> np.ndarray:
+        """선택한 Gaussian의 SH 계수를 08 스크립트가 쓰는 (M, K, 3) float64 배열로 복사한다."""
+        # DC 계수를 (M, 1, 3)으로 만든다.
+        dc = np.asarray(self.sh_dc[indices], dtype=np.float64)[:, None, :]
+        # 나머지 계수를 (M, K-1, 3)으로 전치한다.
+        rest = np.asarray(self.sh_rest[indices], dtype=np.float64).transpose(0, 2, 1)
+        # 두 배열을 계수 축으로 이어 붙여 반환한다.
+        return np.concatenate([dc, rest], axis=1)
+
+    # 렌더러가 쓰는 활성화된 값을 계산하는 method를 정의한다.
+    def activated(self, indices: np.ndarray | slice = slice(None)) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """선택한 Gaussian의 (중심, scale, quaternion, opacity)를 float64로 반환한다."""
+        # 중심을 float64로 복사한다.
+        means = np.asarray(self.means[indices], dtype=np.float64)
+        # log scale에 exp를 적용한다.
+        scales = np.exp(np.asarray(self.log_scales[indices], dtype=np.float64))
+        # quaternion을 float64로 복사한다(정규화는 05의 회전 변환이 한다).
+        rotations = np.asarray(self.rotations[indices], dtype=np.float64)
+        # opacity logit에 sigmoid를 적용한다.
+        opacities = 1.0 / (1.0 + np.exp(-np.asarray(self.opacity_logits[indices], dtype=np.float64)))
+        # 네 배열을 반환한다.
+        return means, scales, rotations, opacities
+
+
+# compact 형식의 구조화 dtype을 만드는 함수를 정의한다.
+def compact_dtype(sh_degree: int) -> np.dtype:
+    """Gaussian 하나를 float32 record 하나로 담는 구조화 dtype을 반환한다."""
+    # degree에서 나머지 SH 계수 수를 계산한다.
+    rest = spherical_harmonics.coefficient_count(sh_degree) - 1
+    # 각 필드를 (이름, 자료형, 모양)으로 나열한 구조화 dtype을 반환한다.
+    return np.dtype([("means", "<f4", (3,)), ("log_scales", "<f4", (3,)), ("rotations", "<f4", (4,)), ("opacity_logits", "<f4"), ("sh_dc", "<f4", (3,)), ("sh_rest", "<f4", (3, rest))])
+
+
+# 구조화 record 배열을 GaussianScene view로 감싸는 함수를 정의한다.
+def scene_from_records(records: np.ndarray) -> GaussianScene:
+    """필드 접근만 사용하므로 records가 memmap이면 결과도 복사 없는 view이다."""
+    # 각 필드를 그대로 장면 필드로 넘긴다.
+    return GaussianScene(means=records["means"], log_scales=records["log_scales"], rotations=records["rotations"], opacity_logits=records["opacity_logits"], sh_dc=records["sh_dc"], sh_rest=records["sh_rest"])
+
+
+# PLY header를 읽어 vertex 수, property 목록, data 시작 위치를 반환하는 함수를 정의한다.
+def read_ply_header(path: Path) -> tuple[int, list[tuple[str, str]], int]:
+    """binary_little_endian PLY의 vertex element 정보를 읽는다."""
+    # property 목록을 저장할 list를 만든다.
+    properties: list[tuple[str, str]] = []
+    # vertex 수를 저장할 변수를 만든다.
+    vertex_count = -1
+    # header는 ASCII이므로 binary mode로 한 줄씩 읽는다.
+    with path.open("rb") as handle:
+        # 첫 줄이 ply인지 검사한다.
+        if handle.readline().strip() != b"ply":
+            # PLY가 아니면 ValueError를 발생시킨다.
+            raise ValueError(f"{path}는 PLY 파일이 아닙니다.")
+        # 현재 읽고 있는 element 이름을 저장한다.
+        element = None
+        # end_header가 나올 때까지 반복한다.
+        while True:
+            # 한 줄을 읽어 공백 기준으로 나눈다.
+            line = handle.readline()
+            # 파일이 끝났는데 end_header가 없으면 잘린 파일이다.
+            if not line:
+                # 잘린 header를 알리는 ValueError를 발생시킨다.
+                raise ValueError(f"{path}의 PLY header가 끝나지 않았습니다.")
+            # ASCII 단어 목록으로 바꾼다.
+            words = line.decode("ascii").split()
+            # 빈 줄과 주석은 건너뛴다.
+            if not words or words[0] in ("comment", "obj_info"):
+                # 다음 줄로 이동한다.
+                continue
+            # 형식 줄에서 binary little-endian만 허용한다.
+            if words[0] == "format" and words[1] != "binary_little_endian":
+                # 지원하지 않는 형식을 알린다.
+                raise ValueError(f"{words[1]} PLY는 지원하지 않습니다. binary_little_endian만 memmap할 수 있습니다.")
+            # element 줄이면 이름과 개수를 기록한다.
+            if words[0] == "element":
+                # vertex 뒤에 다른 element가 오면 vertex 구간만 읽으면 되므로 이름만 바꾼다.
+                if element is None and words[1] != "vertex":
+                    # vertex가 첫 element가 아니면 시작 위치를 계산할 수 없다.
+                    raise ValueError("vertex가 첫 번째 element인 PLY만 지원합니다.")
+                # 현재 element 이름을 저장한다.
+                element = words[1]
+                # vertex element이면 개수를 저장한다.
+                if element == "vertex":
+                    # 개수 문자열을 정수로 바꾼다.
+                    vertex_count = int(words[2])
+            # vertex element의 property 줄이면 이름과 자료형을 기록한다.
+            elif words[0] == "property" and element == "vertex":
+                # list property는 record 크기가 고정되지 않으므로 거부한다.
+                if words[1] == "list":
+                    # 지원하지 않는 property 형식을 알린다.
+                    raise ValueError("vertex의 list property는 지원하지 않습니다.")
+                # property 이름과 NumPy 자료형을 저장한다.
+                properties.append((words[2], PLY_TYPES[words[1]]))
+            # end_header를 만나면 header 읽기를 끝낸다.
+            elif words[0] == "end_header":
+                # 반복을 끝낸다.
+                break
+        # 현재 파일 위치가 binary data의 시작 byte이다.
+        data_offset = handle.tell()
+    # vertex element가 없으면 ValueError를 발생시킨다.
+    if vertex_count < 0:
+        # vertex가 없다는 것을 알린다.
+        raise ValueError(f"{path}에 vertex element가 없습니다.")
+    # vertex 수, property 목록, data 시작 위치를 반환한다.
+    return vertex_count, properties, data_offset
+
+
+# PLY property 목록을 compact와 같은 필드 이름의 dtype으로 묶는 함수를 정의한다.
+def ply_record_dtype(properties: list[tuple[str, str]]) -> np.dtype:
+    """x,y,z처럼 연속된 float property를 (3,) 같은 하위 배열 필드로 보는 dtype을 만든다."""
+    # property 이름별 byte offset을 계산한다.
+    offsets: dict[str, int] = {}
+    # 현재 byte 위치를 0부터 센다.
+    position = 0
+    # property를 순서대로 훑는다.
+    for name, type_name in properties:
+        # 현재 property의 시작 위치를 저장한다.
+        offsets[name] = position
+        # 자료형 크기만큼 위치를 옮긴다.
+        position += np.dtype(type_name).itemsize
+    # 나머지 SH 계수 property 수를 센다.
+    rest_count = sum(name.startswith("f_rest_") for name, _ in properties)
+    # 나머지 계수는 RGB 채널마다 같은 수여야 하므로 3의 배수가 아니면 ValueError로 거부한다.
+    if rest_count % 3:
+        # 잘못된 f_rest 개수를 알린다.
+        raise ValueError(f"f_rest property 수가 3의 배수가 아닙니다: {rest_count}")
+    # 장면 필드별로 연속되어야 하는 property 이름 목록을 만든다.
+    groups = {"means": ["x", "y", "z"], "log_scales": [f"scale_{index}" for index in range(3)], "rotations": [f"rot_{index}" for index in range(4)], "opacity_logits": ["opacity"], "sh_dc": [f"f_dc_{index}" for index in range(3)]}
+    # degree 0 PLY에는 f_rest가 없으므로 나머지 계수가 있을 때만 sh_rest 묶음을 검사한다.
+    if rest_count:
+        # f_rest_0부터 차례로 이어지는 이름 목록을 추가한다.
+        groups["sh_rest"] = [f"f_rest_{index}" for index in range(rest_count)]
+    # property 이름별 자료형을 dict로 만든다.
+    types = dict(properties)
+    # 필드 이름, 자료형, offset 목록을 만든다.
+    names, formats, field_offsets = [], [], []
+    # 장면 필드를 하나씩 검사한다.
+    for field, members in groups.items():
+        # 필요한 property가 모두 있는지 검사한다.
+        missing = [member for member in members if member not in offsets]
+        # 빠진 property가 있으면 3DGS PLY가 아니다.
+        if missing:
+            # 빠진 property 이름을 알린다.
+            raise ValueError(f"3DGS PLY에 필요한 property가 없습니다: {missing}")
+        # 모든 property가 float32이고 4 byte 간격으로 연속되어야 하나의 view로 볼 수 있다.
+        if any(types[member] != "<f4" or offsets[member] != offsets[members[0]] + 4 * index for index, member in enumerate(members)):
+            # 비표준 배치를 알린다.
+            raise ValueError(f"{field} property가 연속된 float32가 아닙니다.")
+        # 필드 이름을 추가한다.
+        names.append(field)
+        # 필드 모양을 정한다. opacity는 스칼라, sh_rest는 (3, K-1), 나머지는 1차원이다.
+        formats.append("<f4" if field == "opacity_logits" else ("<f4", (3, rest_count // 3)) if field == "sh_rest" else ("<f4", (len(members),)))
+        # 필드 시작 offset을 추가한다.
+        field_offsets.append(offsets[members[0]])
+    # degree 0이면 byte를 차지하지 않는 (3, 0) sh_rest 필드를 둬 장면 모양을 compact와 맞춘다.
+    if not rest_count:
+        # 필드 이름을 추가한다.
+        names.append("sh_rest")
+        # 크기가 0인 하위 배열 모양을 추가한다.
+        formats.append(("<f4", (3, 0)))
+        # 크기가 0이므로 offset은 record 안 어디든 되며 sh_dc 시작 위치를 쓴다.
+        field_offsets.append(offsets["f_dc_0"])
+    # normal(nx, ny, nz) 같은 나머지 property는 건너뛰도록 itemsize를 전체 record 크기로 지정한다.
+    return np.dtype({"names": names, "formats": formats, "offsets": field_offsets, "itemsize": position})
+
+
+# 장면 파일을 확장자에 따라 memmap으로 여는 함수를 정의한다.
+def load_scene(path: Path | str) -> GaussianScene:
+    """.ply와 .npy는 memmap view로, .npz는 배열을 읽어 장면을 반환한다."""
+    # 문자열 경로도 Path로 바꾼다.
+    path = Path(path)
+    # PLY 파일이면 header를 읽고 vertex 구간을 memmap한다.
+    if path.suffix == ".ply":
+        # header에서 vertex 수, property, data 시작 위치를 읽는다.
+        vertex_count, properties, data_offset = read_ply_header(path)
+        # 읽기 전용 memmap은 파일 내용을 복사하지 않고 필요한 page만 OS가 읽는다.
+        records = np.memmap(path, dtype=ply_record_dtype(properties), mode="r", offset=data_offset, shape=(vertex_count,))
+        # record 필드 view로 장면을 만든다.
+        return scene_from_records(records)
+    # compact .npy 파일이면 np.load의 mmap_mode로 연다.
+    if path.suffix == ".npy":
+        # mmap_mode="r"은 header만 읽고 data는 memmap으로 연결한다.
+        return scene_from_records(np.load(path, mmap_mode="r"))
+    # .npz는 zip 안의 배열이라 memmap할 수 없으므로 필드별 배열을 읽는다.
+    if path.suffix == ".npz":
+        # with 블록이 끝나면 zip 파일을 닫는다.
+        with np.load(path) as archive:
+            # 필드 이름별 배열을 읽어 장면을 만든다.
+            return GaussianScene(**{name: archive[name] for name in GaussianScene.__dataclass_fields__})
+    # 지원하지 않는 확장자는 ValueError로 거부한다.
+    raise ValueError(f"지원하지 않는 장면 파일 확장자입니다: {path.suffix}")
+
+
+# 장면을 chunk 단위로 구조화 record에 복사하는 함수를 정의한다.
+def _fill_records(records: np.ndarray, scene: GaussianScene) -> None:
+    """입력 장면 전체를 CHUNK_SIZE개씩 records에 복사한다."""
+    # 장면을 chunk 단위로 나눠 복사해 메모리 사용량을 일정하게 유지한다.
+    for start in range(0, len(scene), CHUNK_SIZE):
+        # 현재 chunk 범위를 slice로 만든다.
+        part = slice(start, min(start + CHUNK_SIZE, len(scene)))
+        # 여섯 필드를 차례로 복사한다.
+        for name in GaussianScene.__dataclass_fields__:
+            # 같은 이름의 필드에 chunk를 쓴다.
+            records[name][part] = getattr(scene, name)[part]
+
+
+# compact .npy 파일을 쓰는 함수를 정의한다.
+def save_compact(path: Path | str, scene: GaussianScene) -> None:
+    """np.lib.format.open_memmap으로 파일을 만들고 chunk 단위로 채운다."""
+    # 파일 크기의 memmap 배열을 header와 함께 만든다.
+    records = np.lib.format.open_memmap(Path(path), mode="w+", dtype=compact_dtype(scene.sh_degree), shape=(len(scene),))
+    # 장면 내용을 chunk 단위로 복사한다.
+    _fill_records(records, scene)
+    # 변경 내용을 disk에 반영한다.
+    records.flush()
+
+
+# 3DGS 표준 PLY 파일을 쓰는 함수를 정의한다.
+def save_ply(path: Path | str, scene: GaussianScene) -> None:
+    """공식 3DGS와 같은 property 순서의 binary_little_endian PLY를 쓴다."""
+    # 나머지 SH 계수 수를 계산한다.
+    rest_count = scene.sh_rest.shape[1] * scene.sh_rest.shape[2]
+    # 공식 구현과 같은 순서로 property 이름을 나열한다.
+    names = ["x", "y", "z", "nx", "ny", "nz", "f_dc_0", "f_dc_1", "f_dc_2", *[f"f_rest_{index}" for index in range(rest_count)], "opacity", "scale_0", "scale_1", "scale_2", "rot_0", "rot_1", "rot_2", "rot_3"]
+    # header 문자열을 줄 단위로 만든다.
+    header = ["ply", "format binary_little_endian 1.0", f"element vertex {len(scene)}", *[f"property float {name}" for name in names], "end_header"]
+    # header를 ASCII byte로 바꾼다.
+    header_bytes = ("\n".join(header) + "\n").encode("ascii")
+    # header를 먼저 쓴다.
+    Path(path).write_bytes(header_bytes)
+    # header 뒤 data 구간을 PLY record dtype의 memmap으로 연다.
+    records = np.memmap(path, dtype=ply_record_dtype([(name, "<f4") for name in names]), mode="r+", offset=len(header_bytes), shape=(len(scene),))
+    # 장면 내용을 chunk 단위로 복사한다(normal은 0으로 남는다).
+    _fill_records(records, scene)
+    # 변경 내용을 disk에 반영한다.
+    records.flush()
+
+
+# 확장자를 보고 장면 파일을 변환하는 함수를 정의한다.
+def convert_scene(source: Path | str, destination: Path | str) -> GaussianScene:
+    """source를 memmap으로 열어 destination 확장자(.npy 또는 .ply)로 저장한다."""
+    # 입력 장면을 연다.
+    scene = load_scene(source)
+    # compact 형식이면 save_compact를 사용한다.
+    if Path(destination).suffix == ".npy":
+        # compact .npy로 저장한다.
+        save_compact(destination, scene)
+    # PLY 형식이면 save_ply를 사용한다.
+    elif Path(destination).suffix == ".ply":
+        # 표준 PLY로 저장한다.
+        save_ply(destination, scene)
+    # 그 밖의 확장자는 거부한다.
+    else:
+        # 지원하지 않는 출력 형식을 알린다.
+        raise ValueError("출력 파일은 .npy 또는 .ply여야 합니다.")
+    # 변환한 장면을 반환한다.
+    return scene
+
+
+# 재현 가능한 무작위 장면을 만드는 함수를 정의한다.
+def random_scene(count: int, sh_degree: int = 3, seed: int = 0) -> GaussianScene:
+    """05의 무작위 장면을 활성화 전 parameter와 SH 계수로 바꾼다."""
+    # 05의 무작위 중심, scale, 회전, 색, opacity를 만든다.
+    means, scales, quaternions, colors, opacities = ewa.random_scene(count, seed=seed)
+    # 나머지 SH 계수용 난수 생성기를 만든다.
+    rng = np.random.default_rng(seed + 1)
+    # 나머지 SH 계수 수를 계산한다.
+    rest = spherical_harmonics.coefficient_count(sh_degree) - 1
+    # 모든 필드를 float32 배열로 만들어 장면을 반환한다.
+    return GaussianScene(
+        # 중심을 float32로 저장한다.
+        means=means.astype(np.float32),
+        # scale을 log 공간으로 저장한다.
+        log_scales=np.log(scales).astype(np.float32),
+        # quaternion을 그대로 저장한다.
+        rotations=quaternions.astype(np.float32),
+        # opacity를 logit으로 저장한다.
+        opacity_logits=np.log(opacities / (1.0 - opacities)).astype(np.float32),
+        # RGB = SH_C0 × DC + 0.5가 되도록 DC 계수를 거꾸로 계산한다.
+        sh_dc=((colors - 0.5) / spherical_harmonics.SH_C0).astype(np.float32),
+        # 시점에 따라 색이 조금 바뀌도록 작은 나머지 계수를 넣는다.
+        sh_rest=rng.normal(scale=0.1, size=(count, 3, rest)).astype(np.float32),
+    )
+
+
+# 장면 하나를 카메라 좌표계에서 렌더링하는 함수를 정의한다.
+def render_scene(scene: GaussianScene, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """카메라가 원점에서 +z를 본다고 보고, 화면에 닿는 Gaussian의 SH 색만 계산해 렌더링한다."""
+    # 활성화된 parameter를 계산한다.
+    means, scales, rotations, opacities = scene.activated()
+    # 색 없이 먼저 투영해 화면에 닿는 Gaussian만 고른다.
+    projected = ewa.project_gaussians(means, scales, rotations, np.zeros((len(scene), 3)), opacities, intrinsic_matrix, image_height, image_width)
+    # 보이는 Gaussian의 SH 색만 원점 카메라 기준으로 계산한다.
+    colors = spherical_harmonics.evaluate_sh(scene.sh_coefficients(projected.indices), spherical_harmonics.view_directions(means[projected.indices], np.zeros(3)))
+    # 계산한 색을 넣은 투영 결과를 새로 만든다.
+    projected = ewa.ProjectedGaussians(indices=projected.indices, means_2d=projected.means_2d, conics=projected.conics, depths=projected.depths, boxes=projected.boxes, colors=colors, opacities=projected.opacities)
+    # 05의 batch 합성으로 렌더링한다.
+    return ewa.render_projected(projected, image_height, image_width, background_color)
+
+
+# 예제 또는 변환 CLI를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """인자가 없으면 예제 장면을 만들어 PLY → compact 변환 후 렌더링하고, 인자가 있으면 파일을 변환한다."""
+    # 명령행 인자 parser를 만든다.
+    parser = argparse.ArgumentParser(description="3DGS PLY와 compact .npy 장면을 서로 변환한다.")
+    # 입력 파일 경로 인자를 선택적으로 받는다.
+    parser.add_argument("source", nargs="?", type=Path, help="입력 .ply, .npy, .npz")
+    # 출력 파일 경로 인자를 선택적으로 받는다.
+    parser.add_argument("destination", nargs="?", type=Path, help="출력 .npy 또는 .ply")
+    # 인자를 해석한다.
+    arguments = parser.parse_args()
+    # 입력과 출력이 모두 있으면 변환만 수행한다.
+    if arguments.source is not None and arguments.destination is not None:
+        # 시작 시각을 기록한다.
+        started_at = perf_counter()
+        # 파일을 변환한다.
+        scene = convert_scene(arguments.source, arguments.destination)
+        # 변환 결과를 출력한다.
+        print(f"{len(scene)} Gaussians (SH degree {scene.sh_degree}) → {arguments.destination} in {perf_counter() - started_at:.2f} s")
+        # 변환만 하고 끝낸다.
+        return
+    # 하나만 주어지면 사용법 오류로 끝낸다.
+    if arguments.source is not None:
+        # argparse의 오류 출력으로 끝낸다.
+        parser.error("입력과 출력 파일을 함께 지정해야 합니다.")
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # 예제 PLY 경로를 만든다.
+    ply_path = output_dir / "09_scene.ply"
+    # 예제 compact 경로를 만든다.
+    compact_path = output_dir / "09_scene.npy"
+    # 20만 개의 degree 3 예제 장면을 공식 PLY 형식으로 저장한다.
+    save_ply(ply_path, random_scene(200_000))
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # PLY를 memmap으로 열어 compact 형식으로 변환한다.
+    convert_scene(ply_path, compact_path)
+    # 변환 시간을 계산한다.
+    convert_s = perf_counter() - started_at
+    # 시작 시각을 다시 기록한다.
+    started_at = perf_counter()
+    # compact 파일을 memmap으로 연다.
+    scene = load_scene(compact_path)
+    # 여는 시간을 계산한다. data를 읽지 않으므로 Gaussian 수와 거의 무관하다.
+    open_ms = (perf_counter() - started_at) * 1e3
+    # 두 파일 크기와 시간을 출력한다.
+    print(f"PLY {ply_path.stat().st_size / 2**20:.1f} MiB → compact {compact_path.stat().st_size / 2**20:.1f} MiB, convert {convert_s:.2f} s, open {open_ms:.2f} ms")
+    # 열린 장면의 필드가 memmap 위의 view인지 출력한다.
+    print(f"means is view of file: {isinstance(scene.means.base, np.memmap) or isinstance(scene.means, np.memmap)}")
+    # 640×480 화면을 렌더링할 K를 만든다.
+    intrinsic_matrix = np.array([[520.0, 0.0, 320.0], [0.0, 520.0, 240.0], [0.0, 0.0, 1.0]])
+    # 장면을 SH 색으로 렌더링한다.
+    rendered_rgb, _ = render_scene(scene, intrinsic_matrix, 480, 640, np.array([0.025, 0.035, 0.055]))
+    # 결과 이미지 경로를 만든다.
+    rgb_path = output_dir / "09_scene_rgb.png"
+    # 04의 저장 함수로 RGB를 저장한다.
+    ewa.mini_splat.save_rgb_image(rgb_path, rendered_rgb)
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"RGB 저장 완료: {rgb_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # 장면 입출력 예제를 시작한다.
+    main()
@@ -0,0 +1,279 @@
+"""한 장면을 여러 카메라 pose로 렌더링하고, frame을 하나씩 PNG 또는 동영상 encoder로 흘려보낸다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 03, 05, 08 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 결과를 기다리는 작업 수를 제한하는 FIFO queue로 deque를 가져온다.
+from collections import deque
+# 여러 process에 view를 나눠 렌더링하기 위해 ProcessPoolExecutor를 가져온다.
+from concurrent.futures import ProcessPoolExecutor
+# 장면 공통 배열을 묶고 투영 결과의 색만 바꾸기 위해 dataclass와 replace를 가져온다.
+from dataclasses import dataclass, replace
+# CPU 수로 기본 worker 수를 정하기 위해 os를 가져온다.
+import os
+# ffmpeg 실행 파일을 찾기 위해 shutil을 가져온다.
+import shutil
+# ffmpeg process에 raw frame을 pipe로 보내기 위해 subprocess를 가져온다.
+import subprocess
+# 메인 process의 최대 메모리를 재기 위해 tracemalloc을 가져온다.
+import tracemalloc
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 렌더링 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+# frame 생성기의 자료형을 설명하기 위해 Iterable과 Iterator를 가져온다.
+from typing import Iterable, Iterator
+
+# 배열과 행렬 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+# uint8 frame을 PNG로 저장하기 위해 Pillow의 Image를 가져온다.
+from PIL import Image
+
+# 03 스크립트의 world_to_camera를 재사용한다.
+camera = importlib.import_module("03_camera_projection")
+# 05 스크립트의 covariance 계산, 투영, 합성을 재사용한다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+# 08 스크립트의 SH 색 계산을 재사용한다.
+spherical_harmonics = importlib.import_module("08_spherical_harmonics")
+
+# worker process 안에서 장면과 카메라 설정을 보관하는 전역 dict이다.
+_WORKER_STATE: dict[str, object] = {}
+
+
+# 모든 view가 공유하는 world 좌표 장면을 담는 dataclass를 정의한다.
+@dataclass(frozen=True)
+class SharedScene:
+    """view와 무관한 중심, world covariance, 색 또는 SH 계수, opacity를 한 번만 계산해 담는다."""
+
+    # world 좌표 중심 shape (N, 3)이다.
+    means: np.ndarray
+    # world 좌표 3D covariance shape (N, 3, 3)이다.
+    covariances: np.ndarray
+    # 시점과 무관한 RGB shape (N, 3)이다. sh_coefficients가 있으면 쓰지 않는다.
+    colors: np.ndarray | None
+    # 시점에 따라 색을 바꾸는 SH 계수 shape (N, K, 3)이다.
+    sh_coefficients: np.ndarray | None
+    # opacity shape (N,)이다.
+    opacities: np.ndarray
+
+
+# 장면 공통 전처리를 한 번 수행하는 함수를 정의한다.
+def prepare_scene(means: np.ndarray, scales: np.ndarray, quaternions: np.ndarray, opacities: np.ndarray, colors: np.ndarray | None = None, sh_coefficients: np.ndarray | None = None) -> SharedScene:
+    """world covariance R S Sᵀ Rᵀ를 미리 계산해 view마다 회전만 적용하면 되게 한다."""
+    # 색과 SH 계수 중 하나는 있어야 한다.
+    if colors is None and sh_coefficients is None:
+        # 색 정보가 없는 입력은 ValueError로 거부한다.
+        raise ValueError("colors 또는 sh_coefficients 중 하나가 필요합니다.")
+    # view와 무관한 world covariance를 한 번 계산해 장면을 만든다.
+    return SharedScene(means=means, covariances=ewa.covariance_3d(scales, quaternions), colors=colors, sh_coefficients=sh_coefficients, opacities=opacities)
+
+
+# 카메라 위치와 바라볼 점으로 camera-from-world pose를 만드는 함수를 정의한다.
+def look_at(eye: np.ndarray, target: np.ndarray, down: np.ndarray = np.array([0.0, 1.0, 0.0])) -> tuple[np.ndarray, np.ndarray]:
+    """x 오른쪽, y 아래, z 앞 카메라 축을 행으로 쌓은 (rotation_cw, translation_cw)를 반환한다."""
+    # 카메라 앞 방향 z축을 단위 벡터로 만든다.
+    forward = (target - eye) / np.linalg.norm(target - eye)
+    # 아래 방향과 앞 방향의 외적이 오른쪽 x축이다.
+    right = np.cross(down, forward)
+    # 오른쪽 축을 단위 벡터로 만든다.
+    right /= np.linalg.norm(right)
+    # 앞과 오른쪽의 외적으로 직교하는 아래 y축을 만든다.
+    rotation_cw = np.stack([right, np.cross(forward, right), forward])
+    # 카메라 중심이 원점으로 가도록 이동 벡터를 계산한다.
+    return rotation_cw, -rotation_cw @ eye
+
+
+# target 주위를 한 바퀴 도는 카메라 pose 목록을 만드는 함수를 정의한다.
+def turntable_poses(count: int, target: np.ndarray, radius: float, elevation_degrees: float = 0.0) -> list[tuple[np.ndarray, np.ndarray]]:
+    """각도 0에서는 target 앞쪽 -z 방향 radius 거리에서 +z를 보는 pose부터 시작한다."""
+    # 한 바퀴를 count개로 나눈 각도를 만든다.
+    angles = np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+    # 고도 각을 radian으로 바꾼다.
+    elevation = np.deg2rad(elevation_degrees)
+    # 각 각도의 카메라 위치를 계산한다. y가 아래 방향이므로 위로 올리려면 y를 뺀다.
+    eyes = target + radius * np.c_[np.cos(elevation) * np.sin(angles), -np.sin(elevation) * np.ones_like(angles), -np.cos(elevation) * np.cos(angles)]
+    # 각 위치에서 target을 보는 pose를 반환한다.
+    return [look_at(eye, target) for eye in eyes]
+
+
+# 한 카메라 pose로 장면을 렌더링하는 함수를 정의한다.
+def render_view(scene: SharedScene, rotation_cw: np.ndarray, translation_cw: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """중심은 03의 world_to_camera로, covariance는 R Σ Rᵀ로 옮긴 뒤 05로 투영·합성한다."""
+    # world 중심을 카메라 좌표로 옮긴다.
+    means_camera = camera.world_to_camera(scene.means, rotation_cw, translation_cw)
+    # 미리 계산한 world covariance에 카메라 회전만 적용한다.
+    covariances_camera = np.einsum("ij,njk,lk->nil", rotation_cw, scene.covariances, rotation_cw)
+    # SH 장면이면 색은 투영 후 보이는 Gaussian만 계산하므로 자리만 채운다.
+    colors = scene.colors if scene.sh_coefficients is None else np.zeros((len(scene.means), 3))
+    # 05의 카메라 좌표 투영 단계로 보이는 Gaussian을 깊이 순서로 고른다.
+    projected = ewa.project_camera_gaussians(means_camera, covariances_camera, colors, scene.opacities, intrinsic_matrix, image_height, image_width)
+    # SH 장면이면 보이는 Gaussian의 색을 현재 카메라 중심에서 계산한다.
+    if scene.sh_coefficients is not None:
+        # camera-from-world pose에서 world 좌표 카메라 중심 -Rᵀt를 구한다.
+        camera_center = -rotation_cw.T @ translation_cw
+        # 보이는 Gaussian의 방향으로 SH 색을 계산해 투영 결과의 색만 바꾼다.
+        projected = replace(projected, colors=spherical_harmonics.evaluate_sh(scene.sh_coefficients[projected.indices], spherical_harmonics.view_directions(scene.means[projected.indices], camera_center)))
+    # 05의 batch 합성으로 RGB와 alpha를 계산한다.
+    return ewa.render_projected(projected, image_height, image_width, background_color)
+
+
+# 0~1 실수 RGB를 encoder에 넘길 uint8 frame으로 바꾸는 함수를 정의한다.
+def to_uint8(rgb: np.ndarray) -> np.ndarray:
+    """04의 save_rgb_image와 같은 방식으로 clip·반올림한 uint8 배열을 반환한다."""
+    # 0~1로 제한하고 255를 곱해 반올림한 uint8 배열을 반환한다.
+    return np.rint(np.clip(rgb, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+
+# worker process의 전역 상태를 설정하는 initializer 함수를 정의한다.
+def _init_worker(scene: SharedScene, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray) -> None:
+    """process마다 한 번 장면과 카메라 설정을 받아 두어 view마다 장면을 다시 보내지 않게 한다."""
+    # 이후 view 작업이 참조할 값을 전역 dict에 저장한다.
+    _WORKER_STATE.update(scene=scene, intrinsic_matrix=intrinsic_matrix, image_height=image_height, image_width=image_width, background_color=background_color)
+
+
+# pose 하나를 렌더링해 uint8 frame을 반환하는 worker 함수를 정의한다.
+def _render_frame(pose: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """float64 영상 대신 8배 작은 uint8 frame만 메인 process로 돌려보낸다."""
+    # 전역 상태에서 필요한 값을 꺼낸다.
+    state = _WORKER_STATE
+    # pose 하나를 렌더링한다.
+    rgb, _ = render_view(state["scene"], pose[0], pose[1], state["intrinsic_matrix"], state["image_height"], state["image_width"], state["background_color"])
+    # uint8 frame으로 바꿔 반환한다.
+    return to_uint8(rgb)
+
+
+# pose 순서대로 frame을 하나씩 만드는 generator를 정의한다.
+def iter_frames(scene: SharedScene, poses: Iterable[tuple[np.ndarray, np.ndarray]], intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray, workers: int = 1, max_pending: int | None = None) -> Iterator[np.ndarray]:
+    """uint8 frame (H, W, 3)을 pose 순서로 yield한다. 동시에 들고 있는 frame은 최대 max_pending개이다."""
+    # worker initializer에 넘길 인자를 묶는다.
+    arguments = (scene, intrinsic_matrix, image_height, image_width, background_color)
+    # worker가 1개 이하이면 process를 만들지 않고 현재 process에서 처리한다.
+    if workers <= 1:
+        # 현재 process의 전역 상태를 설정한다.
+        _init_worker(*arguments)
+        # pose를 하나씩 렌더링한다.
+        for pose in poses:
+            # frame 하나를 만들어 바로 넘긴다.
+            yield _render_frame(pose)
+        # 모든 frame을 넘겼으므로 끝낸다.
+        return
+    # 기본 대기 작업 수는 worker마다 두 개로 해 worker가 놀지 않게 한다.
+    max_pending = max_pending or 2 * workers
+    # 제출 순서대로 future를 보관한다.
+    pending: deque = deque()
+    # with 블록이 끝나면 pool의 process를 정리한다.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=arguments) as pool:
+        # pose를 하나씩 제출한다.
+        for pose in poses:
+            # 대기 작업이 가득 찼으면 가장 오래된 frame을 먼저 넘긴다.
+            if len(pending) >= max_pending:
+                # 가장 먼저 제출한 frame을 기다려 넘긴다.
+                yield pending.popleft().result()
+            # 새 pose를 제출한다.
+            pending.append(pool.submit(_render_frame, pose))
+        # 남은 frame을 제출 순서대로 넘긴다.
+        while pending:
+            # 가장 먼저 제출한 frame을 기다려 넘긴다.
+            yield pending.popleft().result()
+
+
+# frame을 번호 붙은 PNG 또는 ffmpeg 동영상으로 쓰는 함수를 정의한다.
+def write_frames(frames: Iterable[np.ndarray], output_path: Path, fps: int = 24) -> int:
+    """output_path가 .mp4면 ffmpeg stdin으로, 아니면 폴더 안 frame_0000.png로 쓰고 frame 수를 반환한다."""
+    # 쓴 frame 수를 센다.
+    count = 0
+    # 동영상 출력이면 ffmpeg process를 연다.
+    if output_path.suffix == ".mp4":
+        # ffmpeg 실행 파일 경로를 찾는다.
+        ffmpeg = shutil.which("ffmpeg")
+        # ffmpeg가 없으면 RuntimeError를 발생시킨다.
+        if ffmpeg is None:
+            # PNG 폴더를 대신 쓰라는 안내와 함께 실패한다.
+            raise RuntimeError("ffmpeg를 찾을 수 없습니다. 폴더 경로를 주면 PNG frame으로 저장합니다.")
+        # process는 첫 frame의 크기를 본 뒤에 연다.
+        encoder = None
+        # frame을 하나씩 받는다.
+        for frame in frames:
+            # 첫 frame이면 크기에 맞춰 ffmpeg를 시작한다.
+            if encoder is None:
+                # raw RGB24 frame을 stdin으로 받아 H.264로 encode하는 ffmpeg를 시작한다.
+                encoder = subprocess.Popen([ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{frame.shape[1]}x{frame.shape[0]}", "-r", str(fps), "-i", "-", "-c:v", "libx264", "-pix_fmt", "yuv420p", str(output_path)], stdin=subprocess.PIPE)
+            # frame byte를 pipe로 보낸다.
+            encoder.stdin.write(np.ascontiguousarray(frame).tobytes())
+            # 쓴 frame 수를 늘린다.
+            count += 1
+        # frame이 하나라도 있었으면 encoder를 닫고 끝나기를 기다린다.
+        if encoder is not None:
+            # 입력 끝을 알린다.
+            encoder.stdin.close()
+            # encode 실패는 CalledProcessError로 알린다.
+            if encoder.wait() != 0:
+                # ffmpeg 종료 코드를 포함해 실패를 알린다.
+                raise subprocess.CalledProcessError(encoder.returncode, ffmpeg)
+        # 쓴 frame 수를 반환한다.
+        return count
+    # PNG 폴더를 만든다.
+    output_path.mkdir(parents=True, exist_ok=True)
+    # frame을 하나씩 받아 바로 저장한다.
+    for frame in frames:
+        # 번호 붙은 PNG로 저장한다.
+        Image.fromarray(frame, mode="RGB").save(output_path / f"frame_{count:04d}.png")
+        # 쓴 frame 수를 늘린다.
+        count += 1
+    # 쓴 frame 수를 반환한다.
+    return count
+
+
+# turntable 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """2만 개 SH Gaussian 장면을 24개 시점에서 렌더링해 mp4 또는 PNG frame으로 저장한다."""
+    # 출력 영상 높이를 240 pixel로 설정한다.
+    image_height = 240
+    # 출력 영상 너비를 320 pixel로 설정한다.
+    image_width = 320
+    # 해상도에 맞춘 K를 만든다.
+    intrinsic_matrix = np.array([[260.0, 0.0, image_width / 2.0], [0.0, 260.0, image_height / 2.0], [0.0, 0.0, 1.0]])
+    # 05의 무작위 장면을 만든다.
+    means, scales, quaternions, colors, opacities = ewa.random_scene(20_000)
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(1)
+    # degree 1 SH 계수를 만든다. DC는 05의 색이 그대로 나오도록 거꾸로 계산한다.
+    sh_coefficients = np.concatenate([((colors - 0.5) / spherical_harmonics.SH_C0)[:, None, :], rng.normal(scale=0.4, size=(len(means), 3, 3))], axis=1)
+    # view와 무관한 전처리를 한 번만 수행한다.
+    scene = prepare_scene(means, scales, quaternions, opacities, sh_coefficients=sh_coefficients)
+    # 장면 중심을 한 바퀴 도는 24개 pose를 만든다.
+    poses = turntable_poses(24, np.array([0.0, 0.0, 4.0]), radius=4.0, elevation_degrees=15.0)
+    # CPU 수에 맞춰 worker 수를 정한다.
+    workers = min(os.cpu_count() or 1, 4)
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # ffmpeg가 있으면 mp4로, 없으면 PNG 폴더로 저장한다.
+    output_path = output_dir / ("10_turntable.mp4" if shutil.which("ffmpeg") else "10_turntable")
+    # 메인 process의 메모리 추적을 시작한다.
+    tracemalloc.start()
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # frame을 만들면서 바로 저장한다.
+    count = write_frames(iter_frames(scene, poses, intrinsic_matrix, image_height, image_width, np.array([0.025, 0.035, 0.055]), workers=workers), output_path)
+    # 걸린 시간을 계산한다.
+    elapsed_s = perf_counter() - started_at
+    # 추적 중 최대 메모리를 읽는다.
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    # 메모리 추적을 멈춘다.
+    tracemalloc.stop()
+    # frame 수, 속도, worker 수를 출력한다.
+    print(f"{count} frames, {count / elapsed_s:.1f} frames/s, workers={workers}")
+    # frame 수와 무관하게 view 하나의 작업 메모리 수준에 머무는 최대 메모리를 출력한다.
+    print(f"main process peak: {peak_bytes / 2**20:.1f} MiB")
+    # 저장 위치의 절대 경로를 출력한다.
+    print(f"저장 완료: {output_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # multi-view 렌더링 예제를 시작한다.
+    main()
@@ -0,0 +1,366 @@
+"""화면 공간 Gaussian splat 렌더러의 해석적 gradient를 NumPy로 계산하고, 목표 이미지에 Gaussian을 맞춘다.
+
+모든 Gaussian-pixel 쌍을 dense (N, H×W) float64 배열로 계산하므로 작업 메모리는 약
+65 × N × H × W byte이다. 지원 범위는 이 값이 MAX_BUFFER_BYTES(2 GiB) 이하인 크기로,
+예를 들어 64×64에서 Gaussian 8천 개, 256×256에서 5백 개 정도이다. 640×480에
+Gaussian 1만 개처럼 큰 장면은 약 200 GB가 필요하므로 SplatBuffers가 거부한다.
+큰 장면은 05처럼 Gaussian마다 3 sigma bounding box 안의 pixel만 계산해야 한다.
+"""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 04 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# parameter와 gradient 배열 묶음을 필드 이름으로 다루기 위해 dataclass와 fields를 가져온다.
+from dataclasses import dataclass, fields
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 반복 속도를 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+
+# 배열, 누적곱, 누적합 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 04 스크립트의 PNG 저장 함수를 재사용한다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+
+# 04와 같은 alpha 상한이다. 이 값에 걸린 pixel은 opacity와 모양에 대한 gradient가 0이다.
+ALPHA_MAX = 0.99
+# SplatBuffers가 만들 수 있는 작업 배열 크기 상한(byte)이다.
+MAX_BUFFER_BYTES = 2 * 2**30
+
+
+# 학습할 화면 공간 Gaussian parameter를 담는 dataclass를 정의한다.
+@dataclass
+class SplatParameters:
+    """배열 순서가 곧 앞에서 뒤로의 합성 순서인 2D Gaussian 묶음이다."""
+
+    # pixel 좌표 (u, v) 중심 shape (N, 2)이다.
+    means: np.ndarray
+    # 축 정렬 표준편차의 log shape (N, 2)이다. log 공간이라 항상 양수 scale이 된다.
+    log_scales: np.ndarray
+    # opacity shape (N,)이다.
+    opacities: np.ndarray
+    # RGB 색 shape (N, 3)이다.
+    colors: np.ndarray
+
+
+# gradient도 parameter와 같은 필드 구성이므로 같은 class를 재사용한다.
+SplatGradients = SplatParameters
+
+
+# forward와 backward가 함께 쓰는 (N, H×W) 작업 배열을 한 번만 만드는 class를 정의한다.
+class SplatBuffers:
+    """Gaussian 수와 화면 크기가 같으면 반복마다 새 배열을 만들지 않고 이 buffer를 재사용한다.
+
+    필요한 크기가 MAX_BUFFER_BYTES를 넘으면 배열을 만들기 전에 ValueError를 발생시킨다.
+    """
+
+    # 만들 buffer 전체의 byte 수를 계산하는 method를 정의한다.
+    @staticmethod
+    def required_bytes(count: int, image_height: int, image_width: int) -> int:
+        """float64 (N, P) 배열 8개, transmittance 마지막 행, RGB·좌표 5행, bool (N, P) 하나의 byte 합을 반환한다."""
+        # 전체 pixel 수를 계산한다.
+        pixel_count = image_height * image_width
+        # float64 원소는 8 byte, bool 원소는 1 byte이다.
+        return 8 * (8 * count + 6) * pixel_count + count * pixel_count
+
+    # Gaussian 수와 화면 크기에 맞춰 buffer를 만든다.
+    def __init__(self, count: int, image_height: int, image_width: int) -> None:
+        # 필요한 메모리를 먼저 계산한다.
+        required = self.required_bytes(count, image_height, image_width)
+        # 상한을 넘으면 수백 GB를 할당하려다 멈추기 전에 입력을 거부한다.
+        if required > MAX_BUFFER_BYTES:
+            # 필요한 크기와 대안을 설명하는 ValueError를 발생시킨다.
+            raise ValueError(f"Gaussian {count}개, {image_width}×{image_height}에는 작업 배열 {required / 2**30:.1f} GiB가 필요해 상한 {MAX_BUFFER_BYTES / 2**30:.0f} GiB를 넘습니다. Gaussian 수나 해상도를 줄이세요.")
+        # 화면 높이를 저장한다.
+        self.image_height = image_height
+        # 화면 너비를 저장한다.
+        self.image_width = image_width
+        # 전체 pixel 수를 계산한다.
+        pixel_count = image_height * image_width
+        # flat pixel의 y와 x 좌표를 만든다.
+        pixel_y, pixel_x = np.indices((image_height, image_width), dtype=np.float64)
+        # x 좌표를 shape (P,)로 펼쳐 저장한다.
+        self.pixel_x = pixel_x.reshape(-1)
+        # y 좌표를 shape (P,)로 펼쳐 저장한다.
+        self.pixel_y = pixel_y.reshape(-1)
+        # 중심까지의 x 차이 shape (N, P)이다.
+        self.delta_x = np.empty((count, pixel_count))
+        # 중심까지의 y 차이 shape (N, P)이다.
+        self.delta_y = np.empty((count, pixel_count))
+        # Gaussian weight g shape (N, P)이다.
+        self.gaussian = np.empty((count, pixel_count))
+        # 상한을 적용한 alpha shape (N, P)이다.
+        self.alpha = np.empty((count, pixel_count))
+        # i번째 Gaussian 앞까지 통과한 빛 T_i shape (N + 1, P)이다. 마지막 행은 배경에 닿는 빛이다.
+        self.transmittance = np.empty((count + 1, pixel_count))
+        # 합성 가중치 T_i α_i shape (N, P)이다.
+        self.weight = np.empty((count, pixel_count))
+        # 중간값을 담는 scratch buffer 두 개 shape (2, N, P)이다.
+        self.scratch = np.empty((2, count, pixel_count))
+        # alpha 상한에 걸리지 않은 위치를 표시하는 bool buffer shape (N, P)이다.
+        self.unclamped = np.empty((count, pixel_count), dtype=bool)
+        # 채널 평면 RGB 결과 shape (3, P)이다.
+        self.rgb = np.empty((3, pixel_count))
+
+
+# parameter로 영상을 렌더링하고 backward에 필요한 값을 buffer에 남기는 함수를 정의한다.
+def render_forward(parameters: SplatParameters, buffers: SplatBuffers, background_color: np.ndarray) -> np.ndarray:
+    """C = Σ_i T_i α_i c_i + T_N bg를 모든 Gaussian과 pixel에 대해 한 번에 계산해 (H, W, 3) view를 반환한다."""
+    # scratch buffer 하나를 임시 배열로 쓴다.
+    temporary = buffers.scratch[0]
+    # 1 / sx² = exp(-2 log sx)를 계산한다.
+    inverse_variance = np.exp(-2.0 * parameters.log_scales)
+    # 모든 Gaussian과 pixel의 x 차이를 buffer에 쓴다.
+    np.subtract(buffers.pixel_x, parameters.means[:, 0:1], out=buffers.delta_x)
+    # y 차이도 같은 방식으로 쓴다.
+    np.subtract(buffers.pixel_y, parameters.means[:, 1:2], out=buffers.delta_y)
+    # dx² / sx²를 임시 buffer에 계산한다.
+    np.multiply(buffers.delta_x, buffers.delta_x, out=temporary)
+    # x 분산으로 나눈다.
+    temporary *= inverse_variance[:, 0:1]
+    # dy² / sy²를 gaussian buffer에 계산한다.
+    np.multiply(buffers.delta_y, buffers.delta_y, out=buffers.gaussian)
+    # y 분산으로 나눈다.
+    buffers.gaussian *= inverse_variance[:, 1:2]
+    # 두 항을 더한다.
+    buffers.gaussian += temporary
+    # -0.5를 곱해 지수를 만든다.
+    buffers.gaussian *= -0.5
+    # 지수함수를 제자리에서 적용해 g를 만든다.
+    np.exp(buffers.gaussian, out=buffers.gaussian)
+    # α = opacity × g를 계산한다.
+    np.multiply(buffers.gaussian, parameters.opacities[:, None], out=buffers.alpha)
+    # 04처럼 α를 0.99로 제한한다.
+    np.minimum(buffers.alpha, ALPHA_MAX, out=buffers.alpha)
+    # 1 - α를 임시 buffer에 계산한다.
+    np.subtract(1.0, buffers.alpha, out=temporary)
+    # 첫 Gaussian 앞에서는 빛이 모두 남아 있다.
+    buffers.transmittance[0] = 1.0
+    # T_{i+1} = Π_{j≤i} (1 - α_j)를 Gaussian 축 누적곱으로 계산한다.
+    np.cumprod(temporary, axis=0, out=buffers.transmittance[1:])
+    # 합성 가중치 T_i α_i를 계산한다.
+    np.multiply(buffers.transmittance[:-1], buffers.alpha, out=buffers.weight)
+    # (3, N) @ (N, P) 행렬곱 한 번으로 Σ_i T_i α_i c_i를 계산한다.
+    np.matmul(parameters.colors.T, buffers.weight, out=buffers.rgb)
+    # 마지막까지 남은 빛에 배경색을 곱해 더한다.
+    buffers.rgb += background_color[:, None] * buffers.transmittance[-1]
+    # 채널 평면 배열을 (H, W, 3) view로 바꿔 반환한다.
+    return buffers.rgb.T.reshape(buffers.image_height, buffers.image_width, 3)
+
+
+# 영상 gradient를 parameter gradient로 역전파하는 함수를 정의한다.
+def render_backward(parameters: SplatParameters, buffers: SplatBuffers, grad_rgb: np.ndarray) -> SplatGradients:
+    """render_forward 직후의 buffer와 ∂L/∂C shape (H, W, 3)으로 네 parameter의 gradient를 계산한다.
+
+    ∂C/∂α_i = T_i c_i - (C - Σ_{j≤i} T_j α_j c_j) / (1 - α_i)이다. 채널 합 Σ_c ∂L/∂C_c를 먼저
+    취하면 뒤쪽 합은 (N, P) 누적합 한 번으로 계산된다.
+    """
+    # scratch buffer 두 개를 꺼낸다.
+    first, second = buffers.scratch
+    # ∂L/∂C를 채널 평면 shape (3, P) view로 바꾼다.
+    grad_planes = grad_rgb.reshape(-1, 3).T
+    # ∂L/∂c_i = Σ_p T_i α_i ∂L/∂C를 행렬곱으로 계산한다.
+    grad_colors = buffers.weight @ grad_planes.T
+    # Gaussian 색과 ∂L/∂C의 내적 c_i · ∂L/∂C_p를 shape (N, P)로 계산한다.
+    np.matmul(parameters.colors, grad_planes, out=first)
+    # pixel마다 C · ∂L/∂C를 계산한다.
+    total = np.einsum("cp,cp->p", buffers.rgb, grad_planes)
+    # T_i α_i (c_i · ∂L/∂C)를 second에 계산한다.
+    np.multiply(buffers.weight, first, out=second)
+    # 앞에서부터 누적합해 Σ_{j≤i} T_j α_j (c_j · ∂L/∂C)를 만든다.
+    np.cumsum(second, axis=0, out=second)
+    # 전체에서 빼면 i 뒤의 Gaussian과 배경이 만든 기여가 남는다.
+    np.subtract(total, second, out=second)
+    # alpha 상한에 걸리지 않은 위치를 bool buffer에 표시한다.
+    np.less(buffers.alpha, ALPHA_MAX, out=buffers.unclamped)
+    # T_i (c_i · ∂L/∂C)를 first에 계산한다.
+    first *= buffers.transmittance[:-1]
+    # weight는 더 쓰지 않으므로 그 buffer에 1 - α를 계산해 뒤쪽 기여를 나눈다. α ≤ 0.99이므로 0으로 나누지 않는다.
+    second /= np.subtract(1.0, buffers.alpha, out=buffers.weight)
+    # ∂L/∂α_i를 first에 완성한다.
+    first -= second
+    # alpha 상한에 걸린 위치는 opacity와 g가 α를 바꾸지 못하므로 gradient를 0으로 만든다.
+    first *= buffers.unclamped
+    # ∂L/∂o_i = Σ_p ∂L/∂α × g를 계산한다.
+    grad_opacities = np.einsum("np,np->n", first, buffers.gaussian)
+    # ∂L/∂g = ∂L/∂α × o를 first에 계산한다.
+    first *= parameters.opacities[:, None]
+    # g를 곱해 지수 항에 대한 gradient ∂L/∂g × g를 만든다.
+    first *= buffers.gaussian
+    # 1 / s²를 다시 계산한다.
+    inverse_variance = np.exp(-2.0 * parameters.log_scales)
+    # 중심과 log scale gradient를 담을 배열을 만든다.
+    grad_means, grad_log_scales = np.empty_like(parameters.means), np.empty_like(parameters.log_scales)
+    # x와 y 축을 차례로 처리한다.
+    for axis, delta in enumerate((buffers.delta_x, buffers.delta_y)):
+        # ∂L/∂g × g × d를 second에 계산한다.
+        np.multiply(first, delta, out=second)
+        # ∂g/∂μ = g d / s²이므로 합에 1 / s²를 곱한다.
+        grad_means[:, axis] = second.sum(axis=1) * inverse_variance[:, axis]
+        # d를 한 번 더 곱한다.
+        second *= delta
+        # ∂g/∂log s = g d² / s²이므로 합에 1 / s²를 곱한다.
+        grad_log_scales[:, axis] = second.sum(axis=1) * inverse_variance[:, axis]
+    # 네 gradient를 묶어 반환한다.
+    return SplatGradients(means=grad_means, log_scales=grad_log_scales, opacities=grad_opacities, colors=grad_colors)
+
+
+# 평균 제곱 오차와 그 gradient를 계산하는 함수를 정의한다.
+def mse_loss(rendered_rgb: np.ndarray, target_rgb: np.ndarray) -> tuple[float, np.ndarray]:
+    """L = mean((C - target)²)와 ∂L/∂C shape (H, W, 3)을 반환한다."""
+    # pixel별 오차를 계산한다.
+    error = rendered_rgb - target_rgb
+    # 평균 제곱 오차와 gradient 2 error / 원소 수를 반환한다.
+    return float(np.mean(error * error)), error * (2.0 / error.size)
+
+
+# Adam optimizer를 정의한다.
+class Adam:
+    """이름별 배열을 제자리에서 갱신하는 Adam이다. moment buffer도 한 번만 만든다."""
+
+    # 학습률과 moment buffer를 초기화한다.
+    def __init__(self, arrays: dict[str, np.ndarray], learning_rates: dict[str, float], beta1: float = 0.9, beta2: float = 0.999, epsilon: float = 1e-8) -> None:
+        # 갱신할 배열을 저장한다.
+        self.arrays = arrays
+        # 이름별 학습률을 저장한다.
+        self.learning_rates = learning_rates
+        # 1차 moment 감쇠율을 저장한다.
+        self.beta1 = beta1
+        # 2차 moment 감쇠율을 저장한다.
+        self.beta2 = beta2
+        # 0으로 나누지 않기 위한 작은 값을 저장한다.
+        self.epsilon = epsilon
+        # 1차 moment buffer를 0으로 만든다.
+        self.first_moments = {name: np.zeros_like(array) for name, array in arrays.items()}
+        # 2차 moment buffer를 0으로 만든다.
+        self.second_moments = {name: np.zeros_like(array) for name, array in arrays.items()}
+        # 갱신 횟수를 센다.
+        self.steps = 0
+
+    # gradient로 모든 배열을 한 번 갱신하는 method를 정의한다.
+    def step(self, gradients: dict[str, np.ndarray]) -> None:
+        """bias 보정한 Adam 갱신을 배열에 제자리로 적용한다."""
+        # 갱신 횟수를 늘린다.
+        self.steps += 1
+        # 1차 moment의 bias 보정 계수를 계산한다.
+        correction1 = 1.0 - self.beta1**self.steps
+        # 2차 moment의 bias 보정 계수를 계산한다.
+        correction2 = 1.0 - self.beta2**self.steps
+        # 배열을 하나씩 갱신한다.
+        for name, array in self.arrays.items():
+            # 현재 gradient를 꺼낸다.
+            gradient = gradients[name]
+            # 1차 moment m = β1 m + (1 - β1) g를 제자리에서 계산한다.
+            first = self.first_moments[name]
+            # 감쇠를 적용한다.
+            first *= self.beta1
+            # 새 gradient를 더한다.
+            first += (1.0 - self.beta1) * gradient
+            # 2차 moment v = β2 v + (1 - β2) g²를 제자리에서 계산한다.
+            second = self.second_moments[name]
+            # 감쇠를 적용한다.
+            second *= self.beta2
+            # 새 gradient 제곱을 더한다.
+            second += (1.0 - self.beta2) * gradient * gradient
+            # lr m̂ / (sqrt(v̂) + ε)만큼 배열을 제자리에서 옮긴다.
+            array -= self.learning_rates[name] * (first / correction1) / (np.sqrt(second / correction2) + self.epsilon)
+
+
+# Gaussian을 목표 영상에 맞추는 함수를 정의한다.
+def fit_image(target_rgb: np.ndarray, count: int, iterations: int, seed: int = 0, background_color: np.ndarray | None = None) -> tuple[SplatParameters, list[float], float]:
+    """무작위로 흩은 count개 Gaussian을 Adam으로 맞추고 (parameter, loss 기록, 초당 반복 수)를 반환한다."""
+    # 목표 영상 크기를 읽는다.
+    image_height, image_width = target_rgb.shape[:2]
+    # 배경색을 검은색으로 기본 설정한다.
+    background_color = np.zeros(3) if background_color is None else background_color
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(seed)
+    # 중심은 화면 전체에 고르게, scale은 Gaussian들이 화면을 대략 덮는 크기로 시작한다.
+    parameters = SplatParameters(means=rng.uniform([0.0, 0.0], [image_width - 1.0, image_height - 1.0], size=(count, 2)), log_scales=np.full((count, 2), np.log(0.5 * np.sqrt(image_height * image_width / count))), opacities=np.full(count, 0.5), colors=np.full((count, 3), 0.5))
+    # opacity는 (0, 1) 밖으로 나가지 않도록 logit 공간에서 학습한다.
+    opacity_logits = np.zeros(count)
+    # 반복마다 재사용할 buffer를 한 번 만든다.
+    buffers = SplatBuffers(count, image_height, image_width)
+    # 이름별 학습률로 Adam을 만든다.
+    optimizer = Adam({"means": parameters.means, "log_scales": parameters.log_scales, "opacity_logits": opacity_logits, "colors": parameters.colors}, {"means": 0.5, "log_scales": 0.05, "opacity_logits": 0.1, "colors": 0.05})
+    # loss 기록을 저장할 list를 만든다.
+    losses = []
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # 지정한 횟수만큼 반복한다.
+    for _ in range(iterations):
+        # logit에 sigmoid를 적용해 opacity를 제자리에서 갱신한다.
+        np.divide(1.0, 1.0 + np.exp(-opacity_logits), out=parameters.opacities)
+        # 영상을 렌더링한다.
+        rendered_rgb = render_forward(parameters, buffers, background_color)
+        # loss와 영상 gradient를 계산한다.
+        loss, grad_rgb = mse_loss(rendered_rgb, target_rgb)
+        # loss를 기록한다.
+        losses.append(loss)
+        # parameter gradient를 계산한다.
+        gradients = render_backward(parameters, buffers, grad_rgb)
+        # sigmoid 미분 o (1 - o)를 곱해 logit gradient로 바꾸고 Adam으로 갱신한다.
+        optimizer.step({"means": gradients.means, "log_scales": gradients.log_scales, "opacity_logits": gradients.opacities * parameters.opacities * (1.0 - parameters.opacities), "colors": gradients.colors})
+        # 색을 0~1 범위로 되돌린다.
+        np.clip(parameters.colors, 0.0, 1.0, out=parameters.colors)
+    # 초당 반복 수를 계산한다.
+    iterations_per_s = iterations / (perf_counter() - started_at)
+    # 마지막 opacity를 갱신한다.
+    np.divide(1.0, 1.0 + np.exp(-opacity_logits), out=parameters.opacities)
+    # parameter, loss 기록, 속도를 반환한다.
+    return parameters, losses, iterations_per_s
+
+
+# 맞출 목표 영상을 만드는 함수를 정의한다.
+def target_image(image_height: int, image_width: int) -> np.ndarray:
+    """빨간 원, 파란 사각형, 초록 띠가 있는 (H, W, 3) 영상을 만든다."""
+    # pixel 좌표 격자를 만든다.
+    pixel_y, pixel_x = np.indices((image_height, image_width), dtype=np.float64)
+    # 검은 배경 영상을 만든다.
+    image = np.zeros((image_height, image_width, 3))
+    # 가로 위치에 따라 밝아지는 초록 띠를 아래쪽에 그린다.
+    image[pixel_y > 0.8 * image_height, 1] = (pixel_x / image_width)[pixel_y > 0.8 * image_height]
+    # 왼쪽 위에 빨간 원을 그린다.
+    image[(pixel_x - 0.35 * image_width) ** 2 + (pixel_y - 0.4 * image_height) ** 2 < (0.22 * image_height) ** 2] = [0.9, 0.2, 0.1]
+    # 오른쪽에 파란 사각형을 그린다.
+    image[(np.abs(pixel_x - 0.7 * image_width) < 0.15 * image_width) & (np.abs(pixel_y - 0.45 * image_height) < 0.2 * image_height)] = [0.1, 0.3, 0.9]
+    # 목표 영상을 반환한다.
+    return image
+
+
+# 맞추기 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """64×64 목표 영상에 Gaussian 128개를 200번 맞추고 초당 반복 수를 출력한다."""
+    # 목표 영상을 만든다.
+    target_rgb = target_image(64, 64)
+    # Gaussian을 맞춘다.
+    parameters, losses, iterations_per_s = fit_image(target_rgb, count=128, iterations=200)
+    # 마지막 parameter로 다시 렌더링한다.
+    fitted_rgb = render_forward(parameters, SplatBuffers(len(parameters.means), 64, 64), np.zeros(3))
+    # 최대값 1 기준 PSNR을 계산한다.
+    psnr = -10.0 * np.log10(np.mean((fitted_rgb - target_rgb) ** 2))
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # 결과 이미지 경로를 만든다.
+    output_path = output_dir / "11_differentiable_splat.png"
+    # 목표와 결과를 가로로 붙여 저장한다.
+    mini_splat.save_rgb_image(output_path, np.concatenate([target_rgb, fitted_rgb], axis=1))
+    # parameter 수를 출력한다.
+    print(f"parameters: {sum(getattr(parameters, item.name).size for item in fields(parameters))}")
+    # 처음과 마지막 loss, PSNR을 출력한다.
+    print(f"loss: {losses[0]:.4f} -> {losses[-1]:.4f}, PSNR {psnr:.1f} dB")
+    # 초당 반복 수를 출력한다.
+    print(f"{iterations_per_s:.1f} iterations/s")
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"저장 완료: {output_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # 미분 가능한 splat 예제를 시작한다.
+    main()
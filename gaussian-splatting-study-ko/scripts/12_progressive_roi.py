@@ -0,0 +1,142 @@
+"""화면 일부(ROI)만 렌더링하거나, 성긴 pixel부터 점점 촘촘하게 채우는 progressive 렌더링을 한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 이름 앞에 숫자가 붙은 04, 05 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 렌더링 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+# progressive 결과 generator의 자료형을 설명하기 위해 Iterator를 가져온다.
+from typing import Iterator
+
+# 배열과 pixel 좌표 계산을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 04 스크립트의 pixel 단위 합성과 PNG 저장 함수를 재사용한다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+# 05 스크립트의 무작위 장면 생성을 재사용한다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+
+# progressive 렌더링에서 차례로 쓸 pixel 간격이다. 각 값은 앞 값의 약수이고 마지막은 1이다.
+PROGRESSIVE_STRIDES = (8, 4, 2, 1)
+
+
+# 화면의 사각형 영역만 렌더링하는 함수를 정의한다.
+def render_window(means_3d: np.ndarray, scales_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, window: tuple[int, int, int, int], background_color: np.ndarray, stats: mini_splat.RenderStats | None = None, dtype: np.dtype | type = np.float64) -> tuple[np.ndarray, np.ndarray]:
+    """window = (x0, y0, x1, y1)은 slice처럼 끝을 포함하지 않으며, 결과는 전체 영상의 [y0:y1, x0:x1]과 같다."""
+    # 사각형 좌표를 꺼낸다.
+    x0, y0, x1, y1 = window
+    # 비어 있거나 뒤집힌 사각형은 ValueError로 거부한다.
+    if x1 <= x0 or y1 <= y0:
+        # 잘못된 window를 알린다.
+        raise ValueError(f"window는 x0 < x1, y0 < y1이어야 합니다: {window}")
+    # 사각형 안 pixel 좌표 격자를 만든다.
+    pixel_y, pixel_x = np.mgrid[y0:y1, x0:x1]
+    # 사각형 pixel만 합성한다. culling도 사각형 기준으로 수행된다.
+    rgb, alpha = mini_splat.render_pixels(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, pixel_x.reshape(-1), pixel_y.reshape(-1), background_color, stats=stats, dtype=dtype)
+    # flat 결과를 사각형 영상 모양으로 되돌려 반환한다.
+    return rgb.reshape(y1 - y0, x1 - x0, 3), alpha.reshape(y1 - y0, x1 - x0)
+
+
+# 성긴 pixel부터 계산하며 중간 영상을 차례로 내보내는 generator를 정의한다.
+def render_progressive(means_3d: np.ndarray, scales_3d: np.ndarray, colors_rgb: np.ndarray, opacities: np.ndarray, intrinsic_matrix: np.ndarray, image_height: int, image_width: int, background_color: np.ndarray, strides: tuple[int, ...] = PROGRESSIVE_STRIDES, stats: mini_splat.RenderStats | None = None) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """간격마다 (간격, RGB 미리보기 (H, W, 3), alpha 미리보기 (H, W))를 yield한다.
+
+    간격 s 단계에서는 x, y가 모두 s의 배수인 pixel 중 아직 계산하지 않은 것만 합성하고,
+    나머지 pixel은 s×s 블록 왼쪽 위 pixel 값으로 채운다. 모든 pixel은 한 번만 계산되므로
+    전체 비용은 render_gaussians 한 번과 같고, 마지막 단계 결과는 render_gaussians와 같다.
+    """
+    # 간격 목록이 1로 끝나는지 검사한다.
+    if not strides or strides[-1] != 1:
+        # 마지막 단계가 전체 해상도가 아니면 ValueError로 거부한다.
+        raise ValueError("strides의 마지막 값은 1이어야 합니다.")
+    # 각 간격이 앞 간격의 약수인지 검사한다.
+    if any(previous % current for previous, current in zip(strides, strides[1:])):
+        # 앞 단계 pixel이 다음 단계 격자에 포함되지 않으면 ValueError로 거부한다.
+        raise ValueError("strides의 각 값은 앞 값의 약수여야 합니다.")
+    # 전체 RGB 결과를 저장할 배열을 만든다.
+    rgb = np.zeros((image_height, image_width, 3))
+    # 전체 alpha 결과를 저장할 배열을 만든다.
+    alpha = np.zeros((image_height, image_width))
+    # 이미 계산한 pixel을 표시할 bool 배열을 만든다.
+    done = np.zeros((image_height, image_width), dtype=bool)
+    # pixel 좌표 격자를 만든다.
+    pixel_y, pixel_x = np.indices((image_height, image_width))
+    # 간격을 큰 것부터 차례로 처리한다.
+    for stride in strides:
+        # 이번 간격 격자 위에서 아직 계산하지 않은 pixel을 고른다.
+        todo = (pixel_x % stride == 0) & (pixel_y % stride == 0) & ~done
+        # 고른 pixel만 합성한다.
+        todo_rgb, todo_alpha = mini_splat.render_pixels(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, pixel_x[todo], pixel_y[todo], background_color, stats=stats)
+        # RGB 결과를 제자리에 쓴다.
+        rgb[todo] = todo_rgb
+        # alpha 결과를 제자리에 쓴다.
+        alpha[todo] = todo_alpha
+        # 계산한 pixel을 표시한다.
+        done |= todo
+        # 간격 1이면 전체 영상이 완성되었으므로 그대로 내보낸다.
+        if stride == 1:
+            # 완성된 영상을 yield한다.
+            yield stride, rgb, alpha
+        # 간격이 1보다 크면 격자 pixel 값을 s×s 블록으로 늘려 미리보기를 만든다.
+        else:
+            # 격자 pixel을 세로와 가로로 반복한 뒤 화면 크기로 자른 RGB와 alpha를 yield한다.
+            yield stride, rgb[::stride, ::stride].repeat(stride, axis=0).repeat(stride, axis=1)[:image_height, :image_width], alpha[::stride, ::stride].repeat(stride, axis=0).repeat(stride, axis=1)[:image_height, :image_width]
+
+
+# ROI와 progressive 예제를 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """무작위 Gaussian 300개를 640×480으로 progressive 렌더링하고, 64×64 ROI 비용과 비교한다."""
+    # 출력 영상 높이를 480 pixel로 설정한다.
+    image_height = 480
+    # 출력 영상 너비를 640 pixel로 설정한다.
+    image_width = 640
+    # 04와 같은 K를 만든다.
+    intrinsic_matrix = np.array([[520.0, 0.0, image_width / 2.0], [0.0, 520.0, image_height / 2.0], [0.0, 0.0, 1.0]])
+    # 05의 무작위 장면을 만든다(04는 등방성이므로 회전은 쓰지 않는다).
+    means_3d, scales_3d, _, colors_rgb, opacities = ewa.random_scene(300)
+    # 04와 같은 어두운 배경색을 설정한다.
+    background_color = np.array([0.025, 0.035, 0.055])
+    # 출력 디렉터리 경로 객체를 만든다.
+    output_dir = Path("outputs")
+    # 출력 디렉터리와 필요한 상위 디렉터리를 생성한다.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # progressive 통계 객체를 만든다.
+    progressive_stats = mini_splat.RenderStats()
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # 단계별 미리보기를 받는다.
+    for stride, rgb, _ in render_progressive(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, image_height, image_width, background_color, stats=progressive_stats):
+        # 단계별 누적 시간과 누적 평가 수를 출력한다.
+        print(f"stride {stride}: {perf_counter() - started_at:.2f} s, evaluated {progressive_stats.evaluated}")
+        # 단계별 미리보기를 저장한다.
+        mini_splat.save_rgb_image(output_dir / f"12_progressive_stride{stride}.png", rgb)
+    # ROI 사각형을 화면 중앙 64×64로 정한다.
+    window = (288, 208, 352, 272)
+    # ROI 통계 객체를 만든다.
+    window_stats = mini_splat.RenderStats()
+    # 시작 시각을 기록한다.
+    started_at = perf_counter()
+    # ROI만 렌더링한다.
+    window_rgb, _ = render_window(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, window, background_color, stats=window_stats)
+    # ROI 시간을 계산한다.
+    window_s = perf_counter() - started_at
+    # ROI 결과와 전체 결과의 같은 위치 차이를 계산한다.
+    difference = np.abs(window_rgb - rgb[window[1] : window[3], window[0] : window[2]]).max()
+    # ROI 비용, 잘라낸 Gaussian 수, 전체와의 차이를 출력한다.
+    print(f"ROI 64x64: {window_s:.3f} s, evaluated {window_stats.evaluated}, culled {window_stats.culled.total}/{len(means_3d)}, max diff vs full {difference:.1e}")
+    # ROI 결과 경로를 만든다.
+    window_path = output_dir / "12_roi.png"
+    # ROI 결과를 저장한다.
+    mini_splat.save_rgb_image(window_path, window_rgb)
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"ROI 저장 완료: {window_path.resolve()}")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # ROI와 progressive 렌더링 예제를 시작한다.
+    main()
@@ -0,0 +1,291 @@
+"""gaussian_2d와 render_gaussians를 Gaussian 수·해상도·dtype별로 측정해 JSON으로 남기고, 이전 결과와 비교한다.
+
+사용법:
+    python scripts/13_benchmark_suite.py                          # 빠른 확인용 작은 sweep
+    python scripts/13_benchmark_suite.py --full --output new.json  # 10~10⁵개, 240p~1080p sweep(기본 예산 2e9)
+    python scripts/13_benchmark_suite.py --full --compare old.json # 이전 commit 결과와 비교
+    python scripts/13_benchmark_suite.py --full --budget 1e10      # 예산을 바꿔 더 큰 경우까지 측정
+    python scripts/13_benchmark_suite.py --full --no-budget        # 수십 분 걸리는 경우까지 모두 측정
+"""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 명령행 인자를 해석하기 위해 argparse를 가져온다.
+import argparse
+# 이름 앞에 숫자가 붙은 02, 04, 05, 07 스크립트를 문자열 이름으로 import하기 위해 importlib를 가져온다.
+import importlib
+# 결과를 JSON 파일로 저장하고 읽기 위해 json을 가져온다.
+import json
+# 실행 환경을 결과에 기록하기 위해 platform을 가져온다.
+import platform
+# 비교에서 회귀가 있으면 종료 코드로 알리기 위해 sys를 가져온다.
+import sys
+# 출력 파일 경로와 폴더를 다루기 위해 Path를 가져온다.
+from pathlib import Path
+# 실행 시간을 고해상도 monotonic clock으로 재기 위해 perf_counter를 가져온다.
+from time import perf_counter
+# 측정할 함수의 자료형을 설명하기 위해 Callable을 가져온다.
+from typing import Callable
+
+# 배열과 난수 장면 생성을 위해 NumPy를 np라는 별칭으로 가져온다.
+import numpy as np
+
+# 02 스크립트의 gaussian_2d와 covariance_2d를 재사용한다.
+gaussian_2d_script = importlib.import_module("02_gaussian_2d")
+# 04 스크립트의 render_gaussians와 RenderStats를 재사용한다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+# 05 스크립트의 무작위 장면 생성을 재사용한다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+# 07 스크립트의 tracemalloc 측정 함수를 재사용한다.
+precision = importlib.import_module("07_precision_benchmark")
+
+# 16:9 해상도 이름별 (너비, 높이)이다.
+RESOLUTIONS = {"240p": (426, 240), "480p": (854, 480), "720p": (1280, 720), "1080p": (1920, 1080)}
+# 전체 sweep의 Gaussian 수이다.
+FULL_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+# 빠른 sweep의 Gaussian 수이다.
+QUICK_COUNTS = (10, 100)
+# 측정할 dtype 이름이다.
+DTYPES = ("float64", "float32")
+# 빠른 sweep의 Gaussian-pixel 평가 수 상한 기본값이다. 추정 평가 수가 넘는 경우는 skipped로 기록한다.
+DEFAULT_BUDGET = 200_000_000
+# 전체 sweep의 평가 수 상한 기본값이다. 한 경우가 대략 1분을 넘지 않는 크기이다.
+FULL_BUDGET = 2_000_000_000
+# 최대 메모리는 Gaussian을 이 수 이하로 줄인 같은 해상도·dtype 장면에서 잰다.
+MEMORY_COUNT = 100
+# render_gaussians 평가 수를 추정할 때 가로·세로로 이 간격마다 한 pixel만 렌더링한다.
+SAMPLE_STRIDE = 16
+# 이전 결과보다 이 배율 이상 느리면 회귀로 표시한다.
+DEFAULT_THRESHOLD = 1.25
+
+
+# gaussian_2d 측정 함수를 만드는 함수를 정의한다.
+def gaussian_2d_case(count: int, width: int, height: int, dtype: str) -> tuple[Callable[[], int], Callable[[], int]]:
+    """같은 격자에 Gaussian count개를 buffer를 재사용하며 평가하는 함수와 평가 수 추정 함수를 반환한다."""
+    # (H, W, 2) 좌표 격자를 지정한 dtype으로 만든다.
+    pixel_grid = np.dstack(np.meshgrid(np.arange(width), np.arange(height))).astype(dtype)
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(0)
+    # 화면 안의 무작위 중심을 만든다.
+    means = rng.uniform([0.0, 0.0], [width, height], size=(count, 2))
+    # 07과 같은 비율의 회전 covariance를 만든다.
+    covariance = gaussian_2d_script.covariance_2d(scale_x=0.11 * width, scale_y=0.07 * height, angle_degrees=35.0)
+    # 측정 함수 안에서 실행할 반복 평가를 정의한다.
+    def run() -> int:
+        # 출력 buffer를 한 번 만든다.
+        out = np.empty((height, width), dtype=dtype)
+        # x 차이와 y 차이용 scratch buffer를 한 번 만든다.
+        scratch = np.empty((2, height, width), dtype=dtype)
+        # Gaussian을 하나씩 평가한다.
+        for mean in means:
+            # buffer를 재사용해 평가한다.
+            gaussian_2d_script.gaussian_2d(pixel_grid, mean, covariance, out=out, scratch=scratch)
+        # 평가한 Gaussian-pixel 쌍의 수를 반환한다.
+        return count * width * height
+    # gaussian_2d는 모든 쌍을 계산하므로 추정 함수는 정확한 평가 수를 돌려준다.
+    return run, lambda: count * width * height
+
+
+# render_gaussians 측정 함수를 만드는 함수를 정의한다.
+def render_case(count: int, width: int, height: int, dtype: str) -> tuple[Callable[[], int], Callable[[], int]]:
+    """05의 무작위 장면을 04로 렌더링해 실제 평가 수를 반환하는 함수와 평가 수 추정 함수를 반환한다."""
+    # 05의 무작위 장면을 만든다(04는 등방성이므로 회전은 쓰지 않는다).
+    means_3d, scales_3d, _, colors_rgb, opacities = ewa.random_scene(count)
+    # 640 너비에서 520인 04의 화각을 유지하도록 focal length를 너비에 비례시킨다.
+    intrinsic_matrix = np.array([[0.8125 * width, 0.0, width / 2.0], [0.0, 0.8125 * width, height / 2.0], [0.0, 0.0, 1.0]])
+    # 측정 함수 안에서 실행할 렌더링을 정의한다.
+    def run() -> int:
+        # 평가 수를 셀 통계 객체를 만든다.
+        stats = mini_splat.RenderStats()
+        # 지정한 dtype으로 렌더링한다.
+        mini_splat.render_gaussians(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, height, width, np.zeros(3), stats=stats, dtype=dtype)
+        # early termination과 culling 뒤 실제로 계산한 쌍의 수를 반환한다.
+        return stats.evaluated
+    # 표본 pixel만 렌더링해 전체 평가 수를 추정하는 함수를 정의한다.
+    def estimate() -> int:
+        # SAMPLE_STRIDE 간격 격자의 가운데 pixel을 고른다.
+        pixel_y, pixel_x = np.mgrid[SAMPLE_STRIDE // 2 : height : SAMPLE_STRIDE, SAMPLE_STRIDE // 2 : width : SAMPLE_STRIDE]
+        # 평가 수를 셀 통계 객체를 만든다.
+        stats = mini_splat.RenderStats()
+        # 표본 pixel만 합성한다. culling과 early termination은 전체 렌더링과 같게 적용된다.
+        mini_splat.render_pixels(means_3d, scales_3d, colors_rgb, opacities, intrinsic_matrix, pixel_x.reshape(-1), pixel_y.reshape(-1), np.zeros(3), stats=stats, dtype=dtype)
+        # 표본 pixel당 평가 수를 전체 pixel 수로 늘려 반환한다.
+        return round(stats.evaluated * width * height / pixel_x.size)
+    # 측정 함수와 추정 함수를 반환한다.
+    return run, estimate
+
+
+# 측정 대상 이름별 case 생성 함수이다.
+CASES = {"gaussian_2d": gaussian_2d_case, "render_gaussians": render_case}
+
+
+# 한 경우를 측정하는 함수를 정의한다.
+def run_case(function_name: str, count: int, resolution: str, dtype: str, budget: float | None = DEFAULT_BUDGET, repeat: int = 1) -> dict[str, object]:
+    """repeat번 중 가장 빠른 시간, tracemalloc 최대 메모리, 평가 수를 dict로 반환한다.
+
+    budget이 있으면 먼저 평가 수를 추정하고(render_gaussians는 표본 pixel 렌더링),
+    추정값이 budget을 넘으면 측정하지 않고 skipped로 기록한다. None이면 항상 측정한다.
+    tracemalloc은 시간을 부풀리므로 최대 메모리는 Gaussian을 MEMORY_COUNT개 이하로
+    줄인 경우에서 한 번 재고, 잰 개수를 peak_count로 남긴다. 두 함수의 메모리는
+    대부분 해상도에 비례하는 buffer라 Gaussian 수를 줄여도 크게 달라지지 않는다.
+    """
+    # 해상도 이름을 너비와 높이로 바꾼다.
+    width, height = RESOLUTIONS[resolution]
+    # 결과 dict의 공통 필드를 만든다.
+    row: dict[str, object] = {"key": f"{function_name}/{count}/{resolution}/{dtype}", "function": function_name, "count": count, "resolution": resolution, "width": width, "height": height, "dtype": dtype}
+    # 측정 함수와 평가 수 추정 함수를 만든다.
+    function, estimate = CASES[function_name](count, width, height, dtype)
+    # 예산이 있으면 추정 평가 수와 비교한다.
+    if budget is not None:
+        # 평가 수를 추정한다.
+        estimated = estimate()
+        # 추정 평가 수가 예산을 넘으면 측정하지 않는다.
+        if estimated > budget:
+            # skipped로 표시하고 추정값을 함께 기록한 결과를 반환한다.
+            return {**row, "skipped": True, "estimated_evaluations": estimated}
+    # 가장 빠른 시간을 저장할 변수를 만든다.
+    best_s = float("inf")
+    # 지정한 횟수만큼 반복한다.
+    for _ in range(repeat):
+        # 시작 시각을 기록한다.
+        started_at = perf_counter()
+        # 측정 함수를 실행하고 평가 수를 받는다.
+        evaluations = function()
+        # 가장 빠른 시간을 갱신한다. tracemalloc이 꺼져 있어야 시간이 부풀지 않는다.
+        best_s = min(best_s, perf_counter() - started_at)
+    # 최대 메모리를 잴 Gaussian 수를 정한다.
+    peak_count = min(count, MEMORY_COUNT)
+    # 줄인 경우가 같으면 측정 함수를 그대로 쓰고, 아니면 작은 장면의 함수를 만든다.
+    memory_function = function if peak_count == count else CASES[function_name](peak_count, width, height, dtype)[0]
+    # tracemalloc은 할당마다 기록해 느려지므로 최대 메모리는 작은 경우에서 한 번 잰다.
+    _, peak_mib = precision.measure(memory_function)
+    # 측정 결과를 더한 dict를 반환한다.
+    return {**row, "skipped": False, "time_s": best_s, "peak_mib": peak_mib, "peak_count": peak_count, "evaluations": evaluations, "evaluations_per_s": evaluations / best_s}
+
+
+# 명령행 선택에서 평가 수 예산을 정하는 함수를 정의한다.
+def resolve_budget(full: bool, budget: float | None, no_budget: bool) -> float | None:
+    """no_budget이면 None, budget을 주면 그 값, 아니면 sweep 종류별 기본 예산을 반환한다."""
+    # 예산을 끄는 것은 명시적으로 요청했을 때뿐이다.
+    if no_budget:
+        # None은 모든 경우를 측정한다는 뜻이다.
+        return None
+    # 직접 준 예산이 있으면 그 값을 쓴다.
+    if budget is not None:
+        # 요청한 예산을 반환한다.
+        return budget
+    # 전체 sweep과 빠른 sweep의 기본 예산 중 하나를 반환한다.
+    return FULL_BUDGET if full else DEFAULT_BUDGET
+
+
+# 이전 결과와 비교해 느려진 경우를 찾는 함수를 정의한다.
+def compare_results(baseline: list[dict[str, object]], current: list[dict[str, object]], threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, float]]:
+    """두 결과에 모두 측정된 같은 key에서 time_s 비율이 threshold 이상인 (key, 비율) 목록을 반환한다."""
+    # 이전 결과를 key로 찾을 수 있게 dict로 바꾼다.
+    previous = {row["key"]: row for row in baseline if not row["skipped"]}
+    # 회귀 목록을 만든다.
+    regressions = []
+    # 현재 결과를 하나씩 비교한다.
+    for row in current:
+        # 둘 다 측정된 경우만 비교한다.
+        if row["skipped"] or row["key"] not in previous:
+            # 비교할 수 없으면 건너뛴다.
+            continue
+        # 현재 시간 / 이전 시간 비율을 계산한다.
+        ratio = row["time_s"] / previous[row["key"]]["time_s"]
+        # 기준 이상 느려졌으면 회귀로 기록한다.
+        if ratio >= threshold:
+            # key와 비율을 저장한다.
+            regressions.append((row["key"], ratio))
+    # 회귀 목록을 반환한다.
+    return regressions
+
+
+# benchmark sweep을 실행하는 main 함수를 정의한다.
+def main() -> None:
+    """sweep 결과 표를 출력하고 JSON으로 저장한다. --compare가 있으면 회귀 시 종료 코드 1로 끝낸다."""
+    # 명령행 인자 parser를 만든다.
+    parser = argparse.ArgumentParser(description="gaussian_2d와 render_gaussians의 Gaussian 수·해상도·dtype sweep benchmark")
+    # 전체 sweep 여부를 받는다.
+    parser.add_argument("--full", action="store_true", help=f"Gaussian 10~10⁵개, 240p~1080p 전체 sweep(기본 예산 {FULL_BUDGET:.0e})")
+    # 예산 값과 예산 끄기는 함께 줄 수 없게 묶는다.
+    budget_group = parser.add_mutually_exclusive_group()
+    # 평가 수 예산을 받는다.
+    budget_group.add_argument("--budget", type=float, help=f"추정 Gaussian-pixel 평가 수가 이보다 큰 경우는 건너뜀(기본: 빠른 sweep {DEFAULT_BUDGET:.0e}, --full {FULL_BUDGET:.0e})")
+    # 예산 없이 모든 경우를 재겠다는 명시적 선택을 받는다.
+    budget_group.add_argument("--no-budget", action="store_true", help="예산 없이 모든 경우를 측정. --full에서는 한 경우에 수십 분 걸릴 수 있음")
+    # 반복 횟수를 받는다.
+    parser.add_argument("--repeat", type=int, default=1, help="시간은 이 횟수 중 최솟값을 기록")
+    # 결과 JSON 경로를 받는다.
+    parser.add_argument("--output", type=Path, default=Path("outputs") / "13_benchmark_suite.json")
+    # 비교할 이전 JSON 경로를 받는다.
+    parser.add_argument("--compare", type=Path, help="이전 결과 JSON")
+    # 회귀 기준 배율을 받는다.
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    # 인자를 해석한다.
+    arguments = parser.parse_args()
+    # sweep할 Gaussian 수를 정한다.
+    counts = FULL_COUNTS if arguments.full else QUICK_COUNTS
+    # sweep할 해상도를 정한다.
+    resolutions = tuple(RESOLUTIONS) if arguments.full else ("240p",)
+    # 명령행 선택에 맞는 평가 수 예산을 정한다.
+    budget = resolve_budget(arguments.full, arguments.budget, arguments.no_budget)
+    # 결과 행을 저장할 list를 만든다.
+    rows = []
+    # 표 머리글을 출력한다.
+    print(f"{'case':<36} {'time s':>8} {'peak MiB':>9} {'evals':>12} {'Mevals/s':>9}")
+    # 측정 대상, Gaussian 수, 해상도, dtype의 모든 조합을 측정한다.
+    for function_name in CASES:
+        # Gaussian 수를 차례로 바꾼다.
+        for count in counts:
+            # 해상도를 차례로 바꾼다.
+            for resolution in resolutions:
+                # dtype을 차례로 바꾼다.
+                for dtype in DTYPES:
+                    # 한 경우를 측정한다.
+                    row = run_case(function_name, count, resolution, dtype, budget=budget, repeat=arguments.repeat)
+                    # 결과 행을 저장한다.
+                    rows.append(row)
+                    # 건너뛴 경우는 표시만 한다.
+                    if row["skipped"]:
+                        # 예산 초과로 건너뛰었음을 추정 평가 수와 함께 출력한다.
+                        print(f"{row['key']:<36} {'skipped (budget)':>30} {row['estimated_evaluations']:>12}")
+                    # 측정한 경우는 표의 한 줄을 출력한다.
+                    else:
+                        # 시간, 메모리, 평가 수, 처리량을 출력한다.
+                        print(f"{row['key']:<36} {row['time_s']:>8.3f} {row['peak_mib']:>9.1f} {row['evaluations']:>12} {row['evaluations_per_s'] / 1e6:>9.1f}")
+    # 출력 파일의 상위 폴더를 만든다.
+    arguments.output.parent.mkdir(parents=True, exist_ok=True)
+    # 실행 환경과 결과를 JSON으로 저장한다.
+    arguments.output.write_text(json.dumps({"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(), "budget": budget, "repeat": arguments.repeat, "rows": rows}, indent=2), encoding="utf-8")
+    # 저장된 파일의 절대 경로를 출력한다.
+    print(f"저장 완료: {arguments.output.resolve()}")
+    # 요청했지만 측정하지 않은 경우를 모은다.
+    skipped = [row["key"] for row in rows if row["skipped"]]
+    # 건너뛴 경우가 있으면 결과만 보고 빠진 줄 모르는 일이 없도록 목록을 다시 출력한다.
+    if skipped:
+        # 건너뛴 수, 예산과 key 목록을 출력한다.
+        print(f"skipped {len(skipped)}/{len(rows)} cases over budget {budget:.3g}: {', '.join(skipped)}")
+    # 비교할 이전 결과가 없으면 끝낸다.
+    if arguments.compare is None:
+        # 비교 없이 끝낸다.
+        return
+    # 이전 결과를 읽어 비교한다.
+    regressions = compare_results(json.loads(arguments.compare.read_text(encoding="utf-8"))["rows"], rows, arguments.threshold)
+    # 회귀를 하나씩 출력한다.
+    for key, ratio in regressions:
+        # key와 느려진 배율을 출력한다.
+        print(f"REGRESSION {key}: {ratio:.2f}x")
+    # 회귀가 있으면 종료 코드 1로 끝낸다.
+    if regressions:
+        # CI가 실패로 인식하도록 종료 코드를 정한다.
+        sys.exit(1)
+    # 회귀가 없음을 출력한다.
+    print(f"no regression (threshold {arguments.threshold:.2f}x)")
+
+
+# 이 파일을 직접 실행했을 때만 main 함수를 호출한다.
+if __name__ == "__main__":
+    # benchmark sweep을 시작한다.
+    main()
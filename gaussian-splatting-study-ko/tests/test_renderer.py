@@ -0,0 +1,579 @@
+"""scripts 폴더의 렌더러 함수를 직접 import해 수치 결과를 검사한다."""
+
+# 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
+from __future__ import annotations
+
+# 숫자로 시작하는 스크립트 파일을 module 이름 문자열로 import하기 위해 importlib를 가져온다.
+import importlib
+# scripts 폴더를 import 경로에 추가하기 위해 sys를 가져온다.
+import sys
+# 파일 경로를 운영체제와 무관하게 조합하기 위해 Path를 가져온다.
+from pathlib import Path
+
+# 배열 비교와 난수 장면 생성을 위해 NumPy를 가져온다.
+import numpy as np
+# 예외 검사를 위해 pytest를 가져온다.
+import pytest
+
+# 이 test 파일 기준으로 학습 폴더의 scripts 경로를 만든다.
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+# scripts 폴더의 파일을 module로 import할 수 있도록 검색 경로 맨 앞에 넣는다.
+sys.path.insert(0, str(SCRIPTS_DIR))
+# 2D Gaussian 스크립트를 module로 가져온다.
+gaussian_2d_script = importlib.import_module("02_gaussian_2d")
+# 교육용 등방성 렌더러 스크립트를 module로 가져온다.
+mini_splat = importlib.import_module("04_mini_splat_renderer")
+# 이방성 EWA 렌더러 스크립트를 module로 가져온다.
+ewa = importlib.import_module("05_ewa_splat_renderer")
+
+
+# 640×480 예제와 같은 intrinsic matrix를 만드는 도우미 함수를 정의한다.
+def intrinsic(width: int, height: int, focal: float = 520.0) -> np.ndarray:
+    """principal point가 영상 중앙인 K를 반환한다."""
+    # focal length와 영상 중앙으로 3×3 K를 만든다.
+    return np.array([[focal, 0.0, width / 2.0], [0.0, focal, height / 2.0], [0.0, 0.0, 1.0]])
+
+
+# float32 경로가 float64 기준과 가까운지 검사하는 test를 정의한다.
+def test_integer_pixel_grid_is_evaluated_in_float64() -> None:
+    """np.mgrid 정수 격자를 그대로 넘겨도 float64 격자와 같은 결과를 내야 한다."""
+    # 변환하지 않은 정수 좌표 격자를 만든다.
+    y_coordinates, x_coordinates = np.mgrid[0:40, 0:50]
+    # (H, W, 2) 정수 격자를 만든다.
+    integer_grid = np.dstack((x_coordinates, y_coordinates))
+    # 회전된 covariance와 소수 중심을 정한다.
+    covariance, mean = gaussian_2d_script.covariance_2d(9.0, 4.0, 20.0), np.array([20.5, 18.25])
+    # 정수 격자로 계산한다.
+    result = gaussian_2d_script.gaussian_2d(integer_grid, mean, covariance)
+    # 결과는 float64여야 한다.
+    assert result.dtype == np.float64
+    # float64로 바꾼 격자의 결과와 같아야 한다.
+    np.testing.assert_array_equal(result, gaussian_2d_script.gaussian_2d(integer_grid.astype(np.float64), mean, covariance))
+
+
+def test_float32_path_stays_close_to_float64_reference() -> None:
+    """scratch buffer를 쓰는 float32 계산은 float64 einsum 기준과 1e-5 안에서 같아야 한다."""
+    # 세로와 가로 좌표 격자를 만든다.
+    y_coordinates, x_coordinates = np.mgrid[0:120, 0:160]
+    # (H, W, 2) float64 좌표 격자를 만든다.
+    pixel_grid = np.dstack((x_coordinates, y_coordinates)).astype(np.float64)
+    # 회전된 covariance와 중심을 정한다.
+    covariance, mean = gaussian_2d_script.covariance_2d(30.0, 12.0, 35.0), np.array([70.0, 55.0])
+    # 기존 einsum 식으로 기준 값을 계산한다.
+    delta = pixel_grid - mean
+    # 각 pixel의 Mahalanobis 거리로 Gaussian 값을 계산한다.
+    expected = np.exp(-0.5 * np.einsum("...i,ij,...j->...", delta, np.linalg.inv(covariance), delta))
+    # float64 in-place 경로는 기준과 거의 정확히 같아야 한다.
+    np.testing.assert_allclose(gaussian_2d_script.gaussian_2d(pixel_grid, mean, covariance), expected, atol=1e-12)
+    # float32 결과 buffer를 미리 만든다.
+    out = np.empty((120, 160), dtype=np.float32)
+    # float32 격자로 계산한다.
+    result = gaussian_2d_script.gaussian_2d(pixel_grid.astype(np.float32), mean, covariance, out=out)
+    # 결과가 넘긴 buffer 자체이고 float32인지 검사한다.
+    assert result is out and result.dtype == np.float32
+    # float32 결과가 기준과 가까운지 검사한다.
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+    # 불투명도와 크기가 다양한 Gaussian 장면을 만든다.
+    rng = np.random.default_rng(3)
+    # 장면 인자를 tuple로 묶는다.
+    scene = (np.c_[rng.uniform(-1.0, 1.0, size=(30, 2)), rng.uniform(2.0, 5.0, size=30)], rng.uniform(0.05, 0.5, size=(30, 3)), rng.uniform(0.0, 1.0, size=(30, 3)), rng.uniform(0.3, 0.95, size=30), intrinsic(160, 120, focal=150.0), 120, 160, np.array([0.1, 0.2, 0.3]))
+    # float64로 렌더링한다.
+    expected_rgb, expected_alpha = mini_splat.render_gaussians(*scene, min_transmittance=0.0)
+    # float32로 렌더링한다.
+    rgb, alpha = mini_splat.render_gaussians(*scene, min_transmittance=0.0, dtype=np.float32)
+    # 출력 dtype이 float32인지 검사한다.
+    assert rgb.dtype == alpha.dtype == np.float32
+    # RGB 차이가 8-bit 양자화 간격(1/255)보다 훨씬 작은지 검사한다.
+    np.testing.assert_allclose(rgb, expected_rgb, atol=1e-5)
+    # alpha 차이도 같은 범위인지 검사한다.
+    np.testing.assert_allclose(alpha, expected_alpha, atol=1e-5)
+
+
+# 포화된 pixel을 건너뛰어도 결과가 거의 같은지 검사하는 test를 정의한다.
+def test_render_gaussians_skips_saturated_pixels() -> None:
+    """불투명한 장면에서 early termination은 평가 수를 줄이고 영상은 거의 바꾸지 않아야 한다."""
+    # 난수 생성기를 seed로 고정한다.
+    rng = np.random.default_rng(0)
+    # 화면 중앙 근처에 크고 불투명한 Gaussian 60개를 배치한다.
+    means = np.c_[rng.uniform(-0.3, 0.3, size=(60, 2)), rng.uniform(2.0, 4.0, size=60)]
+    # 장면 인자를 한 tuple로 묶는다.
+    scene = (means, np.full((60, 3), 1.0), rng.uniform(0.0, 1.0, size=(60, 3)), np.full(60, 0.98), intrinsic(80, 60, focal=80.0), 60, 80, np.array([0.1, 0.2, 0.3]))
+    # early termination 없이 기준 영상을 렌더링하고 통계를 센다.
+    full_stats = mini_splat.RenderStats()
+    # threshold 0은 어떤 pixel도 건너뛰지 않는다.
+    expected_rgb, expected_alpha = mini_splat.render_gaussians(*scene, min_transmittance=0.0, stats=full_stats)
+    # 기본 threshold로 다시 렌더링한다.
+    stats = mini_splat.RenderStats()
+    # 포화 pixel을 건너뛰는 렌더링을 수행한다.
+    rgb, alpha = mini_splat.render_gaussians(*scene, stats=stats)
+    # 기준 렌더링은 모든 쌍을 계산해야 한다.
+    assert full_stats == mini_splat.RenderStats(evaluated=60 * 60 * 80, skipped=0)
+    # 평가 수와 건너뛴 수의 합은 전체 쌍 수와 같아야 한다.
+    assert stats.evaluated + stats.skipped == 60 * 60 * 80
+    # 불투명한 장면이므로 절반 넘게 건너뛰어야 한다.
+    assert stats.skipped > stats.evaluated
+    # 남은 빛이 1e-4 미만일 때만 멈추므로 영상 차이는 아주 작아야 한다.
+    assert np.abs(rgb - expected_rgb).max() < 1e-3
+    # alpha 차이도 threshold 이하이어야 한다.
+    assert np.abs(alpha - expected_alpha).max() <= 1e-4
+
+
+# bounding box 안을 Gaussian 하나씩 순서대로 합성하는 느린 기준 구현을 정의한다.
+def reference_render(projected, height: int, width: int, background: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """batch 없이 Gaussian마다 box를 잘라 04와 같은 순서로 합성한다."""
+    # 출력 RGB를 0으로 초기화한다.
+    rgb = np.zeros((height, width, 3))
+    # transmittance를 1로 초기화한다.
+    transmittance = np.ones((height, width))
+    # 깊이 순서로 Gaussian을 하나씩 처리한다.
+    for index, (x0, y0, x1, y1) in enumerate(projected.boxes):
+        # box 안 pixel 좌표 격자를 만든다.
+        pixel_y, pixel_x = np.mgrid[y0 : y1 + 1, x0 : x1 + 1]
+        # 중심까지의 차이를 계산한다.
+        delta_x, delta_y = pixel_x - projected.means_2d[index, 0], pixel_y - projected.means_2d[index, 1]
+        # conic 세 성분을 꺼낸다.
+        a, b, c = projected.conics[index]
+        # opacity × weight를 0.99로 제한해 alpha를 계산한다.
+        alpha = np.minimum(projected.opacities[index] * np.exp(-0.5 * (a * delta_x**2 + 2 * b * delta_x * delta_y + c * delta_y**2)), ewa.ALPHA_MAX)
+        # 보이지 않는 alpha는 합성하지 않는다.
+        alpha[alpha < ewa.ALPHA_MIN] = 0.0
+        # box 영역의 transmittance view를 가져온다.
+        window = transmittance[y0 : y1 + 1, x0 : x1 + 1]
+        # 앞을 통과한 빛 × alpha × 색을 더한다.
+        rgb[y0 : y1 + 1, x0 : x1 + 1] += (window * alpha)[:, :, None] * projected.colors[index]
+        # transmittance를 제자리에서 갱신한다.
+        window *= 1.0 - alpha
+    # 남은 빛에 배경색을 더해 반환한다.
+    return rgb + transmittance[:, :, None] * background, 1.0 - transmittance
+
+
+# batch 합성이 Gaussian 하나씩 합성한 결과와 같은지 검사하는 test를 정의한다.
+def test_ewa_batches_match_sequential_reference() -> None:
+    """sample 예산을 바꿔도 결과가 순차 기준 구현과 일치해야 한다."""
+    # 겹침이 많도록 작은 화면에 300개 Gaussian을 배치한다.
+    means, scales, quaternions, colors, opacities = ewa.random_scene(300, seed=1)
+    # 작은 화면용 K를 만든다.
+    k = intrinsic(96, 64, focal=60.0)
+    # 배경색을 정한다.
+    background = np.array([0.1, 0.2, 0.3])
+    # 모든 Gaussian을 투영한다.
+    projected = ewa.project_gaussians(means, scales * 4.0, quaternions, colors, opacities, k, 64, 96)
+    # 느린 기준 구현으로 렌더링한다.
+    expected_rgb, expected_alpha = reference_render(projected, 64, 96, background)
+    # 아주 작은 예산과 큰 예산 모두에서 batch 렌더링한다.
+    for max_samples in (50, 1 << 22):
+        # batch 렌더러로 렌더링한다.
+        rgb, alpha = ewa.render_projected(projected, 64, 96, background, max_samples=max_samples)
+        # RGB가 기준 구현과 수치 오차 범위에서 같은지 검사한다.
+        np.testing.assert_allclose(rgb, expected_rgb, atol=1e-10)
+        # alpha도 같은지 검사한다.
+        np.testing.assert_allclose(alpha, expected_alpha, atol=1e-10)
+
+
+# 광축 위 등방성 Gaussian의 투영 분산을 검사하는 test를 정의한다.
+def test_isotropic_gaussian_on_axis_projects_to_focal_scaled_variance() -> None:
+    """Σ₂D는 (f s / z)² + low-pass 분산인 등방성 행렬이어야 한다."""
+    # 광축 위 z=2 위치의 중심 하나를 만든다.
+    means = np.array([[0.0, 0.0, 2.0]])
+    # 세 축 scale이 0.1인 등방성 3D covariance를 만든다.
+    covariance = ewa.covariance_3d(np.full((1, 3), 0.1), np.array([[0.3, 0.1, -0.5, 0.8]]))
+    # 2D로 투영한다.
+    projected = ewa.project_covariance(means, covariance, intrinsic(640, 480))
+    # 기대 분산 (520 × 0.1 / 2)² + 0.3을 계산한다.
+    expected = (520.0 * 0.1 / 2.0) ** 2 + ewa.LOW_PASS_VARIANCE
+    # 회전과 무관하게 등방성 결과가 나오는지 검사한다.
+    np.testing.assert_allclose(projected[0], np.eye(2) * expected, rtol=1e-12, atol=1e-9)
+
+
+# tile rasterizer 결과가 05 batch 렌더러와 같은지 검사하는 test를 정의한다.
+def test_tile_rasterizer_matches_ewa_and_terminates_early() -> None:
+    """early termination을 끄면 결과가 같고, 켜면 포화 pixel을 건너뛰어도 차이가 작아야 한다."""
+    # tile 렌더러 스크립트를 module로 가져온다.
+    tiles = importlib.import_module("06_tile_rasterizer")
+    # 16의 배수가 아닌 화면 크기로 가장자리 tile도 검사한다.
+    height, width = 70, 100
+    # 작은 화면용 K를 만든다.
+    k = intrinsic(width, height, focal=60.0)
+    # 배경색을 정한다.
+    background = np.array([0.1, 0.2, 0.3])
+    # 겹침이 많고 불투명한 장면을 만든다.
+    means, scales, quaternions, colors, opacities = ewa.random_scene(400, seed=2)
+    # opacity를 높이고 scale을 키워 대부분의 pixel이 포화되게 한다.
+    projected = ewa.project_gaussians(means, scales * 6.0, quaternions, colors, np.full(400, 0.98), k, height, width)
+    # 05 batch 렌더러로 기준 영상을 만든다.
+    expected_rgb, expected_alpha = ewa.render_projected(projected, height, width, background)
+    # early termination 없이 한 process와 두 process로 렌더링한다.
+    for workers in (1, 2):
+        # tile 방식으로 렌더링한다.
+        rgb, alpha, stats = tiles.render_tiles(projected, height, width, background, workers=workers, min_transmittance=0.0)
+        # RGB가 기준과 같은지 검사한다.
+        np.testing.assert_allclose(rgb, expected_rgb, atol=1e-10)
+        # alpha가 기준과 같은지 검사한다.
+        np.testing.assert_allclose(alpha, expected_alpha, atol=1e-10)
+        # 아무 pixel도 건너뛰지 않았는지 검사한다.
+        assert stats.skipped == 0
+    # 기본 threshold로 다시 렌더링한다.
+    rgb, alpha, stats = tiles.render_tiles(projected, height, width, background)
+    # 포화된 pixel 평가를 실제로 건너뛰었는지 검사한다.
+    assert stats.skipped > 0
+    # 남은 빛이 1e-4 미만일 때만 멈추므로 결과 차이는 아주 작아야 한다.
+    assert np.abs(rgb - expected_rgb).max() < 1e-3
+
+
+# batch SH 계산이 Gaussian 하나씩 쓴 공식과 같은지 검사하는 test를 정의한다.
+def test_batched_sh_matches_scalar_formula() -> None:
+    """degree 1은 Gaussian마다 쓴 스칼라 식과, degree 3은 +z 방향의 닫힌 식과 같아야 한다."""
+    # SH 스크립트를 module로 가져온다.
+    sh = importlib.import_module("08_spherical_harmonics")
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(5)
+    # 무작위 중심 다섯 개를 만든다.
+    means = rng.normal(size=(5, 3))
+    # degree 1 계수 shape (5, 4, 3)을 만든다.
+    coefficients = rng.normal(scale=0.3, size=(5, 4, 3))
+    # 카메라 중심을 정한다.
+    camera_center = np.array([0.2, -0.1, -3.0])
+    # batch 경로로 RGB를 계산한다.
+    rgb = sh.evaluate_sh(coefficients, sh.view_directions(means, camera_center))
+    # Gaussian마다 스칼라 식으로 다시 계산한다.
+    for index in range(5):
+        # 카메라에서 Gaussian으로 향하는 단위 방향을 계산한다.
+        x, y, z = (means[index] - camera_center) / np.linalg.norm(means[index] - camera_center)
+        # 공식 3DGS의 degree 1 식을 그대로 쓴다.
+        expected = sh.SH_C0 * coefficients[index, 0] - sh.SH_C1 * y * coefficients[index, 1] + sh.SH_C1 * z * coefficients[index, 2] - sh.SH_C1 * x * coefficients[index, 3] + 0.5
+        # 음수를 0으로 자른 값과 비교한다.
+        np.testing.assert_allclose(rgb[index], np.maximum(expected, 0.0), atol=1e-12)
+    # +z 방향에서는 x와 y가 0이라 m=0 basis만 남는다.
+    basis = sh.sh_basis(np.array([[0.0, 0.0, 1.0]]), 3)[0]
+    # m=0 항의 위치와 값을 닫힌 식으로 적는다.
+    expected_basis = {0: sh.SH_C0, 2: sh.SH_C1, 6: 2.0 * sh.SH_C2[2], 12: 2.0 * sh.SH_C3[3]}
+    # 16개 basis 값을 모두 비교한다.
+    np.testing.assert_allclose(basis, [expected_basis.get(index, 0.0) for index in range(16)], atol=1e-15)
+
+
+# SH cache가 작은 카메라 이동에서만 재사용되는지 검사하는 test를 정의한다.
+def test_sh_color_cache_reuses_colors_for_small_camera_moves() -> None:
+    """tolerance 안의 이동은 hit, 밖의 이동이나 다른 입력 배열은 miss여야 한다."""
+    # SH 스크립트를 module로 가져온다.
+    sh = importlib.import_module("08_spherical_harmonics")
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(6)
+    # 중심과 degree 2 계수를 만든다.
+    means, coefficients = rng.normal(size=(50, 3)), rng.normal(size=(50, 9, 3))
+    # tolerance 0.01인 cache를 만든다.
+    cache = sh.ShColorCache(tolerance=0.01)
+    # 첫 호출은 새로 계산한다.
+    first = cache.colors(coefficients, means, np.zeros(3))
+    # tolerance 안의 이동은 같은 배열 객체를 돌려준다.
+    assert cache.colors(coefficients, means, np.array([0.005, 0.0, 0.0])) is first
+    # tolerance 밖의 이동은 새로 계산한다.
+    cache.colors(coefficients, means, np.array([0.5, 0.0, 0.0]))
+    # 다른 계수 배열은 카메라가 같아도 새로 계산한다.
+    cache.colors(coefficients.copy(), means, np.array([0.5, 0.0, 0.0]))
+    # hit 1번과 miss 3번이어야 한다.
+    assert (cache.hits, cache.misses) == (1, 3)
+    # 계산에 쓴 배열을 제자리에서 바꾼 뒤 invalidate하면 바뀐 계수로 다시 계산한다.
+    last = cache.colors(coefficients, means, np.zeros(3)).copy()
+    # 계수를 제자리에서 3배로 만든다.
+    coefficients *= 3.0
+    # cache를 비운다.
+    cache.invalidate()
+    # 다시 계산한 색은 새 계수로 직접 계산한 색과 같아야 한다.
+    np.testing.assert_allclose(cache.colors(coefficients, means, np.zeros(3)), sh.evaluate_sh(coefficients, sh.view_directions(means, np.zeros(3))))
+    # 색이 실제로 바뀌었는지도 확인한다.
+    assert not np.allclose(cache.colors(coefficients, means, np.zeros(3)), last)
+
+
+# PLY와 compact 형식이 memmap으로 열리고 값이 보존되는지 검사하는 test를 정의한다.
+def test_scene_files_round_trip_through_memmap(tmp_path: Path) -> None:
+    """PLY → .npy → PLY 변환 후 모든 필드가 같고, 열린 필드는 파일 위 view여야 한다."""
+    # 장면 입출력 스크립트를 module로 가져온다.
+    scene_io = importlib.import_module("09_scene_io")
+    # CHUNK_SIZE보다 작은 degree 2 장면을 만든다.
+    scene = scene_io.random_scene(300, sh_degree=2, seed=3)
+    # 원본을 PLY로 저장한다.
+    scene_io.save_ply(tmp_path / "scene.ply", scene)
+    # PLY를 compact로 변환한다.
+    scene_io.convert_scene(tmp_path / "scene.ply", tmp_path / "scene.npy")
+    # compact를 다시 PLY로 변환한다.
+    scene_io.convert_scene(tmp_path / "scene.npy", tmp_path / "back.ply")
+    # 변환된 세 파일을 모두 연다.
+    for name in ("scene.ply", "scene.npy", "back.ply"):
+        # 파일을 memmap으로 연다.
+        loaded = scene_io.load_scene(tmp_path / name)
+        # 필드가 memmap을 base로 하는 view인지 검사한다.
+        assert isinstance(loaded.sh_rest.base, np.memmap)
+        # SH degree가 보존되었는지 검사한다.
+        assert loaded.sh_degree == 2
+        # 여섯 필드를 모두 비교한다.
+        for field in scene_io.GaussianScene.__dataclass_fields__:
+            # float32 값이 bit 단위로 같아야 한다.
+            np.testing.assert_array_equal(getattr(loaded, field), getattr(scene, field))
+    # (M, K, 3) 계수의 DC와 채널 우선 나머지 계수 배치를 검사한다.
+    np.testing.assert_array_equal(loaded.sh_coefficients([7])[0, 1:, 2], scene.sh_rest[7, 2])
+
+
+# f_rest가 없는 degree 0 PLY도 열리고, 3의 배수가 아닌 f_rest는 거부되는지 검사하는 test를 정의한다.
+def test_degree_zero_scene_round_trips(tmp_path: Path) -> None:
+    """degree 0 장면은 (N, 3, 0) sh_rest로 PLY와 .npy를 오가고, f_rest 4개 header는 ValueError여야 한다."""
+    # 장면 입출력 스크립트를 module로 가져온다.
+    scene_io = importlib.import_module("09_scene_io")
+    # degree 0 장면을 만든다.
+    scene = scene_io.random_scene(10, sh_degree=0, seed=5)
+    # PLY로 저장한다.
+    scene_io.save_ply(tmp_path / "scene.ply", scene)
+    # PLY를 compact로 변환한다.
+    scene_io.convert_scene(tmp_path / "scene.ply", tmp_path / "scene.npy")
+    # 두 파일을 모두 연다.
+    for name in ("scene.ply", "scene.npy"):
+        # 파일을 memmap으로 연다.
+        loaded = scene_io.load_scene(tmp_path / name)
+        # 나머지 계수는 비어 있고 degree는 0이어야 한다.
+        assert (loaded.sh_rest.shape, loaded.sh_degree) == ((10, 3, 0), 0)
+        # 여섯 필드를 모두 비교한다.
+        for field in scene_io.GaussianScene.__dataclass_fields__:
+            # float32 값이 bit 단위로 같아야 한다.
+            np.testing.assert_array_equal(getattr(loaded, field), getattr(scene, field))
+    # degree 0 PLY의 property 목록을 읽는다.
+    _, properties, _ = scene_io.read_ply_header(tmp_path / "scene.ply")
+    # f_dc 뒤에 f_rest 4개를 끼워 넣는다.
+    broken = properties[:9] + [(f"f_rest_{index}", "<f4") for index in range(4)] + properties[9:]
+    # 채널별로 나눌 수 없는 f_rest 수는 ValueError여야 한다.
+    with pytest.raises(ValueError, match="3의 배수"):
+        # dtype을 만든다.
+        scene_io.ply_record_dtype(broken)
+
+
+# multi-view 렌더러가 05 단일 view와 같고 process 수와 무관한지 검사하는 test를 정의한다.
+def test_multiview_frames_match_single_view_renderer(tmp_path: Path) -> None:
+    """각도 0 turntable pose는 05와 같은 영상을 만들고, worker 수를 바꿔도 frame이 같아야 한다."""
+    # multi-view 스크립트를 module로 가져온다.
+    multiview = importlib.import_module("10_multiview_renderer")
+    # 작은 장면을 만든다.
+    means, scales, quaternions, colors, opacities = ewa.random_scene(300, seed=4)
+    # 작은 화면 크기와 K, 배경색을 정한다.
+    height, width, k, background = 48, 64, intrinsic(64, 48, focal=50.0), np.array([0.1, 0.2, 0.3])
+    # view 공통 전처리를 수행한다.
+    scene = multiview.prepare_scene(means, scales, quaternions, opacities, colors=colors)
+    # target에서 -z로 4만큼 떨어진 카메라는 원점의 단위 pose이다.
+    poses = multiview.turntable_poses(5, np.array([0.0, 0.0, 4.0]), radius=4.0)
+    # 첫 pose가 단위 회전과 영 이동인지 검사한다.
+    np.testing.assert_allclose(np.c_[poses[0][0], poses[0][1]], np.c_[np.eye(3), np.zeros(3)], atol=1e-12)
+    # 첫 pose로 렌더링한다.
+    rgb, alpha = multiview.render_view(scene, *poses[0], k, height, width, background)
+    # 05로 카메라 좌표 장면을 직접 렌더링한다.
+    expected_rgb, expected_alpha = ewa.render_gaussians_ewa(means, scales, quaternions, colors, opacities, k, height, width, background)
+    # RGB가 같은지 검사한다.
+    np.testing.assert_allclose(rgb, expected_rgb, atol=1e-10)
+    # alpha가 같은지 검사한다.
+    np.testing.assert_allclose(alpha, expected_alpha, atol=1e-10)
+    # 한 process로 모든 frame을 만든다.
+    sequential = list(multiview.iter_frames(scene, poses, k, height, width, background))
+    # 두 process와 대기 작업 하나로 frame을 만든다.
+    parallel = list(multiview.iter_frames(scene, poses, k, height, width, background, workers=2, max_pending=1))
+    # frame 순서와 내용이 같은지 검사한다.
+    np.testing.assert_array_equal(np.stack(parallel), np.stack(sequential))
+    # frame을 PNG 폴더로 쓴다.
+    assert multiview.write_frames(iter(sequential), tmp_path / "frames") == 5
+    # 번호 붙은 PNG 다섯 장이 생겼는지 검사한다.
+    assert sorted(path.name for path in (tmp_path / "frames").iterdir()) == [f"frame_{index:04d}.png" for index in range(5)]
+
+
+# frustum culling이 화면에 닿는 Gaussian을 잘못 버리지 않는지 검사하는 test를 정의한다.
+def test_frustum_culling_only_drops_gaussians_without_footprint() -> None:
+    """05에서 화면 밖으로 잘린 Gaussian은 box가 비어야 하고, 04는 화면 밖 Gaussian을 더해도 결과가 같아야 한다."""
+    # 카메라 투영 스크립트를 module로 가져온다.
+    camera = importlib.import_module("03_camera_projection")
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(8)
+    # 화면 안팎과 카메라 뒤에 고루 퍼진 중심을 만든다.
+    means = rng.uniform([-8.0, -6.0, -1.0], [8.0, 6.0, 8.0], size=(3000, 3))
+    # 크기가 다양한 scale을 만든다.
+    scales = np.exp(rng.uniform(-3.0, 0.0, size=(3000, 3)))
+    # 무작위 회전을 만든다.
+    quaternions = rng.normal(size=(3000, 4))
+    # 작은 화면의 K를 만든다.
+    height, width, k = 60, 80, intrinsic(80, 60, focal=70.0)
+    # 카메라 좌표 3D covariance를 계산한다.
+    covariances = ewa.covariance_3d(scales, quaternions)
+    # 잘라낸 수를 셀 통계 객체를 만든다.
+    stats = camera.CullStats()
+    # 05와 같은 반지름과 여유로 culling mask를 만든다.
+    keep = camera.frustum_cull(means, k, height, width, radii=ewa.SIGMA_EXTENT * np.sqrt(np.trace(covariances, axis1=1, axis2=2)), pixel_margin=ewa.SIGMA_EXTENT * np.sqrt(ewa.LOW_PASS_VARIANCE) + 1.0, stats=stats)
+    # 세 이유가 모두 나타나고 합이 잘린 수와 같은지 검사한다.
+    assert stats.near > 0 and stats.outside > 0 and stats.total == int((~keep).sum())
+    # 화면 밖으로 잘린 Gaussian만 고른다.
+    outside = np.flatnonzero(~keep & (means[:, 2] >= camera.NEAR_PLANE))
+    # 자르지 않았다면 05가 계산했을 2D covariance를 구한다.
+    covariance_2d = ewa.project_covariance(means[outside], covariances[outside], k)
+    # 2×2 행렬의 큰 고유값으로 05와 같은 pixel 반지름을 계산한다.
+    radii = np.ceil(ewa.SIGMA_EXTENT * np.sqrt(np.linalg.eigvalsh(covariance_2d)[:, 1]))
+    # 중심의 pixel 좌표를 계산한다.
+    centers = means[outside] @ k.T
+    # 세 번째 성분으로 나눈다.
+    centers = centers[:, :2] / centers[:, 2:3]
+    # box가 화면과 겹치는지 05와 같은 식으로 검사한다.
+    overlaps = (np.floor(centers - radii[:, None]) <= [width - 1, height - 1]).all(axis=1) & (np.ceil(centers + radii[:, None]) >= 0.0).all(axis=1)
+    # 잘린 Gaussian 중 화면과 겹치는 것은 없어야 한다.
+    assert not overlaps.any()
+    # 04용으로 화면 안의 작은 장면을 만든다.
+    inside_means = np.array([[0.0, 0.0, 3.0], [0.3, -0.2, 4.0]])
+    # 카메라 뒤, far plane 뒤, 화면 밖 Gaussian을 더한 장면을 만든다.
+    extra_means = np.array([[0.0, 0.0, -2.0], [0.0, 0.0, 2000.0], [50.0, 0.0, 3.0]])
+    # 두 장면을 이어 붙인 입력을 만든다.
+    all_means = np.vstack([inside_means, extra_means])
+    # 모든 Gaussian에 같은 scale, 색, opacity를 준다.
+    all_scales, all_colors, all_opacities = np.full((5, 3), 0.2), np.full((5, 3), 0.7), np.full(5, 0.8)
+    # 잘라낸 수를 셀 04 통계 객체를 만든다.
+    render_stats = mini_splat.RenderStats()
+    # 더한 장면을 렌더링한다.
+    rgb, alpha = mini_splat.render_gaussians(all_means, all_scales, all_colors, all_opacities, k, height, width, np.zeros(3), stats=render_stats)
+    # 원래 장면만 렌더링한다.
+    expected_rgb, expected_alpha = mini_splat.render_gaussians(inside_means, all_scales[:2], all_colors[:2], all_opacities[:2], k, height, width, np.zeros(3))
+    # RGB가 같은지 검사한다.
+    np.testing.assert_array_equal(rgb, expected_rgb)
+    # alpha가 같은지 검사한다.
+    np.testing.assert_array_equal(alpha, expected_alpha)
+    # 이유별로 하나씩 잘렸는지 검사한다.
+    assert (render_stats.culled.near, render_stats.culled.far, render_stats.culled.outside) == (1, 1, 1)
+
+
+# 해석적 gradient가 중앙 차분과 같은지 검사하는 test를 정의한다.
+def test_splat_backward_matches_finite_differences() -> None:
+    """중심, log scale, opacity, 색의 모든 원소에서 해석적 gradient와 중앙 차분이 1e-6 안에서 같아야 한다."""
+    # 미분 가능한 splat 스크립트를 module로 가져온다.
+    splat = importlib.import_module("11_differentiable_splat")
+    # 재현 가능한 난수 생성기를 만든다.
+    rng = np.random.default_rng(9)
+    # 작은 화면 크기를 정한다.
+    height, width = 10, 12
+    # 서로 겹치는 Gaussian 네 개를 만든다. opacity 0.9 이하라 alpha 상한에 걸리지 않는다.
+    parameters = splat.SplatParameters(means=rng.uniform([2.0, 2.0], [9.0, 7.0], size=(4, 2)), log_scales=np.log(rng.uniform(1.5, 3.0, size=(4, 2))), opacities=rng.uniform(0.3, 0.9, size=4), colors=rng.uniform(0.0, 1.0, size=(4, 3)))
+    # 목표 영상과 배경색을 만든다.
+    target, background = rng.uniform(size=(height, width, 3)), np.array([0.2, 0.1, 0.3])
+    # 재사용 buffer를 만든다.
+    buffers = splat.SplatBuffers(4, height, width)
+    # parameter로 loss를 계산하는 도우미 함수를 정의한다.
+    def loss() -> float:
+        # 렌더링 후 MSE만 반환한다.
+        return splat.mse_loss(splat.render_forward(parameters, buffers, background), target)[0]
+    # 렌더링과 loss gradient를 계산한다.
+    _, grad_rgb = splat.mse_loss(splat.render_forward(parameters, buffers, background), target)
+    # 해석적 gradient를 계산한다.
+    gradients = splat.render_backward(parameters, buffers, grad_rgb)
+    # 네 parameter 배열을 차례로 검사한다.
+    for name in ("means", "log_scales", "opacities", "colors"):
+        # 현재 parameter 배열을 꺼낸다.
+        array = getattr(parameters, name)
+        # 중앙 차분 결과를 담을 배열을 만든다.
+        numeric = np.empty_like(array)
+        # 모든 원소를 하나씩 흔든다.
+        for index in np.ndindex(array.shape):
+            # 원래 값을 저장한다.
+            original = array[index]
+            # 작은 양만큼 올린 loss를 계산한다.
+            array[index] = original + 1e-6
+            # 올린 loss를 저장한다.
+            upper = loss()
+            # 작은 양만큼 내린 loss를 계산한다.
+            array[index] = original - 1e-6
+            # 중앙 차분을 계산한다.
+            numeric[index] = (upper - loss()) / 2e-6
+            # 원래 값으로 되돌린다.
+            array[index] = original
+        # 해석적 gradient와 비교한다.
+        np.testing.assert_allclose(getattr(gradients, name), numeric, atol=1e-6, err_msg=name)
+
+
+# dense buffer가 지원 크기를 넘으면 할당 전에 거부하는지 검사하는 test를 정의한다.
+def test_splat_buffers_reject_unsupported_size() -> None:
+    """640×480에 Gaussian 1만 개는 수백 GB이므로 배열을 만들기 전에 ValueError가 나야 한다."""
+    # 미분 가능한 splat 스크립트를 module로 가져온다.
+    splat = importlib.import_module("11_differentiable_splat")
+    # 필요한 메모리가 약 200 GB로 계산되는지 검사한다.
+    assert splat.SplatBuffers.required_bytes(10_000, 480, 640) > 150 * 2**30
+    # 상한을 넘는 크기는 거부되어야 한다.
+    with pytest.raises(ValueError, match="GiB"):
+        # 수백 GB buffer를 요청한다.
+        splat.SplatBuffers(10_000, 480, 640)
+    # 예제의 64×64, Gaussian 128개는 상한 안이다.
+    assert splat.SplatBuffers.required_bytes(128, 64, 64) < splat.MAX_BUFFER_BYTES
+
+
+# Gaussian 맞추기 반복이 loss를 줄이는지 검사하는 test를 정의한다.
+def test_splat_fit_reduces_loss() -> None:
+    """작은 목표 영상에서 40번 반복하면 loss가 절반 아래로 줄어야 한다."""
+    # 미분 가능한 splat 스크립트를 module로 가져온다.
+    splat = importlib.import_module("11_differentiable_splat")
+    # 작은 목표 영상으로 맞춘다.
+    _, losses, iterations_per_s = splat.fit_image(splat.target_image(24, 24), count=24, iterations=40)
+    # loss가 절반 아래로 줄었는지 검사한다.
+    assert losses[-1] < 0.5 * losses[0]
+    # 초당 반복 수가 양수로 측정되었는지 검사한다.
+    assert iterations_per_s > 0.0
+
+
+# ROI와 progressive 렌더링이 전체 렌더링과 같은 값을 내는지 검사하는 test를 정의한다.
+def test_window_and_progressive_match_full_render() -> None:
+    """ROI는 전체 영상의 같은 위치와, progressive 마지막 단계는 전체 영상과 3 sigma culling 오차 안에서 같아야 한다."""
+    # ROI와 progressive 스크립트를 module로 가져온다.
+    progressive = importlib.import_module("12_progressive_roi")
+    # 작은 장면을 만든다.
+    means, scales, _, colors, opacities = ewa.random_scene(40, seed=10)
+    # 화면 크기와 K, 배경색을 정한다.
+    height, width, k, background = 36, 44, intrinsic(44, 36, focal=40.0), np.array([0.1, 0.2, 0.3])
+    # 전체 영상을 렌더링한다.
+    expected_rgb, expected_alpha = mini_splat.render_gaussians(means, scales, colors, opacities, k, height, width, background)
+    # 전체 평가 수를 셀 통계 객체를 만든다.
+    window_stats = mini_splat.RenderStats()
+    # 가장자리에 걸친 ROI를 렌더링한다.
+    rgb, alpha = progressive.render_window(means, scales, colors, opacities, k, (30, 5, 44, 20), background, stats=window_stats)
+    # ROI가 전체 영상의 같은 위치와 같은지 검사한다.
+    np.testing.assert_allclose(rgb, expected_rgb[5:20, 30:44], atol=1e-4)
+    # alpha도 같은지 검사한다.
+    np.testing.assert_allclose(alpha, expected_alpha[5:20, 30:44], atol=1e-4)
+    # ROI 밖 Gaussian이 잘려 ROI pixel 수 × Gaussian 수보다 적게 계산했는지 검사한다.
+    assert window_stats.evaluated < 14 * 15 * 40
+    # progressive 단계를 모두 받는다.
+    stages = list(progressive.render_progressive(means, scales, colors, opacities, k, height, width, background, strides=(4, 2, 1)))
+    # 단계별 간격이 순서대로 나왔는지 검사한다.
+    assert [stride for stride, _, _ in stages] == [4, 2, 1]
+    # 첫 미리보기도 전체 크기인지 검사한다.
+    assert stages[0][1].shape == (height, width, 3)
+    # 첫 미리보기의 격자 pixel은 이미 최종 값과 같아야 한다.
+    np.testing.assert_allclose(stages[0][1][::4, ::4], expected_rgb[::4, ::4], atol=1e-4)
+    # 마지막 단계 RGB가 전체 영상과 같은지 검사한다.
+    np.testing.assert_allclose(stages[-1][1], expected_rgb, atol=1e-4)
+    # 마지막 단계 alpha가 전체 영상과 같은지 검사한다.
+    np.testing.assert_allclose(stages[-1][2], expected_alpha, atol=1e-4)
+
+
+# benchmark 한 경우의 기록과 회귀 비교를 검사하는 test를 정의한다.
+def test_benchmark_case_records_evaluations_and_flags_regressions() -> None:
+    """예산 안의 경우는 평가 수와 시간을, 넘는 경우는 skipped를 기록하고, 느려진 key만 회귀로 찾아야 한다."""
+    # benchmark 스크립트를 module로 가져온다.
+    benchmark = importlib.import_module("13_benchmark_suite")
+    # 240p에서 Gaussian 3개를 gaussian_2d로 측정한다.
+    row = benchmark.run_case("gaussian_2d", 3, "240p", "float32")
+    # gaussian_2d는 모든 Gaussian-pixel 쌍을 계산한다.
+    assert row["evaluations"] == 3 * 426 * 240 and row["time_s"] > 0.0 and row["peak_mib"] > 0.0
+    # 작은 경우의 최대 메모리는 같은 경우에서 잰다.
+    assert row["peak_count"] == 3
+    # 큰 경우의 최대 메모리는 MEMORY_COUNT개로 줄인 경우에서 잰다.
+    assert benchmark.run_case("gaussian_2d", 150, "240p", "float32")["peak_count"] == benchmark.MEMORY_COUNT
+    # 추정 평가 수가 예산보다 큰 경우는 측정하지 않고 추정값을 남긴다.
+    skipped = benchmark.run_case("render_gaussians", 1_000, "240p", "float64", budget=1e6)
+    # culling과 early termination 뒤 추정값은 전체 쌍 수 이하이고 예산보다 커야 한다.
+    assert skipped["skipped"] and 1e6 < skipped["estimated_evaluations"] <= 1_000 * 426 * 240
+    # 예산을 끄면 같은 경우도 측정한다.
+    assert not benchmark.run_case("render_gaussians", 10, "240p", "float32", budget=None)["skipped"]
+    # --full도 기본 예산을 쓰고, 예산은 --no-budget으로만 끌 수 있다.
+    assert benchmark.resolve_budget(True, None, False) == benchmark.FULL_BUDGET
+    assert benchmark.resolve_budget(False, None, False) == benchmark.DEFAULT_BUDGET
+    assert benchmark.resolve_budget(True, 5e9, False) == 5e9 and benchmark.resolve_budget(True, None, True) is None
+    # 이전 결과를 만든다.
+    baseline = [{"key": "a", "skipped": False, "time_s": 1.0}, {"key": "b", "skipped": False, "time_s": 1.0}, {"key": "c", "skipped": True}]
+    # a는 두 배 느려지고 b는 빨라진 현재 결과를 만든다.
+    current = [{"key": "a", "skipped": False, "time_s": 2.0}, {"key": "b", "skipped": False, "time_s": 0.5}, {"key": "c", "skipped": False, "time_s": 9.0}]
+    # a만 회귀로 찾는지 검사한다.
+    assert benchmark.compare_results(baseline, current, threshold=1.25) == [("a", 2.0)]
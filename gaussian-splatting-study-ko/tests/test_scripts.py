@@ -1,4 +1,4 @@
-"""네 교육용 스크립트가 새 작업 폴더에서 끝까지 실행되는지 검사한다."""
+"""교육용 스크립트가 새 작업 폴더에서 끝까지 실행되는지 검사한다."""
 
 # 미래 Python에서도 현재 방식의 type hint 해석을 유지한다.
 from __future__ import annotations
@@ -14,8 +14,8 @@ from pathlib import Path
 import pytest
 
 
-# 실행할 네 스크립트 파일명을 pytest parameter 목록으로 선언한다.
-@pytest.mark.parametrize("script_name", ["01_gaussian_1d.py", "02_gaussian_2d.py", "03_camera_projection.py", "04_mini_splat_renderer.py"])
+# 실행할 스크립트 파일명을 pytest parameter 목록으로 선언한다.
+@pytest.mark.parametrize("script_name", ["01_gaussian_1d.py", "02_gaussian_2d.py", "03_camera_projection.py", "04_mini_splat_renderer.py", "05_ewa_splat_renderer.py", "06_tile_rasterizer.py", "07_precision_benchmark.py", "08_spherical_harmonics.py", "09_scene_io.py", "10_multiview_renderer.py", "11_differentiable_splat.py", "12_progressive_roi.py", "13_benchmark_suite.py"])
 # 각 스크립트를 독립 process에서 실행하는 test 함수를 정의한다.
 def test_script_runs(script_name: str, tmp_path: Path) -> None:
     """각 실습 스크립트가 종료 코드 0으로 완료되는지 검사한다."""